@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from voice_text_organizer.audio_codec import decode_flac, encode_flac
+from voice_text_organizer.mfcc import read_wav_mono_pcm
+
+SAMPLE_RATE = 16000
+
+
+def _synthetic_dictation(seconds: float, seed: int) -> np.ndarray:
+    # Voiced bursts with pauses over a low noise floor, roughly like a 16 kHz desk-mic dictation.
+    rng = np.random.default_rng(seed)
+    time_axis = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    pitch = 140.0 + 40.0 * np.sin(2.0 * np.pi * 0.3 * time_axis)
+    phase = 2.0 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(phase * harmonic) / harmonic for harmonic in range(1, 8))
+    envelope = np.clip(np.sin(2.0 * np.pi * 0.7 * time_axis) * 1.5, 0.0, 1.0)
+    signal = voiced * envelope * 6000.0 + rng.normal(0.0, 60.0, time_axis.size)
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare FLAC upload encoding with raw WAV.")
+    parser.add_argument("wavs", nargs="*", type=Path, help="16-bit WAV recordings; synthetic audio when omitted")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[5.0, 30.0, 120.0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--uplink-kbps", type=float, default=1000.0, help="uplink used to estimate upload time")
+    parser.add_argument("--verify", action="store_true", help="decode every stream and check it is lossless (slow)")
+    args = parser.parse_args()
+
+    clips = [(path.name, *read_wav_mono_pcm(path)) for path in args.wavs] or [
+        (f"synthetic-{seconds:g}s", _synthetic_dictation(seconds, index), SAMPLE_RATE)
+        for index, seconds in enumerate(args.seconds)
+    ]
+    print(
+        f"{'clip':>18} {'seconds':>8} {'wav_kb':>8} {'flac_kb':>8} {'ratio':>6} "
+        f"{'encode_ms':>10} {'wav_upload_ms':>14} {'flac_total_ms':>14}"
+    )
+    for name, pcm, sample_rate in clips:
+        wav_bytes = pcm.size * 2 + 44
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            encoded = encode_flac(pcm, sample_rate)
+            timings.append((time.perf_counter() - started) * 1000.0)
+        if args.verify and not np.array_equal(decode_flac(encoded)[0], pcm):
+            raise SystemExit(f"{name}: round trip is not lossless")
+        encode_ms = min(timings)
+        bytes_per_ms = args.uplink_kbps * 1000.0 / 8.0 / 1000.0
+        print(
+            f"{name:>18} {pcm.size / sample_rate:>8.1f} {wav_bytes / 1024:>8.1f} {len(encoded) / 1024:>8.1f} "
+            f"{len(encoded) / wav_bytes:>6.2f} {encode_ms:>10.1f} {wav_bytes / bytes_per_ms:>14.0f} "
+            f"{encode_ms + len(encoded) / bytes_per_ms:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from voice_text_organizer.dtw import _reference_dtw_distance, dtw_distance_batch
+
+QUERY_FRAMES = 220
+WINDOW = 30
+
+
+def _build_pairs(pair_count: int, seed: int) -> tuple[np.ndarray, list[np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    query = rng.standard_normal((QUERY_FRAMES, 13)).astype(np.float32)
+    samples = [
+        rng.standard_normal((int(rng.integers(QUERY_FRAMES - 25, QUERY_FRAMES + 25)), 13)).astype(np.float32)
+        for _ in range(pair_count)
+    ]
+    return query, samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the per-cell and vectorized DTW engines.")
+    parser.add_argument("--pairs", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument(
+        "--reference-limit",
+        type=int,
+        default=50,
+        help="time the per-cell engine on at most this many pairs and extrapolate",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pairs':>6} {'reference_ms':>14} {'vectorized_ms':>14} {'speedup':>9} {'max_abs_diff':>13}")
+    for pair_count in args.pairs:
+        query, samples = _build_pairs(pair_count, args.seed)
+
+        measured = samples[: max(1, min(args.reference_limit, pair_count))]
+        started = time.perf_counter()
+        reference = [_reference_dtw_distance(query, sample, window=WINDOW) for sample in measured]
+        reference_ms = (time.perf_counter() - started) * 1000.0 * pair_count / len(measured)
+
+        started = time.perf_counter()
+        vectorized = dtw_distance_batch(query, samples, window=WINDOW)
+        vectorized_ms = (time.perf_counter() - started) * 1000.0
+
+        max_diff = float(np.max(np.abs(vectorized[: len(measured)] - np.asarray(reference))))
+        print(
+            f"{pair_count:>6} {reference_ms:>14.1f} {vectorized_ms:>14.1f} "
+            f"{reference_ms / vectorized_ms:>8.1f}x {max_diff:>13.3g}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from voice_text_organizer.dtw import dtw_distance_batch, fast_dtw_distance_batch
+from voice_text_organizer.personalization import MAX_ACCEPTED_DISTANCE
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    std = matrix.std(axis=0, keepdims=True)
+    return ((matrix - matrix.mean(axis=0, keepdims=True)) / np.where(std < 1e-6, 1.0, std)).astype(np.float32)
+
+
+def _build_corpus(
+    rng: np.random.Generator,
+    *,
+    frames: int,
+    window: int,
+    terms: int,
+    samples_per_term: int,
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    # Each "term" is a smooth random walk over 13 MFCC-like dimensions; samples are
+    # time-warped, noisy renditions of it and the query is a rendition of the first term.
+    prototypes = [np.cumsum(rng.standard_normal((frames, 13)) * 0.3, axis=0) for _ in range(terms)]
+
+    def render(prototype: np.ndarray) -> np.ndarray:
+        length = int(rng.integers(frames - window // 2, frames + window // 2))
+        indices = np.sort(rng.choice(frames, size=length, replace=True))
+        return _normalize(prototype[indices] + rng.standard_normal((length, 13)) * 0.25)
+
+    query = render(prototypes[0])
+    samples = [render(prototypes[idx % terms]) for idx in range(terms * samples_per_term)]
+    return query, samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Accuracy versus latency of approximate (coarse-to-fine) DTW.")
+    parser.add_argument("--frames", type=int, nargs="+", default=[120, 220])
+    parser.add_argument("--window", type=int, default=30)
+    parser.add_argument("--terms", type=int, default=100)
+    parser.add_argument("--samples-per-term", type=int, default=5)
+    parser.add_argument("--radius", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'frames':>6} {'pairs':>6} {'radius':>6} {'exact_ms':>9} {'approx_ms':>10} {'speedup':>8} "
+        f"{'mean_err':>9} {'p95_err':>9} {'max_err':>9} {'flips':>6}"
+    )
+    for frames in args.frames:
+        rng = np.random.default_rng(args.seed)
+        query, samples = _build_corpus(
+            rng,
+            frames=frames,
+            window=args.window,
+            terms=args.terms,
+            samples_per_term=args.samples_per_term,
+        )
+
+        started = time.perf_counter()
+        exact = dtw_distance_batch(query, samples, window=args.window)
+        exact_ms = (time.perf_counter() - started) * 1000.0
+        finite = np.isfinite(exact)
+
+        for radius in args.radius:
+            started = time.perf_counter()
+            approximate = fast_dtw_distance_batch(query, samples, window=args.window, radius=radius)
+            approx_ms = (time.perf_counter() - started) * 1000.0
+
+            relative = (approximate[finite] - exact[finite]) / exact[finite]
+            # Acceptance decisions that the approximation would change at the replacement cutoff.
+            flips = int(np.sum((exact <= MAX_ACCEPTED_DISTANCE) != (approximate <= MAX_ACCEPTED_DISTANCE)))
+            print(
+                f"{frames:>6} {len(samples):>6} {radius:>6} {exact_ms:>9.1f} {approx_ms:>10.1f} "
+                f"{exact_ms / approx_ms:>7.2f}x {relative.mean():>9.2e} {np.percentile(relative, 95):>9.2e} "
+                f"{relative.max():>9.2e} {flips:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
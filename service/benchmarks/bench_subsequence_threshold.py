@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import math
+
+import numpy as np
+
+from voice_text_organizer.dtw import subsequence_dtw_distance_batch
+from voice_text_organizer.mfcc import DEFAULT_MFCC_EXTRACTOR
+from voice_text_organizer.personalization import MAX_ACCEPTED_DISTANCE, MAX_SUBSEQUENCE_DISTANCE, _query_region
+
+SAMPLE_RATE = 16000
+FILLER_SECONDS = 2.0
+VOICE_TEXT = "filler words before the term and filler words after it"
+SPAN = "the term"
+
+
+def _word(rng: np.random.Generator) -> list[tuple[float, float]]:
+    return [tuple(rng.uniform(200.0, 3000.0, 2)) for _ in range(int(rng.integers(3, 6)))]
+
+
+def _render(word: list[tuple[float, float]], seconds: float, rng: np.random.Generator) -> np.ndarray:
+    per = seconds / len(word)
+    t = np.arange(int(per * SAMPLE_RATE), dtype=np.float64) / SAMPLE_RATE
+    pieces = [0.3 * np.sin(2.0 * math.pi * (start * t + (end - start) * t * t / (2.0 * per))) for start, end in word]
+    signal = np.concatenate(pieces)
+    return (signal + 0.02 * rng.standard_normal(signal.size)).astype(np.float32)
+
+
+def _distances(term_seconds: float, trials: int, rng: np.random.Generator) -> tuple[list[float], list[float]]:
+    matched: list[float] = []
+    unrelated: list[float] = []
+    for _ in range(trials):
+        word = _word(rng)
+        spoken = _render(word, term_seconds, rng)
+        recording = np.concatenate(
+            [_render(_word(rng), FILLER_SECONDS, rng), spoken, _render(_word(rng), FILLER_SECONDS, rng)]
+        )
+        query_frames = DEFAULT_MFCC_EXTRACTOR.compute_frames(recording, SAMPLE_RATE)
+        # Place the span where the text alignment would put the spoken term.
+        offset = int(len(VOICE_TEXT) * FILLER_SECONDS / (2.0 * FILLER_SECONDS + term_seconds))
+        voice_text = VOICE_TEXT[:offset] + SPAN + VOICE_TEXT[offset + len(SPAN) :]
+        for seconds, target in ((term_seconds * rng.uniform(0.9, 1.1), matched), (term_seconds, unrelated)):
+            source = word if target is matched else _word(rng)
+            sample = DEFAULT_MFCC_EXTRACTOR.compute(_render(source, seconds, rng), SAMPLE_RATE)
+            region = _query_region(voice_text, SPAN, query_frames, [sample], [int(seconds * 1000)])
+            target.append(float(subsequence_dtw_distance_batch(region, [sample])[0]))
+    return matched, unrelated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distance spread of matched and unrelated subsequence pairs.")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[0.8, 1.5, 3.0, 4.0])
+    parser.add_argument("--trials", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"threshold {MAX_SUBSEQUENCE_DISTANCE:.3f} (whole-query DTW uses {MAX_ACCEPTED_DISTANCE:.3f})")
+    print(
+        f"{'seconds':>8} {'match_p50':>10} {'match_p90':>10} {'rejected':>9} "
+        f"{'miss_min':>9} {'false_acc':>10} {'at_dtw_cut':>11}"
+    )
+    for seconds in args.seconds:
+        matched, unrelated = _distances(seconds, args.trials, rng)
+        hits = np.asarray(matched)
+        misses = np.asarray(unrelated)
+        print(
+            f"{seconds:>8.1f} {np.percentile(hits, 50):>10.3f} {np.percentile(hits, 90):>10.3f} "
+            f"{int((hits > MAX_SUBSEQUENCE_DISTANCE).sum()):>9} {misses.min():>9.3f} "
+            f"{int((misses <= MAX_SUBSEQUENCE_DISTANCE).sum()):>10} {int((misses <= MAX_ACCEPTED_DISTANCE).sum()):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
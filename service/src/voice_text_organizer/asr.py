@@ -1,37 +1,147 @@
 from __future__ import annotations
 
+import logging
+import wave
 from pathlib import Path
+from threading import Lock
 
 import httpx
 
+from voice_text_organizer.audio import RecordedAudio
+from voice_text_organizer.audio_codec import UPLOAD_ENCODERS
 from voice_text_organizer.config import Settings
+from voice_text_organizer.mfcc import read_wav_mono_pcm
+
+logger = logging.getLogger(__name__)
+
+# Transcription prompts are short context, not a dictionary; longer ones start to bleed into the text.
+ASR_PROMPT_MAX_CHARS = 240
+_PROMPT_REJECTION_STATUSES = (400, 422)
+_CODEC_REJECTION_STATUSES = (400, 415, 422)
+
+_prompt_rejected_urls: set[str] = set()
+_prompt_rejected_lock = Lock()
+_codec_rejected_urls: set[str] = set()
+_codec_rejected_lock = Lock()
 
 
 def normalize_asr_text(text: str) -> str:
     return " ".join(text.strip().split())
 
 
+def build_asr_prompt(hotwords: list[str], max_chars: int = ASR_PROMPT_MAX_CHARS) -> str:
+    # Keeps the caller's ranking and stops at the first term that would exceed the budget.
+    prompt = ""
+    for term in hotwords:
+        term = normalize_asr_text(term)
+        if not term:
+            continue
+        candidate = f"{prompt}, {term}" if prompt else term
+        if len(candidate) > max_chars:
+            break
+        prompt = candidate
+    return prompt
+
+
+def asr_prompt_rejected(url: str) -> bool:
+    return url in _prompt_rejected_urls
+
+
+def asr_codec_rejected(url: str) -> bool:
+    return url in _codec_rejected_urls
+
+
+def _encode_upload(audio: Path | RecordedAudio, settings: Settings) -> tuple[str, bytes, str] | None:
+    # (filename, body, content type) in the configured codec, or None to send the WAV as is.
+    encoder = UPLOAD_ENCODERS.get(settings.asr_upload_codec)
+    if encoder is None or asr_codec_rejected(settings.siliconflow_asr_url):
+        return None
+    try:
+        if isinstance(audio, RecordedAudio):
+            pcm, sample_rate, name = audio.pcm, audio.sample_rate, audio.name
+        else:
+            (pcm, sample_rate), name = read_wav_mono_pcm(audio), audio.name
+        return str(Path(name).with_suffix(encoder.suffix)), encoder.encode(pcm, sample_rate), encoder.content_type
+    except (ValueError, EOFError, OSError, wave.Error):
+        logger.warning("asr_upload_encode_failed codec=%s", encoder.name, exc_info=True)
+        return None
+
+
 def transcribe_with_siliconflow(
-    audio_path: str | Path,
+    audio: str | Path | RecordedAudio,
     settings: Settings,
     language: str = "auto",
+    hotwords: list[str] | None = None,
 ) -> str:
     if not settings.siliconflow_api_key:
         raise ValueError("Missing SILICONFLOW_API_KEY")
 
-    path = Path(audio_path)
+    source = audio if isinstance(audio, RecordedAudio) else Path(audio)
     data: dict[str, str] = {"model": settings.siliconflow_asr_model}
     if language != "auto":
         data["language"] = language
+    upload = _encode_upload(source, settings)
+    prompt = build_asr_prompt(hotwords) if hotwords else ""
+    if prompt and not asr_prompt_rejected(settings.siliconflow_asr_url):
+        response, upload = _post_with_codec_fallback(source, settings, {**data, "prompt": prompt}, upload)
+        if response.status_code not in _PROMPT_REJECTION_STATUSES:
+            response.raise_for_status()
+            return normalize_asr_text(response.json().get("text", ""))
+        response, _ = _post_with_codec_fallback(source, settings, data, upload)
+        if response.is_success:
+            # Only the prompt differed, so the model does not take one; send plain requests from now on.
+            with _prompt_rejected_lock:
+                _prompt_rejected_urls.add(settings.siliconflow_asr_url)
+    else:
+        response, _ = _post_with_codec_fallback(source, settings, data, upload)
+    response.raise_for_status()
+    payload = response.json()
+    return normalize_asr_text(payload.get("text", ""))
 
-    with path.open("rb") as audio_file:
-        response = httpx.post(
+
+def _post_with_codec_fallback(
+    source: Path | RecordedAudio,
+    settings: Settings,
+    data: dict[str, str],
+    upload: tuple[str, bytes, str] | None,
+) -> tuple[httpx.Response, tuple[str, bytes, str] | None]:
+    if upload is not None:
+        response = _post_audio(source, settings, data, upload)
+        if response.status_code not in _CODEC_REJECTION_STATUSES:
+            return response, upload
+        fallback = _post_audio(source, settings, data)
+        if fallback.status_code in _CODEC_REJECTION_STATUSES:
+            # WAV is refused too, so the request itself (e.g. its prompt) is the problem.
+            return fallback, upload
+        # The endpoint does not take this codec; remember that and upload WAV from now on.
+        with _codec_rejected_lock:
+            _codec_rejected_urls.add(settings.siliconflow_asr_url)
+        logger.info("asr_upload_codec_rejected codec=%s status=%d", settings.asr_upload_codec, response.status_code)
+        return fallback, None
+    return _post_audio(source, settings, data), None
+
+
+def _post_audio(
+    source: Path | RecordedAudio,
+    settings: Settings,
+    data: dict[str, str],
+    upload: tuple[str, bytes, str] | None = None,
+) -> httpx.Response:
+    if upload is not None or isinstance(source, RecordedAudio):
+        # In-memory recordings stream header plus PCM pieces instead of a joined WAV copy.
+        file = upload if upload is not None else (source.name, source.wav_stream(), "audio/wav")
+        return httpx.post(
             settings.siliconflow_asr_url,
             headers={"Authorization": f"Bearer {settings.siliconflow_api_key}"},
             data=data,
-            files={"file": (path.name, audio_file, "audio/wav")},
+            files={"file": file},
+            timeout=60.0,
+        )
+    with source.open("rb") as audio_file:
+        return httpx.post(
+            settings.siliconflow_asr_url,
+            headers={"Authorization": f"Bearer {settings.siliconflow_api_key}"},
+            data=data,
+            files={"file": (source.name, audio_file, "audio/wav")},
             timeout=60.0,
         )
-    response.raise_for_status()
-    payload = response.json()
-    return normalize_asr_text(payload.get("text", ""))
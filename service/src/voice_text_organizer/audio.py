@@ -1,16 +1,252 @@
 from __future__ import annotations
 
+import io
+import logging
+import struct
 import tempfile
 import wave
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from threading import Lock
+from threading import Event, Lock, Thread
+
+import numpy as np
+
+from voice_text_organizer.mfcc import read_wav_mono_pcm
+
+logger = logging.getLogger(__name__)
+
+# Capture buffer granularity. A chunk is allocated only when the previous one fills up, so the
+# audio callback allocates once per chunk rather than once per block, and nothing is ever regrown.
+CHUNK_SECONDS = 10
+# Streaming sessions keep at most SPILL_BUFFER_SECONDS of PCM in memory; the writer thread
+# appends it to the WAV file every SPILL_FLUSH_SECONDS and then frees the chunks it wrote.
+SPILL_CHUNK_SECONDS = 1
+SPILL_BUFFER_SECONDS = 4
+SPILL_FLUSH_SECONDS = 0.25
+
+
+def _wav_header(frames: int, sample_rate: int) -> bytes:
+    # Canonical 44-byte header of a mono 16-bit PCM WAV file.
+    data_size = frames * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+class _WavStream(io.RawIOBase):
+    # Read-only WAV file over the header and the PCM pieces in place, so an upload streams
+    # the recording without first building one contiguous copy of it.
+    def __init__(self, header: bytes, pieces: tuple[np.ndarray, ...]) -> None:
+        super().__init__()
+        self._parts = [memoryview(header)] + [memoryview(piece).cast("B") for piece in pieces]
+        self._size = sum(part.nbytes for part in self._parts)
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._offset
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._offset, io.SEEK_END: self._size}[whence]
+        self._offset = max(0, base + offset)
+        return self._offset
+
+    def readinto(self, buffer) -> int:
+        target = memoryview(buffer).cast("B")
+        filled = 0
+        part_start = 0
+        for part in self._parts:
+            part_end = part_start + part.nbytes
+            if filled < target.nbytes and self._offset < part_end:
+                position = self._offset - part_start
+                take = min(part.nbytes - position, target.nbytes - filled)
+                target[filled : filled + take] = part[position : position + take]
+                filled += take
+                self._offset += take
+            part_start = part_end
+        return filled
+
+
+@dataclass(frozen=True)
+class RecordedAudio:
+    # Mono int16 PCM handed between record-stop stages, as consecutive pieces (the capture
+    # buffer's chunk views). path is set only when the recording already lives on disk
+    # (streaming sessions); the caller then owns and removes that file.
+    chunks: tuple[np.ndarray, ...]
+    sample_rate: int
+    path: Path | None = None
+    name: str = "recording.wav"
+
+    def __post_init__(self) -> None:
+        # No-op for native little-endian int16 views; other input is converted once here.
+        object.__setattr__(
+            self, "chunks", tuple(np.ascontiguousarray(chunk, dtype="<i2").reshape(-1) for chunk in self.chunks)
+        )
+
+    @classmethod
+    def from_pcm(
+        cls, pcm: np.ndarray, sample_rate: int, *, path: Path | None = None, name: str = "recording.wav"
+    ) -> RecordedAudio:
+        return cls(chunks=(pcm,), sample_rate=sample_rate, path=path, name=name)
+
+    @classmethod
+    def from_wav(cls, path: Path) -> RecordedAudio:
+        pcm, sample_rate = read_wav_mono_pcm(path)
+        return cls.from_pcm(pcm, sample_rate, path=path, name=path.name)
+
+    @property
+    def frames(self) -> int:
+        return sum(chunk.size for chunk in self.chunks)
+
+    @cached_property
+    def pcm(self) -> np.ndarray:
+        # One contiguous array, built on first use by the stages that need it (VAD, MFCC, encoders).
+        return self.chunks[0] if len(self.chunks) == 1 else np.concatenate(self.chunks)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frames / float(self.sample_rate) if self.sample_rate > 0 else 0.0
+
+    def wav_stream(self) -> io.RawIOBase:
+        return _WavStream(_wav_header(self.frames, self.sample_rate), self.chunks)
+
+
+class _PcmBuffer:
+    def __init__(self, chunk_frames: int, channels: int, max_chunks: int | None = None) -> None:
+        self.chunk_frames = chunk_frames
+        self.channels = channels
+        # With max_chunks set, blocks that would need more live chunks are dropped instead.
+        self.max_chunks = max_chunks
+        self._chunks: dict[int, np.ndarray] = {0: np.empty((chunk_frames, channels), dtype=np.int16)}
+        # Released chunks are reused, so a streaming session stops allocating after warm-up.
+        self._spare: list[np.ndarray] = []
+        # Lowest chunk index that may still be live. Only release() raises it, after popping,
+        # so the audio callback reads a plain int and at worst overcounts live chunks.
+        self._first_chunk = 0
+        # Published after each block is fully copied; readers never look past it.
+        self._written = 0
+        self.frames_dropped = 0
+
+    @property
+    def frames_written(self) -> int:
+        return self._written
+
+    def append(self, block: np.ndarray) -> bool:
+        written = self._written
+        total = block.shape[0]
+        if total and self.max_chunks is not None:
+            needed = (written + total - 1) // self.chunk_frames + 1 - self._first_chunk
+            if needed > self.max_chunks:
+                self.frames_dropped += total
+                return False
+        offset = 0
+        while offset < total:
+            chunk_index, position = divmod(written, self.chunk_frames)
+            if chunk_index not in self._chunks:
+                self._chunks[chunk_index] = (
+                    self._spare.pop() if self._spare else np.empty((self.chunk_frames, self.channels), dtype=np.int16)
+                )
+            take = min(total - offset, self.chunk_frames - position)
+            self._chunks[chunk_index][position : position + take] = block[offset : offset + take]
+            offset += take
+            written += take
+        self._written = written
+        return True
+
+    def release(self, end: int) -> None:
+        # Frees every chunk that lies entirely before frame end.
+        first_live = end // self.chunk_frames
+        for chunk_index in range(self._first_chunk, first_live):
+            chunk = self._chunks.pop(chunk_index, None)
+            if chunk is not None:
+                self._spare.append(chunk)
+        self._first_chunk = max(self._first_chunk, first_live)
+
+    def views(self, start: int = 0, end: int | None = None) -> list[np.ndarray]:
+        # Zero-copy slices covering frames [start, end) in order.
+        end = self._written if end is None else min(end, self._written)
+        views: list[np.ndarray] = []
+        while start < end:
+            chunk_index, position = divmod(start, self.chunk_frames)
+            take = min(end - start, self.chunk_frames - position)
+            views.append(self._chunks[chunk_index][position : position + take])
+            start += take
+        return views
+
+
+class _WavSpillWriter:
+    def __init__(self, path: Path, buffer: _PcmBuffer, sample_rate: int) -> None:
+        self.path = path
+        self._buffer = buffer
+        self._flushed = 0
+        self._stop = Event()
+        self._wav = wave.open(str(path), "wb")
+        self._wav.setnchannels(buffer.channels)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+        self._thread = Thread(target=self._run, name="wav-spill-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def frames_flushed(self) -> int:
+        return self._flushed
+
+    def _flush(self) -> None:
+        end = self._buffer.frames_written
+        if end == self._flushed:
+            return
+        for view in self._buffer.views(self._flushed, end):
+            self._wav.writeframesraw(view)
+        # Rewrites the RIFF sizes, so the file on disk is a valid WAV after every flush.
+        self._wav.writeframes(b"")
+        self._flushed = end
+        self._buffer.release(end)
+
+    def _run(self) -> None:
+        while not self._stop.wait(SPILL_FLUSH_SECONDS):
+            self._flush()
+
+    def close(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        self._flush()
+        self._wav.close()
+        return self._flushed
 
 
 class _RecordingSession:
-    def __init__(self, sample_rate: int = 16000, channels: int = 1) -> None:
+    def __init__(self, sample_rate: int = 16000, channels: int = 1, spill_path: Path | None = None) -> None:
         self.sample_rate = sample_rate
         self.channels = channels
-        self._frames: list[bytes] = []
+        self._spill_path = spill_path
+        if spill_path is None:
+            self._buffer = _PcmBuffer(sample_rate * CHUNK_SECONDS, channels)
+        else:
+            self._buffer = _PcmBuffer(
+                sample_rate * SPILL_CHUNK_SECONDS,
+                channels,
+                max_chunks=SPILL_BUFFER_SECONDS // SPILL_CHUNK_SECONDS,
+            )
+        self._writer: _WavSpillWriter | None = None
         self._stream = None
 
     def start(self) -> None:
@@ -25,7 +261,7 @@ class _RecordingSession:
         def callback(indata, _frames, _time, status) -> None:
             if status:
                 return
-            self._frames.append(indata.copy().tobytes())
+            self._buffer.append(indata)
 
         self._stream = sd.InputStream(
             samplerate=self.sample_rate,
@@ -33,25 +269,55 @@ class _RecordingSession:
             dtype="int16",
             callback=callback,
         )
+        if self._spill_path is not None:
+            self._writer = _WavSpillWriter(self._spill_path, self._buffer, self.sample_rate)
         self._stream.start()
 
-    def stop_to_wav(self, path: Path) -> Path:
+    def stop(self) -> list[np.ndarray]:
+        self._stop_stream()
+        if self._buffer.frames_written == 0:
+            raise RuntimeError("no audio captured")
+        return self._buffer.views()
+
+    def _stop_stream(self) -> None:
         if self._stream is not None:
             self._stream.stop()
             self._stream.close()
-        if not self._frames:
-            raise RuntimeError("no audio captured")
+            self._stream = None
+
+    def stop_to_audio(self, path: Path) -> RecordedAudio:
+        if self._writer is not None:
+            return RecordedAudio.from_wav(self.stop_to_wav(path))
+        views = self.stop()
+        if self.channels > 1:
+            views = [view.mean(axis=1).astype(np.int16) for view in views]
+        return RecordedAudio(chunks=tuple(views), sample_rate=self.sample_rate, name=path.name)
 
+    def stop_to_wav(self, path: Path) -> Path:
+        if self._writer is not None:
+            self._stop_stream()
+            frames = self._writer.close()
+            if self._buffer.frames_dropped:
+                logger.warning("recording_frames_dropped frames=%s", self._buffer.frames_dropped)
+            if frames == 0:
+                self._writer.path.unlink(missing_ok=True)
+                raise RuntimeError("no audio captured")
+            if self._writer.path != path:
+                self._writer.path.replace(path)
+            return path
+        views = self.stop()
         with wave.open(str(path), "wb") as wav_file:
             wav_file.setnchannels(self.channels)
             wav_file.setsampwidth(2)
             wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(b"".join(self._frames))
+            for view in views:
+                wav_file.writeframesraw(view)
         return path
 
 
 class AudioRecorder:
-    def __init__(self, temp_dir: str | None = None) -> None:
+    def __init__(self, temp_dir: str | None = None, *, stream_to_disk: bool = False) -> None:
+        self._stream_to_disk = stream_to_disk
         self._lock = Lock()
         self._sessions: dict[str, _RecordingSession] = {}
         self._temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.gettempdir())
@@ -61,12 +327,20 @@ class AudioRecorder:
         with self._lock:
             if session_id in self._sessions:
                 raise RuntimeError("session already recording")
-            rec = _RecordingSession()
+            rec = _RecordingSession(spill_path=self._output_path(session_id) if self._stream_to_disk else None)
             self._sessions[session_id] = rec
         rec.start()
 
     def stop(self, session_id: str) -> Path:
         with self._lock:
             rec = self._sessions.pop(session_id)
-        output = self._temp_dir / f"{session_id}.wav"
-        return rec.stop_to_wav(output)
+        return rec.stop_to_wav(self._output_path(session_id))
+
+    def stop_audio(self, session_id: str) -> RecordedAudio:
+        # Like stop(), but in-memory sessions hand back their PCM without writing a file.
+        with self._lock:
+            rec = self._sessions.pop(session_id)
+        return rec.stop_to_audio(self._output_path(session_id))
+
+    def _output_path(self, session_id: str) -> Path:
+        return self._temp_dir / f"{session_id}.wav"
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+# Encodes 16-bit PCM as a standard FLAC stream: FIXED predictors (orders 0-4) with partitioned
+# Rice residuals, CONSTANT subframes for digital silence and VERBATIM when prediction does not pay.
+FLAC_BLOCK_SIZE = 4096
+MAX_FIXED_ORDER = 4
+MAX_PARTITION_ORDER = 6
+MAX_RICE_PARAMETER = 14
+BITS_PER_SAMPLE = 16
+
+_BLOCK_SIZE_CODES = {192: 1, 576: 2, 1152: 3, 2304: 4, 4608: 5, 256: 8, 512: 9, 1024: 10, 2048: 11, 4096: 12}
+_RICE_PARAMETERS = np.arange(MAX_RICE_PARAMETER + 1, dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class UploadEncoder:
+    name: str
+    content_type: str
+    suffix: str
+    encode: Callable[[np.ndarray, int], bytes]
+
+
+def _crc_table(poly: int, width: int, chunk_bits: int) -> list[int]:
+    top = 1 << (width - 1)
+    mask = (1 << width) - 1
+    table = []
+    for value in range(1 << chunk_bits):
+        crc = value << (width - chunk_bits)
+        for _ in range(chunk_bits):
+            crc = ((crc << 1) ^ poly) if crc & top else (crc << 1)
+        table.append(crc & mask)
+    return table
+
+
+_CRC8_TABLE = _crc_table(0x07, 8, 8)
+# CRC of each 16-bit word on its own. It is also the map that appends 16 zero bits to a message.
+_CRC16_WORD_TABLE = np.array(_crc_table(0x8005, 16, 16), dtype=np.uint16)
+
+
+def crc8(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc = _CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def _apply_linear(images: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # images[b] is where the GF(2)-linear map sends bit b; two byte-indexed tables apply it.
+    low = np.zeros(1, dtype=np.uint16)
+    for bit in range(8):
+        low = np.concatenate([low, low ^ images[bit]])
+    high = np.zeros(1, dtype=np.uint16)
+    for bit in range(8, 16):
+        high = np.concatenate([high, high ^ images[bit]])
+    return high[values >> 8] ^ low[values & 0xFF]
+
+
+def crc16_many(messages: list[bytes]) -> list[int]:
+    # FLAC's CRC-16 (poly 0x8005, init 0) without a per-byte Python loop. With init 0 leading
+    # zero bytes change nothing, so messages are left-padded to a common power-of-two word count,
+    # and crc(A + B) = shift(crc(A), len(B)) ^ crc(B) halves the words at every level.
+    if not messages:
+        return []
+    words = 1 << max(0, (max(len(message) for message in messages) + 1) // 2 - 1).bit_length()
+    padded = b"".join(bytes(2 * words - len(message)) + message for message in messages)
+    crcs = _CRC16_WORD_TABLE[np.frombuffer(padded, dtype=">u2").reshape(len(messages), words)]
+    shift = _CRC16_WORD_TABLE[1 << np.arange(16)]
+    while crcs.shape[1] > 1:
+        crcs = _apply_linear(shift, crcs[:, 0::2]) ^ crcs[:, 1::2]
+        shift = _apply_linear(shift, shift)
+    return crcs[:, 0].tolist()
+
+
+def crc16(data: bytes) -> int:
+    return crc16_many([data])[0]
+
+
+def _utf8_number(value: int) -> bytes:
+    if value < 0x80:
+        return bytes([value])
+    length = 2
+    while value >= 1 << (5 * length + 1):
+        length += 1
+    tail = [0x80 | ((value >> (6 * index)) & 0x3F) for index in reversed(range(length - 1))]
+    lead = ((0xFF << (8 - length)) & 0xFF) | (value >> (6 * (length - 1)))
+    return bytes([lead, *tail])
+
+
+class _BitWriter:
+    def __init__(self) -> None:
+        self._parts: list[np.ndarray] = []
+
+    def put(self, value: int, bits: int) -> None:
+        self.put_array(np.array([value], dtype=np.int64), bits)
+
+    def put_array(self, values: np.ndarray, bits: int) -> None:
+        # Two's complement for negatives, most significant bit first.
+        shifts = np.arange(bits - 1, -1, -1, dtype=np.int64)
+        self._parts.append(((values.astype(np.int64)[:, None] >> shifts) & 1).astype(np.uint8).ravel())
+
+    def put_rice(self, folded: np.ndarray, parameter: int) -> None:
+        quotients = folded >> parameter
+        lengths = quotients + 1 + parameter
+        starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        bits = np.zeros(int(lengths.sum()), dtype=np.uint8)
+        stops = starts + quotients
+        bits[stops] = 1
+        for index in range(parameter):
+            bits[stops + 1 + index] = (folded >> (parameter - 1 - index)) & 1
+        self._parts.append(bits)
+
+    def to_bytes(self) -> bytes:
+        bits = np.concatenate(self._parts) if self._parts else np.zeros(0, dtype=np.uint8)
+        return np.packbits(bits).tobytes()
+
+
+def _fixed_residual(block: np.ndarray, order: int) -> np.ndarray:
+    # FLAC's fixed predictors are exactly the order-th finite differences.
+    return np.diff(block, n=order) if order else block
+
+
+def _fold(residual: np.ndarray) -> np.ndarray:
+    return np.where(residual >= 0, residual << 1, ((-residual) << 1) - 1)
+
+
+def _rice_partitions(folded: np.ndarray, block_size: int, order: int) -> tuple[int, list[int], int]:
+    # Returns (partition order, per-partition parameters, residual bits) with the fewest bits.
+    best: tuple[int, list[int], int] | None = None
+    # Row i holds, per Rice parameter, the summed quotients of the first i residuals.
+    quotient_sums = np.zeros((folded.size + 1, _RICE_PARAMETERS.size), dtype=np.int64)
+    np.cumsum(folded[:, None] >> _RICE_PARAMETERS[None, :], axis=0, out=quotient_sums[1:])
+    for partition_order in range(MAX_PARTITION_ORDER + 1):
+        partitions = 1 << partition_order
+        if block_size % partitions or (block_size >> partition_order) <= order:
+            break
+        size = block_size >> partition_order
+        # The first partition is short by the warm-up samples.
+        bounds = np.maximum(np.arange(partitions) * size - order, 0)
+        ends = np.append(bounds[1:], folded.size)
+        costs = quotient_sums[ends] - quotient_sums[bounds] + (ends - bounds)[:, None] * (_RICE_PARAMETERS[None, :] + 1)
+        parameters = costs.argmin(axis=1)
+        total = int(costs[np.arange(partitions), parameters].sum()) + 4 * partitions
+        if best is None or total < best[2]:
+            best = (partition_order, parameters.tolist(), total)
+    assert best is not None
+    return best
+
+
+def _write_subframe(writer: _BitWriter, block: np.ndarray) -> None:
+    if np.all(block == block[0]):
+        writer.put(0b00000000, 8)
+        writer.put(int(block[0]), BITS_PER_SAMPLE)
+        return
+
+    best: tuple[int, np.ndarray] | None = None
+    for order in range(min(MAX_FIXED_ORDER, block.size - 1) + 1):
+        residual = _fixed_residual(block, order)
+        if best is None or np.abs(residual).sum() < np.abs(best[1]).sum():
+            best = (order, residual)
+    assert best is not None
+    order, residual = best
+    folded = _fold(residual)
+    partition_order, parameters, residual_bits = _rice_partitions(folded, block.size, order)
+    if order * BITS_PER_SAMPLE + 6 + residual_bits >= block.size * BITS_PER_SAMPLE:
+        writer.put(0b00000010, 8)
+        writer.put_array(block, BITS_PER_SAMPLE)
+        return
+
+    writer.put(0b00010000 | (order << 1), 8)
+    writer.put_array(block[:order], BITS_PER_SAMPLE)
+    writer.put(0, 2)
+    writer.put(partition_order, 4)
+    size = block.size >> partition_order
+    start = 0
+    for index, parameter in enumerate(parameters):
+        end = (index + 1) * size - order
+        writer.put(parameter, 4)
+        writer.put_rice(folded[start:end], parameter)
+        start = end
+
+
+def _encode_frame_body(block: np.ndarray, frame_number: int) -> bytes:
+    size_code = _BLOCK_SIZE_CODES.get(block.size, 0b0111)
+    header = bytearray(struct.pack(">HBB", 0xFFF8, size_code << 4, 0b00001000))
+    header += _utf8_number(frame_number)
+    if size_code == 0b0111:
+        header += struct.pack(">H", block.size - 1)
+    header.append(crc8(bytes(header)))
+
+    writer = _BitWriter()
+    _write_subframe(writer, block)
+    return bytes(header) + writer.to_bytes()
+
+
+def encode_flac(pcm: np.ndarray, sample_rate: int) -> bytes:
+    # Mono 16-bit only; that is what the recorder produces.
+    if pcm.ndim != 1 or pcm.size == 0:
+        raise ValueError("flac encoding needs non-empty mono pcm")
+    samples = pcm.astype(np.int64)
+    bodies = [
+        _encode_frame_body(samples[start : start + FLAC_BLOCK_SIZE], index)
+        for index, start in enumerate(range(0, samples.size, FLAC_BLOCK_SIZE))
+    ]
+    frames = [body + struct.pack(">H", crc) for body, crc in zip(bodies, crc16_many(bodies))]
+    block_size = min(FLAC_BLOCK_SIZE, samples.size)
+    frame_sizes = [len(frame) for frame in frames]
+    streaminfo = (
+        struct.pack(">HH", block_size, block_size)
+        + min(frame_sizes).to_bytes(3, "big")
+        + max(frame_sizes).to_bytes(3, "big")
+        + ((sample_rate << 44) | ((BITS_PER_SAMPLE - 1) << 36) | samples.size).to_bytes(8, "big")
+        + hashlib.md5(pcm.astype("<i2").tobytes()).digest()
+    )
+    return b"fLaC" + bytes([0x80, 0, 0, len(streaminfo)]) + streaminfo + b"".join(frames)
+
+
+class _BitReader:
+    def __init__(self, data: bytes) -> None:
+        self._bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        self._ones = np.flatnonzero(self._bits)
+        self.position = 0
+
+    def read(self, bits: int) -> int:
+        chunk = self._bits[self.position : self.position + bits]
+        if chunk.size != bits:
+            raise ValueError("truncated flac stream")
+        self.position += bits
+        return int(chunk.dot(1 << np.arange(bits - 1, -1, -1, dtype=np.int64))) if bits else 0
+
+    def read_signed(self, bits: int) -> int:
+        value = self.read(bits)
+        return value - (1 << bits) if value >> (bits - 1) else value
+
+    def read_rice(self, count: int, parameter: int) -> np.ndarray:
+        values = np.empty(count, dtype=np.int64)
+        for index in range(count):
+            stop = int(self._ones[np.searchsorted(self._ones, self.position)])
+            quotient = stop - self.position
+            self.position = stop + 1
+            values[index] = (quotient << parameter) | self.read(parameter)
+        return values
+
+    def align(self) -> None:
+        self.position = -(-self.position // 8) * 8
+
+
+def decode_flac(data: bytes) -> tuple[np.ndarray, int]:
+    # Reference decoder for what encode_flac writes (mono, 16-bit, fixed/constant/verbatim
+    # subframes), used to check the round trip. It reads Rice codes one at a time, so it is slow.
+    if data[:4] != b"fLaC" or data[4] & 0x7F != 0:
+        raise ValueError("not a flac stream")
+    info = int.from_bytes(data[18:26], "big")
+    sample_rate, total = info >> 44, info & ((1 << 36) - 1)
+    reader = _BitReader(data[8 + (int.from_bytes(data[5:8], "big")) :])
+    samples: list[np.ndarray] = []
+    decoded = 0
+    while decoded < total:
+        if reader.read(16) != 0xFFF8:
+            raise ValueError("lost flac frame sync")
+        size_code = reader.read(4)
+        reader.read(12)
+        lead = reader.read(8)
+        reader.read(8 * (max(1, 8 - (lead ^ 0xFF).bit_length()) - 1))
+        if size_code == 0b0111:
+            block_size = reader.read(16) + 1
+        else:
+            block_size = {code: size for size, code in _BLOCK_SIZE_CODES.items()}[size_code]
+        reader.read(8)
+
+        reader.read(1)
+        kind = reader.read(6)
+        reader.read(1)
+        if kind == 0:
+            block = np.full(block_size, reader.read_signed(BITS_PER_SAMPLE), dtype=np.int64)
+        elif kind == 1:
+            block = np.array([reader.read_signed(BITS_PER_SAMPLE) for _ in range(block_size)], dtype=np.int64)
+        elif kind & 0b111000 == 0b001000:
+            order = kind & 0b111
+            warmup = [reader.read_signed(BITS_PER_SAMPLE) for _ in range(order)]
+            reader.read(2)
+            partition_order = reader.read(4)
+            folded: list[np.ndarray] = []
+            for index in range(1 << partition_order):
+                count = (block_size >> partition_order) - (order if index == 0 else 0)
+                folded.append(reader.read_rice(count, reader.read(4)))
+            unfolded = np.concatenate(folded)
+            residual = np.where(unfolded & 1, -((unfolded + 1) >> 1), unfolded >> 1)
+            # Undo the finite differences one order at a time.
+            for level in range(order, 0, -1):
+                seeds = np.diff(np.array(warmup, dtype=np.int64), n=level - 1)
+                residual = np.concatenate([[seeds[0]], seeds[0] + np.cumsum(residual)])
+            block = residual
+        else:
+            raise ValueError(f"unsupported flac subframe type: {kind}")
+        reader.align()
+        reader.read(16)
+        samples.append(block)
+        decoded += block_size
+    return np.concatenate(samples).astype(np.int16), sample_rate
+
+
+UPLOAD_ENCODERS: dict[str, UploadEncoder] = {
+    "flac": UploadEncoder(name="flac", content_type="audio/flac", suffix=".flac", encode=encode_flac),
+}
@@ -11,6 +11,14 @@ class Settings(BaseModel):
     update_channel: Literal["stable", "beta"] = "stable"
     auto_template_confidence_threshold: float = Field(default=0.72, ge=0.0, le=1.0)
     personalized_acoustic_enabled: bool = True
+    dtw_worker_processes: int = Field(default=0, ge=0)
+    fingerprint_encoding: Literal["float32", "float16", "int8"] = "float32"
+    fingerprint_pca_components: int = Field(default=0, ge=0, le=12)
+    asr_term_hints: int = Field(default=0, ge=0, le=100)
+    defer_sample_fingerprints: bool = False
+    stream_recordings_to_disk: bool = False
+    vad_trim_enabled: bool = False
+    asr_upload_codec: Literal["wav", "flac"] = "wav"
     fallback_to_local_on_cloud_error: bool = True
     siliconflow_base_url: str = "https://api.siliconflow.cn/v1/chat/completions"
     siliconflow_model: str = "deepseek-ai/DeepSeek-V3"
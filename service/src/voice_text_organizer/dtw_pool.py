@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import numpy as np
+
+from voice_text_organizer.dtw import QueryEnvelope
+from voice_text_organizer.fingerprint_arena import FingerprintArena, arena_index_stamp
+from voice_text_organizer.personalization import DtwMode, EnhanceStats, _best_sample_distance
+
+_worker_arena_dir: Path | None = None
+_worker_samples: dict[str, tuple[tuple[int, int, int] | None, dict[int, tuple[str, np.ndarray]]]] = {}
+
+
+def _worker_matrices(profile_id: str, sample_ids: list[int]) -> list[np.ndarray]:
+    if _worker_arena_dir is None:
+        return []
+    # Remap whenever the index changed, not only when an id is missing: a recomputed sample
+    # keeps its id but its rows move to the end of the arena.
+    stamp = arena_index_stamp(_worker_arena_dir, profile_id)
+    cached = _worker_samples.get(profile_id)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, FingerprintArena(_worker_arena_dir, profile_id).matrices())
+        _worker_samples[profile_id] = cached
+    samples = cached[1]
+    return [samples[sample_id][1] for sample_id in sample_ids if sample_id in samples]
+
+
+def _init_worker(arena_dir: str, profile_ids: tuple[str, ...]) -> None:
+    global _worker_arena_dir
+    _worker_arena_dir = Path(arena_dir)
+    for profile_id in profile_ids:
+        _worker_matrices(profile_id, [])
+
+
+def _score_term(
+    profile_id: str,
+    sample_ids: list[int],
+    query_matrix: np.ndarray,
+    envelope: QueryEnvelope | None,
+    dtw_mode: DtwMode,
+    deadline: float,
+) -> tuple[float, EnhanceStats]:
+    # Running tasks cannot be cancelled, so a worker stops itself at the request's deadline
+    # instead of holding up the next request's terms.
+    stats = EnhanceStats()
+    matrices = _worker_matrices(profile_id, sample_ids)
+    if not matrices:
+        return float("inf"), stats
+    return _best_sample_distance(query_matrix, envelope, matrices, stats, dtw_mode, deadline), stats
+
+
+class DtwProcessPool:
+    def __init__(self, arena_dir: Path, profile_id: str, *, workers: int) -> None:
+        self.profile_id = profile_id
+        self._arena_dir = arena_dir
+        self._workers = max(1, workers)
+        self._executor = self._start_executor()
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_worker,
+            initargs=(str(self._arena_dir), (self.profile_id,)),
+        )
+
+    def best_distances(
+        self,
+        query_matrix: np.ndarray | None,
+        envelope: QueryEnvelope | None,
+        term_sample_ids: dict[str, list[int]],
+        *,
+        timeout_ms: float,
+        stats: EnhanceStats,
+        dtw_mode: DtwMode = "exact",
+        term_queries: dict[str, np.ndarray] | None = None,
+    ) -> dict[str, float]:
+        try:
+            return self._best_distances(
+                query_matrix, envelope, term_sample_ids, timeout_ms, stats, dtw_mode, term_queries or {}
+            )
+        except BrokenProcessPool:
+            # A crashed worker poisons the executor; replace it so the next request can use the pool again.
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._start_executor()
+            raise
+
+    def _best_distances(
+        self,
+        query_matrix: np.ndarray | None,
+        envelope: QueryEnvelope | None,
+        term_sample_ids: dict[str, list[int]],
+        timeout_ms: float,
+        stats: EnhanceStats,
+        dtw_mode: DtwMode,
+        term_queries: dict[str, np.ndarray],
+    ) -> dict[str, float]:
+        # Subsequence mode sends each term its own audio region instead of the shared query.
+        deadline = time.monotonic() + max(0.0, timeout_ms) / 1000.0
+        pending: dict[Future[tuple[float, EnhanceStats]], str] = {}
+        for term, sample_ids in term_sample_ids.items():
+            query = term_queries.get(term, query_matrix)
+            if query is None:
+                continue
+            future = self._executor.submit(
+                _score_term, self.profile_id, sample_ids, query, envelope, dtw_mode, deadline
+            )
+            pending[future] = term
+
+        # Terms still pending at the deadline are dropped; the caller keeps whatever finished.
+        results: dict[str, float] = {}
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                term = pending.pop(future)
+                distance, term_stats = future.result()
+                stats.timed_out = stats.timed_out or term_stats.timed_out
+                if not term_stats.timed_out:
+                    # A term cut short by the deadline has no trustworthy best distance.
+                    results[term] = distance
+                stats.pruned_pairs += term_stats.pruned_pairs
+                stats.abandoned_pairs += term_stats.abandoned_pairs
+                stats.scored_pairs += term_stats.scored_pairs
+
+        if pending:
+            stats.timed_out = True
+            for future in pending:
+                future.cancel()
+        return results
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+EMBEDDING_SEGMENTS = 4
+# Query windows slide over the audio region in steps of this many frames.
+WINDOW_STRIDE = 4
+
+
+@dataclass(frozen=True)
+class SampleEmbeddings:
+    matrix: np.ndarray
+    rows: dict[str, np.ndarray]
+
+
+def _prefix_sums(values: np.ndarray) -> np.ndarray:
+    return np.concatenate([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+
+
+def embed_windows(frames: np.ndarray, window: int, starts: Sequence[int] | np.ndarray) -> np.ndarray:
+    # Per window: the mean of each of EMBEDDING_SEGMENTS equal slices (a coarse trajectory)
+    # plus the spread of the frame-to-frame deltas, L2-normalized so dot products are cosines.
+    if frames.ndim != 2:
+        raise ValueError("embedding inputs must be 2D arrays")
+    values = frames.astype(np.float64)
+    if values.shape[0] < EMBEDDING_SEGMENTS + 1:
+        values = np.pad(values, ((0, EMBEDDING_SEGMENTS + 1 - values.shape[0]), (0, 0)), mode="edge")
+    window = max(EMBEDDING_SEGMENTS + 1, min(int(window), values.shape[0]))
+    starts = np.clip(np.asarray(starts, dtype=np.int64), 0, values.shape[0] - window)
+
+    sums = _prefix_sums(values)
+    bounds = (np.arange(EMBEDDING_SEGMENTS + 1) * window) // EMBEDDING_SEGMENTS
+    lower = starts[:, None] + bounds[None, :-1]
+    upper = starts[:, None] + bounds[None, 1:]
+    segments = (sums[upper] - sums[lower]) / (upper - lower)[..., None]
+
+    deltas = np.diff(values, axis=0)
+    delta_sums = _prefix_sums(deltas)
+    delta_squares = _prefix_sums(deltas * deltas)
+    ends = starts + window - 1
+    delta_mean = (delta_sums[ends] - delta_sums[starts]) / (window - 1)
+    delta_var = (delta_squares[ends] - delta_squares[starts]) / (window - 1) - delta_mean * delta_mean
+    delta_std = np.sqrt(np.maximum(delta_var, 0.0))
+
+    embedded = np.concatenate([segments.reshape(len(starts), -1), delta_std], axis=1)
+    norms = np.linalg.norm(embedded, axis=1, keepdims=True)
+    return (embedded / np.where(norms < 1e-12, 1.0, norms)).astype(np.float32)
+
+
+def embed_fingerprint(matrix: np.ndarray) -> np.ndarray:
+    return embed_windows(matrix, matrix.shape[0], [0])[0]
+
+
+def embed_query_windows(frames: np.ndarray, window: int) -> np.ndarray:
+    last = max(0, frames.shape[0] - window)
+    starts = np.arange(0, last + 1, WINDOW_STRIDE)
+    if starts[-1] != last:
+        starts = np.append(starts, last)
+    return embed_windows(frames, window, starts)
+
+
+def build_sample_embeddings(
+    sample_lookup: Mapping[str, Sequence[np.ndarray]],
+    vectors: Mapping[str, Sequence[np.ndarray]] | None = None,
+) -> SampleEmbeddings:
+    # One contiguous row per sample; rows[term] follows the order of sample_lookup[term].
+    rows: dict[str, np.ndarray] = {}
+    stacked: list[np.ndarray] = []
+    for term, matrices in sample_lookup.items():
+        term_vectors = vectors.get(term) if vectors is not None else None
+        if term_vectors is None or len(term_vectors) != len(matrices):
+            term_vectors = [embed_fingerprint(matrix) for matrix in matrices]
+        rows[term] = np.arange(len(stacked), len(stacked) + len(term_vectors), dtype=np.int64)
+        stacked.extend(term_vectors)
+
+    if not stacked:
+        return SampleEmbeddings(matrix=np.zeros((0, 0), dtype=np.float32), rows=rows)
+    return SampleEmbeddings(matrix=np.ascontiguousarray(np.stack(stacked), dtype=np.float32), rows=rows)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+ARENA_DTYPE = np.dtype("<f4")
+# Compact once dead rows outnumber live ones, but never for tiny arenas.
+MIN_COMPACT_ROWS = 4096
+
+
+def _arena_stem(profile_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "_", profile_id) or "profile"
+
+
+def arena_index_stamp(directory: Path, profile_id: str) -> tuple[int, int, int] | None:
+    # Every arena write replaces the index file, so its identity changes with each append,
+    # removal or compaction. Readers compare stamps to know when their mapping is stale.
+    try:
+        stat = (directory / f"{_arena_stem(profile_id)}.json").stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class ArenaEntry:
+    term: str
+    offset: int
+    frames: int
+
+
+class FingerprintArena:
+    def __init__(self, directory: Path, profile_id: str) -> None:
+        self._directory = directory
+        self._stem = _arena_stem(profile_id)
+        self._entries: dict[int, ArenaEntry] = {}
+        self._dim = 0
+        self._rows = 0
+        self._generation = 0
+        self._data: np.memmap | None = None
+        self._load()
+
+    @property
+    def _index_path(self) -> Path:
+        return self._directory / f"{self._stem}.json"
+
+    @property
+    def _lock_path(self) -> Path:
+        return self._directory / f"{self._stem}.lock"
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        # Every write re-reads the index under this file lock, so several stores (or processes)
+        # sharing the directory append after each other's rows instead of over them.
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with self._lock_path.open("a+b") as handle:
+            if os.name == "nt":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                self._load()
+                yield
+            finally:
+                if os.name == "nt":
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _data_path(self, generation: int) -> Path:
+        return self._directory / f"{self._stem}-{generation}.f32"
+
+    def _load(self) -> None:
+        # An index that is missing or does not fit its data file leaves the arena empty; callers
+        # re-append whatever term_samples still needs.
+        self._entries = {}
+        self._dim = 0
+        self._rows = 0
+        self._data = None
+        try:
+            payload = json.loads(self._index_path.read_text(encoding="utf-8"))
+            dim = int(payload["dim"])
+            rows = int(payload["rows"])
+            generation = int(payload["generation"])
+            entries = {
+                int(item["id"]): ArenaEntry(str(item["term"]), int(item["offset"]), int(item["frames"]))
+                for item in payload["samples"]
+            }
+            data_size = self._data_path(generation).stat().st_size if rows else 0
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        self._generation = max(self._generation, generation)
+        if data_size < rows * dim * ARENA_DTYPE.itemsize:
+            return
+        if any(entry.offset < 0 or entry.offset + entry.frames > rows for entry in entries.values()):
+            return
+
+        self._dim = dim
+        self._rows = rows
+        self._generation = generation
+        self._entries = entries
+        self._remap()
+
+    def _remap(self) -> None:
+        if self._rows == 0:
+            self._data = None
+            return
+        self._data = np.memmap(
+            self._data_path(self._generation),
+            dtype=ARENA_DTYPE,
+            mode="r",
+            shape=(self._rows, self._dim),
+        )
+
+    def _write_index(self) -> None:
+        payload = {
+            "dim": self._dim,
+            "rows": self._rows,
+            "generation": self._generation,
+            "samples": [
+                {"id": sample_id, "term": entry.term, "offset": entry.offset, "frames": entry.frames}
+                for sample_id, entry in self._entries.items()
+            ],
+        }
+        temp_path = self._index_path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+        os.replace(temp_path, self._index_path)
+
+    def _remove_stale_data_files(self) -> None:
+        current = self._data_path(self._generation)
+        for path in self._directory.glob(f"{self._stem}-*.f32"):
+            if path == current:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Still mapped by an older view on Windows; retried after the next compaction.
+                continue
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    def sample_ids(self) -> set[int]:
+        return set(self._entries)
+
+    def matrices(self) -> dict[int, tuple[str, np.ndarray]]:
+        if self._data is None:
+            return {}
+        return {
+            sample_id: (entry.term, self._data[entry.offset : entry.offset + entry.frames])
+            for sample_id, entry in self._entries.items()
+        }
+
+    def append(self, samples: list[tuple[int, str, np.ndarray]]) -> dict[int, tuple[str, np.ndarray]]:
+        with self._exclusive():
+            accepted: list[tuple[int, str, np.ndarray]] = []
+            for sample_id, term, matrix in samples:
+                matrix = np.ascontiguousarray(matrix, dtype=ARENA_DTYPE)
+                if matrix.ndim != 2 or matrix.shape[0] == 0:
+                    continue
+                if self._dim == 0:
+                    self._dim = int(matrix.shape[1])
+                if matrix.shape[1] != self._dim:
+                    continue
+                accepted.append((sample_id, term, matrix))
+            if not accepted:
+                return {}
+
+            data_path = self._data_path(self._generation)
+            indexed_size = self._rows * self._dim * ARENA_DTYPE.itemsize
+            with data_path.open("r+b" if data_path.exists() else "w+b") as handle:
+                # The index was just re-read under the lock, so bytes past it can only be left
+                # over from an interrupted append.
+                if handle.seek(0, os.SEEK_END) > indexed_size:
+                    handle.truncate(indexed_size)
+                handle.seek(indexed_size)
+                for sample_id, term, matrix in accepted:
+                    handle.write(matrix.tobytes())
+                    self._entries[sample_id] = ArenaEntry(term, self._rows, int(matrix.shape[0]))
+                    self._rows += int(matrix.shape[0])
+            self._write_index()
+            self._remap()
+
+        matrices = self.matrices()
+        return {sample_id: matrices[sample_id] for sample_id, _, _ in accepted}
+
+    def remove(self, sample_ids: set[int]) -> None:
+        if not sample_ids & set(self._entries):
+            return
+        with self._exclusive():
+            removed = [sample_id for sample_id in sample_ids if sample_id in self._entries]
+            for sample_id in removed:
+                del self._entries[sample_id]
+
+            live_rows = sum(entry.frames for entry in self._entries.values())
+            if self._rows >= MIN_COMPACT_ROWS and self._rows - live_rows > live_rows:
+                self._compact()
+                return
+            if removed:
+                self._write_index()
+
+    def clear(self) -> None:
+        # Starts a new, empty generation, so the next append may use another matrix width.
+        with self._exclusive():
+            self._entries = {}
+            self._compact()
+
+    def _compact(self) -> None:
+        live = self.matrices()
+        generation = self._generation + 1
+        entries: dict[int, ArenaEntry] = {}
+        rows = 0
+        with self._data_path(generation).open("wb") as handle:
+            for sample_id, (term, matrix) in live.items():
+                handle.write(np.ascontiguousarray(matrix).tobytes())
+                entries[sample_id] = ArenaEntry(term, rows, int(matrix.shape[0]))
+                rows += int(matrix.shape[0])
+
+        self._generation = generation
+        self._entries = entries
+        self._rows = rows
+        if not entries:
+            self._dim = 0
+        self._write_index()
+        self._remap()
+        self._remove_stale_data_files()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import io
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+# Stored in term_samples.fingerprint_format; rows written before the column existed default to 1.
+# Pending rows hold an empty blob until a background worker fills in the fingerprint.
+FINGERPRINT_FORMAT_PENDING = 0
+FINGERPRINT_FORMAT_NPY = 1
+FINGERPRINT_FORMAT_COMPACT = 2
+FingerprintEncoding = Literal["float32", "float16", "int8"]
+FINGERPRINT_ENCODINGS = ("float32", "float16", "int8")
+# A basis fitted on fewer frames than this would mostly describe noise.
+MIN_PCA_FIT_FRAMES = 200
+
+_HEADER = struct.Struct("<BBHH")
+_DTYPE_CODES = {"float16": 1, "int8": 2}
+_DTYPE_NAMES = {code: name for name, code in _DTYPE_CODES.items()}
+
+
+@dataclass(frozen=True)
+class PcaBasis:
+    mean: np.ndarray
+    components: np.ndarray
+
+    def project(self, matrix: np.ndarray) -> np.ndarray:
+        return ((matrix.astype(np.float64) - self.mean) @ self.components.T).astype(np.float32)
+
+    def reconstruct(self, coefficients: np.ndarray) -> np.ndarray:
+        return (coefficients.astype(np.float64) @ self.components + self.mean).astype(np.float32)
+
+    def reduce(self, matrix: np.ndarray) -> np.ndarray:
+        # Coefficients plus each frame's distance from the basis subspace. A stored projection
+        # has no such residual, so frame distances in this space equal those to its reconstruction.
+        centered = matrix.astype(np.float64) - self.mean
+        coefficients = centered @ self.components.T
+        residual = np.linalg.norm(centered - coefficients @ self.components, axis=1, keepdims=True)
+        return np.hstack([coefficients, residual]).astype(np.float32)
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, np.vstack([self.mean[None, :], self.components]).astype(np.float64), allow_pickle=False)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> PcaBasis:
+        stacked = np.load(io.BytesIO(blob), allow_pickle=False)
+        return cls(mean=stacked[0], components=stacked[1:])
+
+
+def fit_pca_basis(matrices: Sequence[np.ndarray], components: int) -> PcaBasis | None:
+    frames = np.concatenate([matrix.astype(np.float64) for matrix in matrices if matrix.ndim == 2], axis=0)
+    if frames.shape[0] < MIN_PCA_FIT_FRAMES or components <= 0 or components >= frames.shape[1]:
+        return None
+    mean = frames.mean(axis=0)
+    _, _, vt = np.linalg.svd(frames - mean, full_matrices=False)
+    return PcaBasis(mean=mean, components=vt[:components])
+
+
+def encode_compact_fingerprint(
+    matrix: np.ndarray,
+    encoding: FingerprintEncoding,
+    basis: PcaBasis | None = None,
+) -> bytes:
+    if encoding not in _DTYPE_CODES:
+        raise ValueError(f"unsupported compact fingerprint encoding: {encoding}")
+    values = basis.project(matrix) if basis is not None else matrix.astype(np.float32)
+    header = _HEADER.pack(_DTYPE_CODES[encoding], basis is not None, values.shape[0], values.shape[1])
+    if encoding == "float16":
+        return header + values.astype("<f2").tobytes()
+
+    # Symmetric per-column scale so every coefficient uses the full int8 range.
+    peaks = np.abs(values).max(axis=0) if values.size else np.zeros(values.shape[1], dtype=np.float32)
+    scales = np.where(peaks > 0, peaks / 127.0, 1.0).astype("<f4")
+    quantized = np.clip(np.rint(values / scales), -127, 127).astype(np.int8)
+    return header + scales.tobytes() + quantized.tobytes()
+
+
+def _decode_compact_values(blob: bytes) -> tuple[np.ndarray, bool]:
+    if len(blob) < _HEADER.size:
+        raise ValueError("truncated fingerprint")
+    dtype_code, projected, frames, dims = _HEADER.unpack_from(blob)
+    encoding = _DTYPE_NAMES.get(dtype_code)
+    body = memoryview(blob)[_HEADER.size :]
+    if encoding == "float16":
+        if len(body) != frames * dims * 2:
+            raise ValueError("truncated fingerprint")
+        values = np.frombuffer(body, dtype="<f2").reshape(frames, dims).astype(np.float32)
+    elif encoding == "int8":
+        if len(body) != dims * 4 + frames * dims:
+            raise ValueError("truncated fingerprint")
+        scales = np.frombuffer(body[: dims * 4], dtype="<f4")
+        values = np.frombuffer(body[dims * 4 :], dtype=np.int8).reshape(frames, dims) * scales
+    else:
+        raise ValueError(f"unknown fingerprint encoding code: {dtype_code}")
+    return values.astype(np.float32, copy=False), bool(projected)
+
+
+def decode_fingerprint(blob: bytes, format_version: int, basis: PcaBasis | None = None) -> np.ndarray:
+    if format_version == FINGERPRINT_FORMAT_NPY:
+        return np.load(io.BytesIO(blob), allow_pickle=False).astype(np.float32)
+    if format_version != FINGERPRINT_FORMAT_COMPACT:
+        raise ValueError(f"unknown fingerprint format: {format_version}")
+
+    values, projected = _decode_compact_values(blob)
+    if not projected:
+        return values
+    if basis is None or basis.components.shape[0] != values.shape[1]:
+        raise ValueError("fingerprint needs the profile's pca basis")
+    return basis.reconstruct(values)
+
+
+def decode_reduced_fingerprint(blob: bytes, format_version: int, basis: PcaBasis) -> np.ndarray:
+    # The matrix DTW runs on in a profile with a basis. Projected rows are never reconstructed;
+    # older full-width rows are reduced, keeping only the size of their residual.
+    if format_version == FINGERPRINT_FORMAT_COMPACT:
+        values, projected = _decode_compact_values(blob)
+        if projected:
+            if basis.components.shape[0] != values.shape[1]:
+                raise ValueError("fingerprint needs the profile's pca basis")
+            return np.hstack([values, np.zeros((values.shape[0], 1), dtype=np.float32)])
+        return basis.reduce(values)
+    return basis.reduce(decode_fingerprint(blob, format_version))
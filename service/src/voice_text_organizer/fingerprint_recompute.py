@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+import wave
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Literal
+
+from voice_text_organizer.personalization import build_mfcc_fingerprint_bytes
+
+if TYPE_CHECKING:
+    from voice_text_organizer.history_store import HistoryStore
+
+logger = logging.getLogger(__name__)
+
+RECOMPUTE_BATCH_SIZE = 8
+# Pause after every batch so the job never holds the store lock or the CPU for long stretches.
+RECOMPUTE_BATCH_PAUSE_SECONDS = 0.05
+BUSY_POLL_SECONDS = 0.05
+WORKER_NICENESS = 10
+
+RecomputeState = Literal["idle", "running", "done", "failed"]
+
+
+@dataclass(frozen=True)
+class RecomputeProgress:
+    state: RecomputeState = "idle"
+    total: int = 0
+    processed: int = 0
+    updated: int = 0
+    failed: int = 0
+
+
+def _lower_worker_priority() -> None:
+    if hasattr(os, "nice"):
+        try:
+            os.nice(WORKER_NICENESS)
+        except OSError:
+            pass
+
+
+def _fingerprint_or_none(audio_path: str) -> bytes | None:
+    try:
+        return build_mfcc_fingerprint_bytes(audio_path)
+    except (ValueError, EOFError, OSError, wave.Error):
+        return None
+
+
+class FingerprintRecomputeJob:
+    def __init__(
+        self,
+        store: HistoryStore,
+        profile_id: str,
+        *,
+        workers: int,
+        busy: Callable[[], bool] = lambda: False,
+    ) -> None:
+        self._store = store
+        self._profile_id = profile_id
+        self._workers = max(1, workers)
+        # Polled before each batch; the job waits while interactive requests are in flight.
+        self._busy = busy
+        self._lock = Lock()
+        self._progress = RecomputeProgress()
+        self._thread: Thread | None = None
+
+    def progress(self) -> RecomputeProgress:
+        with self._lock:
+            return self._progress
+
+    def start(self) -> RecomputeProgress:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self._progress
+            stale = self._store.list_stale_term_samples(self._profile_id)
+            self._progress = RecomputeProgress(state="running" if stale else "done", total=len(stale))
+            if stale:
+                self._thread = Thread(target=self._run, args=(stale,), name="fingerprint-recompute", daemon=True)
+                self._thread.start()
+            return self._progress
+
+    def wait(self, timeout: float | None = None) -> RecomputeProgress:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.progress()
+
+    def _advance(self, **changes: int | str) -> None:
+        with self._lock:
+            self._progress = replace(self._progress, **changes)  # type: ignore[arg-type]
+
+    def _run(self, stale: list[tuple[int, str]]) -> None:
+        executor = (
+            ProcessPoolExecutor(max_workers=self._workers, initializer=_lower_worker_priority)
+            if self._workers > 1 and len(stale) > RECOMPUTE_BATCH_SIZE
+            else None
+        )
+        try:
+            for offset in range(0, len(stale), RECOMPUTE_BATCH_SIZE):
+                while self._busy():
+                    time.sleep(BUSY_POLL_SECONDS)
+                batch = stale[offset : offset + RECOMPUTE_BATCH_SIZE]
+                paths = [audio_path for _, audio_path in batch]
+                if executor is not None:
+                    fingerprints = list(executor.map(_fingerprint_or_none, paths))
+                else:
+                    fingerprints = [_fingerprint_or_none(path) for path in paths]
+                updated = self._store.replace_term_sample_fingerprints(
+                    [
+                        (sample_id, fingerprint)
+                        for (sample_id, _), fingerprint in zip(batch, fingerprints)
+                        if fingerprint is not None
+                    ],
+                    self._profile_id,
+                )
+                progress = self.progress()
+                self._advance(
+                    processed=progress.processed + len(batch),
+                    updated=progress.updated + updated,
+                    failed=progress.failed + len(batch) - updated,
+                )
+                time.sleep(RECOMPUTE_BATCH_PAUSE_SECONDS)
+            self._advance(state="done")
+        except Exception:
+            logger.warning("fingerprint_recompute_failed", exc_info=True)
+            self._advance(state="failed")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
@@ -1,26 +1,110 @@
 ﻿from __future__ import annotations
 
+import math
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
 from typing import Any
 
+import numpy as np
+
+from voice_text_organizer.embedding import SampleEmbeddings, build_sample_embeddings, embed_fingerprint
+from voice_text_organizer.fingerprint_arena import FingerprintArena
+from voice_text_organizer.mfcc import FINGERPRINT_VERSION
+from voice_text_organizer.fingerprint_codec import (
+    FINGERPRINT_FORMAT_COMPACT,
+    FINGERPRINT_FORMAT_NPY,
+    FINGERPRINT_FORMAT_PENDING,
+    FingerprintEncoding,
+    PcaBasis,
+    decode_fingerprint,
+    decode_reduced_fingerprint,
+    encode_compact_fingerprint,
+    fit_pca_basis,
+)
+from voice_text_organizer.personalization import (
+    TermMatchOutcome,
+    TermMatchStats,
+    decode_mfcc_fingerprint_bytes,
+    encode_mfcc_fingerprint,
+)
+
 DEFAULT_PROFILE_ID = "local_default"
 MAX_TERM_SAMPLES = 5
+ACTIVE_TERM_LIMIT = 200
+# Weight of the newest best distance in a term's running typical distance.
+MATCH_DISTANCE_SMOOTHING = 0.2
+# Rows per transaction for bulk imports; the store lock is released between batches.
+IMPORT_BATCH_SIZE = 100
+
+
+@dataclass(frozen=True)
+class TermLibrarySnapshot:
+    version: int
+    active_terms: tuple[str, ...]
+    sample_counts: dict[str, int]
+    sample_lookup: dict[str, list[np.ndarray]]
+    sample_ids: dict[str, list[int]]
+    embeddings: SampleEmbeddings
+    sample_durations_ms: dict[str, list[int]]
+    # Set when the profile stores PCA projections; queries must be reduced with it before DTW.
+    basis: PcaBasis | None = None
 
 
 class HistoryStore:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        fingerprint_encoding: FingerprintEncoding = "float32",
+        pca_components: int = 0,
+    ) -> None:
         self._db_path = db_path
+        self._fingerprint_encoding = fingerprint_encoding
+        self._pca_components = max(0, int(pca_components))
+        self._bases: dict[str, PcaBasis] = {}
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = Lock()
+        self._arena_dir = db_path.parent / "fingerprint_arena"
+        self._arenas: dict[str, FingerprintArena] = {}
+        # profile_id -> sample id -> (term, fingerprint view into the profile's memory-mapped arena).
+        self._fingerprint_cache: dict[str, dict[int, tuple[str, np.ndarray]]] = {}
+        self._embedding_cache: dict[str, dict[int, np.ndarray]] = {}
+        # Bumped by every term/sample write, and when PRAGMA data_version shows another connection's commit.
+        self._version = 0
+        self._snapshots: dict[str, TermLibrarySnapshot] = {}
+        self._match_stats: dict[str, dict[str, TermMatchStats]] = {}
         self._init_schema()
+        self._watch_lock = Lock()
+        self._watch_conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._data_version = self._read_data_version()
+
+    @property
+    def arena_dir(self) -> Path:
+        return self._arena_dir
 
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self._db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _read_data_version(self) -> int:
+        with self._watch_lock:
+            row = self._watch_conn.execute("PRAGMA data_version").fetchone()
+        return int(row[0]) if row else 0
+
+    def _bump_version(self) -> None:
+        self._version += 1
+        self._snapshots.clear()
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        # Caller holds self._lock. The watch connection sees this store's own commits as data_version
+        # changes too; adopt the new value so that only other writers invalidate the caches.
+        self._sync_data_version(self._read_data_version())
+        conn.commit()
+        self._data_version = self._read_data_version()
+
     def _ensure_column(self, conn: sqlite3.Connection, table: str, column: str, column_sql: str) -> None:
         columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
         if column not in columns:
@@ -58,6 +142,22 @@ class HistoryStore:
                     FOREIGN KEY(term) REFERENCES term_stats(term) ON DELETE CASCADE
                 );
 
+                CREATE TABLE IF NOT EXISTS fingerprint_bases (
+                    profile_id TEXT PRIMARY KEY,
+                    basis BLOB NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+                );
+
+                CREATE TABLE IF NOT EXISTS term_match_stats (
+                    profile_id TEXT NOT NULL,
+                    term TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    replacements INTEGER NOT NULL DEFAULT 0,
+                    typical_distance REAL,
+                    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+                    PRIMARY KEY(profile_id, term)
+                );
+
                 CREATE TABLE IF NOT EXISTS app_meta (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL
@@ -76,6 +176,19 @@ class HistoryStore:
                 "profile_id",
                 "profile_id TEXT NOT NULL DEFAULT 'local_default'",
             )
+            self._ensure_column(
+                conn,
+                "term_samples",
+                "fingerprint_format",
+                f"fingerprint_format INTEGER NOT NULL DEFAULT {FINGERPRINT_FORMAT_NPY}",
+            )
+            # Rows that predate the column were extracted by the code that shipped with it.
+            self._ensure_column(
+                conn,
+                "term_samples",
+                "fingerprint_version",
+                f"fingerprint_version TEXT NOT NULL DEFAULT '{FINGERPRINT_VERSION}'",
+            )
 
             cleanup_flag = conn.execute(
                 "SELECT value FROM app_meta WHERE key = 'auto_terms_purged'"
@@ -93,11 +206,13 @@ class HistoryStore:
     def _status_from_sample_count(self, sample_count: int) -> str:
         return "active" if sample_count > 0 else "pending"
 
-    def _sample_count(self, conn: sqlite3.Connection, term: str, profile_id: str) -> int:
-        row = conn.execute(
-            "SELECT COUNT(*) AS n FROM term_samples WHERE term = ? AND profile_id = ?",
-            (term, profile_id),
-        ).fetchone()
+    def _sample_count(self, conn: sqlite3.Connection, term: str, profile_id: str, *, ready_only: bool = False) -> int:
+        query = "SELECT COUNT(*) AS n FROM term_samples WHERE term = ? AND profile_id = ?"
+        params: tuple[Any, ...] = (term, profile_id)
+        if ready_only:
+            query += " AND fingerprint_format != ? AND fingerprint_version = ?"
+            params += (FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION)
+        row = conn.execute(query, params).fetchone()
         return int(row["n"]) if row else 0
 
     def _safe_delete_file(self, raw_path: str) -> None:
@@ -110,6 +225,148 @@ class HistoryStore:
         except OSError:
             return
 
+    def _arena(self, profile_id: str) -> FingerprintArena:
+        arena = self._arenas.get(profile_id)
+        if arena is None:
+            arena = FingerprintArena(self._arena_dir, profile_id)
+            self._arenas[profile_id] = arena
+        return arena
+
+    def _basis(self, conn: sqlite3.Connection, profile_id: str) -> PcaBasis | None:
+        # Only a fitted basis is cached; until then another store may fit one at any time.
+        basis = self._bases.get(profile_id)
+        if basis is None:
+            row = conn.execute("SELECT basis FROM fingerprint_bases WHERE profile_id = ?", (profile_id,)).fetchone()
+            if row is not None:
+                basis = PcaBasis.from_bytes(bytes(row["basis"]))
+                self._bases[profile_id] = basis
+        return basis
+
+    def _ensure_basis(self, conn: sqlite3.Connection, profile_id: str, matrix: np.ndarray) -> PcaBasis | None:
+        # Fitted once from the samples on hand and never refitted, since stored rows depend on it.
+        basis = self._basis(conn, profile_id)
+        if basis is not None or self._pca_components <= 0:
+            return basis
+        rows = conn.execute(
+            """
+            SELECT mfcc_fingerprint, fingerprint_format
+            FROM term_samples
+            WHERE profile_id = ? AND fingerprint_format != ? AND fingerprint_version = ?
+            """,
+            (profile_id, FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION),
+        ).fetchall()
+        matrices = [matrix]
+        for row in rows:
+            try:
+                matrices.append(decode_fingerprint(bytes(row["mfcc_fingerprint"]), int(row["fingerprint_format"])))
+            except (ValueError, EOFError, OSError):
+                continue
+        basis = fit_pca_basis(matrices, self._pca_components)
+        if basis is not None:
+            conn.execute(
+                "INSERT INTO fingerprint_bases(profile_id, basis) VALUES (?, ?)",
+                (profile_id, basis.to_bytes()),
+            )
+            self._bases[profile_id] = basis
+            # Everything cached so far is full width; samples are re-read in the reduced space.
+            self._arena(profile_id).clear()
+            self._fingerprint_cache.pop(profile_id, None)
+            self._embedding_cache.pop(profile_id, None)
+        return basis
+
+    def _encode_for_storage(self, conn: sqlite3.Connection, profile_id: str, blob: bytes) -> tuple[bytes, int]:
+        if self._fingerprint_encoding == "float32":
+            return blob, FINGERPRINT_FORMAT_NPY
+        try:
+            matrix = decode_mfcc_fingerprint_bytes(blob)
+        except (ValueError, EOFError, OSError):
+            return blob, FINGERPRINT_FORMAT_NPY
+        if matrix.ndim != 2:
+            return blob, FINGERPRINT_FORMAT_NPY
+        basis = self._ensure_basis(conn, profile_id, matrix)
+        return encode_compact_fingerprint(matrix, self._fingerprint_encoding, basis), FINGERPRINT_FORMAT_COMPACT
+
+    def _decode_fingerprints(
+        self,
+        rows: list[tuple[int, str, bytes, int]],
+        basis: PcaBasis | None = None,
+    ) -> list[tuple[int, str, np.ndarray]]:
+        decoded: list[tuple[int, str, np.ndarray]] = []
+        for sample_id, term, blob, format_version in rows:
+            try:
+                if basis is not None:
+                    # DTW runs on the basis coefficients, so projected rows never go back to 13-D.
+                    matrix = decode_reduced_fingerprint(blob, format_version, basis)
+                elif format_version == FINGERPRINT_FORMAT_NPY:
+                    matrix = decode_mfcc_fingerprint_bytes(blob)
+                else:
+                    matrix = decode_fingerprint(blob, format_version, basis)
+            except (ValueError, EOFError, OSError):
+                continue
+            decoded.append((sample_id, term, matrix))
+        return decoded
+
+    def _sync_data_version(self, data_version: int) -> None:
+        # Caller holds self._lock. When another connection has committed, every cache derived
+        # from term_samples is dropped, arenas included: another store may have appended to or
+        # compacted the arena files, and this one must re-read their index before using them.
+        if data_version == self._data_version:
+            return
+        self._data_version = data_version
+        self._arenas.clear()
+        self._fingerprint_cache.clear()
+        self._embedding_cache.clear()
+        self._bump_version()
+
+    def _cached_fingerprints(self, profile_id: str) -> dict[int, tuple[str, np.ndarray]]:
+        cached = self._fingerprint_cache.get(profile_id)
+        if cached is not None:
+            return cached
+
+        arena = self._arena(profile_id)
+        with self._connect() as conn:
+            basis = self._basis(conn, profile_id)
+            if basis is not None and arena.dim not in (0, basis.components.shape[0] + 1):
+                # Rows appended before the profile's basis was fitted are full width.
+                arena.clear()
+            rows = conn.execute(
+                """
+                SELECT id, term
+                FROM term_samples
+                WHERE profile_id = ? AND fingerprint_format != ? AND fingerprint_version = ?
+                """,
+                (profile_id, FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION),
+            ).fetchall()
+            known = {int(row["id"]): str(row["term"]) for row in rows}
+            arena_terms = {sample_id: term for sample_id, (term, _) in arena.matrices().items()}
+            arena.remove({sample_id for sample_id, term in arena_terms.items() if known.get(sample_id) != term})
+
+            missing = sorted(set(known) - arena.sample_ids())
+            if missing:
+                placeholders = ",".join("?" for _ in missing)
+                missing_rows = conn.execute(
+                    f"SELECT id, term, mfcc_fingerprint, fingerprint_format FROM term_samples WHERE id IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                arena.append(
+                    self._decode_fingerprints(
+                        [
+                            (
+                                int(row["id"]),
+                                str(row["term"]),
+                                bytes(row["mfcc_fingerprint"]),
+                                int(row["fingerprint_format"]),
+                            )
+                            for row in missing_rows
+                        ],
+                        basis,
+                    )
+                )
+
+        cached = arena.matrices()
+        self._fingerprint_cache[profile_id] = cached
+        return cached
+
     def _ensure_manual_term(self, conn: sqlite3.Connection, term: str, profile_id: str) -> bool:
         row = conn.execute(
             "SELECT term FROM term_stats WHERE term = ?",
@@ -154,7 +411,7 @@ class HistoryStore:
                 """,
                 (mode, voice_text, final_text, max(0, int(duration_seconds))),
             )
-            conn.commit()
+            self._commit(conn)
 
     def add_manual_term(self, term: str, profile_id: str = DEFAULT_PROFILE_ID) -> dict[str, Any]:
         cleaned = self._normalize_term(term)
@@ -170,7 +427,8 @@ class HistoryStore:
         with self._lock, self._connect() as conn:
             existed = self._ensure_manual_term(conn, cleaned, profile_id)
             sample_count = self._sample_count(conn, cleaned, profile_id)
-            conn.commit()
+            self._commit(conn)
+            self._bump_version()
 
         return {
             "ok": True,
@@ -187,9 +445,10 @@ class HistoryStore:
         audio_path: str,
         duration_ms: int,
         quality_score: float,
-        mfcc_fingerprint: bytes,
+        mfcc_fingerprint: bytes | None,
         profile_id: str = DEFAULT_PROFILE_ID,
     ) -> dict[str, Any]:
+        # A None fingerprint stores the sample as pending; complete_term_sample_fingerprint fills it in.
         cleaned = self._normalize_term(term)
         if not cleaned:
             raise ValueError("term is empty")
@@ -201,10 +460,17 @@ class HistoryStore:
             if existing_count >= MAX_TERM_SAMPLES:
                 raise ValueError("sample limit reached (max 5)")
 
+            if mfcc_fingerprint is None:
+                stored_blob, format_version = b"", FINGERPRINT_FORMAT_PENDING
+            else:
+                stored_blob, format_version = self._encode_for_storage(conn, profile_id, mfcc_fingerprint)
             cursor = conn.execute(
                 """
-                INSERT INTO term_samples(profile_id, term, audio_path, duration_ms, quality_score, mfcc_fingerprint, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+                INSERT INTO term_samples(
+                    profile_id, term, audio_path, duration_ms, quality_score, mfcc_fingerprint, fingerprint_format,
+                    fingerprint_version, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
                 """,
                 (
                     profile_id,
@@ -212,7 +478,9 @@ class HistoryStore:
                     audio_path,
                     max(1, int(duration_ms)),
                     float(quality_score),
-                    mfcc_fingerprint,
+                    stored_blob,
+                    format_version,
+                    FINGERPRINT_VERSION,
                 ),
             )
             conn.execute(
@@ -226,17 +494,160 @@ class HistoryStore:
                 """,
                 (profile_id, cleaned),
             )
-            conn.commit()
+            self._commit(conn)
             sample_id = int(cursor.lastrowid)
             sample_count = existing_count + 1
+            ready_count = self._sample_count(conn, cleaned, profile_id, ready_only=True)
+            if format_version != FINGERPRINT_FORMAT_PENDING:
+                self._append_to_arena(conn, profile_id, sample_id, cleaned, stored_blob, format_version)
+            self._bump_version()
 
         return {
             "ok": True,
             "sample_id": sample_id,
             "sample_count": sample_count,
-            "status": self._status_from_sample_count(sample_count),
+            "status": self._status_from_sample_count(ready_count),
+            "fingerprint_pending": format_version == FINGERPRINT_FORMAT_PENDING,
         }
 
+    def complete_term_sample_fingerprint(
+        self,
+        sample_id: int,
+        mfcc_fingerprint: bytes,
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> bool:
+        # False when the sample was deleted, or already completed, before the worker got to it.
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT term FROM term_samples WHERE id = ? AND profile_id = ? AND fingerprint_format = ?",
+                (int(sample_id), profile_id, FINGERPRINT_FORMAT_PENDING),
+            ).fetchone()
+            if row is None:
+                return False
+            term = str(row["term"])
+            stored_blob, format_version = self._encode_for_storage(conn, profile_id, mfcc_fingerprint)
+            conn.execute(
+                "UPDATE term_samples SET mfcc_fingerprint = ?, fingerprint_format = ?, fingerprint_version = ? WHERE id = ?",
+                (stored_blob, format_version, FINGERPRINT_VERSION, int(sample_id)),
+            )
+            self._commit(conn)
+            self._append_to_arena(conn, profile_id, int(sample_id), term, stored_blob, format_version)
+            self._bump_version()
+        return True
+
+    def discard_pending_term_sample(self, sample_id: int, profile_id: str = DEFAULT_PROFILE_ID) -> bool:
+        # For pending samples whose audio is missing or unreadable, which can never be fingerprinted.
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT term, audio_path FROM term_samples WHERE id = ? AND profile_id = ? AND fingerprint_format = ?",
+                (int(sample_id), profile_id, FINGERPRINT_FORMAT_PENDING),
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM term_samples WHERE id = ?", (int(sample_id),))
+            conn.execute("UPDATE term_stats SET updated_at = datetime('now') WHERE term = ?", (str(row["term"]),))
+            self._commit(conn)
+            self._bump_version()
+        self._safe_delete_file(str(row["audio_path"]))
+        return True
+
+    def list_pending_term_samples(self, profile_id: str = DEFAULT_PROFILE_ID) -> list[tuple[int, str]]:
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, audio_path FROM term_samples WHERE profile_id = ? AND fingerprint_format = ? ORDER BY id",
+                (profile_id, FINGERPRINT_FORMAT_PENDING),
+            ).fetchall()
+        return [(int(row["id"]), str(row["audio_path"])) for row in rows]
+
+    def list_stale_term_samples(self, profile_id: str = DEFAULT_PROFILE_ID) -> list[tuple[int, str]]:
+        # Fingerprinted samples whose extractor version differs from the running one.
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, audio_path
+                FROM term_samples
+                WHERE profile_id = ? AND fingerprint_format != ? AND fingerprint_version != ?
+                ORDER BY id
+                """,
+                (profile_id, FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION),
+            ).fetchall()
+        return [(int(row["id"]), str(row["audio_path"])) for row in rows]
+
+    def replace_term_sample_fingerprints(
+        self,
+        fingerprints: list[tuple[int, bytes]],
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> int:
+        # Only rows that are still stale are rewritten, so a concurrent delete or re-record wins.
+        if not fingerprints:
+            return 0
+        updated: list[tuple[int, str, bytes, int]] = []
+        with self._lock, self._connect() as conn:
+            for sample_id, mfcc_fingerprint in fingerprints:
+                row = conn.execute(
+                    """
+                    SELECT term
+                    FROM term_samples
+                    WHERE id = ? AND profile_id = ? AND fingerprint_format != ? AND fingerprint_version != ?
+                    """,
+                    (int(sample_id), profile_id, FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION),
+                ).fetchone()
+                if row is None:
+                    continue
+                stored_blob, format_version = self._encode_for_storage(conn, profile_id, mfcc_fingerprint)
+                conn.execute(
+                    "UPDATE term_samples SET mfcc_fingerprint = ?, fingerprint_format = ?, fingerprint_version = ? WHERE id = ?",
+                    (stored_blob, format_version, FINGERPRINT_VERSION, int(sample_id)),
+                )
+                updated.append((int(sample_id), str(row["term"]), stored_blob, format_version))
+            self._commit(conn)
+            if updated:
+                # The ids stay the same, so the stale rows are dropped first; a sample whose new
+                # fingerprint cannot be appended then goes missing instead of matching on old data.
+                self._remove_from_arena(profile_id, {sample_id for sample_id, _, _, _ in updated})
+            for sample_id, term, stored_blob, format_version in updated:
+                self._append_to_arena(conn, profile_id, sample_id, term, stored_blob, format_version)
+            if updated:
+                self._bump_version()
+        return len(updated)
+
+    def _append_to_arena(
+        self,
+        conn: sqlite3.Connection,
+        profile_id: str,
+        sample_id: int,
+        term: str,
+        stored_blob: bytes,
+        format_version: int,
+    ) -> None:
+        try:
+            appended = self._arena(profile_id).append(
+                self._decode_fingerprints(
+                    [(sample_id, term, stored_blob, format_version)],
+                    self._basis(conn, profile_id),
+                )
+            )
+        except OSError:
+            # The next lookup reconciles the arena against term_samples.
+            self._fingerprint_cache.pop(profile_id, None)
+        else:
+            cached = self._fingerprint_cache.get(profile_id)
+            if cached is not None:
+                cached.update(appended)
+
+    def _remove_from_arena(self, profile_id: str, sample_ids: set[int]) -> None:
+        # Runs after the rows are gone from term_samples, so a failed removal must not fail the
+        # write; the next lookup drops arena rows that term_samples no longer has.
+        try:
+            self._arena(profile_id).remove(sample_ids)
+        except OSError:
+            self._fingerprint_cache.pop(profile_id, None)
+            return
+        cached = self._fingerprint_cache.get(profile_id)
+        if cached is not None:
+            for sample_id in sample_ids:
+                cached.pop(sample_id, None)
+
     def export_term_samples_blob(self, term: str, profile_id: str = DEFAULT_PROFILE_ID) -> str:
         cleaned = self._normalize_term(term)
         if not cleaned:
@@ -259,6 +670,120 @@ class HistoryStore:
         ]
         return "\n".join(lines)
 
+    def export_profile(self, profile_id: str = DEFAULT_PROFILE_ID) -> dict[str, Any]:
+        # Fingerprints come back in the float32 .npy layout; pending samples have none.
+        with self._lock, self._connect() as conn:
+            term_rows = conn.execute(
+                "SELECT term FROM term_stats WHERE profile_id = ? AND source = 'manual' ORDER BY term COLLATE NOCASE",
+                (profile_id,),
+            ).fetchall()
+            sample_rows = conn.execute(
+                """
+                SELECT id, term, audio_path, duration_ms, quality_score, mfcc_fingerprint, fingerprint_format,
+                    fingerprint_version
+                FROM term_samples
+                WHERE profile_id = ?
+                ORDER BY id
+                """,
+                (profile_id,),
+            ).fetchall()
+            basis = self._basis(conn, profile_id)
+
+        samples: list[dict[str, Any]] = []
+        for row in sample_rows:
+            format_version = int(row["fingerprint_format"])
+            fingerprint: bytes | None = None
+            if format_version == FINGERPRINT_FORMAT_NPY:
+                fingerprint = bytes(row["mfcc_fingerprint"])
+            elif format_version != FINGERPRINT_FORMAT_PENDING:
+                try:
+                    fingerprint = encode_mfcc_fingerprint(
+                        decode_fingerprint(bytes(row["mfcc_fingerprint"]), format_version, basis)
+                    )
+                except ValueError:
+                    fingerprint = None
+            samples.append(
+                {
+                    "sample_id": int(row["id"]),
+                    "term": str(row["term"]),
+                    "audio_path": str(row["audio_path"]),
+                    "duration_ms": int(row["duration_ms"]),
+                    "quality_score": float(row["quality_score"]),
+                    "mfcc_fingerprint": fingerprint,
+                    "fingerprint_version": str(row["fingerprint_version"]),
+                }
+            )
+        return {"terms": [str(row["term"]) for row in term_rows], "samples": samples}
+
+    def import_term_samples(
+        self,
+        terms: list[str],
+        samples: list[dict[str, Any]],
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> dict[str, Any]:
+        # samples carry add_term_sample's keyword arguments. Samples beyond a term's
+        # MAX_TERM_SAMPLES are not inserted; their audio paths come back in skipped_paths.
+        cleaned_terms = list(dict.fromkeys(self._normalize_term(term) for term in terms if self._normalize_term(term)))
+        with self._lock, self._connect() as conn:
+            for term in cleaned_terms:
+                self._ensure_manual_term(conn, term, profile_id)
+            counts = {
+                str(row["term"]): int(row["n"])
+                for row in conn.execute(
+                    "SELECT term, COUNT(*) AS n FROM term_samples WHERE profile_id = ? GROUP BY term",
+                    (profile_id,),
+                ).fetchall()
+            }
+            self._commit(conn)
+            self._bump_version()
+
+        imported = 0
+        skipped_paths: list[str] = []
+        for offset in range(0, len(samples), IMPORT_BATCH_SIZE):
+            batch = samples[offset : offset + IMPORT_BATCH_SIZE]
+            with self._lock, self._connect() as conn:
+                inserted: list[tuple[int, str, bytes, int]] = []
+                for sample in batch:
+                    term = self._normalize_term(str(sample["term"]))
+                    if not term or counts.get(term, 0) >= MAX_TERM_SAMPLES:
+                        skipped_paths.append(str(sample["audio_path"]))
+                        continue
+                    self._ensure_manual_term(conn, term, profile_id)
+                    fingerprint = sample.get("mfcc_fingerprint")
+                    if fingerprint is None:
+                        stored_blob, format_version = b"", FINGERPRINT_FORMAT_PENDING
+                    else:
+                        stored_blob, format_version = self._encode_for_storage(conn, profile_id, fingerprint)
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO term_samples(
+                            profile_id, term, audio_path, duration_ms, quality_score, mfcc_fingerprint, fingerprint_format,
+                            fingerprint_version, created_at
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                        """,
+                        (
+                            profile_id,
+                            term,
+                            str(sample["audio_path"]),
+                            max(1, int(sample["duration_ms"])),
+                            float(sample["quality_score"]),
+                            stored_blob,
+                            format_version,
+                            FINGERPRINT_VERSION,
+                        ),
+                    )
+                    counts[term] = counts.get(term, 0) + 1
+                    imported += 1
+                    if format_version != FINGERPRINT_FORMAT_PENDING:
+                        inserted.append((int(cursor.lastrowid), term, stored_blob, format_version))
+                self._commit(conn)
+                for sample_id, term, stored_blob, format_version in inserted:
+                    self._append_to_arena(conn, profile_id, sample_id, term, stored_blob, format_version)
+                self._bump_version()
+
+        return {"ok": True, "terms": len(cleaned_terms), "imported": imported, "skipped_paths": skipped_paths}
+
     def delete_term_sample(
         self,
         term: str,
@@ -290,7 +815,10 @@ class HistoryStore:
                     (cleaned,),
                 )
             sample_count = self._sample_count(conn, cleaned, profile_id)
-            conn.commit()
+            ready_count = self._sample_count(conn, cleaned, profile_id, ready_only=True)
+            self._commit(conn)
+            self._remove_from_arena(profile_id, {int(sample_id)})
+            self._bump_version()
 
         if deleted_path:
             self._safe_delete_file(deleted_path)
@@ -298,7 +826,7 @@ class HistoryStore:
         return {
             "ok": True,
             "sample_count": sample_count,
-            "status": self._status_from_sample_count(sample_count),
+            "status": self._status_from_sample_count(ready_count),
         }
 
     def delete_term(self, term: str, profile_id: str = DEFAULT_PROFILE_ID) -> bool:
@@ -309,10 +837,11 @@ class HistoryStore:
         sample_paths: list[str] = []
         with self._lock, self._connect() as conn:
             rows = conn.execute(
-                "SELECT audio_path FROM term_samples WHERE term = ? AND profile_id = ?",
+                "SELECT id, audio_path FROM term_samples WHERE term = ? AND profile_id = ?",
                 (cleaned, profile_id),
             ).fetchall()
             sample_paths = [str(row["audio_path"]) for row in rows]
+            sample_ids = {int(row["id"]) for row in rows}
 
             conn.execute(
                 "DELETE FROM term_samples WHERE term = ? AND profile_id = ?",
@@ -322,8 +851,15 @@ class HistoryStore:
                 "DELETE FROM term_stats WHERE term = ? AND profile_id = ?",
                 (cleaned, profile_id),
             )
-            conn.commit()
+            conn.execute(
+                "DELETE FROM term_match_stats WHERE term = ? AND profile_id = ?",
+                (cleaned, profile_id),
+            )
+            self._commit(conn)
+            self._match_stats.get(profile_id, {}).pop(cleaned, None)
             deleted = cursor.rowcount > 0
+            self._remove_from_arena(profile_id, sample_ids)
+            self._bump_version()
 
         for sample_path in sample_paths:
             self._safe_delete_file(sample_path)
@@ -349,7 +885,8 @@ class HistoryStore:
                 SELECT
                     ts.term AS term,
                     ts.updated_at AS updated_at,
-                    COALESCE(COUNT(s.id), 0) AS sample_count
+                    COALESCE(COUNT(s.id), 0) AS sample_count,
+                    COALESCE(SUM(s.fingerprint_format != ? AND s.fingerprint_version = ?), 0) AS ready_count
                 FROM term_stats ts
                 LEFT JOIN term_samples s
                     ON s.term = ts.term
@@ -364,43 +901,52 @@ class HistoryStore:
                     ts.term COLLATE NOCASE ASC
                 LIMIT ?
                 """,
-                (DEFAULT_PROFILE_ID, like_query, max(1, int(limit))),
+                (FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION, DEFAULT_PROFILE_ID, like_query, max(1, int(limit))),
             ).fetchall()
 
         lines: list[str] = []
         for row in rows:
             sample_count = int(row["sample_count"])
-            current_status = self._status_from_sample_count(sample_count)
+            current_status = self._status_from_sample_count(int(row["ready_count"]))
             if normalized_status != "all" and normalized_status != current_status:
                 continue
             lines.append(f"{row['term']}\t{sample_count}\t{current_status}")
         return "\n".join(lines)
 
-    def get_active_terms(self, profile_id: str = DEFAULT_PROFILE_ID, limit: int = 200) -> list[dict[str, Any]]:
+    def get_active_terms(
+        self,
+        profile_id: str = DEFAULT_PROFILE_ID,
+        limit: int = ACTIVE_TERM_LIMIT,
+    ) -> list[dict[str, Any]]:
         with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT
-                    ts.term AS term,
-                    COALESCE(COUNT(s.id), 0) AS sample_count,
-                    MAX(s.created_at) AS last_sample_at,
-                    ts.updated_at AS updated_at
-                FROM term_stats ts
-                LEFT JOIN term_samples s
-                    ON s.term = ts.term
-                    AND s.profile_id = ts.profile_id
-                WHERE ts.profile_id = ?
-                    AND ts.source = 'manual'
-                GROUP BY ts.term, ts.updated_at
-                HAVING sample_count > 0
-                ORDER BY
-                    sample_count DESC,
-                    COALESCE(MAX(s.created_at), ts.updated_at) DESC,
-                    ts.term COLLATE NOCASE ASC
-                LIMIT ?
-                """,
-                (profile_id, max(1, int(limit))),
-            ).fetchall()
+            return self._query_active_terms(conn, profile_id, limit)
+
+    def _query_active_terms(self, conn: sqlite3.Connection, profile_id: str, limit: int) -> list[dict[str, Any]]:
+        rows = conn.execute(
+            """
+            SELECT
+                ts.term AS term,
+                COALESCE(COUNT(s.id), 0) AS sample_count,
+                MAX(s.created_at) AS last_sample_at,
+                ts.updated_at AS updated_at
+            FROM term_stats ts
+            LEFT JOIN term_samples s
+                ON s.term = ts.term
+                AND s.profile_id = ts.profile_id
+                AND s.fingerprint_format != ?
+                AND s.fingerprint_version = ?
+            WHERE ts.profile_id = ?
+                AND ts.source = 'manual'
+            GROUP BY ts.term, ts.updated_at
+            HAVING sample_count > 0
+            ORDER BY
+                sample_count DESC,
+                COALESCE(MAX(s.created_at), ts.updated_at) DESC,
+                ts.term COLLATE NOCASE ASC
+            LIMIT ?
+            """,
+            (FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION, profile_id, max(1, int(limit))),
+        ).fetchall()
 
         return [
             {
@@ -422,30 +968,208 @@ class HistoryStore:
             return {}
 
         placeholders = ",".join("?" for _ in cleaned_terms)
-        params: list[Any] = [profile_id, *cleaned_terms]
+        params: list[Any] = [profile_id, FINGERPRINT_VERSION, *cleaned_terms]
 
         with self._lock, self._connect() as conn:
             rows = conn.execute(
                 f"""
-                SELECT term, mfcc_fingerprint
+                SELECT term, mfcc_fingerprint, fingerprint_format
                 FROM term_samples
                 WHERE profile_id = ?
+                    AND fingerprint_format != {FINGERPRINT_FORMAT_PENDING}
+                    AND fingerprint_version = ?
                     AND term IN ({placeholders})
                 ORDER BY id DESC
                 """,
                 params,
             ).fetchall()
+            basis = self._basis(conn, profile_id)
 
         result: dict[str, list[bytes]] = {term: [] for term in cleaned_terms}
         for row in rows:
             term = str(row["term"])
             blob = row["mfcc_fingerprint"]
-            if isinstance(blob, memoryview):
-                result.setdefault(term, []).append(blob.tobytes())
-            else:
-                result.setdefault(term, []).append(bytes(blob))
+            blob = blob.tobytes() if isinstance(blob, memoryview) else bytes(blob)
+            if int(row["fingerprint_format"]) != FINGERPRINT_FORMAT_NPY:
+                # Callers expect the float32 .npy layout regardless of how the row is stored.
+                try:
+                    blob = encode_mfcc_fingerprint(decode_fingerprint(blob, int(row["fingerprint_format"]), basis))
+                except ValueError:
+                    continue
+            result.setdefault(term, []).append(blob)
+        return result
+
+    def load_term_sample_matrices(
+        self,
+        terms: list[str],
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> dict[str, list[np.ndarray]]:
+        cleaned_terms = [self._normalize_term(term) for term in terms if self._normalize_term(term)]
+        if not cleaned_terms:
+            return {}
+
+        with self._lock:
+            cached = self._cached_fingerprints(profile_id)
+            result: dict[str, list[np.ndarray]] = {term: [] for term in cleaned_terms}
+            for sample_id in sorted(cached, reverse=True):
+                term, matrix = cached[sample_id]
+                if term in result:
+                    result[term].append(matrix)
         return result
 
+    def load_term_sample_ids(
+        self,
+        terms: list[str],
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> dict[str, list[int]]:
+        cleaned_terms = [self._normalize_term(term) for term in terms if self._normalize_term(term)]
+        if not cleaned_terms:
+            return {}
+
+        with self._lock:
+            cached = self._cached_fingerprints(profile_id)
+            result: dict[str, list[int]] = {term: [] for term in cleaned_terms}
+            for sample_id in sorted(cached, reverse=True):
+                term, _ = cached[sample_id]
+                if term in result:
+                    result[term].append(sample_id)
+        return result
+
+    def term_library_snapshot(self, profile_id: str = DEFAULT_PROFILE_ID) -> TermLibrarySnapshot:
+        data_version = self._read_data_version()
+        snapshot = self._snapshots.get(profile_id)
+        if snapshot is not None and data_version == self._data_version and snapshot.version == self._version:
+            return snapshot
+
+        with self._lock:
+            self._sync_data_version(self._read_data_version())
+            version = self._version
+            snapshot = self._snapshots.get(profile_id)
+            if snapshot is not None and snapshot.version == version:
+                return snapshot
+
+            with self._connect() as conn:
+                active = self._query_active_terms(conn, profile_id, ACTIVE_TERM_LIMIT)
+                durations = {
+                    int(row["id"]): int(row["duration_ms"])
+                    for row in conn.execute(
+                        "SELECT id, duration_ms FROM term_samples WHERE profile_id = ?", (profile_id,)
+                    ).fetchall()
+                }
+            active_terms = tuple(str(item["term"]) for item in active)
+            sample_lookup: dict[str, list[np.ndarray]] = {term: [] for term in active_terms}
+            sample_ids: dict[str, list[int]] = {term: [] for term in active_terms}
+            sample_durations_ms: dict[str, list[int]] = {term: [] for term in active_terms}
+            cached = self._cached_fingerprints(profile_id)
+            known_vectors = self._embedding_cache.get(profile_id, {})
+            vectors: dict[int, np.ndarray] = {}
+            for sample_id in sorted(cached, reverse=True):
+                term, matrix = cached[sample_id]
+                if term in sample_lookup:
+                    sample_lookup[term].append(matrix)
+                    sample_ids[term].append(sample_id)
+                    sample_durations_ms[term].append(durations.get(sample_id, 0))
+                    vector = known_vectors.get(sample_id)
+                    vectors[sample_id] = vector if vector is not None else embed_fingerprint(matrix)
+            self._embedding_cache[profile_id] = vectors
+
+            snapshot = TermLibrarySnapshot(
+                version=version,
+                active_terms=active_terms,
+                sample_counts={str(item["term"]): int(item["sample_count"]) for item in active},
+                sample_lookup=sample_lookup,
+                sample_ids=sample_ids,
+                embeddings=build_sample_embeddings(
+                    sample_lookup,
+                    {term: [vectors[sample_id] for sample_id in ids] for term, ids in sample_ids.items()},
+                ),
+                sample_durations_ms=sample_durations_ms,
+                basis=self._bases.get(profile_id),
+            )
+            self._snapshots[profile_id] = snapshot
+        return snapshot
+
+    def get_term_match_stats(self, profile_id: str = DEFAULT_PROFILE_ID) -> dict[str, TermMatchStats]:
+        cached = self._match_stats.get(profile_id)
+        if cached is not None:
+            return dict(cached)
+
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT term, attempts, replacements, typical_distance FROM term_match_stats WHERE profile_id = ?",
+                (profile_id,),
+            ).fetchall()
+            cached = {
+                str(row["term"]): TermMatchStats(
+                    attempts=int(row["attempts"]),
+                    replacements=int(row["replacements"]),
+                    typical_distance=None if row["typical_distance"] is None else float(row["typical_distance"]),
+                )
+                for row in rows
+            }
+            self._match_stats[profile_id] = cached
+        return dict(cached)
+
+    def record_term_match_outcomes(
+        self,
+        outcomes: list[TermMatchOutcome],
+        profile_id: str = DEFAULT_PROFILE_ID,
+    ) -> None:
+        if not outcomes:
+            return
+        # Counters are incremented in SQL inside one write transaction, so concurrent callers
+        # (threads, or other stores on the same file) never overwrite each other's attempts.
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO term_match_stats(profile_id, term, attempts, replacements, typical_distance, updated_at)
+                VALUES (?, ?, 1, ?, ?, datetime('now'))
+                ON CONFLICT(profile_id, term) DO UPDATE SET
+                    attempts = attempts + 1,
+                    replacements = replacements + excluded.replacements,
+                    typical_distance = CASE
+                        WHEN excluded.typical_distance IS NULL THEN typical_distance
+                        WHEN typical_distance IS NULL THEN excluded.typical_distance
+                        ELSE ? * typical_distance + ? * excluded.typical_distance
+                    END,
+                    updated_at = excluded.updated_at
+                """,
+                [
+                    (
+                        profile_id,
+                        outcome.term,
+                        int(outcome.replaced),
+                        outcome.best_distance if math.isfinite(outcome.best_distance) else None,
+                        1.0 - MATCH_DISTANCE_SMOOTHING,
+                        MATCH_DISTANCE_SMOOTHING,
+                    )
+                    for outcome in outcomes
+                ],
+            )
+            terms = sorted({outcome.term for outcome in outcomes})
+            placeholders = ",".join("?" for _ in terms)
+            rows = conn.execute(
+                f"""
+                SELECT term, attempts, replacements, typical_distance
+                FROM term_match_stats
+                WHERE profile_id = ? AND term IN ({placeholders})
+                """,
+                (profile_id, *terms),
+            ).fetchall()
+            self._commit(conn)
+            cached = self._match_stats.get(profile_id)
+            if cached is not None:
+                cached.update(
+                    {
+                        str(row["term"]): TermMatchStats(
+                            attempts=int(row["attempts"]),
+                            replacements=int(row["replacements"]),
+                            typical_distance=None if row["typical_distance"] is None else float(row["typical_distance"]),
+                        )
+                        for row in rows
+                    }
+                )
+
     def get_summary(self) -> dict[str, int]:
         with self._lock, self._connect() as conn:
             row = conn.execute(
@@ -467,13 +1191,15 @@ class HistoryStore:
                     LEFT JOIN term_samples s
                         ON s.term = ts.term
                         AND s.profile_id = ts.profile_id
+                        AND s.fingerprint_format != ?
+                        AND s.fingerprint_version = ?
                     WHERE ts.profile_id = ?
                         AND ts.source = 'manual'
                     GROUP BY ts.term
                     HAVING COUNT(s.id) > 0
                 )
                 """,
-                (DEFAULT_PROFILE_ID,),
+                (FINGERPRINT_FORMAT_PENDING, FINGERPRINT_VERSION, DEFAULT_PROFILE_ID),
             ).fetchone()
 
         transcript_count = int(row["transcript_count"]) if row else 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import errno
 import hashlib
 import json
 import logging
@@ -7,6 +8,11 @@ import os
 import re
 import shutil
 import wave
+import zipfile
+from collections.abc import AsyncIterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
 from threading import Lock
 from typing import Any
@@ -15,14 +21,29 @@ from uuid import uuid4
 import numpy as np
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 
-from voice_text_organizer.asr import normalize_asr_text, transcribe_with_siliconflow
-from voice_text_organizer.audio import AudioRecorder
+from voice_text_organizer.asr import asr_prompt_rejected, normalize_asr_text, transcribe_with_siliconflow
+from voice_text_organizer.audio import AudioRecorder, RecordedAudio
 from voice_text_organizer.config import Settings
+from voice_text_organizer.dtw_pool import DtwProcessPool
+from voice_text_organizer.fingerprint_codec import FINGERPRINT_ENCODINGS
+from voice_text_organizer.fingerprint_recompute import FingerprintRecomputeJob
 from voice_text_organizer.history_store import DEFAULT_PROFILE_ID, HistoryStore
+from voice_text_organizer.mfcc import DEFAULT_MFCC_EXTRACTOR, pcm_to_float, read_wav_mono_pcm
 from voice_text_organizer.personalization import (
-    build_mfcc_fingerprint_bytes,
+    EnhanceStats,
+    PersonalizationContext,
+    build_mfcc_fingerprint_bytes_from_signal,
     enhance_voice_text,
+    select_asr_hotwords,
+)
+from voice_text_organizer.profile_archive import (
+    ImportEntry,
+    iter_profile_archive,
+    prepare_import,
+    read_archive_entries,
+    scan_sample_directory,
 )
 from voice_text_organizer.policy import (
     TemplateDecision,
@@ -42,6 +63,7 @@ from voice_text_organizer.runtime_paths import (
     RUNTIME_SETTINGS_PATH,
 )
 from voice_text_organizer.router import route_rewrite
+from voice_text_organizer.sample_quality import evaluate_sample_audio_quality
 from voice_text_organizer.template_classifier import classify_template
 from voice_text_organizer.schemas import (
     AppVersionResponse,
@@ -49,6 +71,9 @@ from voice_text_organizer.schemas import (
     StartSessionResponse,
     SettingsUpdateRequest,
     SettingsViewResponse,
+    DashboardFingerprintRecomputeResponse,
+    DashboardProfileImportRequest,
+    DashboardProfileImportResponse,
     DashboardSummaryResponse,
     DashboardTermsExportResponse,
     DashboardTermAddRequest,
@@ -69,6 +94,7 @@ from voice_text_organizer.schemas import (
     StopSessionResponse,
 )
 from voice_text_organizer.session_store import SessionStore
+from voice_text_organizer.vad import trim_silence
 from voice_text_organizer.version import CURRENT_VERSION
 from voice_text_organizer.version_check import resolve_version
 
@@ -78,17 +104,7 @@ DEFAULT_AUTO_TEMPLATE_CONFIDENCE_THRESHOLD = 0.72
 _CJK_CHAR_RE = re.compile(r"[\u3400-\u4DBF\u4E00-\u9FFF\uF900-\uFAFF]")
 _LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
 MAX_TERM_LENGTH = 20
-MAX_SAMPLE_DURATION_MS = 15000
-MIN_SAMPLE_DURATION_MS = 300
-MAX_SAMPLE_SILENCE_RATIO = 0.97
-MIN_SAMPLE_RMS = 0.003
-MIN_SAMPLE_PEAK = 0.01
-MIN_SILENCE_ABS_THRESHOLD = 0.003
-MAX_SILENCE_ABS_THRESHOLD = 0.015
-SILENCE_THRESHOLD_RMS_SCALE = 1.2
-MIN_ENERGY_RATIO_FOR_SILENCE_REJECT = 1.5
-MIN_PEAK_RATIO_FOR_SILENCE_REJECT = 1.3
-MAX_SAMPLE_CLIPPING_RATIO = 0.03
+MAX_IMPORT_ERRORS_REPORTED = 20
 PERSONALIZATION_TIMEOUT_MS = 900
 
 
@@ -202,6 +218,27 @@ def _load_settings() -> Settings:
         current = Settings(default_mode=default_mode, update_channel=update_channel)
     except ValueError:
         current = Settings(default_mode="local", update_channel="stable")
+    try:
+        current.dtw_worker_processes = max(0, int(os.getenv("VTO_DTW_WORKERS", "0")))
+    except ValueError:
+        current.dtw_worker_processes = 0
+    fingerprint_encoding = os.getenv("VTO_FINGERPRINT_ENCODING", "float32")
+    if fingerprint_encoding in FINGERPRINT_ENCODINGS:
+        current.fingerprint_encoding = fingerprint_encoding  # type: ignore[assignment]
+    try:
+        current.fingerprint_pca_components = min(12, max(0, int(os.getenv("VTO_FINGERPRINT_PCA", "0"))))
+    except ValueError:
+        current.fingerprint_pca_components = 0
+    try:
+        current.asr_term_hints = min(100, max(0, int(os.getenv("VTO_ASR_TERM_HINTS", "0"))))
+    except ValueError:
+        current.asr_term_hints = 0
+    current.defer_sample_fingerprints = os.getenv("VTO_DEFER_SAMPLE_FINGERPRINTS", "0") == "1"
+    current.stream_recordings_to_disk = os.getenv("VTO_STREAM_RECORDINGS", "0") == "1"
+    current.vad_trim_enabled = os.getenv("VTO_VAD_TRIM", "0") == "1"
+    asr_upload_codec = os.getenv("VTO_ASR_UPLOAD_CODEC", "wav")
+    if asr_upload_codec in ("wav", "flac"):
+        current.asr_upload_codec = asr_upload_codec  # type: ignore[assignment]
 
     runtime_overrides = _load_runtime_settings()
     if runtime_overrides.get("default_mode") in ("cloud", "local"):
@@ -223,10 +260,30 @@ def _load_settings() -> Settings:
 
 settings = _load_settings()
 store = SessionStore()
-recorder = AudioRecorder()
-history_store = HistoryStore(RUNTIME_HISTORY_DB_PATH)
+recorder = AudioRecorder(stream_to_disk=settings.stream_recordings_to_disk)
+history_store = HistoryStore(
+    RUNTIME_HISTORY_DB_PATH,
+    fingerprint_encoding=settings.fingerprint_encoding,
+    pca_components=settings.fingerprint_pca_components,
+)
 sample_recording_sessions: dict[str, str] = {}
 sample_recording_lock = Lock()
+personalization_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="personalization")
+sample_fingerprint_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sample-fingerprint")
+dtw_pool: DtwProcessPool | None = None
+dtw_pool_lock = Lock()
+# How often acoustic correction still edits the ASR text, split by whether ASR got term hints.
+personalization_effect = {"hinted_requests": 0, "hinted_changed": 0, "plain_requests": 0, "plain_changed": 0}
+personalization_effect_lock = Lock()
+# Background jobs back off while any of these are in flight.
+interactive_requests = 0
+interactive_requests_lock = Lock()
+recompute_job = FingerprintRecomputeJob(
+    history_store,
+    DEFAULT_PROFILE_ID,
+    workers=max(1, (os.cpu_count() or 1) // 2),
+    busy=lambda: interactive_requests > 0,
+)
 
 
 def cloud_provider(messages: list[dict[str, str]]) -> str:
@@ -237,11 +294,61 @@ def local_provider(messages: list[dict[str, str]]) -> str:
     return rewrite_with_ollama(messages, settings=settings)
 
 
-def transcribe_audio(audio_path: Path, language_hint: str = "auto") -> str:
+def _enter_interactive_request() -> None:
+    global interactive_requests
+    with interactive_requests_lock:
+        interactive_requests += 1
+
+
+def _leave_interactive_request() -> None:
+    global interactive_requests
+    with interactive_requests_lock:
+        interactive_requests -= 1
+
+
+def transcribe_audio(
+    audio: Path | RecordedAudio,
+    language_hint: str = "auto",
+    hotwords: list[str] | None = None,
+) -> str:
     return transcribe_with_siliconflow(
-        audio_path=audio_path,
+        audio=audio,
         settings=settings,
         language=language_hint,
+        hotwords=hotwords,
+    )
+
+
+def _asr_hotwords() -> list[str]:
+    if settings.asr_term_hints <= 0:
+        return []
+    try:
+        snapshot = history_store.term_library_snapshot(DEFAULT_PROFILE_ID)
+        if not snapshot.active_terms:
+            return []
+        return select_asr_hotwords(
+            list(snapshot.active_terms),
+            history_store.get_term_match_stats(DEFAULT_PROFILE_ID),
+            limit=settings.asr_term_hints,
+        )
+    except Exception:
+        logger.warning("asr_hotwords_unavailable", exc_info=True)
+        return []
+
+
+def _record_personalization_effect(*, hinted: bool, changed: bool) -> None:
+    prefix = "hinted" if hinted else "plain"
+    with personalization_effect_lock:
+        personalization_effect[f"{prefix}_requests"] += 1
+        personalization_effect[f"{prefix}_changed"] += int(changed)
+        requests = personalization_effect[f"{prefix}_requests"]
+        change_rate = personalization_effect[f"{prefix}_changed"] / requests
+    logger.info(
+        "personalized_acoustic_effect hinted=%s changed=%s requests=%d change_rate=%.3f",
+        "true" if hinted else "false",
+        "true" if changed else "false",
+        requests,
+        change_rate,
     )
 
 
@@ -252,16 +359,24 @@ def _safe_unlink(path: Path) -> None:
         pass
 
 
-def _wav_duration_seconds(path: Path) -> int:
+def _trim_for_upload(audio: RecordedAudio) -> RecordedAudio:
+    # Returns the recording with silence trimmed for the ASR upload, or audio itself when
+    # trimming would not save enough to matter.
     try:
-        with wave.open(str(path), "rb") as wav_file:
-            framerate = wav_file.getframerate()
-            frames = wav_file.getnframes()
-            if framerate <= 0:
-                return 0
-            return max(0, round(frames / float(framerate)))
+        result = trim_silence(audio.pcm, audio.sample_rate)
     except Exception:
-        return 0
+        logger.warning("vad_trim_failed", exc_info=True)
+        return audio
+    if not result.trimmed:
+        return audio
+    logger.info(
+        "vad_trim original_ms=%d trimmed_ms=%d segments=%d bytes_saved=%d",
+        result.original_samples * 1000 // audio.sample_rate,
+        result.pcm.size * 1000 // audio.sample_rate,
+        len(result.segments),
+        result.bytes_saved,
+    )
+    return RecordedAudio.from_pcm(result.pcm, audio.sample_rate, name=audio.name)
 
 
 def _validate_term_or_raise(raw_term: str) -> str:
@@ -276,6 +391,16 @@ def _validate_term_or_raise(raw_term: str) -> str:
     return term
 
 
+def _split_valid_import_entries(entries: list[ImportEntry]) -> tuple[list[ImportEntry], list[str]]:
+    valid = [entry for entry in entries if len(entry.term) <= MAX_TERM_LENGTH]
+    errors = [
+        f"{entry.source}: term exceeds max length {MAX_TERM_LENGTH}"
+        for entry in entries
+        if len(entry.term) > MAX_TERM_LENGTH
+    ]
+    return valid, errors
+
+
 def _term_sample_dir(term: str) -> Path:
     runtime_dir_env = os.getenv("VTO_RUNTIME_DIR")
     if runtime_dir_env:
@@ -303,7 +428,7 @@ def _persist_term_sample_file(term: str, session_id: str, source_path: Path) ->
         try:
             sample_dir.mkdir(parents=True, exist_ok=True)
             target_path = sample_dir / f"{session_id}.wav"
-            shutil.copy2(source_path, target_path)
+            _move_file(source_path, target_path)
             return target_path
         except OSError as exc:
             last_error = exc
@@ -313,91 +438,152 @@ def _persist_term_sample_file(term: str, session_id: str, source_path: Path) ->
     raise OSError("failed to persist term sample")
 
 
-def _evaluate_sample_audio_quality(audio_path: Path) -> dict[str, float]:
-    with wave.open(str(audio_path), "rb") as wav_file:
-        channels = wav_file.getnchannels()
-        sample_width = wav_file.getsampwidth()
-        sample_rate = wav_file.getframerate()
-        frame_count = wav_file.getnframes()
-        raw_audio = wav_file.readframes(frame_count)
-
-    if sample_width != 2:
-        raise ValueError("unsupported sample format")
-    if sample_rate <= 0:
-        raise ValueError("invalid sample rate")
-
-    pcm = np.frombuffer(raw_audio, dtype=np.int16)
-    if channels > 1:
-        pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
-    if pcm.size == 0:
-        raise ValueError("empty audio")
-
-    duration_ms = int(round((pcm.size / float(sample_rate)) * 1000.0))
-    if duration_ms <= MIN_SAMPLE_DURATION_MS:
-        raise ValueError("sample duration must be > 0.3s")
-    if duration_ms > MAX_SAMPLE_DURATION_MS:
-        raise ValueError("sample duration must be <= 15s")
-
-    normalized = pcm.astype(np.float32) / 32768.0
-    rms = float(np.sqrt(np.mean(np.square(normalized))))
-    peak = float(np.max(np.abs(normalized)))
-    if rms < MIN_SAMPLE_RMS and peak < MIN_SAMPLE_PEAK:
-        raise ValueError("sample volume too low")
-
-    silence_threshold = min(
-        MAX_SILENCE_ABS_THRESHOLD,
-        max(MIN_SILENCE_ABS_THRESHOLD, rms * SILENCE_THRESHOLD_RMS_SCALE),
+def _move_file(source_path: Path, target_path: Path) -> None:
+    try:
+        os.replace(source_path, target_path)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        # Different volume: stage next to the target so readers never see a partial file.
+        staging_path = target_path.with_name(f"{target_path.name}.part")
+        try:
+            shutil.copyfile(source_path, staging_path)
+            os.replace(staging_path, target_path)
+        finally:
+            _safe_unlink(staging_path)
+        _safe_unlink(source_path)
+
+
+def _log_personalization_stats(stats: EnhanceStats) -> None:
+    logger.info(
+        "personalized_acoustic candidates=%d phonetic=%d pairs=%d skipped=%d filtered=%d cold_skipped=%d pruned=%d abandoned=%d scored=%d timed_out=%s elapsed_ms=%.1f",
+        stats.candidates,
+        stats.phonetic_replacements,
+        stats.pairs,
+        stats.skipped_pairs,
+        stats.filtered_pairs,
+        stats.cold_skipped_pairs,
+        stats.pruned_pairs,
+        stats.abandoned_pairs,
+        stats.scored_pairs,
+        "true" if stats.timed_out else "false",
+        stats.elapsed_ms,
     )
-    silence_ratio = float(np.mean(np.abs(normalized) < silence_threshold))
-    if (
-        silence_ratio >= MAX_SAMPLE_SILENCE_RATIO
-        and rms < (MIN_SAMPLE_RMS * MIN_ENERGY_RATIO_FOR_SILENCE_REJECT)
-        and peak < (MIN_SAMPLE_PEAK * MIN_PEAK_RATIO_FOR_SILENCE_REJECT)
-    ):
-        raise ValueError("too much silence in sample")
-
-    clipping_ratio = float(np.mean(np.abs(pcm) >= 32760))
-    if clipping_ratio > MAX_SAMPLE_CLIPPING_RATIO:
-        raise ValueError("sample clipping is too high")
-
-    quality_score = max(
-        0.0,
-        min(
-            1.0,
-            1.0
-            - (silence_ratio * 0.45)
-            - (max(0.0, MIN_SAMPLE_RMS - rms) * 4.0)
-            - (clipping_ratio * 1.2),
-        ),
+
+
+def _complete_sample_fingerprint(sample_id: int, pcm: np.ndarray | None, sample_rate: int, audio_path: Path) -> None:
+    try:
+        if pcm is None:
+            try:
+                pcm, sample_rate = read_wav_mono_pcm(audio_path)
+            except (ValueError, EOFError, OSError, wave.Error):
+                # Retrying on every start would never succeed; drop the sample so it can be re-recorded.
+                logger.warning("sample_fingerprint_audio_unreadable sample_id=%d path=%s", sample_id, audio_path)
+                history_store.discard_pending_term_sample(sample_id, DEFAULT_PROFILE_ID)
+                return
+        fingerprint = build_mfcc_fingerprint_bytes_from_signal(pcm_to_float(pcm), sample_rate)
+        history_store.complete_term_sample_fingerprint(sample_id, fingerprint, DEFAULT_PROFILE_ID)
+    except Exception:
+        logger.warning("sample_fingerprint_failed sample_id=%d", sample_id, exc_info=True)
+
+
+def _resume_pending_sample_fingerprints() -> None:
+    # Samples left pending by a previous run are fingerprinted from their saved WAV.
+    try:
+        pending = history_store.list_pending_term_samples(DEFAULT_PROFILE_ID)
+    except Exception:
+        logger.warning("sample_fingerprint_resume_failed", exc_info=True)
+        return
+    for sample_id, audio_path in pending:
+        _complete_sample_fingerprint(sample_id, None, 0, Path(audio_path))
+
+
+def _prepare_personalization(audio: RecordedAudio) -> PersonalizationContext | None:
+    snapshot = history_store.term_library_snapshot(DEFAULT_PROFILE_ID)
+    if not snapshot.active_terms:
+        return None
+
+    query_frames = DEFAULT_MFCC_EXTRACTOR.compute_frames(pcm_to_float(audio.pcm), audio.sample_rate)
+    return PersonalizationContext(
+        active_terms=list(snapshot.active_terms),
+        sample_lookup=snapshot.sample_lookup,
+        query_matrix=DEFAULT_MFCC_EXTRACTOR.fingerprint(query_frames),
+        sample_ids=snapshot.sample_ids,
+        query_frames=query_frames,
+        embeddings=snapshot.embeddings,
+        match_stats=history_store.get_term_match_stats(DEFAULT_PROFILE_ID),
+        sample_durations_ms=snapshot.sample_durations_ms,
+        basis=snapshot.basis,
     )
-    return {
-        "duration_ms": float(duration_ms),
-        "quality_score": float(quality_score),
-        "silence_ratio": float(silence_ratio),
-        "peak": float(peak),
-        "rms": float(rms),
-        "clipping_ratio": float(clipping_ratio),
-    }
 
 
-def _apply_personalized_acoustic(voice_text: str, audio_path: Path) -> str:
+def _get_dtw_pool() -> DtwProcessPool | None:
+    global dtw_pool
+    if settings.dtw_worker_processes <= 0:
+        return None
+    with dtw_pool_lock:
+        if dtw_pool is None:
+            dtw_pool = DtwProcessPool(
+                history_store.arena_dir,
+                DEFAULT_PROFILE_ID,
+                workers=settings.dtw_worker_processes,
+            )
+        return dtw_pool
+
+
+def _start_personalization_prefetch(audio: RecordedAudio) -> Future[PersonalizationContext | None]:
+    return personalization_executor.submit(_prepare_personalization, audio)
+
+
+def _finish_personalization_prefetch(prefetch: Future[PersonalizationContext | None] | None) -> None:
+    # Let a running worker finish so it never outlives the request that started it.
+    if prefetch is None or prefetch.cancel():
+        return
+    try:
+        prefetch.result()
+    except Exception:
+        return
+
+
+def _apply_personalized_acoustic(
+    voice_text: str,
+    audio: RecordedAudio,
+    prefetch: Future[PersonalizationContext | None] | None = None,
+) -> str:
     try:
-        active = history_store.get_active_terms(profile_id=DEFAULT_PROFILE_ID, limit=200)
-        if not active:
+        if prefetch is None:
+            context = _prepare_personalization(audio)
+        else:
+            context = prefetch.result()
+        if context is None:
             return voice_text
 
-        active_terms = [str(item["term"]) for item in active]
-        sample_lookup = history_store.load_term_sample_fingerprints(
-            active_terms,
-            profile_id=DEFAULT_PROFILE_ID,
-        )
-        return enhance_voice_text(
+        stats = EnhanceStats()
+        enhanced = enhance_voice_text(
             voice_text=voice_text,
-            audio_path=audio_path,
-            active_terms=active_terms,
-            sample_lookup=sample_lookup,
+            active_terms=context.active_terms,
+            sample_lookup=context.sample_lookup,
             timeout_ms=PERSONALIZATION_TIMEOUT_MS,
+            stats=stats,
+            dtw_mode="subsequence",
+            query_matrix=context.query_matrix,
+            pool=_get_dtw_pool(),
+            sample_ids=context.sample_ids,
+            query_frames=context.query_frames,
+            embeddings=context.embeddings,
+            match_stats=context.match_stats,
+            sample_durations_ms=context.sample_durations_ms,
+            basis=context.basis,
         )
+        _log_personalization_stats(stats)
+        if stats.outcomes:
+            # Off the response path; the counters only steer later requests.
+            personalization_executor.submit(
+                history_store.record_term_match_outcomes,
+                stats.outcomes,
+                DEFAULT_PROFILE_ID,
+            )
+        return enhanced
     except Exception:
         logger.warning("personalized_acoustic_fallback_to_asr_text", exc_info=True)
         return voice_text
@@ -557,7 +743,16 @@ def _resolve_final_text(
     return final_text
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Background work starts with the server, not on import, so tests and tooling that only
+    # import the app never touch stored samples.
+    sample_fingerprint_executor.submit(_resume_pending_sample_fingerprints)
+    sample_fingerprint_executor.submit(recompute_job.start)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/health")
 def health() -> dict[str, str]:
@@ -700,9 +895,15 @@ def dashboard_stop_term_sample(payload: DashboardTermSampleStopRequest) -> Dashb
 
     saved_path: Path | None = None
     try:
-        quality = _evaluate_sample_audio_quality(audio_path)
+        # Decoded once; quality checks and the fingerprint share the same PCM array.
+        pcm, sample_rate = read_wav_mono_pcm(audio_path)
+        quality = evaluate_sample_audio_quality(pcm, sample_rate)
         saved_path = _persist_term_sample_file(term, payload.session_id, audio_path)
-        fingerprint = build_mfcc_fingerprint_bytes(saved_path)
+        fingerprint = (
+            None
+            if settings.defer_sample_fingerprints
+            else build_mfcc_fingerprint_bytes_from_signal(pcm_to_float(pcm), sample_rate)
+        )
         result = history_store.add_term_sample(
             term=term,
             audio_path=str(saved_path),
@@ -710,6 +911,14 @@ def dashboard_stop_term_sample(payload: DashboardTermSampleStopRequest) -> Dashb
             quality_score=float(quality["quality_score"]),
             mfcc_fingerprint=fingerprint,
         )
+        if fingerprint is None:
+            sample_fingerprint_executor.submit(
+                _complete_sample_fingerprint,
+                int(result["sample_id"]),
+                pcm,
+                sample_rate,
+                saved_path,
+            )
         return DashboardTermSampleStopResponse(
             ok=True,
             sample_id=int(result["sample_id"]),
@@ -718,6 +927,7 @@ def dashboard_stop_term_sample(payload: DashboardTermSampleStopRequest) -> Dashb
             duration_ms=int(quality["duration_ms"]),
             quality_score=float(quality["quality_score"]),
             sample_path=str(saved_path),
+            fingerprint_pending=bool(result.get("fingerprint_pending", False)),
         )
     except ValueError as exc:
         if saved_path is not None:
@@ -758,6 +968,65 @@ def dashboard_delete_term_sample(payload: DashboardTermSampleDeleteRequest) -> D
     return DashboardTermSampleDeleteResponse(**result)
 
 
+@app.get("/v1/dashboard/fingerprints/recompute", response_model=DashboardFingerprintRecomputeResponse)
+def dashboard_fingerprint_recompute_progress() -> DashboardFingerprintRecomputeResponse:
+    return DashboardFingerprintRecomputeResponse(**asdict(recompute_job.progress()))
+
+
+@app.post("/v1/dashboard/fingerprints/recompute", response_model=DashboardFingerprintRecomputeResponse)
+def dashboard_start_fingerprint_recompute() -> DashboardFingerprintRecomputeResponse:
+    return DashboardFingerprintRecomputeResponse(**asdict(recompute_job.start()))
+
+
+@app.get("/v1/dashboard/profile/export")
+def dashboard_export_profile() -> StreamingResponse:
+    profile = history_store.export_profile(DEFAULT_PROFILE_ID)
+    return StreamingResponse(
+        iter_profile_archive(profile),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="typeless-profile-{DEFAULT_PROFILE_ID}.zip"'},
+    )
+
+
+@app.post("/v1/dashboard/profile/import", response_model=DashboardProfileImportResponse)
+def dashboard_import_profile(payload: DashboardProfileImportRequest) -> DashboardProfileImportResponse:
+    source = Path(payload.path).expanduser()
+    workers = os.cpu_count() or 1
+    try:
+        if source.is_dir():
+            terms, entries = scan_sample_directory(source)
+            entries, errors = _split_valid_import_entries(entries)
+            records, import_errors = prepare_import(entries, _term_sample_dir, workers=workers)
+        elif zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                terms, entries = read_archive_entries(archive)
+                entries, errors = _split_valid_import_entries(entries)
+                records, import_errors = prepare_import(entries, _term_sample_dir, archive=archive, workers=workers)
+        else:
+            raise HTTPException(status_code=422, detail="path is not a profile archive or directory")
+    except (ValueError, zipfile.BadZipFile) as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except OSError as exc:
+        raise HTTPException(status_code=500, detail=f"failed to read profile import: {exc}") from exc
+
+    errors.extend(import_errors)
+    result = history_store.import_term_samples(
+        [term for term in terms if len(term) <= MAX_TERM_LENGTH],
+        records,
+        DEFAULT_PROFILE_ID,
+    )
+    for skipped_path in result["skipped_paths"]:
+        _safe_unlink(Path(skipped_path))
+    return DashboardProfileImportResponse(
+        ok=True,
+        terms=int(result["terms"]),
+        imported=int(result["imported"]),
+        skipped=len(result["skipped_paths"]),
+        failed=len(errors),
+        errors=errors[:MAX_IMPORT_ERRORS_REPORTED],
+    )
+
+
 @app.post("/v1/session/start", response_model=StartSessionResponse)
 def start_session(payload: StartSessionRequest) -> StartSessionResponse:
     session_id = store.create(
@@ -809,7 +1078,7 @@ def stop_record(payload: StopRecordRequest) -> StopRecordResponse:
         raise HTTPException(status_code=404, detail="session not found") from exc
 
     try:
-        audio_path = recorder.stop(payload.session_id)
+        audio = recorder.stop_audio(payload.session_id)
     except KeyError as exc:
         raise HTTPException(
             status_code=404,
@@ -818,14 +1087,25 @@ def stop_record(payload: StopRecordRequest) -> StopRecordResponse:
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"failed to stop recording: {exc}") from exc
 
+    _enter_interactive_request()
+    # Feature extraction and fingerprint loading only need the PCM, so they overlap the ASR upload.
+    prefetch = _start_personalization_prefetch(audio) if settings.personalized_acoustic_enabled else None
     try:
+        upload = _trim_for_upload(audio) if settings.vad_trim_enabled else audio
+        hotwords = _asr_hotwords()
+        asr_kwargs: dict[str, Any] = {"hotwords": hotwords} if hotwords else {}
         voice_text = normalize_asr_text(
-            transcribe_audio(audio_path, language_hint=payload.language_hint)
+            transcribe_audio(upload, language_hint=payload.language_hint, **asr_kwargs)
         )
         if not voice_text:
             raise HTTPException(status_code=422, detail="no speech detected")
         if settings.personalized_acoustic_enabled:
-            voice_text = _apply_personalized_acoustic(voice_text, audio_path)
+            asr_text = voice_text
+            voice_text = _apply_personalized_acoustic(voice_text, audio, prefetch)
+            _record_personalization_effect(
+                hinted=bool(hotwords) and not asr_prompt_rejected(settings.siliconflow_asr_url),
+                changed=voice_text != asr_text,
+            )
 
         final_text = _resolve_final_text(
             endpoint="record_stop",
@@ -838,8 +1118,11 @@ def stop_record(payload: StopRecordRequest) -> StopRecordResponse:
             mode=payload.mode or settings.default_mode,
             voice_text=voice_text,
             final_text=final_text,
-            duration_seconds=_wav_duration_seconds(audio_path),
+            duration_seconds=round(audio.duration_seconds),
         )
         return StopRecordResponse(voice_text=voice_text, final_text=final_text)
     finally:
-        _safe_unlink(audio_path)
+        _finish_personalization_prefetch(prefetch)
+        if audio.path is not None:
+            _safe_unlink(audio.path)
+        _leave_interactive_request()
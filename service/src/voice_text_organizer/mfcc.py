@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import math
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+
+NUM_CEPS = 13
+N_FFT = 512
+N_MEL_FILTERS = 26
+PRE_EMPHASIS = 0.97
+FRAME_SECONDS = 0.025
+STEP_SECONDS = 0.01
+MAX_FINGERPRINT_FRAMES = 220
+# Bump whenever extraction changes in a way MfccExtractor.version's parameters do not capture.
+MFCC_ALGORITHM_REVISION = 1
+
+
+@dataclass(frozen=True)
+class MfccPlan:
+    sample_rate: int
+    frame_len: int
+    frame_step: int
+    window: np.ndarray
+    filterbank_t: np.ndarray
+    dct_basis_t: np.ndarray
+
+
+def read_wav_mono_pcm(audio_path: str | Path) -> tuple[np.ndarray, int]:
+    path = Path(audio_path)
+    with wave.open(str(path), "rb") as wf:
+        channels = wf.getnchannels()
+        sample_rate = wf.getframerate()
+        sampwidth = wf.getsampwidth()
+        frames = wf.getnframes()
+        raw = wf.readframes(frames)
+
+    if sampwidth != 2:
+        raise ValueError("only 16-bit PCM wav is supported")
+
+    pcm = np.frombuffer(raw, dtype=np.int16)
+    if channels > 1:
+        pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    if pcm.size == 0:
+        raise ValueError("empty audio")
+    return pcm, sample_rate
+
+
+def write_wav_mono_pcm(audio_path: str | Path, pcm: np.ndarray, sample_rate: int) -> None:
+    with wave.open(str(audio_path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(np.ascontiguousarray(pcm, dtype="<i2").tobytes())
+
+
+def pcm_to_float(pcm: np.ndarray) -> np.ndarray:
+    return pcm.astype(np.float32) / np.float32(32768.0)
+
+
+def read_wav_mono_float(audio_path: str | Path) -> tuple[np.ndarray, int]:
+    pcm, sample_rate = read_wav_mono_pcm(audio_path)
+    return pcm_to_float(pcm), sample_rate
+
+
+def _hz_to_mel(freq_hz: np.ndarray | float) -> np.ndarray | float:
+    return 2595.0 * np.log10(1.0 + np.asarray(freq_hz) / 700.0)
+
+
+def _mel_to_hz(mel: np.ndarray | float) -> np.ndarray | float:
+    return 700.0 * (10.0 ** (np.asarray(mel) / 2595.0) - 1.0)
+
+
+def build_mel_filterbank(sample_rate: int, n_fft: int, n_filters: int = N_MEL_FILTERS) -> np.ndarray:
+    mel_points = np.linspace(_hz_to_mel(0.0), _hz_to_mel(sample_rate / 2.0), n_filters + 2)
+    bins = np.floor((n_fft + 1) * _mel_to_hz(mel_points) / sample_rate).astype(int)
+
+    left = bins[:-2, None]
+    center = np.maximum(bins[1:-1], bins[:-2] + 1)[:, None]
+    right = np.maximum(bins[2:, None], center + 1)
+    j = np.arange(n_fft // 2 + 1)[None, :]
+
+    rising = (j - left) / (center - left)
+    falling = (right - j) / (right - center)
+    fbank = np.where((j >= left) & (j < center), rising, np.where((j >= center) & (j < right), falling, 0.0))
+    return fbank.astype(np.float32)
+
+
+def _dct_type_2_basis(n: int, num_ceps: int) -> np.ndarray:
+    k = np.arange(num_ceps, dtype=np.float32).reshape(-1, 1)
+    n_idx = np.arange(n, dtype=np.float32).reshape(1, -1)
+    return np.cos((math.pi / n) * (n_idx + 0.5) * k).astype(np.float32)
+
+
+def normalize_cepstra(mfcc: np.ndarray) -> np.ndarray:
+    mean = np.mean(mfcc, axis=0, keepdims=True)
+    std = np.std(mfcc, axis=0, keepdims=True)
+    std = np.where(std < 1e-6, np.float32(1.0), std)
+    return ((mfcc - mean) / std).astype(np.float32, copy=False)
+
+
+def normalize_cepstra_locally(mfcc: np.ndarray, window: int) -> np.ndarray:
+    # Mean/variance over a centred window, so a term found inside a longer recording is
+    # scaled like its standalone fingerprint rather than by the whole recording.
+    frames = mfcc.shape[0]
+    window = max(1, min(int(window), frames))
+    half = window // 2
+    values = mfcc.astype(np.float64)
+    padded = np.pad(values, ((half, window - 1 - half), (0, 0)), mode="edge")
+    sums = np.concatenate([np.zeros((1, values.shape[1])), np.cumsum(padded, axis=0)])
+    squares = np.concatenate([np.zeros((1, values.shape[1])), np.cumsum(padded * padded, axis=0)])
+    mean = (sums[window:] - sums[:-window]) / window
+    variance = np.maximum((squares[window:] - squares[:-window]) / window - mean * mean, 0.0)
+    std = np.sqrt(variance)
+    std = np.where(std < 1e-6, 1.0, std)
+    return ((values - mean) / std).astype(np.float32)
+
+
+def frame_signal(signal: np.ndarray, frame_len: int, frame_step: int) -> np.ndarray:
+    if signal.size <= frame_len:
+        return np.pad(signal, (0, frame_len - signal.size), mode="constant").reshape(1, frame_len)
+
+    n_frames = 1 + int(math.ceil((signal.size - frame_len) / float(frame_step)))
+    total_len = (n_frames - 1) * frame_step + frame_len
+    padded = np.pad(signal, (0, max(0, total_len - signal.size)), mode="constant")
+    return np.lib.stride_tricks.sliding_window_view(padded, frame_len)[::frame_step]
+
+
+class MfccExtractor:
+    def __init__(
+        self,
+        *,
+        num_ceps: int = NUM_CEPS,
+        n_fft: int = N_FFT,
+        n_filters: int = N_MEL_FILTERS,
+        max_frames: int = MAX_FINGERPRINT_FRAMES,
+    ) -> None:
+        self.num_ceps = num_ceps
+        self.n_fft = n_fft
+        self.n_filters = n_filters
+        self.max_frames = max_frames
+        self._plans: dict[int, MfccPlan] = {}
+        self._lock = Lock()
+
+    @property
+    def version(self) -> str:
+        # Stored with every sample fingerprint; samples with another version are re-extracted.
+        return (
+            f"r{MFCC_ALGORITHM_REVISION}-c{self.num_ceps}-f{self.n_fft}-m{self.n_filters}-n{self.max_frames}"
+            f"-p{PRE_EMPHASIS:g}-w{FRAME_SECONDS:g}-s{STEP_SECONDS:g}"
+        )
+
+    def plan(self, sample_rate: int) -> MfccPlan:
+        plan = self._plans.get(sample_rate)
+        if plan is not None:
+            return plan
+
+        with self._lock:
+            plan = self._plans.get(sample_rate)
+            if plan is None:
+                frame_len = int(round(FRAME_SECONDS * sample_rate))
+                plan = MfccPlan(
+                    sample_rate=sample_rate,
+                    frame_len=frame_len,
+                    frame_step=int(round(STEP_SECONDS * sample_rate)),
+                    window=np.hamming(frame_len).astype(np.float32),
+                    filterbank_t=np.ascontiguousarray(build_mel_filterbank(sample_rate, self.n_fft, self.n_filters).T),
+                    dct_basis_t=np.ascontiguousarray(_dct_type_2_basis(self.n_filters, self.num_ceps).T),
+                )
+                self._plans[sample_rate] = plan
+        return plan
+
+    def _windowed_frames(self, signal: np.ndarray, plan: MfccPlan) -> np.ndarray:
+        signal = np.asarray(signal, dtype=np.float32)
+        emphasized = np.empty_like(signal)
+        emphasized[:1] = signal[:1]
+        np.subtract(signal[1:], np.float32(PRE_EMPHASIS) * signal[:-1], out=emphasized[1:])
+        return frame_signal(emphasized, plan.frame_len, plan.frame_step) * plan.window
+
+    def _cepstra(self, frames: np.ndarray, plan: MfccPlan) -> np.ndarray:
+        spectrum = np.fft.rfft(frames, self.n_fft)
+        pow_spec = (spectrum.real**2 + spectrum.imag**2) * np.float32(1.0 / self.n_fft)
+        mel_energy = np.maximum(pow_spec @ plan.filterbank_t, np.float32(1e-10))
+        return np.log(mel_energy) @ plan.dct_basis_t
+
+    def fingerprint(self, mfcc: np.ndarray) -> np.ndarray:
+        normalized = normalize_cepstra(mfcc)
+        if normalized.shape[0] > self.max_frames:
+            indices = np.linspace(0, normalized.shape[0] - 1, self.max_frames).astype(int)
+            normalized = normalized[indices]
+        return normalized.astype(np.float32, copy=False)
+
+    def compute(self, signal: np.ndarray, sample_rate: int) -> np.ndarray:
+        return self.fingerprint(self.compute_frames(signal, sample_rate))
+
+    def compute_frames(self, signal: np.ndarray, sample_rate: int) -> np.ndarray:
+        # Raw cepstra at full frame rate, before normalization and the fingerprint frame cap.
+        plan = self.plan(sample_rate)
+        return self._cepstra(self._windowed_frames(signal, plan), plan).astype(np.float32, copy=False)
+
+    def compute_batch(self, signals: list[tuple[np.ndarray, int]]) -> list[np.ndarray]:
+        return [self.compute(signal, sample_rate) for signal, sample_rate in signals]
+
+    def compute_file(self, audio_path: str | Path) -> np.ndarray:
+        return self.compute(*read_wav_mono_float(audio_path))
+
+    def compute_file_frames(self, audio_path: str | Path) -> np.ndarray:
+        return self.compute_frames(*read_wav_mono_float(audio_path))
+
+    def compute_files(self, audio_paths: list[str | Path]) -> list[np.ndarray]:
+        return [self.compute_file(path) for path in audio_paths]
+
+
+DEFAULT_MFCC_EXTRACTOR = MfccExtractor()
+FINGERPRINT_VERSION = DEFAULT_MFCC_EXTRACTOR.version
@@ -1,134 +1,140 @@
 ﻿from __future__ import annotations
 
+import heapq
 import io
 import math
 import re
 import time
-import wave
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
+from voice_text_organizer.dtw import (  # noqa: F401 - dtw_distance is re-exported
+    QueryEnvelope,
+    build_query_envelope,
+    dtw_distance,
+    dtw_distance_batch,
+    fast_dtw_distance_batch,
+    lb_keogh,
+    subsequence_dtw_distance_batch,
+)
+from voice_text_organizer.embedding import SampleEmbeddings, embed_fingerprint, embed_query_windows
+from voice_text_organizer.mfcc import DEFAULT_MFCC_EXTRACTOR, STEP_SECONDS, normalize_cepstra_locally
+from voice_text_organizer.phonetic import PhoneticIndex
+from voice_text_organizer.term_index import AhoCorasick, TermIndex, fold_case
+
+if TYPE_CHECKING:
+    from voice_text_organizer.dtw_pool import DtwProcessPool
+    from voice_text_organizer.fingerprint_codec import PcaBasis
+
+DTW_WINDOW = 30
+ACOUSTIC_DISTANCE_SCALE = 8.0
+MIN_ACOUSTIC_CONFIDENCE = 0.86
+MIN_TEXT_SCORE = 0.68
+DtwMode = Literal["exact", "approximate", "subsequence"]
+DTW_MODES = ("exact", "approximate", "subsequence")
+# Proportional text-to-audio alignment drifts with speaking rate; widen the region by this much.
+ALIGNMENT_SLACK_FRAMES = 50
+# Samples whose embeddings rank below this many across all candidates never reach DTW.
+EMBEDDING_TOP_K = 16
+# A term needs this many scored attempts before its history can push it back, skip it, or let
+# its homophones be replaced without acoustic scoring.
+COLD_TERM_MIN_ATTEMPTS = 8
+# Once this share of the deadline is spent, cold terms are skipped instead of scored.
+DEADLINE_PRESSURE_RATIO = 0.5
+# Exact toneless homophones at least this long are replaced without acoustic scoring, but only for
+# terms whose acoustic checks have proven them: correctly transcribed homophones exist too. Shorter
+# or unproven ones still go through DTW.
+PHONETIC_DIRECT_MIN_CHARS = 3
+PHONETIC_DIRECT_MIN_WIN_RATE = 0.6
+PHONETIC_CANDIDATE_SCORE = 0.75
+# Largest DTW distance that still clears MIN_ACOUSTIC_CONFIDENCE; anything above it is pruned.
+MAX_ACCEPTED_DISTANCE = -ACOUSTIC_DISTANCE_SCALE * math.log(MIN_ACOUSTIC_CONFIDENCE) + 1e-9
+# Subsequence search picks the closest span anywhere in the region, so unrelated samples
+# score lower than under whole-query DTW and need a tighter cut. Calibrated with
+# benchmarks/bench_subsequence_threshold.py.
+MAX_SUBSEQUENCE_DISTANCE = 0.95
+
+
+@dataclass
+class EnhanceStats:
+    candidates: int = 0
+    pairs: int = 0
+    skipped_pairs: int = 0
+    phonetic_replacements: int = 0
+    filtered_pairs: int = 0
+    pruned_pairs: int = 0
+    abandoned_pairs: int = 0
+    scored_pairs: int = 0
+    cold_skipped_pairs: int = 0
+    timed_out: bool = False
+    elapsed_ms: float = 0.0
+    outcomes: list[TermMatchOutcome] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class TermMatchOutcome:
+    term: str
+    # For a term whose samples were all pruned or abandoned, the acceptance cutoff they exceeded.
+    best_distance: float
+    replaced: bool
+
+
+@dataclass(frozen=True)
+class TermMatchStats:
+    attempts: int = 0
+    replacements: int = 0
+    typical_distance: float | None = None
+
+    @property
+    def win_rate(self) -> float:
+        # Laplace-smoothed, so unseen terms start at 0.5 instead of 0 or 1.
+        return (self.replacements + 1) / (self.attempts + 2)
+
+    def is_cold(self, max_distance: float) -> bool:
+        # Losses are recorded at the cutoff they missed, so a term that never got under the
+        # active mode's limit settles exactly on it; one near miss pulls it back below.
+        return (
+            self.attempts >= COLD_TERM_MIN_ATTEMPTS
+            and self.replacements == 0
+            and self.typical_distance is not None
+            and self.typical_distance >= max_distance
+        )
 
-def _read_wav_mono_float(audio_path: str | Path) -> tuple[np.ndarray, int]:
-    path = Path(audio_path)
-    with wave.open(str(path), "rb") as wf:
-        channels = wf.getnchannels()
-        sample_rate = wf.getframerate()
-        sampwidth = wf.getsampwidth()
-        frames = wf.getnframes()
-        raw = wf.readframes(frames)
-
-    if sampwidth != 2:
-        raise ValueError("only 16-bit PCM wav is supported")
-
-    pcm = np.frombuffer(raw, dtype=np.int16)
-    if channels > 1:
-        pcm = pcm.reshape(-1, channels).mean(axis=1).astype(np.int16)
-
-    signal = pcm.astype(np.float32) / 32768.0
-    if signal.size == 0:
-        raise ValueError("empty audio")
-    return signal, sample_rate
-
-
-def _hz_to_mel(freq_hz: np.ndarray | float) -> np.ndarray | float:
-    return 2595.0 * np.log10(1.0 + np.asarray(freq_hz) / 700.0)
-
-
-def _mel_to_hz(mel: np.ndarray | float) -> np.ndarray | float:
-    return 700.0 * (10.0 ** (np.asarray(mel) / 2595.0) - 1.0)
-
-
-def _build_mel_filterbank(sample_rate: int, n_fft: int, n_filters: int = 26) -> np.ndarray:
-    low_mel = _hz_to_mel(0.0)
-    high_mel = _hz_to_mel(sample_rate / 2.0)
-    mel_points = np.linspace(low_mel, high_mel, n_filters + 2)
-    hz_points = _mel_to_hz(mel_points)
-    bins = np.floor((n_fft + 1) * hz_points / sample_rate).astype(int)
-
-    fbank = np.zeros((n_filters, n_fft // 2 + 1), dtype=np.float32)
-    for idx in range(1, n_filters + 1):
-        left = bins[idx - 1]
-        center = bins[idx]
-        right = bins[idx + 1]
-        if center <= left:
-            center = left + 1
-        if right <= center:
-            right = center + 1
-
-        for j in range(left, center):
-            fbank[idx - 1, j] = (j - left) / float(center - left)
-        for j in range(center, right):
-            fbank[idx - 1, j] = (right - j) / float(right - center)
-
-    return fbank
-
-
-def _frame_signal(signal: np.ndarray, frame_len: int, frame_step: int) -> np.ndarray:
-    if signal.size <= frame_len:
-        pad_len = frame_len - signal.size
-        padded = np.pad(signal, (0, pad_len), mode="constant")
-        return padded.reshape(1, frame_len)
-
-    n_frames = 1 + int(math.ceil((signal.size - frame_len) / float(frame_step)))
-    total_len = (n_frames - 1) * frame_step + frame_len
-    padded = np.pad(signal, (0, max(0, total_len - signal.size)), mode="constant")
-
-    indices = (
-        np.tile(np.arange(0, frame_len), (n_frames, 1))
-        + np.tile(np.arange(0, n_frames * frame_step, frame_step), (frame_len, 1)).T
-    )
-    return padded[indices]
-
-
-def _dct_type_2(x: np.ndarray, num_ceps: int) -> np.ndarray:
-    n = x.shape[1]
-    k = np.arange(num_ceps, dtype=np.float32).reshape(-1, 1)
-    n_idx = np.arange(n, dtype=np.float32).reshape(1, -1)
-    basis = np.cos((math.pi / n) * (n_idx + 0.5) * k)
-    return np.dot(x, basis.T)
-
-
-def _compute_mfcc(signal: np.ndarray, sample_rate: int, num_ceps: int = 13) -> np.ndarray:
-    emphasized = np.append(signal[0], signal[1:] - 0.97 * signal[:-1])
 
-    frame_len = int(round(0.025 * sample_rate))
-    frame_step = int(round(0.01 * sample_rate))
-    n_fft = 512
+@dataclass
+class PersonalizationContext:
+    active_terms: list[str]
+    sample_lookup: dict[str, list[np.ndarray]]
+    query_matrix: np.ndarray
+    sample_ids: dict[str, list[int]] | None = None
+    query_frames: np.ndarray | None = None
+    embeddings: SampleEmbeddings | None = None
+    match_stats: dict[str, TermMatchStats] | None = None
+    sample_durations_ms: dict[str, list[int]] | None = None
+    basis: PcaBasis | None = None
 
-    frames = _frame_signal(emphasized, frame_len, frame_step)
-    frames *= np.hamming(frame_len)
 
-    mag = np.absolute(np.fft.rfft(frames, n_fft))
-    pow_spec = (1.0 / n_fft) * (mag ** 2)
+def encode_mfcc_fingerprint(matrix: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, matrix.astype(np.float32, copy=False), allow_pickle=False)
+    return buffer.getvalue()
 
-    fbank = _build_mel_filterbank(sample_rate, n_fft, n_filters=26)
-    mel_energy = np.dot(pow_spec, fbank.T)
-    mel_energy = np.maximum(mel_energy, 1e-10)
-    log_mel = np.log(mel_energy)
 
-    mfcc = _dct_type_2(log_mel, num_ceps=num_ceps).astype(np.float32)
-    mean = np.mean(mfcc, axis=0, keepdims=True)
-    std = np.std(mfcc, axis=0, keepdims=True)
-    std = np.where(std < 1e-6, 1.0, std)
-    normalized = (mfcc - mean) / std
+def build_mfcc_fingerprint_bytes(audio_path: str | Path) -> bytes:
+    return encode_mfcc_fingerprint(DEFAULT_MFCC_EXTRACTOR.compute_file(audio_path))
 
-    if normalized.shape[0] > 220:
-        indices = np.linspace(0, normalized.shape[0] - 1, 220).astype(int)
-        normalized = normalized[indices]
 
-    return normalized
+def build_mfcc_fingerprint_bytes_from_signal(signal: np.ndarray, sample_rate: int) -> bytes:
+    return encode_mfcc_fingerprint(DEFAULT_MFCC_EXTRACTOR.compute(signal, sample_rate))
 
 
-def build_mfcc_fingerprint_bytes(audio_path: str | Path) -> bytes:
-    signal, sample_rate = _read_wav_mono_float(audio_path)
-    matrix = _compute_mfcc(signal, sample_rate)
-    buffer = io.BytesIO()
-    np.save(buffer, matrix.astype(np.float32), allow_pickle=False)
-    return buffer.getvalue()
+def build_mfcc_fingerprints(audio_paths: list[str | Path]) -> list[bytes]:
+    return [encode_mfcc_fingerprint(matrix) for matrix in DEFAULT_MFCC_EXTRACTOR.compute_files(audio_paths)]
 
 
 def decode_mfcc_fingerprint_bytes(blob: bytes) -> np.ndarray:
@@ -136,33 +142,6 @@ def decode_mfcc_fingerprint_bytes(blob: bytes) -> np.ndarray:
     return np.load(buffer, allow_pickle=False).astype(np.float32)
 
 
-def dtw_distance(a: np.ndarray, b: np.ndarray, window: int | None = None) -> float:
-    if a.ndim != 2 or b.ndim != 2:
-        raise ValueError("dtw inputs must be 2D arrays")
-    if a.shape[1] != b.shape[1]:
-        raise ValueError("dtw feature dimensions mismatch")
-
-    n = a.shape[0]
-    m = b.shape[0]
-    if n == 0 or m == 0:
-        return float("inf")
-
-    if window is None:
-        window = max(abs(n - m), 25)
-
-    dp = np.full((n + 1, m + 1), np.inf, dtype=np.float64)
-    dp[0, 0] = 0.0
-
-    for i in range(1, n + 1):
-        j_start = max(1, i - window)
-        j_end = min(m + 1, i + window)
-        for j in range(j_start, j_end):
-            cost = float(np.linalg.norm(a[i - 1] - b[j - 1]))
-            dp[i, j] = cost + min(dp[i - 1, j], dp[i, j - 1], dp[i - 1, j - 1])
-
-    return float(dp[n, m] / (n + m))
-
-
 def _collect_text_spans(voice_text: str) -> list[str]:
     spans: list[str] = []
     normalized = voice_text.strip()
@@ -195,21 +174,91 @@ def _collect_text_spans(voice_text: str) -> list[str]:
     return deduped
 
 
-def _best_lexical_match(term: str, spans: list[str]) -> tuple[str, float]:
+_term_index: TermIndex | None = None
+
+
+def _get_term_index(active_terms: list[str]) -> TermIndex:
+    global _term_index
+    index = _term_index
+    if index is None or index.key != tuple(active_terms):
+        index = TermIndex(active_terms)
+        _term_index = index
+    return index
+
+
+_phonetic_index: PhoneticIndex | None = None
+
+
+def _get_phonetic_index(active_terms: list[str]) -> PhoneticIndex:
+    global _phonetic_index
+    index = _phonetic_index
+    if index is None or index.key != tuple(active_terms):
+        index = PhoneticIndex(active_terms)
+        _phonetic_index = index
+    return index
+
+
+def _merge_phonetic_matches(
+    candidates: list[dict[str, Any]],
+    phonetic_matches: dict[str, tuple[str, float]],
+    present_terms: set[str],
+    replacements: list[tuple[float, str, str]],
+    stats: EnhanceStats,
+    match_stats: Mapping[str, TermMatchStats] | None = None,
+) -> list[dict[str, Any]]:
+    by_term = {str(item["term"]): item for item in candidates}
+    resolved: set[str] = set()
+    for term, (span, score) in phonetic_matches.items():
+        if term in present_terms:
+            continue
+        term_stats = match_stats.get(term) if match_stats is not None else None
+        proven = (
+            term_stats is not None
+            and term_stats.attempts >= COLD_TERM_MIN_ATTEMPTS
+            and term_stats.win_rate >= PHONETIC_DIRECT_MIN_WIN_RATE
+        )
+        if score >= 1.0 and len(term) >= PHONETIC_DIRECT_MIN_CHARS and proven:
+            replacements.append((score, term, span))
+            stats.phonetic_replacements += 1
+            resolved.add(term)
+            continue
+        if score < PHONETIC_CANDIDATE_SCORE:
+            continue
+        # Homophones share no characters, so the lexical score alone would never let them reach DTW.
+        item = by_term.get(term)
+        if item is None:
+            item = {"term": term, "best_match": span, "text_score": score, "priority": score}
+            by_term[term] = item
+            candidates = [*candidates, item]
+        elif float(item["text_score"]) < score:
+            item.update(best_match=span, text_score=score, priority=max(float(item["priority"]), score))
+    return [item for item in candidates if item["term"] not in resolved]
+
+
+def _best_lexical_match(
+    term: str,
+    spans: list[str],
+    matchers: list[SequenceMatcher],
+    bounds: np.ndarray,
+) -> tuple[str, float]:
     term_lower = term.lower()
-    best_match = ""
+    best_idx = -1
     best_score = 0.0
 
-    for span in spans:
-        span_lower = span.lower()
-        if term_lower == span_lower:
-            return span, 1.0
-        score = SequenceMatcher(None, term_lower, span_lower).ratio()
-        if score > best_score:
+    # Visit spans by descending upper bound; ties on score still go to the earliest span.
+    for idx in np.argsort(-bounds, kind="stable").tolist():
+        if bounds[idx] <= 0.0 or bounds[idx] < best_score:
+            break
+        matcher = matchers[idx]
+        matcher.set_seq1(term_lower)
+        if term_lower == matcher.b:
+            return spans[idx], 1.0
+        score = matcher.ratio()
+        if score > best_score or (score == best_score and idx < best_idx):
             best_score = score
-            best_match = span
+            best_idx = idx
 
-    return best_match, best_score
+    return (spans[best_idx] if best_idx >= 0 else ""), best_score
 
 
 def select_candidate_terms(
@@ -217,22 +266,52 @@ def select_candidate_terms(
     active_terms: list[str],
     *,
     max_candidates: int = 20,
+    match_stats: Mapping[str, TermMatchStats] | None = None,
 ) -> list[dict[str, Any]]:
     if not active_terms or max_candidates <= 0:
         return []
 
     spans = _collect_text_spans(voice_text)
-    scored: list[dict[str, Any]] = []
-    for term in active_terms:
-        best_match, score = _best_lexical_match(term, spans)
-        scored.append(
-            {
-                "term": term,
-                "best_match": best_match,
-                "text_score": float(score),
-            }
-        )
-
+    # Matchers cache the span side (seq2), so each span is preprocessed once for all terms.
+    matchers = [SequenceMatcher(None, "", span.lower()) for span in spans]
+    hit_positions, pair_bounds = _get_term_index(active_terms).pair_bounds(spans)
+    term_bounds = pair_bounds.max(axis=1) if spans else np.zeros(len(hit_positions))
+
+    # The result is the top max_candidates by (score, term); once the best remaining bound falls
+    # below the current cut-off no unscored term can enter it.
+    top: list[tuple[float, str, int]] = []
+    results: dict[int, tuple[str, float]] = {}
+
+    def offer(position: int, best_match: str, score: float) -> None:
+        results[position] = (best_match, score)
+        entry = (score, active_terms[position].lower(), position)
+        if len(top) < max_candidates:
+            heapq.heappush(top, entry)
+        elif entry[:2] > top[0][:2]:
+            heapq.heapreplace(top, entry)
+
+    for row in np.argsort(-term_bounds, kind="stable").tolist():
+        if len(top) >= max_candidates and term_bounds[row] < top[0][0]:
+            break
+        position = int(hit_positions[row])
+        best_match, score = _best_lexical_match(active_terms[position], spans, matchers, pair_bounds[row])
+        offer(position, best_match, float(score))
+
+    # Terms sharing no character with the text score exactly 0 and only matter as filler.
+    if len(top) < max_candidates or top[0][0] <= 0.0:
+        hit = set(hit_positions.tolist())
+        for position in range(len(active_terms)):
+            if position not in hit:
+                offer(position, "", 0.0)
+
+    scored: list[dict[str, Any]] = [
+        {
+            "term": active_terms[position],
+            "best_match": results[position][0],
+            "text_score": results[position][1],
+        }
+        for position in results
+    ]
     scored.sort(key=lambda item: (item["text_score"], item["term"].lower()), reverse=True)
 
     stage_a = [item for item in scored if item["text_score"] >= 0.55][:12]
@@ -246,77 +325,385 @@ def select_candidate_terms(
         if len(stage_a) + len(stage_b) >= max_candidates:
             break
 
-    return (stage_a + stage_b)[:max_candidates]
+    selected = (stage_a + stage_b)[:max_candidates]
+    for item in selected:
+        term_stats = match_stats.get(item["term"]) if match_stats is not None else None
+        item["priority"] = item["text_score"] * (term_stats.win_rate if term_stats is not None else 1.0)
+    if match_stats:
+        # Same candidates, but terms that keep losing the acoustic check are tried last.
+        selected.sort(key=lambda item: item["priority"], reverse=True)
+    return selected
+
+
+def select_asr_hotwords(
+    active_terms: list[str],
+    match_stats: Mapping[str, TermMatchStats] | None = None,
+    *,
+    limit: int,
+) -> list[str]:
+    # Terms acoustic correction keeps having to fix are the ones ASR gets wrong, so they go
+    # first; the rest keep the library order (most samples, most recent).
+    if limit <= 0:
+        return []
+    stats = match_stats or {}
+    ranked = sorted(
+        range(len(active_terms)),
+        key=lambda position: (
+            -(stats[active_terms[position]].replacements if active_terms[position] in stats else 0),
+            position,
+        ),
+    )
+    return [active_terms[position] for position in ranked[:limit]]
+
+
+def locate_audio_region(voice_text: str, best_match: str, total_frames: int, term_frames: int) -> tuple[int, int]:
+    # ASR returns plain text, so the span is placed by its character offset, assuming a
+    # roughly even speaking rate, then padded by the term length plus a fixed slack.
+    text = fold_case(voice_text)
+    start_char = text.find(fold_case(best_match))
+    if not text or start_char < 0:
+        return 0, total_frames
+    end_char = start_char + len(best_match)
+    scale = total_frames / len(text)
+    pad = ALIGNMENT_SLACK_FRAMES + term_frames
+    start = max(0, int(math.floor(start_char * scale)) - pad)
+    end = min(total_frames, int(math.ceil(end_char * scale)) + pad)
+    return start, max(start + 1, end)
+
+
+def _decimation_rate(sample_matrices: list[np.ndarray], durations_ms: list[int] | None) -> float:
+    # Fingerprints over the frame cap were decimated; the recorded duration gives the
+    # original frame count, so the ratio is the step between the frames that were kept.
+    if not durations_ms or len(durations_ms) != len(sample_matrices):
+        return 1.0
+    rates = [
+        duration_ms / 1000.0 / STEP_SECONDS / sample.shape[0]
+        for duration_ms, sample in zip(durations_ms, sample_matrices)
+        if duration_ms > 0 and sample.shape[0] > 0
+    ]
+    return max(1.0, float(np.median(rates))) if rates else 1.0
+
+
+def _query_region(
+    voice_text: str,
+    best_match: str,
+    query_frames: np.ndarray,
+    sample_matrices: list[np.ndarray],
+    durations_ms: list[int] | None = None,
+) -> np.ndarray:
+    # The region is cut at the full frame rate, then decimated like the term's samples so
+    # both sides of the subsequence search advance at the same rate.
+    rate = _decimation_rate(sample_matrices, durations_ms)
+    term_frames = int(round(max(sample.shape[0] for sample in sample_matrices) * rate))
+    start, end = locate_audio_region(voice_text, best_match, query_frames.shape[0], term_frames)
+    region = normalize_cepstra_locally(query_frames[start:end], term_frames)
+    if rate > 1.0:
+        kept = max(1, int(round(region.shape[0] / rate)))
+        region = region[np.linspace(0, region.shape[0] - 1, kept).astype(int)]
+    return region
+
+
+def _deadline_passed(deadline: float | None, stats: EnhanceStats) -> bool:
+    # deadline is on time.monotonic(), which is system-wide, so pool workers can share the caller's.
+    if deadline is None or time.monotonic() < deadline:
+        return False
+    stats.timed_out = True
+    return True
+
+
+def _best_subsequence_distance(
+    region: np.ndarray,
+    sample_matrices: list[np.ndarray],
+    stats: EnhanceStats,
+    deadline: float | None = None,
+) -> float:
+    best_distance = float("inf")
+    for sample in sample_matrices:
+        if _deadline_passed(deadline, stats):
+            break
+        limit = min(MAX_SUBSEQUENCE_DISTANCE, best_distance)
+        distance = float(subsequence_dtw_distance_batch(region, [sample], max_distance=limit)[0])
+        if math.isfinite(distance):
+            stats.scored_pairs += 1
+            best_distance = min(best_distance, distance)
+        else:
+            stats.abandoned_pairs += 1
+    return best_distance
+
+
+def _prefilter_samples(
+    eligible: list[tuple[str, str, float, list[np.ndarray], np.ndarray]],
+    embeddings: SampleEmbeddings,
+    shared_query: np.ndarray | None,
+    top_k: int,
+) -> dict[str, list[int]]:
+    # Returns the sample positions per term that survive the cosine-similarity cut.
+    shared_vector = None if shared_query is None else embed_fingerprint(shared_query)
+    scored: list[tuple[float, str, int]] = []
+    kept: dict[str, list[int]] = {}
+    for term, _, _, sample_matrices, term_query in eligible:
+        rows = embeddings.rows.get(term)
+        if rows is None or len(rows) != len(sample_matrices):
+            kept[term] = list(range(len(sample_matrices)))
+            continue
+        vectors = embeddings.matrix[rows]
+        if shared_vector is not None:
+            similarity = vectors @ shared_vector
+        else:
+            window = int(np.median([matrix.shape[0] for matrix in sample_matrices]))
+            similarity = (embed_query_windows(term_query, window) @ vectors.T).max(axis=0)
+        scored.extend((float(value), term, position) for position, value in enumerate(similarity))
+
+    for _, term, position in heapq.nlargest(top_k, scored, key=lambda item: item[0]):
+        kept.setdefault(term, []).append(position)
+    return {term: sorted(positions) for term, positions in kept.items()}
+
+
+def _best_sample_distance(
+    query_matrix: np.ndarray,
+    envelope: QueryEnvelope | None,
+    sample_matrices: list[np.ndarray],
+    stats: EnhanceStats,
+    dtw_mode: DtwMode = "exact",
+    deadline: float | None = None,
+) -> float:
+    # With a deadline, scoring stops between batches once it passes and stats.timed_out is set.
+    if dtw_mode == "subsequence" or envelope is None:
+        return _best_subsequence_distance(query_matrix, sample_matrices, stats, deadline)
+
+    bounds = [lb_keogh(envelope, matrix) for matrix in sample_matrices]
+    order = sorted(range(len(sample_matrices)), key=lambda idx: bounds[idx])
+
+    # Score the most promising sample alone so its distance tightens the budget for the rest.
+    best_distance = float("inf")
+    for group in (order[:1], order[1:]):
+        if group and _deadline_passed(deadline, stats):
+            break
+        limit = min(MAX_ACCEPTED_DISTANCE, best_distance)
+        kept = [idx for idx in group if bounds[idx] <= limit]
+        stats.pruned_pairs += len(group) - len(kept)
+        if not kept:
+            continue
+
+        score_batch = fast_dtw_distance_batch if dtw_mode == "approximate" else dtw_distance_batch
+        distances = score_batch(
+            query_matrix,
+            [sample_matrices[idx] for idx in kept],
+            window=DTW_WINDOW,
+            max_distance=limit,
+        )
+        finished = int(np.isfinite(distances).sum())
+        stats.scored_pairs += finished
+        stats.abandoned_pairs += len(kept) - finished
+        best_distance = min(best_distance, float(distances.min()))
+    return best_distance
+
+
+def apply_replacements(text: str, replacements: list[tuple[str, str]]) -> str:
+    # replacements are (span, term) in priority order; each claims the first occurrence of its
+    # span that does not overlap a higher-priority claim, then the text is rebuilt in one pass.
+    if not replacements:
+        return text
+    automaton = AhoCorasick([fold_case(span) for span, _ in replacements])
+    occurrences: dict[int, list[int]] = {}
+    for start, pattern_id in automaton.iter_matches(fold_case(text)):
+        occurrences.setdefault(pattern_id, []).append(start)
+
+    claimed: list[tuple[int, int, str]] = []
+    for pattern_id, (span, term) in enumerate(replacements):
+        for start in sorted(occurrences.get(pattern_id, ())):
+            end = start + len(span)
+            if all(end <= other_start or start >= other_end for other_start, other_end, _ in claimed):
+                claimed.append((start, end, term))
+                break
+
+    pieces: list[str] = []
+    cursor = 0
+    for start, end, term in sorted(claimed):
+        pieces.append(text[cursor:start])
+        pieces.append(term)
+        cursor = end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+def _collect_replacement(
+    replacements: list[tuple[float, str, str]],
+    best_distance: float,
+    term: str,
+    best_match: str,
+    text_score: float,
+    max_distance: float = MAX_ACCEPTED_DISTANCE,
+) -> bool:
+    if not math.isfinite(best_distance) or best_distance > max_distance:
+        return False
+    acoustic_conf = float(math.exp(-best_distance / ACOUSTIC_DISTANCE_SCALE))
+    if acoustic_conf >= MIN_ACOUSTIC_CONFIDENCE:
+        replacements.append((acoustic_conf * text_score, term, best_match))
+        return True
+    return False
+
+
+def _outcome_distance(best_distance: float, max_distance: float) -> float:
+    # Pruned and abandoned samples only show the distance is beyond the cutoff they were scored
+    # against; record that cutoff so repeated losses still build up a typical distance.
+    return best_distance if math.isfinite(best_distance) else max_distance
 
 
 def enhance_voice_text(
     *,
     voice_text: str,
-    audio_path: str | Path,
     active_terms: list[str],
-    sample_lookup: dict[str, list[bytes]],
+    audio_path: str | Path | None = None,
+    sample_lookup: dict[str, list[bytes]] | dict[str, list[np.ndarray]],
     timeout_ms: int = 900,
+    stats: EnhanceStats | None = None,
+    dtw_mode: DtwMode = "exact",
+    query_matrix: np.ndarray | None = None,
+    pool: DtwProcessPool | None = None,
+    sample_ids: dict[str, list[int]] | None = None,
+    query_frames: np.ndarray | None = None,
+    embeddings: SampleEmbeddings | None = None,
+    match_stats: Mapping[str, TermMatchStats] | None = None,
+    sample_durations_ms: dict[str, list[int]] | None = None,
+    basis: PcaBasis | None = None,
 ) -> str:
+    # With a basis, sample matrices are the profile's reduced PCA fingerprints and every
+    # query is reduced the same way before it reaches DTW or the embedding prefilter.
+    if dtw_mode not in DTW_MODES:
+        raise ValueError(f"unsupported dtw mode: {dtw_mode}")
+    stats = stats if stats is not None else EnhanceStats()
     if not voice_text.strip() or not active_terms:
         return voice_text
     if timeout_ms <= 0:
+        stats.timed_out = True
         return voice_text
 
     started = time.perf_counter()
 
-    candidates = select_candidate_terms(voice_text, active_terms, max_candidates=20)
-    if not candidates:
+    candidates = select_candidate_terms(voice_text, active_terms, max_candidates=20, match_stats=match_stats)
+    present_terms = _get_term_index(active_terms).present_terms(voice_text)
+    replacements: list[tuple[float, str, str]] = []
+    phonetic_matches = _get_phonetic_index(active_terms).best_matches(_collect_text_spans(voice_text))
+    candidates = _merge_phonetic_matches(
+        candidates, phonetic_matches, present_terms, replacements, stats, match_stats
+    )
+    if not candidates and not replacements:
         return voice_text
 
-    query_blob = build_mfcc_fingerprint_bytes(audio_path)
-    query_matrix = decode_mfcc_fingerprint_bytes(query_blob)
-
-    replacements: list[tuple[float, str, str]] = []
+    envelope: QueryEnvelope | None = None
+    if candidates and audio_path is None and (query_frames if dtw_mode == "subsequence" else query_matrix) is None:
+        raise ValueError("enhance_voice_text needs audio_path or precomputed query features")
+    if candidates and dtw_mode == "subsequence":
+        if query_frames is None:
+            query_frames = DEFAULT_MFCC_EXTRACTOR.compute_file_frames(audio_path)
+    elif candidates:
+        if query_matrix is None:
+            query_matrix = DEFAULT_MFCC_EXTRACTOR.compute_file(audio_path)
+        if basis is not None:
+            query_matrix = basis.reduce(query_matrix)
+        envelope = build_query_envelope(query_matrix, window=DTW_WINDOW)
+
+    pooled: list[tuple[str, str, float]] = []
+    regions: dict[str, np.ndarray] = {}
+    eligible: list[tuple[str, str, float, list[np.ndarray], np.ndarray]] = []
+    candidates = sorted(candidates, key=lambda item: float(item["priority"]), reverse=True)
+    stats.candidates = len(candidates)
     for candidate in candidates:
+        # Decoding samples and cutting regions costs time too, so the deadline holds here as well.
         elapsed_ms = (time.perf_counter() - started) * 1000.0
         if elapsed_ms > timeout_ms:
+            stats.timed_out = True
+            stats.elapsed_ms = elapsed_ms
             return voice_text
 
         term = str(candidate["term"])
         term_lower = term.lower()
-        if term_lower in voice_text.lower():
+        if term in present_terms:
             continue
 
         samples = sample_lookup.get(term, [])
         if not samples:
             continue
+        stats.pairs += len(samples)
 
-        best_distance = float("inf")
-        for sample_blob in samples:
-            elapsed_ms = (time.perf_counter() - started) * 1000.0
-            if elapsed_ms > timeout_ms:
-                return voice_text
+        text_score = float(candidate["text_score"])
+        best_match = str(candidate["best_match"])
+        # These gates do not depend on the audio, so failing candidates never reach DTW.
+        if text_score < MIN_TEXT_SCORE or not best_match or best_match.lower() == term_lower:
+            stats.skipped_pairs += len(samples)
+            continue
 
-            sample_matrix = decode_mfcc_fingerprint_bytes(sample_blob)
-            distance = dtw_distance(query_matrix, sample_matrix, window=30)
-            if distance < best_distance:
-                best_distance = distance
+        sample_matrices = [
+            sample if isinstance(sample, np.ndarray) else decode_mfcc_fingerprint_bytes(sample) for sample in samples
+        ]
+        term_query = query_matrix
+        if query_frames is not None and envelope is None:
+            # Only the audio around the lexical match is searched, so cost follows the term length.
+            durations_ms = None if sample_durations_ms is None else sample_durations_ms.get(term)
+            term_query = _query_region(voice_text, best_match, query_frames, sample_matrices, durations_ms)
+            if basis is not None:
+                term_query = basis.reduce(term_query)
+        eligible.append((term, best_match, text_score, sample_matrices, term_query))
+
+    kept: dict[str, list[int]] | None = None
+    if embeddings is not None and embeddings.matrix.size:
+        kept = _prefilter_samples(eligible, embeddings, None if envelope is None else query_matrix, EMBEDDING_TOP_K)
+
+    accept_limit = MAX_SUBSEQUENCE_DISTANCE if envelope is None else MAX_ACCEPTED_DISTANCE
+    term_sample_ids: dict[str, list[int]] = {}
+    for term, best_match, text_score, sample_matrices, term_query in eligible:
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if elapsed_ms > timeout_ms:
+            stats.timed_out = True
+            stats.elapsed_ms = elapsed_ms
+            return voice_text
 
-        if not math.isfinite(best_distance):
+        term_stats = match_stats.get(term) if match_stats is not None else None
+        cold = term_stats is not None and term_stats.is_cold(accept_limit)
+        if cold and elapsed_ms > timeout_ms * DEADLINE_PRESSURE_RATIO:
+            stats.cold_skipped_pairs += len(sample_matrices)
             continue
 
-        acoustic_conf = float(math.exp(-best_distance / 8.0))
-        text_score = float(candidate["text_score"])
-        best_match = str(candidate["best_match"])
-        if not best_match:
+        positions = list(range(len(sample_matrices))) if kept is None else kept.get(term, [])
+        stats.filtered_pairs += len(sample_matrices) - len(positions)
+        if not positions:
+            continue
+        sample_matrices = [sample_matrices[position] for position in positions]
+        if envelope is None:
+            regions[term] = term_query
+        if pool is not None and sample_ids is not None:
+            ids = sample_ids.get(term, [])
+            term_sample_ids[term] = [ids[position] for position in positions if position < len(ids)]
+            pooled.append((term, best_match, text_score))
             continue
 
-        if acoustic_conf >= 0.86 and text_score >= 0.68 and best_match.lower() != term_lower:
-            replacements.append((acoustic_conf * text_score, term, best_match))
-
+        best_distance = _best_sample_distance(term_query, envelope, sample_matrices, stats, dtw_mode)
+        replaced = _collect_replacement(replacements, best_distance, term, best_match, text_score, accept_limit)
+        stats.outcomes.append(TermMatchOutcome(term, _outcome_distance(best_distance, accept_limit), replaced))
+
+    if pooled and pool is not None and sample_ids is not None:
+        # Workers enforce a real deadline; terms that finish in time still count after a timeout.
+        distances = pool.best_distances(
+            query_matrix,
+            envelope,
+            term_sample_ids,
+            timeout_ms=timeout_ms - (time.perf_counter() - started) * 1000.0,
+            stats=stats,
+            dtw_mode=dtw_mode,
+            term_queries=regions or None,
+        )
+        for term, best_match, text_score in pooled:
+            if term in distances:
+                replaced = _collect_replacement(
+                    replacements, distances[term], term, best_match, text_score, accept_limit
+                )
+                distance = _outcome_distance(distances[term], accept_limit)
+                stats.outcomes.append(TermMatchOutcome(term, distance, replaced))
+
+    stats.elapsed_ms = (time.perf_counter() - started) * 1000.0
     if not replacements:
         return voice_text
 
-    result = voice_text
     replacements.sort(key=lambda item: item[0], reverse=True)
-    for _, term, best_match in replacements:
-        pattern = re.compile(re.escape(best_match), re.IGNORECASE)
-        if pattern.search(result):
-            result = pattern.sub(term, result, count=1)
-
-    return result
+    return apply_replacements(voice_text, [(best_match, term) for _, term, best_match in replacements])
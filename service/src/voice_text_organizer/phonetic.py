@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import itertools
+from threading import Lock
+
+from voice_text_organizer.pinyin_table import PINYIN_TABLE
+
+# Readings whose combinations exceed this are truncated; heteronym-heavy spans are rare.
+MAX_READING_COMBINATIONS = 16
+# Initials and finals SenseVoice (and many speakers) confuse; both sides fold to the same key.
+_FUZZY_INITIALS = (("zh", "z"), ("ch", "c"), ("sh", "s"), ("l", "n"), ("h", "f"))
+_FUZZY_FINALS = (("ang", "an"), ("eng", "en"), ("ing", "in"))
+
+_readings: dict[str, tuple[str, ...]] | None = None
+_readings_lock = Lock()
+
+
+def _load_readings() -> dict[str, tuple[str, ...]]:
+    global _readings
+    if _readings is None:
+        with _readings_lock:
+            if _readings is None:
+                readings: dict[str, list[str]] = {}
+                for line in PINYIN_TABLE.splitlines():
+                    syllable, _, chars = line.partition(" ")
+                    for char in chars:
+                        options = readings.setdefault(char, [])
+                        if syllable not in options:
+                            options.append(syllable)
+                _readings = {char: tuple(options) for char, options in readings.items()}
+    return _readings
+
+
+def char_readings(char: str) -> tuple[str, ...]:
+    return _load_readings().get(char, ())
+
+
+def fuzzy_syllable(syllable: str) -> str:
+    for source, target in _FUZZY_INITIALS:
+        if syllable.startswith(source):
+            syllable = target + syllable[len(source) :]
+            break
+    for source, target in _FUZZY_FINALS:
+        if syllable.endswith(source):
+            syllable = syllable[: -len(source)] + target
+            break
+    return syllable
+
+
+def text_readings(text: str) -> list[tuple[str, ...]] | None:
+    # None unless every character is a Han character with a known reading.
+    readings = [char_readings(char) for char in text]
+    if not readings or any(not options for options in readings):
+        return None
+    return readings
+
+
+def _fuzzy_keys(readings: list[tuple[str, ...]]) -> list[tuple[str, ...]]:
+    folded = [tuple(dict.fromkeys(fuzzy_syllable(option) for option in options)) for options in readings]
+    return list(itertools.islice(itertools.product(*folded), MAX_READING_COMBINATIONS))
+
+
+def phonetic_similarity(a: list[tuple[str, ...]], b: list[tuple[str, ...]]) -> float:
+    # 1.0 per syllable sharing a toneless reading, 0.5 per syllable equal only after fuzzy
+    # folding, and 0 overall once any syllable differs beyond that.
+    if len(a) != len(b) or not a:
+        return 0.0
+    total = 0.0
+    for left, right in zip(a, b):
+        if set(left) & set(right):
+            total += 1.0
+        elif {fuzzy_syllable(option) for option in left} & {fuzzy_syllable(option) for option in right}:
+            total += 0.5
+        else:
+            return 0.0
+    return total / len(a)
+
+
+class PhoneticIndex:
+    def __init__(self, terms: list[str]) -> None:
+        self.terms = list(terms)
+        self.key = tuple(self.terms)
+        self._readings: dict[str, list[tuple[str, ...]]] = {}
+        self._by_key: dict[tuple[str, ...], list[str]] = {}
+        for term in self.terms:
+            readings = text_readings(term)
+            if readings is None or len(readings) < 2:
+                continue
+            self._readings[term] = readings
+            for key in _fuzzy_keys(readings):
+                bucket = self._by_key.setdefault(key, [])
+                if term not in bucket:
+                    bucket.append(term)
+
+    def best_matches(self, spans: list[str]) -> dict[str, tuple[str, float]]:
+        # Returns term -> (span, similarity) for spans that sound like a term but are spelled differently.
+        matches: dict[str, tuple[str, float]] = {}
+        for span in spans:
+            readings = text_readings(span)
+            if readings is None:
+                continue
+            candidates = {term for key in _fuzzy_keys(readings) for term in self._by_key.get(key, ())}
+            for term in candidates:
+                if term == span:
+                    continue
+                score = phonetic_similarity(self._readings[term], readings)
+                if score > matches.get(term, ("", 0.0))[1]:
+                    matches[term] = (span, score)
+        return matches
@@ -0,0 +1,856 @@
+# Character -> toneless pinyin for the CJK Unified Ideographs block (U+4E00-U+9FFF).
+# Generated from the pinyin_dict data of pypinyin 0.55.0 (MIT licensed): tone marks are
+# dropped, "ü" is written "v", and up to the first two readings of a heteronym are kept.
+# Each line is "<syllable> <characters>"; a syllable may span several lines.
+PINYIN_TABLE = """
+a 吖啊嗄腌錒锕阿
+ai 乂乃伌佁僾凒剴厓叆哀哎唉啀嗌嗳嘊噫噯埃塧壒娭娾嫒嬡嵦愛懓懝挨捱敱敳昹暧曖欬欸毐溰
+ai 溾濭焥爱獃瑷璦癌皑皚皧瞹矮砹硋碍礙絠艾蔼薆藹謁譪譺賹躷銰鎄鑀锿閡阨阸隘霭靄靉餲馤
+ai 騃鯦鱫鴱
+an 侒俺儑厈咹唵啽垵垾埯堓婩媕安屽岸峖庵按揞晻暗案桉氨洝犴玵痷盒盦盫碪罯胺腤荌菴萻葊
+an 蓭裺誝諳谙豻貋遃鉗銨錌铵闇隌雸鞌鞍韽頇頞馣鮟鴳鵪鶕鹌黯鿷
+ang 仰卬岇昂昻枊盎肮醃醠骯
+ao 傲凹厫嗷嗸嚣囂坳垇墺奡奥奧媪媼嫯岙岰嶅嶴廒慠懊扷抝拗摮擙敖柪梎泑滶澆澳熝熬燠爊獒
+ao 獓璈眑磝翱翶翺聱芺蔜薁蝹螯袄襖謷謸軪遨郩鏊鏕鏖镺隞隩驁骜鰲鳌鴁鴢鷔鼇鿫
+ba 丷仈八叐叭吧哵坝坺垻墢壩夿妭岜峇巴巼弝扒把抜拔捌捭朳杷柭欛湃灞炦爸犮玐疤癹皅矲笆
+ba 粑紦罢罷羓耙胈芭茇菝蚆覇詙豝跁跋軷釛釟鈀钯霸靶颰魃魞鮁鮊鲃鲅鲌鼥鿱
+bai 伯佰呗唄庍拜拝挀捭掰摆擘擺敗柏栢猈瓸白百稗竡粨粺絔薭襬贁败鞁韛
+ban 並伴办半坂坢姅岅彬怑扮扳拌搫搬攽斑斒昄朌板柈湴版班瓣瓪瘢癍秚籓粄絆绊舨般蝂螁螌褩
+ban 覂豳跘辦辬鈑鉡钣闆阪靽頒颁魬鳻
+bang 傍垹埲塝嫎帮幇幚幫徬捠搒梆棒棓榜浜牓玤硥磅稖紡綁縍绑膀艕蒡蚄蚌蛖蜯螃謗谤邦邫鎊镑
+bang 鞤騯髈
+bao 佨保儤刨剥勹勽包呆堡堢報媬嫑孢宝宲寚寳寶忁怉报抱暴曓曝枹瀑炮煲爆珤砲窇笣緥胞苞菢
+bao 葆蕔薄藵虣蚫袌袍裒褒褓襃豹賲趵鉋鑤铇闁雹靌靤飹飽饱駂骲髱鮑鲍鳵鴇鸨齙龅
+bei 俻倍偝偹備僃北卑呗唄垻备孛悖悲惫愂憊揹昁杮杯柸桮梖棑棓椑波焙牬犕狈狽珼琲盃碑碚禙
+bei 箄糒背臂苝菩萯葡蓓藣蛽被褙襬誖諀貝贝跋軰輩辈邶郥鄁鉳鋇錍鐴鐾钡陂鞁鞴骳鵯鹎
+ben 倴喯坋坌夯夲奔奙捹撪本栟桳楍泍渀炃燌犇獖畚笨翉苯蟦贲軬輽逩錛鐼锛
+beng 伻俸傰唪嗙嘣埄埲堋塴奟崩嵭抨揼榜泵熢琣琫甏甭痭祊絣綳繃绷菶蚌跰蹦迸逬錋鏰镚閍鞛
+bi 佊佖俾偪匕卑吡咇哔啚嗶坒堛壁夶奰妣妼娝婢媲嬖嬶屄崥币幅幣幤庇庳廦弊弻弼彃彼必怭怶
+bi 悂愊愎拂敝斃旇朼枇枈柀柲梐楅榌檗殍比毕毖毙毴沘泌湢滗滭潷濞煏熚狴獘獙珌璧畀畁畐畢
+bi 疕疪痹痺皕睤瞥碧祕禆秕秘稫笓笔筆筚箄箅箆篦篳粃粊紴綼縪繴罼翍聛肥肶肸胇腷臂舭芘苾
+bi 荜荸萆萞蓖蓽蔽薜蘗虑蜌螕袐被裨襅襞襣觱詖诐豍貏貱賁贔贲赑跛跸踾蹕躃躄辟逼避邲鄙鄨
+bi 鄪鈚鉍鎞鏎鐴铋閇閈閉閟闭陛陴鞞鞸韠飶饆馝馥駜驆髀髲魓魮鮅鮩鰏鲾鴓鵖鶝鷝鷩鸊鼊鼻
+bian 便匾卞变変封峅弁徧忭惼扁抃拚揙昪汳汴炞煸牑猵獱玣甂疺砭碥稨窆笾箯籩糄編緶缏编臱艑
+bian 苄萹藊蝙褊覍覵變豍貶贬辡辧辨辩辫辮辯边辺遍邉邊邲釆鍽閞鞕鞭頨鯾鯿鳊鴘鶣
+biao 俵僄儦墂婊幖彪摽杓标標檦淲滮瀌灬熛爂猋瘭磦穮篻脿膔膘臕蔈藨表裱褾諘謤贆錶鏖鏢鑣镖
+biao 镳颩颮颷飆飇飈飊飑飙飚驃驫骉骠髟鰾鳔麃
+bie 別别咇彆徶憋捌柲瘪癟癿穪苾莂蔽虌蛂蟞襒蹩鱉鳖鼈龞
+bin 份傧儐宾彬摈擯攽斌梹椕槟檳殡殯氞汃浜滨濒濱濵瀕玢瑸璸砏繽缤膑臏虨訜豩豳賓賔贇邠鑌
+bin 镔霦頻顮髌髕髩鬂鬓鬢
+bing 丙並仌仒併倂偋傡兵冫冰垪寎屏并幷庰怲抦拼掤摒昞昺柄栟栤梹棅槟檳氷炳燹琕病癛眪禀秉
+bing 稟窉竝絣綆苪蛃誁邴鈵鉼鋲陃靐鞆鞞鞸餅餠饼鮩
+bo 亳仢伯侼僠僰剝剥勃募博卜哱啵噃嚗妭孛孹嶓帗帛彴怕愽懪拍拔拨挬搏撥播擗擘柏桲檗檘欂
+bo 泊波浡淿渤溊潑煿爆牔犦犻狛猼玻瓝瓟癶癷發白百盋砵碆磻礡礴秡穛箔箥簙簸簿糪紴缽肑胉
+bo 脖膊舶艊艴苩茀菠萡葧蒲蔔蔢蕃薄薜蘖蘗蚾袚袯袰袹襎襏襮詙譒豰趵跛踣蹳郣鈸鉑鉢鋍鎛鑮
+bo 钵钹铂镈餑餺饽馎馛馞駁駮驋驳髆髉魄鮁鮊鱍鲅鲌鵓鹁
+bu 不佈勏卜卟吥咘哺喸埔埗埠堡尃峬布庯廍怖悑抪捕捗撲晡柨步歨歩瓿秿箁篰簿荹蔀补補誧踄
+bu 輹轐逋部郶醭鈈鈽钚钸附陠餔餢鯆鳪鵏鸔鿻
+ca 嚓囃擦攃磣礤礸遪
+cai 倸偲啋埰婇寀彩才採揌材棌毝猜睬綵縩纔菜蔡裁財财跴踩采
+can 傪儏参參叄叅喰嘇噆嬠孱嵾惨惭慘慙慚憯戔掺摲摻朁残殘湌澯灿燦爘璨穇篸粲薒蚕蝅蠶蠺謲
+can 蹔飡飱餐驂骖黪黲
+cang 仓仺伧倉傖凔匨嵢欌沧滄濸獊篬臧舱艙苍蒼蔵藏螥賶鑶鶬鸧
+cao 傮嘈屮嶆愺慅慒慥懆撡操曹曺槽漕澡糙肏艚艸艹草蓸螬褿襙造鄵鏪騲鼜
+ce 侧側冊册厕厠墄嫧幘廁恻惻憡拺敇测測畟笧策筞筴箣簎粣荝萗萴蓛赦齰
+cen 参岑嵾梣涔硶笒篸
+ceng 僧噌层層嶒曽曾橧竲蹭鄫驓
+cha 侘偛刹叉喳嗏嚓垞奼姹察岎岔嵖差扠扱挿插揷搽摖杈查梌楂槎檫汊猹疀碴秅紁肞臿艖芆苴茬
+cha 茶荖荼衩褨訍詧詫诧蹅釵銟鍤鎈鑔锸镲靫餷馇
+chai 侪儕喍囆扠拆柴犲瘥祡芆茝虿蠆袃訍豺釵钗齜
+chan 丳产佔僝僤儃儳冁刬剗剷劖单厘啴嘽嚵囅墠壥婵嬋嬗孱嵼嶄巉幝幨廛忏懴懺掺搀摌摲攙斺旵
+chan 梴棎榐欃毚浐湹滻潹潺澶瀍瀺灛煘燀獑產産硟磛禅禪簅緾繟纏纒缠羼脠艬蒇蕆蝉螹蟬蟾袩裧
+chan 襜襝覘觇誗諂譂讇讒讖谄谗躔辴辿鄽酁醦鉆鋋鋓鏟鑱铲镡镵閳闡阐韂顫颤饞馋骣
+chang 仧仩伥倀倘倡偿僘償兏厂厰唱嘗嚐场場塲娼嫦尚尝常廠徜怅悵惝敞昌昶晿暢棖椙氅淌淐焻猖
+chang 玚琩瑒瑺瓺甞畅畼肠脹腸膓苌菖萇蟐裮裳誯鋹鋿錩鏛锠長镸长閶阊韔鬯鯧鱨鲳鲿鼚
+chao 仦仯剿劋勦吵嘮嘲巐巢巣弨怊抄摷晁朝槱樔欩漅潮濤炒焣焯煼牊眧窲粆紹綽縐绰罺耖觘訬謿
+chao 超趠轈鄛鈔钞麨鼂鼌
+che 伡俥偖勶呫唓喢坼奲宅尺屮彻徹扯拆掣揊摰撤撦斥澈烢烲爡瞮砗硨硩聅莗蛼詀謵車车迠頙
+chen 伧儭嗔嚫堪塵墋夦宸尘帘忱愖抻捵揨敐晨曟枕桭梣棽榇樄櫬沈沉湛瀋煁琛疢疹瘎瘨眈瞋硶碜
+chen 磣称稱綝縝肜臣茞莀莐蔯薼螴衬襯訦諃諶謓讖谌谶賝贂趁趂趻踸軙辰迧郴醦鈂鍖闖陈陳霃鷐
+chen 麎齓齔龀
+cheng 丞乗乘侱倀偁傖僜净呈噌城埕埩堘塍塖娍宬峸嵊庱徎悜惩憆憕懲成承挰掁摚撐撑撜敞晟朾枨
+cheng 柽棖棦椉槍樘橕橖橙檉檙氶泟洆浧浾淨湞溗澂澄瀓爯牚珵珹琤瑲畻盛盯睈睖瞠矃碀秤称程稱
+cheng 穪窚竀筬絾緽罉脀脭荿虰蛏蟶裎誠诚赪赬逞郕郢酲醒鋮鎗鏳鏿鐣鐺铖铛阷靗頳饓騁騬骋鯎
+chi 侈侙俿傺剟勅勑匙卙卶叱叺吃呎呬呹哆哧啻喫嗤嘯噄坻垑墀妛媸尺岻弛彨彲彳徲恜恥慗慸憏
+chi 懘抬抶拖拸持捇搋摛摴攡敕斥杘柅樆欼歭歯汖池沶治泜湁滯漦灻炽烾熾瓻痓痴痸瘈瘛癡眙眵
+chi 瞝硳祇离移穉竾笞筂箈箎篪粚絺翄翅翤翨耛耻肔胝胣胵脪腟芪茌茬荎蚇蚩蚳蝭螭袲袳裭褫訵
+chi 誀誃誺謘謻豉貾赤赿趍趐趩跅跮踅踟軧迟迡迣遅遟遫遲邌郗鉓鉹銐鍉雴飭飾饎饬馳騺驪驰魑
+chi 鳷鴟鵄鵣鶒鶗鷘鸱麶黐齒齝齣齿
+chong 偅傭充冲喠嘃埫宠寵崇崈徸忡憃憧揰摏樁沖浺涌漴潼烛爞珫痋盅祌种種緟罿翀舂艟茧茺虫蝩
+chong 蟲衝褈蹖蹱重銃铳隀
+chou 丑丒仇侴俦偢儔吜嚋妯婤媿嬦帱幬怞惆愁懤扭抽揄搊擣杻杽栦椆檮殠溴燽牰犨犫畤畴疇瘳皗
+chou 盩眣瞅矁稠筹篘簉籌紬絒綢绸臭臰菗薵裯詶謅譸讎讐跾踌躊遚酧酬醔醜醻鈕雔雠魗鮋
+chu 亍俶傗储儊儲処出刍初助厨嘼埱处媰岀幮廚怵慉憷拀搐摢摴敊斶杵柠柷椘楚楮榋樗橱橻檚櫉
+chu 櫖櫥欪歜涂淑滀滁濋炪犓珿琡璴畜矗础硫礎竌竐篨絀絮绌耝耡臅芻蒢蒭蓫蕏藸處蜍蟵蠩褚觕
+chu 触觸詘諔諸豖豠貙趎跦踀蹰躇躕鄐鉏鋤锄閦除雏雛鶵鸀黜齣齭齼
+chua 欻歘
+chuai 啜嘬揣搋欼膗膪踹
+chuan 串丳传傳僢剶喘圌團巛川惴掾暷椯椽歂氚汌猭玔瑏甎穿篅舛舡舩船荈賗踳輲遄釧钏鶨
+chuang 倉傸凔刅创刱剏剙創噇囱幢床怆愴戧摐摤朣橦漺牀牎牕疮瘡磢窓窗窻舂葱闖闯
+chui 倕吹圌垂埀惙捶搥棰椎槌炊箠腄菙郵錘鎚锤陲顀鬌魋龡
+chun 偆僢唇堾媋惷旾春暙杶椿槆橁櫄浱淳湻滣漘犉瑃睶箺純纯肫脣芚莼萅萶蒓蓴蝽蠢賰踳輇輴醇
+chun 醕錞陙鯙鰆鶉鶞鹑
+chuo 促吷啜嚽娕娖婥婼惙戳擉斫歠涰磭簇綴綽繛绰腏荃趠踔踱躇輟辍辵辶逴酫醛鋜錣鏃鑡齪齱龊
+ci 伺佌佽偨兹刺刾司呰呲啙垐堲姕嬨嵯庛廁慈朿柌柴栜栨次此泚滋澬濨玼珁瓷甆疵皉磁礠祠粢
+ci 糍絘縒胔茈茦茨茲莿薋薺蚝蛓螅螆蠀詞词賜赐趀趑跐辝辞辤辭鈶雌飺餈骴髊鮆鴜鶿鷀鹚齹
+cong 丛从偬匆叢囪囱婃孮従徖從忩怱悤悰慒憁暰枞棇楤樅樬樷欉淙漎漗潀潨灇焧熜爜琮瑽璁瞛碂
+cong 窗篵総緫縱繱聡聦聪聰苁茐葱蓯蔥藂蟌誴謥賨賩鍯鏓鏦騘驄骢
+cou 凑奏揍楱湊腠蔟輳辏
+cu 促卒噈娕娖媨徂憱戚捽殂猝瘄瘯皻簇粗縬脨蔍蔖蔟觕誎趗趣趥趨踀踓踤踧蹙蹴蹵酢醋錯顣麁
+cu 麄麆麤鼀
+cuan 僔巑撺攒攛攢櫕欑殩汆灒熶爨穳窜窾竄篡簒菆襸蹿躥鋑鑹镩
+cui 乼伜倅催凗啐啛墔察崒崔嶉忰悴慛摧椊榱槯毳淬漼濢焠熣獕琗璀疩瘁皠磪竁粋粹紣綷縗繀缞
+cui 翆翠脃脆脺膬膵臎萃襊趡鏙隹顇
+cun 侟刌吋墫存寸忖拵村洊澊皴竴籿膥踆邨
+cuo 剉剒厝夎嵯嵳挫措搓撮斮昔最棤澨營瑳痤瘥睉矬磋縒脞莝莡蒫蓌蔖虘襊諎蹉躦逪遳酂酇醝銼
+cuo 錯锉错髊鹺鹾齹
+da 亣剳匒呾咑哒嗒噠垯塌塔墶大妲怛憚打搨搭撘汏沓溚炟燵畗畣疸瘩眔矺笚笪答繨羍耷荅荙薘
+da 蟽褡觰詚跶躂达迏迖迚逹達鎉鎝鐽阘靼鞑韃龖龘鿎
+dai 代侢傣叇呆呔垈埭大岱帒带帯帶廗待怠懛戴曃柋歹殆毒瀻獃玳瑇甙箉簤紿緿绐艜蔕蚮蝳螮袋
+dai 襶詒貸贷跢蹛軑軚軩轪迨逮逯隶霴靆駘骀鮘鴏黛黱
+dan 丹丼亶伔但倓僤儋刐勯匰单単啖啗啿單嘾噉噡嚪妉娊媅帎弹弾彈忱怛惔惮愖憚憺憾抌担掸撢
+dan 撣擔旦柦檐殚殫氮沊泹淡澶澸澹燀狚玬瓭甔疍疸瘅癉癚眈石砃禫窞箪簞紞繵耼耽聃聸胆腅膻
+dan 膽萏蓞蛋蜑蟺衴褝襌覘觛訑詹誕譂诞贉贍赕躭郸鄲酖醈霮頕餤饏馾駳髧鴠黕黮黵鿕
+dang 偒儅党凼噹圵垱壋婸宕崵嵣当愓挡擋攩档檔欓氹潒澢灙燙珰璗璫瓽當瘍盪瞊砀碭礑筜簜簹艡
+dang 荡菪蕩蘯蟷裆襠譡讜谠趤逿鐺铛闣雼黨
+dao 倒儔刀刂到受叨噵壔导導岛島嶋嶌嶹帱幬忉忑悼捣捯搗擣朷椡槝檤氘焘燾瓙盗盜祷禂禱稲稻
+dao 箌纛翢翿舠艔菿虭衜衟裯蹈軇道釖陦隝隯魛鱽
+de 嘚地底得徳德恴悳惪棏淂登的脦鍀锝陟
+dei 嘚
+den 扥扽
+deng 僜凳噔墱嬁嶝戥朩橙櫈澄灯燈璒登瞪磴竳等簦艠覴豋蹬邓鄧鐙镫隥
+di 仾低俤偙僀儥厎呧哋唙啇啲啻嘀嚁地坔坘坻埊埞堤墆墑墬奃娣媂嫡嵽嶳帝底廸弔弟弤彽怟慸
+di 扚抵拞掋提揥摕敌敵旳杕枤柢梊梑棣楴樀櫂氐浟涤渧滌滴焍牴狄玓珶甋疐的眱睇砥碮碲磾祶
+di 禘笛第篴籴糴締缔羝翟聜肑腣苐苖茋荻菂菧蒂蔋蔐蔕藋藡蝃螮袛覿觌觝詆諟諦诋谛豴赿趆踧
+di 踶蹄蹢軧迪逐递逓遞適遰邸釱鉪鍉鏑镝阺隄靮鞮頔題馰骶髢鬄魡鯳鸐
+dia 嗲
+dian 佃傎典厧唸嚸坫垫埝墊壂奌奠婝婰嵮巅巓巔店惦扂掂攧敁敟椣槇槙橂橝殿淀滇澱点猠玷琔电
+dian 甸痶瘨癜癫癲碘磹簟腍蒧蕇蜓蜔跕踮蹎鈿钿阽電靛頕顚顛颠驔點齻
+diao 伄倜凋刀刁刟叼吊奝嬥屌弔弴彫扚掉殦汈淍琱瘹瞗矵碉窎窵竨簓糶絩莜蓧藋虭蛁蜩訋誂調调
+diao 貂趙跳踔軺釣鈟銚銱鋽錭鑃钓铞铫雕雿魡鮉鯛鲷鳥鳭鵃鵰鸟鼦
+die 佚叠哋喋嗲垤堞峌崼嵽幉怢恎惵戜挃挕揲昳曡柣楪槢殜氎泆涉渫爹牃牒瓞畳疂疉疊眣眰碟窒
+die 絰绖耊耋胅至臷艓苵蜨蝶螲褋褶褺詄諜谍趃跌跮踢蹀蹛軼迭鐵镻鰈鰨鲽
+ding 丁仃叮啶奵定嵿帄忊掟椗濎灯玎疔盯矴碇碠磸耵聢腚艼萣葶薡虰蝊訂订酊釘鋌錠鐤钉铤锭靪
+ding 頂顁顶飣饤鼎鼑
+diu 丟丢銩铥颩
+dong 东侗倲働冬冻凍动動勭咚垌埬墥姛娻嬞岽峒崠崬徚恫懂戙挏揰昸東栋棟氡氭洞涷湩烔狪甬硐
+dong 笗筒箽絧胨胴腖苳菄董蕫蝀詷諌迵酮霘駧騆鮗鯟鶇鶫鸫鼕鿴
+dou 乧侸兜兠剅吋吺唗唞投抖斗斣枓梪橷毭浢瀆痘瞗窦窬竇篼脰荳蔸蚪讀读豆逗逾郖都酘鈄鋀钭
+dou 閗闘阧陡餖饾鬥鬦鬪鬬鬭
+du 凟剢剫匵厾嘟土堵塗妒妬嬻帾度斁晵暏杜椟樚橐櫝殬殰毒涜渎渡瀆牍牘犊犢独獨琽瓄皾督睹
+du 碡秺竇竺笃篤纛罜肚芏荰蝳螙蠧蠹裻襡覩詫読讀讟读豄賭贕赌都醏錖鍍鑟镀闍阇陼靯韇韣韥
+du 頓顿騳髑黩黷
+duan 偳剬塅媏断斷椴段毈煅瑖短碫端篅簖籪緞缎耑腶葮褍躖鍛鍴锻
+dui 兊兌兑垖埻堆塠奪对対對嵟怼憝憞懟搥敦杸濧瀢瀩痽碓磓祋綐薱襨謉譈譵追鈗鋭錞鎚鐓鐜镦
+dui 队陮隊頧鴭
+dun 伅吨噸囤坉墩墪庉惇憞撉撴敦楯橔沌潡炖燉犜獤盹盾砘碷礅腞腯蜳豚趸踲蹲蹾躉逇遁遯鈍鐜
+dun 钝镦頓顿驐
+duo 亸仛凙刴剁剟剫咄哆哚喥嚉嚲垛垜埵堕墮墯多夛夺奪奲媠尮崜嶞度惰憜挅挆捶掇敓敚敠敪朵
+duo 朶杂杕柁柂柮桗棰椯橢毲沰沱畓痥硾綞缍舵茤裰襗貀趓跢跥跺跿踱躱躲軃鄲酡鈬鍺鐸铎陀陊
+duo 陏隋隓飿饳馱驮鮵鵽
+e 佮俄偔僫匎匼卾厄吪呃呝咢咹哦啞噁噩囮垩埡堊堨堮妸妿姶娥娿婀屙屵岋峉峨峩崿廅恶悪惡
+e 愕戹扼搕搤搹擜曷枙椏櫮歞歹歺涐湂玀珴琧疴痾皒睋砈砐砨砵硆硪磀礘胺腭苊莪萼蕚蘁蚅蛾
+e 蝁覨訛詻誐諤譌讍讹谔豟軛軶轭迗遌遏遻邑鄂鈋鈪鋨鍔鑩锇锷閜閼阏阨阸阿隘頋頞頟額顎颚
+e 额餓餩饿騀魤魥鰐鰪鱷鳄鵈鵝鵞鶚鹅鹗齃齶齾
+ei 誒诶
+en 奀峎恩摁煾蒽
+eng 鞥
+er 二佴侕儿児兒刵厼咡唲嬭尒尓尔峏弍弐杒栭栮樲毦洏洱爾珥粫而耏耳聏胹荋薾衈袻誀貮貳贰
+er 趰輀輭轜迩邇鉺铒陑陾隭餌饵駬髵髶鮞鲕鴯鸸
+fa 乏伐佱傠发垡姂彂撥栰橃汎沷法浌灋珐琺疺発發瞂砝笩筏罚罰罸茷蕟藅貶醱鍅閥阀髪髮
+fan 仮伋凡凢凣勫匥反噃墦奿婏嬎嬏帆幡忛憣払旙旛杋柉梵棥楓樊橎氾汎泛渢滼瀪瀿烦煩燔犯犿
+fan 璠畈畨番盕矾礬笲笵範籓籵緐繁繙羳翻膰舤舧舩范蕃薠藩蘩蟠蠜袢襎訉販贩蹯軓軬轓返釩鐇
+fan 鐢钒颿飜飯飰饭鱕鷭
+fang 仿倣匚坊埅堏妨彷房放方旊昉昘昞枋汸淓牥瓬眆眪祊紡纺肪舫芳蚄訪访趽邡鈁錺钫防髣魴鰟
+fang 鲂鴋鶭
+fei 俷剕匪厞吠啡墢奜妃婓婔屝废廃廢怫悱扉斐昲暃曊朏杮柹棐榧橃櫠沸淝渄濷狒猆疿痱癈砩祓
+fei 笰篚紼緋绯翡肥肺胇胏胐腓芾菲萉蕜蕟蕡蜚蜰蟦裴裶襏誹诽費费鐨镄陫霏靅非靟飛飝飞餥馡
+fei 騑騛髴鯡鲱鼣鼥
+fen 份偾僨兝兺分吩哛坆坋坟墳奋奮妢岎帉幩弅忿愍愤憤扮敃昐朆朌枌梤棻棼橨氛汾濆瀵炃焚燌
+fen 燓燔獖玢盼瞓砏秎竕粉粪糞紛纷羒羵翂肦膹芬葐蒶蕡蚠蚡衯訜豮豶賁躮轒酚鈖錀鐼隫雰頒餴
+fen 饙馚馩魵鱝鲼鳻黂黺鼖鼢
+feng 丰仹俸偑僼冯凤凨凬凮唪埄堸夆奉妦寷封峯峰崶捀捧摓枫桻楓檒沣沨泛浲渢湗溄漨灃炐烽焨
+feng 煈犎猦琒甮疯瘋盽砜碸篈綘縫缝舽艂莑葑蘴蜂蠭覂諷讽豊豐賵赗逄逢鄷酆鋒鎽鏠锋闏霻靊風
+feng 飌风馮鳯鳳鴌鵬麷
+fiao 覅
+fo 仏仸佛坲梻
+fou 不否妚殕炰紑缶缹缻芣衃裦雬鴀
+fu 乀乶仅付伏伕佛俌俘俛俯偩偪傅冨冹凫刜副匐呋咈咐哹嘸坿垘垺報复夫妇妋姇娐婏婦媍嬎嬔
+fu 孚孵宓富尃岪峊巿市帗幅幞府弗弣彳彿復怀怤怫懯扶抚拂拊捬撨撫敷斧旉服枎枹柎柫柭栿桴
+fu 棴椨椱榑氟汱沸泭洑浮涪溥滏澓炥烰焤父玞玸琈璷甫甶畉畐畗痡癁盙砆砩祓祔福禣秿稃稪竎
+fu 符笰筟箙簠粰糐紨紱紼絥綍綒緮縛纀绂绋缚罘罦翇肤胕脯腐腑腹膚艀艴芙芣芾苻茀茯荂荴莆
+fu 莩菔萯葍蕧虙蚥蚨蚹蛗蜅蜉蝜蝠蝮衭袚袝袱複褔襆襥覄覆訃詂諨讣豧負費賦賻负赋赙赴趺跗
+fu 踾軵輔輹輻辅辐邚邞郙郛鄜酜酻釜釡鈇鉘鉜錇鍑鍢阜阝附陚鞴韍韛韨頫颫颰馥駙驸髴鬴鮄鮒
+fu 鮲鰒鲋鳆鳧鳬鳺鴔鵩鶝麩麬麱麸黻黼
+ga 伽呷咖嘎嘠噶夹尕尜尬戛旮玍釓錷钆魀
+gai 丐乢侅匃匄垓姟峐忋戤摡改晐杚概槩槪汽溉漑瓂畡盖祴絠絯胲芥荄葢蓋該该豥賅賌赅郂鈣钙
+gai 阣陔隑骸
+gan 乹乾亁仠佄倝凎凲咁坩奸尲尴尶尷干幹忓感扞擀攼敢旰杆柑桿榦橄檊汵泔淦漧澉灨玕玵甘疳
+gan 皯盰矸秆稈竿笴筸簳粓紺绀肝芉苷虷衦詌諴豃贑贛赣赶趕迀酐釬錎飦骭魐鰔鱤鳡鳱
+gang 亢伉冈冮刚剛堈堽岗岡崗戅戆戇扛抗掆杠棡槓港溝焵焹牨犅犺疘矼碙筻綱纲缸罁罓罡肛釭鋼
+gang 鎠钢頏鿍
+gao 勂吿告咎夰峼搞暠杲槀槁槔槹橰檺櫜浩滜獋皋皐睾祮祰禞稁稾稿筶篙糕縞缟羔羙膏臯菒蒿藁
+gao 藳誥诰郜鋯鎬锆镐韟餻高髙鷎鷱鼛
+ge 个介仡佫佮個割匌各合吤呄咯哥哿嗝嗰噶圪塥屹彁愅戈戓戨挌搁搿擱敋杚格槅櫊歌滆滒牫牱
+ge 犵獦疙盖硌秴箇紇纥肐胳膈臈臵舸茖菏葛蓋虼蛒蛤袼裓觡詥諽謌輵轕鉀鉻鉿鎘鎶铬镉閣閤阁
+ge 隔革鞈鞷韐韚颌饹騔骼髂鬲魺鮥鮯鰪鴐鴚鴿鵅鸽鿔
+gei 給给
+gen 亘亙哏揯搄根痕艮茛跟
+geng 亙刯哽埂堩峺庚恆挭暅更梗椩浭焿畊硬絙絚綆緪縆绠羮羹耕耿莄菮賡赓邢郠頸颈骾鯁鲠鶊鹒
+gong 供公共功匑匔厷咣唝嗊塨宫宮工巩幊廾弓恭愩慐拱拲攻杛栱汞渱熕珙疘硔碽礦篢糼紅红羾肱
+gong 莻蚣蛩觥觵貢贛贡躬躳輁釭銾鑛鞏髸魟龏龔龚
+gou 佝傋冓勾句坸垢够夠姤媾岣彀拘搆撀构枸構沟泃溝煹狗玽痀笱篝簼緱缑耇耈耉芶苟茩蚼袧褠
+gou 覯觏訽詬诟豿購购軥遘鈎鉤钩雊鞲韝鴝
+gu 估傦僱凅古呱咕哌唂唃啒嗗嘏固堌夃姑嫴孤尳崓崮怘愲扢故枯柧梏棝榖榾橭毂汩沽泒淈滑濲
+gu 瀔牯牿痼皷皼盬瞽祻稒穀笟箍箛篐糓縎罛罟羖股胍脵臌苦苽菇菰蓇薣蛄蛊蛌蠱觚詁诂谷賈贾
+gu 軱軲轂轱辜逧酤鈲鈷錮钴锢雇顧顾餶馉骨骰鮕鯝鲴鴣鵠鶻鸪鹄鹘鼓鼔
+gua 冎刮剐剮劀卦叧呱啩坬寡括挂捖掛栝歄焻煱瓜絓緺罣罫聒胍舌苽袿褂詿諣诖趏踻銽颪颳騧鴰
+gua 鸹
+guai 乖叏噲夬怪恠拐掴摑枴柺箉
+guan 丱串倌关冠卝婠官悹悺惯慣懽掼摜斡棺樌權毌泴涫淉潅灌爟琯瓘痯瘝癏盥矔礶祼窤筦管綸纶
+guan 罆罐舘莞菅蒄覌観觀观貫贯躀輨遦錧鏆鑵閞関闗關雚館馆鰥鱞鱹鳏鳤鸛鹳
+guang 侊俇僙光咣垙姯广広廣恍挄撗桄櫎欟洸灮炗炚炛烡犷獷珖硄胱臦臩茪趪輄迋逛銧黆
+gui 亀佹傀刽刿劊劌匦匭匮匱厬圭垝妫姽媯嫢嬀宄嶡巂帰庋庪廆归恑摫撌攰攱昋晷朹柜桂桅桧椝
+gui 椢概槣槶槻槼檜櫃櫰櫷歸氿洼湀溎潙炅炔猤珪瑰璝瓌癐癸皈瞡瞶硅祈祪禬窐筀簂簋繪胿膭茥
+gui 蓕蛫螝蟡袿襘規规觤詭诡貴贵赽趹跪軌轨邽郌鐀閨闺陒鞼騩鬶鬹鬼鮭鱖鱥鲑鳜鳺鴂龜龟
+gun 丨惃棍混滚滾琯璭睔睴磙緄緷绲蓘蔉衮袞裷謴輥辊錕鮌鯀鲧
+guo 呙咼啯嘓囗囯囶囻国圀國埚堝墎崞帼幗彉彍惈慖掴摑果椁楇槨活涡淉渦漍濄猓瘑矌簂粿綶聒
+guo 聝腂腘膕菓蔮虢蜮蜾蝈蟈裹褁輠过過郭鈛錁鍋鐹锅餜馃馘
+ha 呵哈奤獬虾蛤蝦铪
+hai 亥侅咍咳咴嗐嗨嚡塰妎孩害氦浬海烸絯胲还還郂酼醢頦餀饚駭駴骇骸
+han 丆仠佄傼兯函凾厂厈含咁哻唅喊嚂圅垾娢嫨寒屽岾崡嵅嵌忓悍感憨憾扞捍撖撼攼旰旱晗晘暵
+han 桿梒椷榦欦歛汉汗汵泔浛浫涆涵淊淦漢澉澏澣瀚灘焊焓熯爳犴猂琀甘甝皔睅筨罕翰肣莟菡蔊
+han 蘫虷蚶蛿蜬蜭螒譀谽豃邗邯酣釬鈐銲鋎鋡閈闞闬阚雗韓韩頇頜頷顄顸颔馠馯駻鬫魽鳱鶾鼾鿰
+hang 吭垳夯妔巷忼斻杭桁沆炕珩笐筕絎绗肮航苀蚢行貥迒邟酐頏颃魧
+hao 傐儫号呺哠嗥嘷噑嚆嚎壕好妞恏悎昊昦晧暠暤暭曍椃毜毫浩淏滈澔濠灏灝獆獋獔皋皓皜皞皡
+hao 皥睾秏竓籇翯耗聕茠蒿薃薅薧藃號虠蚝蠔諕譹豪貉郝鄗鎒鎬镐顥颢鰝
+he 何佫劾合吓呵咊和哬啝喝嗃嗬嚇垎壑姀害寉峆惒抲挌敆曷柇核楁欱毼河洽涸渮澕焃煂熆熇燺
+he 爀犵狢猲癋皬盇盉盍盒硅碋礉禾秴穒篕籺粭紇纥翮翯苛荷菏萂藿蚵蝎螛蠚袔褐覈訶訸詥謞诃
+he 貈貉賀贺赫輅轄郃鉌鑉閡闔阂阖隺霍靍靎靏鞨頜颌餄餲饸鬩魺鲄鶡鶮鶴鸖鹖鹤麧齃齕龁龢
+hei 嗨嘿潶黑黒
+hen 佷哏很恨拫掀狠痕詪鞎
+heng 亨佷哼啈堼姮恆恒悙桁横橫涥烆珩胻脝蘅衡鑅鴴鵆鸻
+hm 噷
+hng 哼
+hong 仜厷叿吰吽呍哄哅唝嗊嚝垬妅娂宏宖屸巆弘彋揈撔晎汯泓洚洪浤浲港渱渹潂澋澒灴烘焢玒玜
+hong 瓨硔硡竑竤篊粠紅紘紭綋红纮翃翝耾舼苰荭葒葓蕻薨虹訇訌讧谹谼谾軣輷轟轰鈜鉷銾鋐鍧閎
+hong 閧闀闂闳霐霟鞃鬨魟鴻鸿黉黌
+hou 侯候厚后吼呴喉垕堠帿後洉犼猴瘊睺矦篌糇翭翵腄葔詬豞逅郈鄇銗鍭餱骺鮜鯸鱟鲎鲘齁
+hu 乎乕乥乯互俿冱冴匢匫呼唬唿喖嗀嘑嘝嚛囫垀壶壷壺姱婟媩嫭嫮寣岵帍幠弖弧忽怘怙恗惚戏
+hu 戯戲戶户戸戽扈抇护搰摢斛昈昒曶枑核楛楜槲槴歑汻沍沪泘洿浒淈淲淴湖滬滸滹濩瀫烀焀煳
+hu 熩狐猢琥瑚瓠瓡瓳礐祜穫笏箎箶簄粐糊絗綔縎縠羽胡膴芐芔芴苸萀葫蔛蔰虍虎虖虝蝴螜衚觳
+hu 觷許謼護许豰軤轷鄠醐鈷錿鍙鍸隺雇雐雽韄頀頶餬鬍魱鯱鰗鱯鳠鳸鴩鵠鶘鶦鶮鶻鸌鹄鹕鹘鹱
+hua 侉划劃化华叱吪哗嘩埖夻姡婲婳嫿嬅學崋找搳摦撶敌杹枠桦椛槬樺檴滑澅猾獪画畫畵砉硴磆
+hua 稞竵粿糀繣罫舙花芲華蒊蒍蕐蘤螖觟話誮諙諣譁譮话輠釪釫鋘錵鏵铧驊骅魤鷨黊
+huai 佪咶喟坏坯壊壞徊怀懐懷槐櫰淮瀤耲蘹蘾褢褱踝
+huan 唤喚喛嚾圂圜垸奂奐嬛孉宦寏寰峘嵈巜幻患愌懁懽换換援擐攌桓梙槵欢欥歓歡汍洹浣涣渙漶
+huan 澣澴灌烉焕煥犿狟獾环瑍瑗環瓛痪瘓皖眩睆睔瞏糫絙綄緩繯缓缳羦肒脘荁萈萑蒝藧蠸讙豢豩
+huan 豲貆貛轘还逭還郇酄鉮鍰鐶锾镮闤阛雈雚驩鬟鯇鯶鰀鲩鴅鵍鸛鹮
+huang 偟兤凰喤堭塃墴奛媓宺崲巟幌徨怳恍惶愰慌揘晃晄曂朚楻榥櫎汻洸湟滉潢炾煌熀熿爌獚瑝璜
+huang 癀皇皝皩磺穔篁篊簧縨肓艎芒茫荒葟蝗蟥衁詤諻謊谎趪遑鍠鎤鐄锽隍韹餭騜鰉鱑鳇鷬黃黄
+hui 会佪僡儶匯卉叀咴哕喙嘒噅噕噦嚖囘回囬圚堕墮壞婎媈嬒孈寭屶屷幑廻廽彗彙彚徊徻徽恚恛
+hui 恢恵悔惠慧憓懳拻挥揮撝晖晦暉暳會桧椲楎槥橞檅檓櫘殨毀毁毇汇沬泋洃洄浍涣湏溃滙潓澮
+hui 濊瀈灰灳烠烣烩煇煒燬燴獩珲琿璤璯痐瘣皓眭睢睳瞺硊禈秽穢篲絵繢繪绘缋翙翚翬翽芔茴荟
+hui 蒐蔧蕙薈薉藱蘬蘳虫虺蚘蛔蛕蜖螝蟪袆褘襘詯詼誨諱譓譭譿讳诙诲豗賄贿輝辉迴逥違銊鏸鐬
+hui 鑴闠阓隓隳靧鞼韋韢頮顪颒餯鮰鰴麾鼿
+hun 俒倱圂堚婚婫忶惛惽慁捆掍揮昆昏昬梡梱棍棔殙浑涽混渾湣湷溷焄焝煇珲琿眃睧睯碈緄繉荤
+hun 葷觨諢诨轋閽阍顐餛餫馄魂鼲
+huo 伙佸俰剨劐吙咟嚄嚯嚿壑夥奯姡惑或捇掝搉擭攉旤曤楇檴沎活湱漷濩瀖火灬焃獲癨眓矆矐砉
+huo 礊祸禍秮秳穫篧耠耯膕臛艧获萿蒦藿蠖謋豁貨货越趏邩鈥鍃鑊钬锪镬閄隻霍靃騞
+ji 丌丮乁乩亟亼亽伋伎佶倚偈偮僟其兾冀几击刉刏剂剞剤劑勣卙卟即卽厝及叝叽吇吉咭哜唧喞
+ji 嗘嘰嚌圾坖垍基堲塈塉墼奇妀妓姞姫姬嫉季寂寄尐居屐岋岌峜嵆嵇嵴嶯己帺幾庴廭彐彑彶徛
+ji 忌忣急悸惎愱憿懠懻戟戢技挤掎揖揤撃撠擊擠攲敧旡既旣暨暩曁朞期机极枅梞棋棘楖楫極槉
+ji 槣樭機橶檕檝檵櫅櫭殛毄汥汲泲洁洎济淁済湒漃漈潗激濈濟瀱焏犄犱狤玑璣璾畟畸畿疾痵瘠
+ji 瘵癠癪皀皍瞉矶磯祭禝禨积秸稘稩稷稽穄穊積穖穧笄笈筓箕箿簊簎籍系紀紒級結給継緝績繋
+ji 繫繼级纪给继绩缉罽羁羇羈耤耭肌脊脔脨膌臮艥艻芨芰苙茍茤荠莋萁葪蒺蓟蓻蔇蕀蕺薊薺藉
+ji 蘄蘎蘮蘻虀虮蝍螏蟣蟻蟿蠀裚襀襋覉覊覬覿觊觙觭計訐記誋諅諔譏譤计讥记诘谻谿賫賷赍趌
+ji 跡跻跽踑踖蹐蹟躋躤躸輯轚辑迹郅郆鄿銈銡錤鍓鏶鐖鑇鑙际際隮集雞雦雧霁霵霽革鞊鞿韲颳
+ji 飢饑饥騎驥骥髻鬾魕魝魢鮆鯚鯽鰶鰿鱀鱭鱾鲚鲫鳮鵋鶏鶺鷄鷑鸄鸡鹡麂齊齌齍齎齏齐齑
+jia 乫价伽佳假傢價加叚唊嘉嘏圿埉夏夹夾婽嫁宊家岬幏徦忦恝戛戞扴抸拁拮挟挾揩斚斝架枷柙
+jia 梜椵榎榢槚檟毠泇浃浹犌猰猳玾珈甲痂瘕稼笳筴糘耞胛腵茄荚莢葭蛱蛺袈袷裌豭貑賈贾跏跲
+jia 迦郏郟鉀鉫鉿鋏鎵钾铗镓頡頬頰颊餄駕駱驾骱鴶鵊麚鿼
+jian 件侟俭俴倹健傔僣僭儉兼冿减前剑剣剪剱劍劎劒劔劗咸囏囝坚堅堿塹墹奸姦姧寋尖帴幵建弿
+jian 彅徤惤戋戔戩戬拣挸捡揀揃揵搛撿擶攕旔暕枧柬栫梘检検椷椾楗榗槛樫橏橺檢檻櫼歼殱殲毽
+jian 洊浅涀涧淺渐減湔湕溅漸澗濫濺瀐瀳瀸瀽煎熞熸牋牮犍猏玪珔瑊瑐监監睑睷瞯瞷瞼硷碊碱磵
+jian 礀礆礛稴笕笺筧简箋箭箴篯簡籈籛糋絸緘縑繝繭纖缄缣翦聻肩腱臶舰艦艰艱茛茧荐菅菺葌葥
+jian 蒹蔪蕑蕳薦藆虃螹蠒袸裥襇襉襺見覵覸见詃諓諫謇謭譖譼譾谏谫豜豣賎賤贱趝趼跈践踐踺蹇
+jian 轞醎釼鉴銒鋑鋻錢錽鍊鍳鍵鏩鐗鐧鐱鑑鑒鑬鑯鑳锏键閒間间險靬鞬鞯韀韉餞餰饯馢騫鬋鰎鰔
+jian 鰜鰹鲣鳒鳽鵳鶼鹣鹸鹹鹻鹼麉黚
+jiang 傋僵勥匞匠塂壃夅奖奨奬姜将將嵹弜弶強强彊摪摾桨槳橿櫤殭江洚浆滰漿犟獎畕畺疅疆礓糡
+jiang 糨絳繮绛缰翞耩膙茳葁蒋蔃蔣薑虹螀螿袶講謽讲豇酱醤醬降韁顜鱂鳉
+jiao 交佼侥僑僥僬儌剿劋勦卻叫叽呌咬喬嘂嘄嘐嘦噍噭嚼妖姣娇嫶嬌嬓孂峤峧嵺嶕嶠嶣徺徼恔悎
+jiao 憍憢憿挍挢捁搅摷撟撹攪敎教敥敫敽敿斠晈暞曒校椒橋櫵浇湫湬滘漖潐澆激灚烄焦煍燋燞爝
+jiao 狡獥珓璬皎皛皦皭矫矯礁穚窌窖笅筊簥糾絞繳纐绞缴胶脚腳膠膲臫艽芁茭茮菽萩蕉蕎藠虠蛟
+jiao 蟜蟭覺觉角訆譑譥賋趫趭跤踋較轇轎轿较郊酵醮釂釥鉸鐎铰隦餃饺驕骄骹鮫鱎鲛鵁鵤鷦鷮鹪
+jie 丯亥介价借倢偈偕偼傑刦刧刼劫劼卩卪吤唧唶喈喼嗟嚌堦堺她妎姐婕媎媘媫嫅孑尐屆届岊岕
+jie 崨嵑嵥嶰嶻巀幯庎徣悈戒截拮捷接掲掶揭搩擑擮擳斺昅暨杢杰桀桔桝椄楐楬楶楷榤檞櫭毑洁
+jie 洯渴湝滐潔煯犗狤玠琾界畍疌疖疥痎癤皆睫砎碣礍祖秸稭竭節籍紒結絜结罝羯耤脻艐节芥莭
+jie 菨蓵藉蚧蛣蛶蜐蝍蝔蠘蠞蠽街衱衸袓袺裓褯解觧訐詰誡誱謯讦诘诫趌跲踕迼鉣鍇鍻鎅阶階雃
+jie 鞂鞊颉飷骱髻魝魪鮚鲒鶛
+jin 仅今伒侭僅僸儘兓凚劤劲勁卺厪唫噤嚍埐堇堻墐壗妗婜嫤嬧寖尽嶜巹巾廑惍慬搢斤斳晉晋枃
+jin 榗槿歏殣津浕浸溍漌濅濜烬煡燼珒琎琻瑨瑾璡璶盡矜矝砛祲禁竻笒筋紟紧緊縉缙臸荕荩菫蓳
+jin 藎衿襟覲觐觔謹谨賮贐赆近进進金釒釿錦钅锦靳饉馑馸鹶黅齽
+jing 丼井京亰仱俓倞傹儆兢净凈刭剄劲勁坓坕坙境妌婙婛婧宑巠幜弪弳径徑惊憬憼擏敬旌旍景晶
+jing 暻曔桱梷橸檠殑汫汬泾浄涇淨瀞烴燝猄獍獷璄璟璥痉痙睛秔稉穽竞竟竧竫競竸箐粇粳精経經
+jing 经聙肼胫脛腈茎荆荊莖菁葏葝蜻蟼誩警踁迳逕鏡镜阱陘青靓靖静靚靜頚頴頸颈驚鯨鲸鵛鶁鶄
+jing 麖麠鼱
+jiong 侰僒冂冋冏囧坰垧埛扃扄昋泂浻澃炅炯烱煚煛熲燛窘絅綗臦臩蘏蘔褧迥逈銄顈颎駉駫
+jiu 丩久乆九乣倃僦剹勼匓匛匶厩咎啾奺就廄廏廐慦捄揂揪揫摎救旧朻杦柩柾桕樛欍殧氿汣灸牞
+jiu 玖疚稵穋究糺糾紤繆纠臼舅舊舏萛赳酒镹阄韭韮鬏鬮鯦鳩鷲鸠鹫麔齨
+ju 且举乬侷俥俱倨倶僪具冣凥剧劇勮匊句告咀啹坥埧埾壉姐姖娵娶婅婮寠局居屦屨岠岨崌巈巨
+ju 巪弆忂怇怐怚惧愳懅懼抅拒拘拠拱挙挶捄据掬揟據擧昛柜桔梮椇椈椐榉榘橘檋櫸欅歫毩毱沮
+ju 泃泦洰涺淗渠湨澽炬烥焗焣爠犋犑狊狙珇琚疽痀眗瞿矩砠租秬窭窶筥簴籧粔粷罝耟聚聥腒臄
+ju 舉艍苣苴莒菊菹萭蒟蒩蘜蘧虡蚷蛆蜛螶袓裾襷詎諊讵豦貗趄趉趜足跔跙距跼踘踞踽蹫躆躹車
+ju 輂车遽邭郰郹鄒鄹醵鉅鋤鋦鋸鐻钜锔锯閰陱雎雛鞠鞫颶飓駏駒駶驧驹鮈鮔鴡鵙鵴鶋鶪鼰鼳齟
+ju 龃
+juan 倦劵勌勬卷呟圈埍埢奆姢娟婘巻帣弮悁惓慻捐捲擐朘桊梋棬涓淃焆狷獧瓹眷睊睠絭絹縳绢罥
+juan 羂脧臇菤萒蔨蕊蜷蠲裐襈踡身鄄鋗錈鎸鐫锩镌隽雋鞙韏飬餋鵍鵑鹃
+jue 亅倔傕决刔劂勪匷厥啳噘噱嚼埆壆夬妜孒孓屈屩屫崛崫嶡嶥弡彏憠憰戄抉挗捔掘撅撧攫斍柽
+jue 桷梏構橛橜欔欮殌氒決泬潏灍焳熦爑爝爴爵狂獗玃玦玨珏瑴璚疦瘚矍矞矡砄穱穴絕絶繑繘绝
+jue 脚腳臄芵蕝蕞蕨虳蚗蛙蟨蟩蠼袦覐覚覺觉角觖觼訣誳譎诀谲貜赽趉趹蹶蹷蹻躩較逫鈌鐍鐝钁
+jue 镢闋駃騤髉鱖鴂鴃鶌鷢龣
+jun 俊儁军匀君呁均埈姰寯峻懏捃攈攟旬晙桾棞汮浚濬焌燇珺畯皲皸皹睃碅竣筠箘箟莙菌葰蔨蚐
+jun 蜠袀覠訇軍郡鈞銁銞鋆鍕钧陖隽雋餕馂駿骏鮶鲪鵔鵕鵘麇麏麕龟
+ka 佧卡呿咔咖咯喀垰擖胩衉裃鉲
+kai 凯凱剀剴劾勓喫嘅垲塏奒岂嵦幆开忾恺愒愷愾慨揩暟楷欬欯溘濭炌炏烗蒈豈輆鍇鎎鎧鐦铠锎
+kai 锴開闓闿雉颽
+kan 侃偘冚凵刊勘喊坎埳堪堿塪墈崁嵁惂戡栞槛檻欿歁看瞰矙砍磡竷莰衎輡輱轁轗闞阚顑餡龕龛
+kang 亢伉匟囥坑奋嫝嵻康忼慷扛抗摃杭槺漮炕犺砊穅粇糠羫躿邟鈧鏮钪閌闶阬骯鱇
+kao 丂尻嵪拷攷栲槀槁洘烤焅犒稾考薧訄銬铐靠髛鮳鯌鲓
+ke 克刻剋勀勊匼可咳喀嗑坷堁壳娔客尅岢峇嵑嵙嶱恪悈愙揢搕敤柯棵榼樖歁殼毼氪渇渴溘炣牁
+ke 犐珂疴痾盍瞌砢硞碣碦磆磕礊礚科稞窠窼簻緙缂翗胢艐苛萪薖蚵蝌袔課课趷軻轲醘鈳錒钶锞
+ke 頦顆颏颗騍骒髁龕
+kei 刻剋尅
+ken 啃垠垦墾恳懇掯珢肎肯肻裉褃豤錹頎齦龈
+keng 劥吭坈坑奟妔忐挳揁摼殸牼硁硎硜硻脛誙踁鉺銵鍞鏗铿阬
+kong 倥埪孔崆恐悾控椌涳矼硿空箜腔躻錓鞚鵼
+kou 佝冦刳剾劶口叩宼寇彀彄怐扣抠摳敂毆滱眍瞉瞘窛竘筘簆芤蔲蔻釦鏂鷇
+ku 俈刳哭喾嚳圐圣堀崫库庫廤扝挎捁掘搰朏枯桍楛泏焅狜瘔矻秙窋窟絝绔苦袴裤褲趶跍跨郀酷
+ku 骷鮬齁
+kua 侉咵垮夸姱恗挎晇絓胯舿誇跨銙錁顝骻髁
+kuai 会侩儈凷哙噲圦块塊墤巜廥快擓旝會檜浍澮狯獪璯筷糩脍膾蒯蕢郐鄶駃鬠鱠鲙
+kuan 完宽寛寬梡棵欵款歀窽窾臗鑧髋髖
+kuang 丱儣兄况劻匡匩卝呈哐圹壙夼岲忹恇懬懭抂旷昿曠枉框況洭湟爌狂狅眖眶矌矿砿硄磺礦穬筐
+kuang 筺絋絖纊纩誆誑诓诳貺贶軖軠軦軭逛邝邼鄺鉱鋛鑛鵟黋
+kui 亏傀刲匮匱喟喹嘳夔奎媿嬇尯岿巋巙悝愦愧憒戣揆晆暌楏楑樻櫆欳歸殨溃潰煃犪盔睽瞆磈窥
+kui 窺篑簣籄缺聧聩聭聵胿腃膭葵蒉蕢藈蘬蘷虁虧蝰觖謉跬踩蹞躨逵鄈鍨鍷鐀鑎闚隗頄頍頯顝餽
+kui 饋馈馗騤骙魁
+kun 卵困坤堃堒壸壼婫尡崐崑悃捆昆晜梱涃潉焜熴猑琨瑻睏硱祵稇稛綑罤菎蜫裈裍裩褌豤貇醌錕
+kun 锟閫閸阃頑餛騉髠髡髨鯤鲲鵾鶤鹍
+kuo 噋廓懖扩拡括挄擴桰漷濶燭秳筈萿葀蛞适鄺闊阔霩鞟鞹韕頢髺鬠
+la 儠剌啦喇嚹垃拉揦揧搚摺擸攋旯柆楋溂爉瓎瘌癩砬磖翋腊臈臘菈落蓝藍藞蜡蝋蝲蠟辢辣邋鑞
+la 镴鞡鬎鯻鱲
+lai 來俫倈勑厲唻婡崃崍庲徕徠懶攋来梾棶櫴涞淶濑瀨瀬猍琜癘癞癩睐睞筙箂籁籟莱萊藾襰誺賚
+lai 賴赉赖逨郲錸铼頼顂騋鯠鵣鶆麳黧
+lan 僋儖兰厱啉嚂囒囕坔壈壏婪嬾孄孏岚嵐幱廩惏懒懔懢懶拦揽擥攔攬斓斕暕栏榄欄欖欗浨湅滥
+lan 漣漤澜濫瀾灆灠灡烂煉燗燣燷爁爛爤爦璼瓓礷篮籃籣糷繿纜缆罱葻蓝藍蘫蘭褴襕襤襴襽覧覽
+lan 览諫譋讕谰躝郴醂鑭钄镧闌阑韊顲
+lang 俍勆哴唥啷埌塱嫏崀廊悢斏朖朗朤桹榔樃樠欴浪烺狼琅瑯硠稂筤羹脼艆莨蒗蓈蓢蜋螂誏躴郎
+lang 郒郞鋃鎯锒閬阆駺鿶鿾
+lao 佬僗劳労勞咾哰唠嗠嘮姥嫪崂嶗恅憥憦捞撈朥栳橑橯浶涝潦澇烙牢狫獠珯痨癆硓磱窂簩粩絡
+lao 络老耂耢耮荖蛯蟧躼軂轑酪醪銠鐒铑铹顟髝鮱鿲
+le 乐了仂勒叻嘞忇扐楽樂氻泐牞玏砳竻簕肋艻阞韷餎饹鰳鳓
+lei 傫儡儽勒厽嘞垒塁壘壨嫘擂攂樏檑櫐櫑欙泪洡涙淚灅瓃畾瘣癗矋磊磥礌礧礨祱禷类累絫縲纇
+lei 纍纝缧罍羸耒肋腂蔂蕌蕾藟蘱蘲蘽虆蠝誄讄诔轠郲酹銇錑鐳鑘鑸镭雷靁頛頪類颣鱩鸓鼺
+leng 倰冷堎塄崚愣棱楞睖碐稜薐踜輘
+li 丽仂位例俐俚俪傈儮儷兣凓刕列利剓剺劙力励勵历厉厘厤厯厲叓叻吏呖哩唎唳喱嚟嚦囄囇坜
+li 塛壢娌娳婯嫠孋孷屴岦峛峢峲巁廲悝悡悧悷慄戾扐捩搮擽攊攦攭斄暦曆曞朸李杝枥栃栎栗栛
+li 梨梩梸棃棙樆檪櫔櫟櫪欐欚歴歷氂沥沴泣浬浰涖淚溧漓澧濿瀝灕爄爏犁犂犛犡狸猁珕珞理琍
+li 瑮璃瓅瓈瓑瓥疠疬痢癘癧皪盠盭睝矖砅砬砺砾磿礪礫礰礼禮禲离秝穲立竰笠筣篥篱籬粒粝粴
+li 糎糲綟縭纅纚缡罹翮脷艃苈苙茘荔荲莅莉菞蒚蒞蓠蔾藜藶蘺蚸蛎蛠蜊蜧蝕蝷蟍蟸蠇蠡蠣蠫裏
+li 裡褵觻詈謧讈豊貍赲跞躒轢轣轹逦邌邐郦酈醨醴里釐鉝銐鋫鋰錅錑鎘鏫鑗锂隶隷隸離雳霾靂
+li 靋颯驪骊鬁鬲鬴鯉鯏鯬鱧鱱鱳鱺鲡鲤鳢鳨鴗鵹鷅鸝鹂麗麜黎黐黧
+lia 俩倆
+lian 亷僆劆匲匳嗹噒堜奁奩媡嫾嬚孌帘廉怜恋慩憐戀搛摙撿攣敛斂梿楝槤櫣欄歛殓殮浰涟湅溓漣
+lian 潋澰濂濓瀲炼煉熑燫琏瑓璉磏簾籢籨練縺纞练羷羸翴联聨聫聮聯脸膦臁臉苓莲萰蓮蔹薕薟蘝
+lian 蘞螊蠊裢裣褳襝覝謰譧蹥輦连連鄻醶錬鍊鎌鏈鐮链镰零鬑鰊鰱鲢
+liang 両两亮俍俩倆倞兩凉哴唡啢喨墚悢惊掚晾梁椋樑涼湸煷粮粱糧綡緉脼良莨蜋蜽裲諒谅踉輌輛
+liang 輬辆辌量鍄靓靚駺魉魎鿄鿌
+liao 了佬僇僚叾嘹嫽寥寮尞尥尦屪嵺嶚嶛廖廫憀憭撂撩敹料暸曢樛橑漻潦炓燎爎爒獠璙疗療瞭窷
+liao 竂簝繚缭聊膋膫蓼藔蟉蟟蟧豂賿蹘蹽辽遼鄝釕鐐钌镣镽飂飉髎鷯鹩
+lie 例儠冽列劣劦劽咧哷埒埓奊姴峛巁巤忚挒挘捩擸栗栵棙毟洌浖烈烮煭燤爄爉犣猎猟獵睙綟聗
+lie 脟臘茢蛚裂趔躐迾邋颲鬛鬣鮤鱲鴷
+lin 临亃伈僯冧凛凜厸吝啉壣崊嶙廩廪恡悋惏懍懔拎撛斴晽暽林橉檁檩淋潾澟瀶焛燐獜琳璘甐疄
+lin 痳癛癝瞵碄磷稟箖粦粼繗翷膦臨菻蔺藺賃赁蹸躏躙躪轔轥辚遴邻鄰鏻閵隣霖顲驎魿鱗鳞麐麟
+ling 令伶倰冷凌刢另呤囹坽夌姈婈孁岭岺崚嶺彾怜拎掕昤朎柃棂櫺欞泠淩澪瀮灵炩燯爧狑玲琌瓴
+ling 皊砱祾秢竛笭紷綾绫羚翎聆舲苓菱蓤蔆蕶蘦蛉衑袊裬詅跉軨輘酃醽鈴錂铃閝阾陵零霊霗霛霝
+ling 靇靈領领駖魿鯪鲮鴒鸰鹷麢齡齢龄龗
+liu 僂六刘劉嚠塯媹嬼嵧廇懰摎斿旈旒柳栁桞桺榴橊橮沠泖流浏游溜澑瀏熘熮珋琉瑠瑬璢畂畄留
+liu 畱疁瘤癅硫碌磂磟綹绺罶羀翏聊蒥蓅藰蟉裗蹓遛鉚鋶鎏鎦鏐鐂锍镏镠陆陸雡霤飀飂飅飗餾馏
+liu 駠駵騮驑骝鬸鰡鶹鷚鹠鹨麍
+lo 囖
+long 儱咙哢嚨垄垅壟壠寵屸嶐巃巄弄徿拢攏昽曨朧栊梇槞櫳泷湰滝漋瀧爖珑瓏癃眬矓砻硦礱礲窿
+long 竉竜笼篢篭籠聋聾胧茏蕯蘢蠪蠬衖襱谾豅贚躘鏧鑨陇隆隴霳靇驡鸗龍龐龒龓龙
+lou 偻僂剅喽嘍塿娄婁屚嵝嶁廔慺搂摟楼樓溇漊漏熡甊瘘瘺瘻瞜窶篓簍耧耬艛蒌蔞蝼螻謱軁遱鏤
+lou 镂陋露鞻髅髏
+lu 侓僇六剹勎勠卢卤噜嚕嚧圥坴垆塶塷壚娽峍庐廘廬彔录戮掳摝撸擄擼攄攎曥枦栌椂樐樚橹櫓
+lu 櫨氇氌泸淕淥渌滷漉潞澛瀂瀘炉熝爐獹玈琭璐璷瓐甪瘳盝盧睩矑硉硵碌磟磠祿禄稑穋箓簏簬
+lu 簵簶籙籚粶緑纑绿罏翏胪膔膚臚舮舻艣艪艫芦菉蓼蓾蔍蕗蘆虂虏虜螰蠦觮觻謢谷賂赂趢路踛
+lu 蹗輅轆轤轳辂辘逯鄜醁鈩錄録錴鏀鏕鏴鐪鑥鑪镥陆陸露顱颅騄騼髗魯魲鯥鱳鱸鲁鲈鵦鵱鷺鸕
+lu 鸬鹭鹵鹿麓黸
+luan 乱乿亂卵圝圞奱娈孌孪孿峦巒挛攣曫栾欒滦灓灤癴癵羉脔脟臠臡薍虊覶釠銮鑾鵉鸞鸾龻
+lun 仑伦侖倫囵圇埨婨崘崙惀抡掄棆沦淪溣碖磮稐綸纶耣腀菕蜦論论踚輪轮錀陯鯩
+luo 倮儸剆啰囉峈捋捰摞攎攞攭曪果格椤櫟欏欙泺洛洜漯濼烙爍犖猓猡玀珞瘰癳皪砢硌硦礫笿箩
+luo 籮絡纙络罖罗羅脶腡臝茖荦萝落蓏蘿蛒蜾蝸螺蠃袼裸覙覶覼跞路躶逻邏酪鉻鎯鏍鑼锣镙雒頱
+luo 饠駱騾驘骆骡鮥鴼鵅鸁
+lv 侣侶偻儢勴吕呂哷垏婁寠寽屡屢履嵂廬律慮慺挔捋捛旅梠榈樓櫖櫚櫨氀氯滤漊濾焒爈率瘻盧
+lv 祣稆穞穭箻簍絽綠緑縷繂绿缕膂膐膟膢臚菉葎蔞藘虑褛褸謱軁郘鋁録鏤鑢铝閭闾馿驢驴魯鷜
+lv 鹿
+lve 剠圙寽掠擽略畧稤詻鋝鋢锊
+m 呒呣
+ma 亇傌吗唛嗎嘛嘜妈媽嫲嬤嬷孖抹摩杩榪溤犘犸獁玛瑪痲睰码碼礣祃禡罵蔴蚂螞蟆蟇貊遤鎷閁
+ma 馬駡驀马骂鬕鰢鷌麻麽
+mai 买佅劢勱卖唛嘪埋売派脈脉荬蕒薶衇貍買賣迈邁霡霢霾鷶麥麦鿏鿺
+man 僈埋墁姏嫚屘幔幕悗慢慲摱曼槾樠満满滿漫澫澷熳獌睌瞒瞞矕縵缦蔄蔓蘰蛮螨蟎蠻襔謾谩蹣
+man 鄤鏋鏝镘鞔顢颟饅馒鬗鬘鰻鳗
+mang 厖吂哤壾娏尨庬忙恾朚朦杗杧氓汒浝漭牤牻狵甿痝盲盳瞢硥硭笀芒茫茻莽莾蘉蛖蟒蠎邙釯鋩
+mang 铓駹鸏龍
+mao 乮侔兞冃冇冐冒勖卯堥夘媢峁嵍帽愗懋戼描旄昴暓枆柕楙毛毣毷氂泖渵牦犛猫瑁皃眊瞀矛秏
+mao 笷緢罞耄耗芼茂茅茆萺蓩蛑蝐蝥蟊袤覒貇貌貓貿贸軞鄚鄮酕鉚鉾錨铆锚霿髦髳鶜
+me 么嚒嚜末濹癦麼
+mei 凂呅味嚜坆堳塺墨妹娒媄媒媚媺嬍寐嵄嵋徾抺挴攗旀昧枚某栂梅楣楳槑櫗毎每氼沒没沬浼渼
+mei 湄湈溦煝煤燘猸玫珻瑂痗眉眊眛睂睸矀祙禖穈篃糜美羙脄脢腜苺莓葿蘪蝞袂谜跊躾郿酶鋂鎂
+mei 鎇镁镅霉韎鬽魅鶥鹛黣黴
+men 亹们們呇怋悗悶懑懣扪捫暪椚殙滿焖燜玧璊瞞穈菛虋鍆钔門閅门闷鞔
+meng 儚冡勐夢夣孟尨幪庬懜懞懵掹擝明曚朦梦橗檬氋氓溕濛猛獴瓾甍甿盟瞑瞢矇矒礞艋艨莔萌蒙
+meng 蕄蘉虻蜢蝱蟊蟒蠓鄳鄸鋂錳锰雺霥霧霿靀顭饛鯍鯭鸏鹲黽鼆
+mi 侎冖冞冪劘咪嘧塓孊宓宻密峚幂幎幦幺弥弭彌戂擟攠敉榓樒檷櫁汨沕沵泌洣淧渳滵漞濔濗瀰
+mi 灖熐爢爾猕獮獼瓕眫眯眽瞇祕祢禰秘簚籋米粎糜糸縻羃羋脒芈葞蒾蓂蔝蔤藌蘼蜜袮覓覔覛觅
+mi 詸謎謐谜谧迷醚醾醿釄銤鑖镾靡鸍麊麋麛麿鼏鿹
+mian 丏俛偭免冕冥勉勔喕娩婂媔嬵宀愐杣棉檰櫋汅沔泯渑湎澠牑眄眠矈矊矏糆絻綿緜緬绵缅腼臱
+mian 芇葂蝒蠠面靣靦鮸麪麫麵麺黽黾
+miao 仯喵妙媌嫹庙庿廟描杪淼渺猫玅眇瞄秒竗篎紗緢緲缈缪苗藐蜱訬邈鱙鶓鹋
+mie 乜吀咩哶孭幭懱搣櫗滅瀎灭烕眜篾羋蔑薎蠛衊覕鑖鱴鴓
+min 僶冺刡勄厸呡垊姄岷崏忞怋悯惽愍慜憫抿捪敃敏敯旻旼暋民泯渂湏湣潣玟珉琘琝瑉痻皿盿砇
+min 碈笢笽簢緍緡缗罠苠蠠鈱錉鍲閔閩闵闽鰵鳘鴖黾
+ming 佲冥凕名命姳嫇慏掵明暝朙椧榠洺溟猽皿眀眳瞑茗萌蓂螟覭詺鄍酩銘铭鳴鸣
+miu 謬谬
+mo 万佰冒劘劰勿唜嗼嘿嚤嚩嚰圽塻墨妺嫫嫼嬷寞尛帓帕帞庅怽懡戂抹摩摸摹撫擵攠无昩暯末枺
+mo 模橅歾歿殁没沫湐漠瀎無爅狢獏瘼皌眜眽眿瞐瞙砞磨礳秣粖糢絈絔縸纆耱脈脉膜艒茉莈莫蓦
+mo 藐藦蘑蛨蟆蟔袜袹謨謩譕谟貃貈貊貌貘鄚銆鏌镆陌靺饃饝馍驀髍魔魩魹麽默黙
+mou 件侔劺厶哞堥婺恈敄某桙毋洠牟畝眸瞴繆缪蛑蟱袤謀谋踎鉾鍪鞪鴾麰
+mu 亩仫凩募坶墓墲姆姥娒峔幕幙慔慕拇暮木朰朷楘模樢母毣毪氁沐炑牟牡牧牳狇獏畆畒畝畞畮
+mu 目睦砪穆縸胟艒苜茻莫莯萺蚞踇鉧鉬钼雮霂鞪鶩
+n 嗯
+na 乸内南吶呐呶哪嗱妠娜拏拿挐捺秅笝箬納纳肭蒘蒳衲袦訤詉誽豽貀軜那郍鈉鎿钠镎雫靹魶
+nai 乃佴倷奈奶妳嬭孻廼搱摨柰氖渿熋疓耏耐腉艿萘螚褦迺釢錼鼐
+nan 侽冉南喃囝囡妠娚婻嫨戁抩揇攤暔枏柟楠湳煵男畘罱腩莮萳蝻諵赧遖难難
+nang 乪儾噥嚢囊囔搑擃攮曩欜涳灢蠰譨饢馕鬞齉
+nao 匘呶垴堖夒婥嫐孬峱嶩巎巙怓恼悩惱憹挠撓橈淖猱獶獿瑙硇碙碯脑脳腦臑蛲蝚蟯詉譊鐃铙閙
+nao 闹鬧
+ne 呐呢抐疒疔眲訥讷
+nei 內内娞氝浽脮腇錗餒餧馁鮾鯘
+nen 媆嫩嫰恁枘
+neng 竜而耐能
+ng 唵嗯
+ni 伱伲你倪儗儞兒匿呢坭埿堄妮妳婗嫟嬺孨孴尼屔屰嶷怩惄愵慝懝抐抳拟掜擬旎昵晲暱柅棿檷
+ni 氼泥淣溺灄狔猊痆眤睨祢禰秜籾縌聣聻胒腝腻膩臡苨薿蚭蛪蜺觬誽貎跜輗迡逆郳鈮鉨鑈铌隬
+ni 霓馜鯢鲵麑齯鿭
+nian 卄哖唸埝姩年廿念拈捻撚撵攆涊淰焾碾秊秥簐粘艌蔫跈蹍蹨躎輦輾辇辗鮎鯰鲇鲶鵇黏
+niang 娘嬢孃酿醸釀
+niao 嫋嬝嬲尥尿樢脲茑茮蔦袅裊褭鳥鸟
+nie 乜啮喦嗫噛嚙囁囐囓囡圼孼孽峊嵒嵲嶭巕帇幸惗捏捻揑摰敜枿棿槷櫱涅湼痆篞籋糱糵聂聶臬
+nie 臲苶菍蘖蠥褹諗讘踂踗踙蹑躡鉩銸鋷錜鎳鑈鑷钀镊镍闑陧隉顳颞齧
+nin 囜您拰脌
+ning 佞侫倿儜冰凝咛嚀嬣宁寍寕寗寜寧年拧擰柠橣檸泞澝濘狞獰甯疑矃聍聹苧薴鑏鬡鬤鸋
+niu 妞忸怓扭杻汼沑炄牛牜狃紐纽莥鈕钮靵
+nong 侬儂农哝噥弄憹挊挵檂欁浓濃燶癑禯秾穠繷脓膿莀蕽襛農辳醲齈
+nou 啂嬬槈檽獳羺耨譨譳鎒鐞
+nu 伮傉努奴孥帑弩怒搙擩砮笯肭胬褥駑驽
+nuan 奻暖暧渜湪煖煗餪
+nun 黁
+nuo 傩儺喏堧娜愞懦懧挪掉掿搙搦搻梛榒橠毭稬穤糑糥糯耎袲諾诺蹃逽郍鍩锘需
+nv 女恧朒沑狃籹聏胬衂衄釹钕
+nve 婩疟瘧硸虐
+o 哦喔噢
+ou 偶区區吘吽呕嘔塸怄慪握摳敺樞櫙欧歐殴毆沤渥漚熰瓯甌筽紆耦腢膒蓲蕅藕藲謳讴醧鏂鴎鷗
+ou 鸥齵
+pa 叭啪妑帊帕怕扒掱杷汃潖爬琶皅筢耙舥芭苩葩袙趴跁钯
+pai 俳哌廹徘拍排棑派渒湃牌犤猅簰簲脾蒎輫迫鎃
+pan 乑伴冸判半卞叛坢媻審幋弁彦扳拌拚搫攀柈槃沜泮洀湴溿潘瀊炍爿牉畔畨番皤盘盤盻盼眅眫
+pan 磐磻縏聁胖膰般萠蒰螌蟠袢褩襻詊跘踫蹒蹣鋬鎜鑻闆鞶頖鵥
+pang 乓仿傍厐厖嗙夆嫎庞彭彷徬房旁汸沗滂炐牓磅篣耪肨胖胮膀膖舽蒡螃蠭覫趽逄鎊雱霶髈鰟鳑
+pang 龎龐
+pao 刨包匏咆嚗垉奅庖抛抱拋泡炮炰爮犥狍瓟疱皰砲礟礮穮窌胞脬苞萢藨蚫袌袍褜謈跑軳鉋鞄颮
+pao 麃麅麭
+pei 伂佩俖倍呸啡培妃妚姵婄嶏帔怌抷攈斾旆昢柸毰沛浿淠犻珮琣肧肺胚茇茷蓜衃裴裵賠赔轡辔
+pei 配醅锫阫陪陫霈馷駍
+pen 吩呠喯喷噴歕汾湓濆瓫盆翸葐衯
+peng 倗傰剻匉嘭堋塜塳庄弸彭怦恲憉抨挷捧掽搒摓旁朋梈棚椖椪槰樥泙洴淎淜滂漨漰澎烹熢痭皏
+peng 砰硑硼碰磞稝竼篣篷纄胓膨芃苹荓莑蓬蘕蟚蟛踫軯輣輧逢逬錋鑝閛韸韼駍騯髼鬅鬔鵬鹏
+pi 丕仳伓伾僻副劈匹否啤噼噽嚊嚭圮坏坯埤壀媲嫓屁岯崥嶏帔庀庇庳怶悂憵扑批披抷揊擗旇朇
+pi 枇枈椑毗毘毞淠潎澼濞炋焷狉狓猈琵甓疈疋疲痞痦癖皮睥砒磇礔礕秛秠稫笓篦篺粃紕纰罴罷
+pi 羆翍耚肶脴脾腗膍芘苉苤萆蚍蚽蚾蜱螕螷蠯裨諀譬豼豾貔辟邳郫鄱釽鈈鈚鈲鈹鉟銔銢錃錍鎞
+pi 铍闢阰陂陴隦霹駓髬魮魾鮍鲏鴄鵧鷿鸊鼙
+pian 便偏囨媥平徧扁楄楩片犏猵璸篇緶缏翩胼腁蝙褊覑諚諞谝貵賆跰蹁辯鍂駢騈騗騙骈骗骿魸鶣
+piao 僄剽勡嘌嫖彯徱慓旚朴殍漂犥瓢皫瞟票篻縹缥翲膘莩蔈薸螵謤醥闝顠飃飄飘驃驫骠髟魒
+pie 丿嫳撆撇暼氕潎瞥苤覕鐅
+pin 匕品嚬姘娉娦嫔嬪拼榀汖泵牝玭琕矉礗穦聘薲蘋蠙貧贫頻顰频颦馪驞
+ping 乒俜冯凭凴呯坪塀娉屏屛岼帡帲幈平慿憑枰檘泙洴涄淜焩玶瓶甁甹砯砰硑竮箳簈缾聘聠胓艵
+ping 苹荓萍蓱蘋蚲蛢評评軿輧郱鉼頩馮鮃鲆
+po 剖叵哱嘙坡奤婆尀屰岥岶巿廹敀昢桲櫇泊泺泼洦溌潑濼烞猼珀皤破砶笸粕繁膊蒪蔢謈迫鄱酦
+po 醗醱釙鉕鏺钋钷霸頗颇馞駊髆魄
+pou 剖吥咅哣培堷娝婄抔抙捊掊涪犃瓿箁裒襃踣部錇
+pu 仆僕匍噗圃圑圤埔墣巬巭扑扶抪捗撲擈攴攵普暜暴曝朴柨樸檏氆浦溥潽濮瀑炇烳獛璞痡瞨穙
+pu 纀脯舖舗苻荹莆菐菩葡蒱蒲蜅襆諩譜谱贌蹼酺鋪鏷鐠铺镤镨陠鯆
+qi 七丌乞亓亝亟企俟倛傶僛其凄剘勤吃启呇呮咠唘唭啓啔啟嘁噐器圻埼夡奇契妻娸婍屺岂岐岓
+qi 崎嵜己帺弃忔忮忯忾恓恝悽愒愭慼慽憇憩懠戚扢扺技挈捿掑揭摖攲敧斉斊旂旗晵暣朞期杞枝
+qi 柒栔栖桤桼棄棊棋棨棲榿槭檱櫀欫欹欺歧气気氣汔汽沏泣洓淇淒湆湇溪漆濝炁焏猉玂玘琦琪
+qi 璂甈甭畦畸疧盀盵矵砌碁碕碛碶磎磜磧磩礘示祁祇祈祺禥稘稽竒簯簱籏粸紪綥綦綨綮綺緀緕
+qi 緝纃绮缉缼罊耆肐肵脐臍舙艩芑芞芪荠萁萋萕葺蕲藄蘄蚑蚔蚚蛣蛴蜝蜞螇螧蟣蟿蠐袳裿褀褄
+qi 觭訖諆諬諿讫豈起趞跂踑踖踦蹊躩軙軝迄迉邔郪鄿釮錡鏚鐖锜闙霋頎颀饑騎騏騹骐骑鬐鬾鬿
+qi 魌鮨鯕鰭鲯鳍鵸鶀鶈鸂麒麡鼜齊齐齮
+qia 佉價冾卡圶客峠帢恰愘拤掐揢擖楬殎洽矻硈磍葜袷跒酠鞐髂鮚
+qian 乾仟仱伣佥俔倩偂傔僉儙兛凵刋前千厱唊嗛圱圲堑塹墘壍奷婜媊嬱孅孯岍岒嵌嵰幵廞忏忴悓
+qian 悭愆慊慳扦扲拑拪掔掮揵搴摼撁撖攐攑攓朁杄杴柑棈椠榩槏槧橬檶櫏欠欦欿歉歬汘汧浅涔淒
+qian 淺潛潜濳灊煔熑燖牵牽犍瓩皘磏竏筋签箝箞篏篟簽籖籤粁綪縴繾纤缱羥羬肷脥腱膁臤艌芊芡
+qian 茜茾荨葥葴蒨蔳蕁藖虔蚈蚙蜸褰諐謙譴谦谴谸赶軡輤迁遣遷釺鈆鈐鉆鉗鉛銭鋟錢鍼鎆鏲鐱鑓
+qian 鑯钎钤钱钳铅開阡雃靬韆顅馯騚騝騫骞鬜鬝鰜鰬鳽鵮鶼鹐黔黚齦
+qiang 丬勥呛哐唴啌嗆嗴墏墙墻嫱嬙嶈廧強强彊戕戗戧抢搶摪斨枪椌槍樯檣溬漒炝熗爿牄牆猐獇玱
+qiang 瑲篬繈繦羌羗羟羥羫羻腔艢蔃蔷薔蘠蜣襁謒跄跫蹌蹡錆鎗鏘鏹锖锵镪鶬
+qiao 丂乔侨俏偢僑僺劁喬喿嘺噭塙墝墧墽壳嫶峤峭嵪嶠巧帩幧悄愀愁憔招搞摮撬撽敫敲桥槗樵橇
+qiao 橋橾殻殼毃毳焦燆燋犞癄睄瞧硗硚硝碻磝磽礄礉窍竅繑缲翘翹荍荞菬蕉蕎藮蟜誚譑譙诮谯趫
+qiao 趬跤跷踃踍蹺蹻躈郻鄗鄡鄥醮釥鍫鍬鏒鐈鐰锹陗雀鞒鞘鞩鞽韒頝顤顦骹髚髜
+qie 且倢切匧厒唼妾婕帹怯悏惬愜慊挈捷朅沏洯淁漆疌癿砌稧穕窃竊笡箧篋籡緁聺脞苆茄蕺藒蛪
+qie 詧趄踥郄鍥鐑锲魥鯜鰈
+qin 亲侵儭勤吢吣唚嗪噙坅埁埐堇墐媇嫀寑寝寢寴嵚嶔嶜庈廑忴慬懃懄扲抋捦揿搇撳擒斳昑梫槿
+qin 橬檎櫬欽沁浸溱澿瀙珡琴琹瘽矜禽秦笉綅耹芩芹菣菦菳蓁藽蚙螓螼蠄衾衿覃親誛赺赾鈂鈊鈙
+qin 鈫鋟钦锓雂靲顉顩駸骎鬵鮼鳹鵭
+qing 亲倩倾傾儬凊剠勍卿啨圊埥声夝寈庆庼廎情慶掅擎擏晴暒棾樈檠檾櫦殑殸氢氫氰涇淸清渹漀
+qing 濪甠硘硜碃磬箐精綪綮罄苘葝蜻親請謦请軽輕轻郬鑋靑青靘頃顷鯖鯨鲭鶄黥
+qiong 儝卭宆惸憌桏橩焪焭煢熍琁琼璚瓊瓗睘瞏穷穹窮竆笻筇舼芎茕藑藭蛩蛬赹跫邛銎
+qiu 丘丠仇俅厹叴唒囚团坵媝崷巯巰恘惆愀扏搝朹梂楸櫹殏毬氽求汓泅浗渞湫湭煪牫犰玌球璆皳
+qiu 盚秋秌穐篍糗紌絿緧肍艽莍萩蓲蘒虬虯蚯蛷蝤蝵蟗蠤裘觓觩訄訅賕赇趥逎逑遒邱邺酋醔釓釚
+qiu 釻銶鞦鞧馗鮂鯄鰌鰍鰽鱃鳅鳩鶖鹙鼽龜龝
+qu 伹佉佢刞劬匤区區厺去取呿唟坥娶屈岖岨岴嶇巨弆忂怚憈戌戵抾敺斪曲朐欋氍浀淭渠灈焌璖
+qu 璩癯瞿磲祛竘竬筁籧粬紶組絇翑翵耝胊胠脥臞苣菃葋蕖蘧蚼蛆蛐蜡蝺螶蟝蠷蠼衐衢袪覰覷覻
+qu 觑詓詘誇誳诎趋趍趜趣趨跔跙跼躣躯軀軥迲遽鐻鑺镼閴闃阒阹鞠鞫駆駈驅驱髷魼鮈鰸鱋鴝鶌
+qu 鸜鸲麮麯麴麹黢鼁鼩齲龋
+quan 佺全券劝勧勸啳圈圏圳埢奍姾婘孉峑巏弮恮悛惓拳拴捲搼权桊棬椦楾権權汱泉洤湶灥烇牶牷
+quan 犈犬犭狋獾瑔甽畎痊矔硂筌絟綣縓绻腃荃葲虇蜷蠸觠詮謜譔诠跧踡輇辁酄醛銓鐉铨闎韏顴颧
+quan 駩騡鬈鰁鳈齤
+que 傕却卻埆塙墧崅悫愨慤搉敠榷決炔燩琷瘸皵硞确碏確碻礐礭缺舄蒛蚗觳趞闋闕阕阙雀鵲鹊
+qun 囷夋宭峮帬歏箘羣群裙裠踆輑逡遁麇麕
+ran 冄冉呥嘫姌媣染柟橪然熯燃珃繎肰苒蒅蚦蚺衻袇袡蹨髥髯
+rang 儴勷嚷壌壤孃忀懹攘欀瀼爙獽瓤禳穣穰纕蘘譲讓让躟鑲鬤
+rao 娆嬈扰擾桡橈犪穘繚繞绕荛蕘蟯襓遶隢饒饶
+re 偌喏惹渃热焫熱若蹃
+ren 人亻仁仞仭任刃刄壬妊姙屻岃忈忍忎恁扨朲杒栠栣梕棯涊牣祍秂秹稔紉紝絍綛纫纴肕腍芢荏
+ren 荵菍葚衽袵訒認认讱躵軔轫釰鈓銋靭靱韌韧飪餁饪魜鵀
+reng 仍戎扔礽耳艿芿辸陾
+ri 囸日氜釰鈤馹驲
+rong 傇傛冗坈媶嫆嬫宂容峵嵘嵤嶸巆戎搈搑曧栄榕榮榵毧氄溶瀜烿熔爃狨瑢穁穃絨縙縟绒羢肜茙
+rong 茸荣蓉蝾融螎蠑褣軵鎔镕隔頌駥髶
+rou 厹媃宍揉柔楺渘煣瑈瓇禸粈糅肉腬莥葇蝚蹂輮鍒鞣韖騥髳鰇鶔
+ru 乳侞偄儒入吺嗕嚅如媷嬬孺嶿帤扖挐擩曘月杁桇汝洳渪溽濡燸獳筎縟繻缛肉肗臑茹蒘蓐蕠薷
+ru 蝡蠕袽褥襦辱邚鄏醹銣鑐铷顬颥鱬鳰鴑鴽
+rua 挼
+ruan 偄堧壖媆撋朊檽濡燸瑌瓀碝礝緛耎腝蝡軟輭软阮
+rui 兑叡壡婑惢撋枘桵橤汭瑞甤睿笍緌繠芮苼蕊蕋蕤蘂蘃蚋蜹鈉銳鋭锐
+run 橍润潤瞤膶閏閠闰
+ruo 偌叒婼嵶弱惹挼捼楉渃溺焫爇箬篛芮若蒻鄀鰙鰯鶸
+sa 仨卅挱挲摋撒攃檫櫒泧洒潵灑脎萨蔡薩虄訯趿躠鈒鎝钑隡靸鞈颯飒馺
+sai 僿嗮嘥噻塞思愢揌毢毸簺腮賽赛顋鰓鳃
+san 三仐伞俕傘傪厁叁壭帴弎散橵毵毶毿潵犙糁糂糝糣糤繖蔘鏒鏾閐霰饊馓鬖
+sang 丧喪嗓搡桑桒槡磉褬鎟顙颡
+sao 哨埽嫂慅懆扫掃掻搔氉溞燥瘙矂繅繰缫缲臊螦鄵鐰颾騒騷骚髞鰠鰺鱢鳋
+se 啬嗇寨廧愬懎拺擌栜歮歰洓涩渋漬澀澁濇濏瀒琗瑟璱瘷穑穡穯粣繬色薔虩譅轖鉍銫鎍鏼铯閪
+se 闟雭飋
+sen 森椮槮滲襂
+seng 僧鬙
+sha 乷倽傻儍刹剎厦唦唼啑啥喢嗄帹廈挱杀杉桬榝樧歃歰殺毮沙濈煞猀痧砂硰箑粆紗繌纱翜翣莎
+sha 菨萐蔱裟賒鎩铩閯閷霎魦鯊鯋鲨
+shai 摋攦晒曬殺筛篩簁簛繺色諰酾釃閷
+shan 傓僐儃删刪剡剼善嘇圸埏墠墡壇姍姗嬗山嶦幓彡扇挻掞掸搧摻擅攙敾晱杉杣柵栅椫樿檀檆櫼
+shan 歚汕潬潸澘灗炶烻煔煽熌狦珊疝痁睒磰禅禪穇笘笧縿繕纔缮羴羶脠膳膻舢芟苫葠蟮蟺衫襂襳
+shan 覢訕謆譱讪贍赡赸跚軕邓邖鄯釤銏鐥钐閃閄閊闪陕陝顃饍騸骟鯅鱓鱔鱣鳝鿃
+shang 丄上伤傷商垧塲墒尙尚恦愓慯扄晌殇殤汤滳漡熵禓緔绱蔏螪蠰裳觞觴謪賞贘赏鑜鞝鬺
+shao 佋劭勺卲召哨娋少弰捎旓杓柖梢潲烧焼燒玿睄稍笤筲紹綃綤绍艄芍苕莦萷蕱蛸袑裢輎邵鞘韒
+shao 韶颵髾鮹
+she 佘厍厙奓奢射弽慑慴懾折抴拾挕捨揲摂摄摵攝檨欇歙涉涻渉滠灄猞畬畲睫碟磼社舌舍舎葉蔎
+she 虵蛇蛞蛥蠂設设賒賖赊赦輋鉈鍦闍阇鞨韘騇麝
+shei 誰谁
+shen 什伸侁侺信兟參吲呻哂堔妽姺娠婶嫀嬸审宷審屾峷幓弞愼慎扟抌抻搷敒昚曋曑柛棯棽椹榊槮
+shen 氠沈涁淰深渖渗滲瀋燊珅甚甡甧申瘆瘮眒眘瞫矤矧砷神祳穼籶籸糁紳綝绅罙罧肾胂脤腎莘葚
+shen 葠蓡蔘薓蜃蜄裑覾訠訷詵諗讅诜谂谉身邥鉮鋠震頣駪魫鯅鯓鯵鰰鰺鲹鵢
+sheng 丞乘偗冼剩剰勝升呏圣垩墭声姓娍媵嵊憴斘昇晟晠曻枡栍椉榺橳殅泩渑渻湦澠焺牲狌珄琞生
+sheng 甥盛省眚竔笙縄繩绳聖聲胜苼蕂譝貹賸鉎鍟阩陞陹鱦鵿鼪
+shi 世丗乨乭亊事什仕似佦使侍兘冟势勢匙十卋厔叓史呞呩咶唑啇嗜嘘噬埘埶塒士失奭始姼媞嬕
+shi 实実室宩宲寔實寺尸屍屎峕峙崼嵵市师師式弑弒彖徥忕忯恀恃惿戺拭拾揓斯施时旹是昰時枾
+shi 柹柿栻榁榯檡殖氏浉液湜湤湿溡溮溼澤澨濕炻烒煶狧狮狶獅瑡痑眂眎眡睗矢石示礻祏秲竍笶
+shi 筮箷篒篩簭籂絁繹肢舐舓莳葹蒒蒔蓍虱蚀蝕蝨螫褆褷襫襹視视觢試詩誓諟諡謚識识试诗谥豉
+shi 豕貰贳赫跩軾轼辻适逝遈遞適遰遾邿郝酾醳釃釈释釋釶鈰鉂鉃鉇鉈鉐鉽銴鍦鎩铈食飠飭飾餙
+shi 餝饣饰馶駛驶魳鮖鯴鰘鰣鰤鲥鲺鳲鳾鶳鸤鼫鼭齛
+shou 兽収受售垨壽夀守寿手扌授掱收敊涭熟狩獣獸痩瘦綬绶膄艏醻鏉首龵
+shu 书侸俆俞俶倏倐儵叔咰售塾墅姝婌孎孰尌尗属屬庶庻忬怷恕悆戍抒捈捒掓摅攄数數暏暑曙書
+shu 朮术朱束杸杼枢树梳樞樹橾殊殳毹毺氀沭淑漱潄潻澍濖瀭焂熟瑹璹疋疎疏癙秫稌竖竪籔糬紓
+shu 紵絉綀纾署翛腧舒荗菽蒁蒣蔬薥薯藪藷虪蜀蠴蠾術裋襡襩謶豎贖赎跾踈軗輸输述透鄃野鉥錰
+shu 鏣鐲陎隃鮛鱪鱰鵨鶐鷸黍鼠鼡
+shua 刷唆唰涮耍誜
+shuai 卛帅帥摔率甩蟀衰
+shuan 拴栓槫汕涮腨踹閂闩
+shuang 傱双塽孀孇慡樉欆泷淙漺瀧灀爽礵縔艭鏯雙霜騻驦骦鷞鸘鹴
+shui 娷帨捝水氵氺涗涚睡祱稅税脽裞説誰说谁閖
+shun 俊吮巛恂楯橓盾眴瞚瞤瞬舜蕣輴順顺鬊
+shuo 勺哾嗍嗽妁揱搠朔槊欶洬溯濯烁燿爍獡矟硕碩箾蒴藥說説说銏鎙鑠铄
+si 丝亖以伺似佀価俟俬偲傂儩兕凘厕厮厶司咝嗣嘶噝四姒娰媤孠寺已巳廝徙思恖愢撕斯杫析枱
+si 柶梩楒榹死汜泀泗泤洍涘澌瀃燍牭磃祀祠禗禠禩私竢笥簛籭糸糹絲緦纟缌罳耜肂肄肆菥蕬蕼
+si 虒蛳蜤螄螔蟖蟴覗謕貄逘釲鈶鈻鉰銉銯鋖鍶鐁锶颸飔食飤飴飼饲駟騃騦驷鷉鷥鸶鼶
+song 倯傱凇吅娀宋崧嵩嵷庺忪怂悚愯慫憁憽揔摗松枀枩柗梥棇楤檧淞漎濍硹竦耸聳菘蘴蜙訟誦讼
+song 诵送鍶鎹頌颂餸駷鬆
+sou 傁凁叜叟嗖嗽嗾廀廋捒捜搜摉摗擞擻敕族棷櫢欶涑溲獀瘶瞍籔艘蒐蓃薮藪螋謏鄋醙鎪鏉锼颼
+sou 颾飕餿馊騪
+su 俗傃僁僳卹嗉嗖囌圱埣塐塑夙嫊宿愫愬憟搬摵梀棴榡樎樕橚櫯殐泝洬涑溯溸潚潥玊珟璛甦碿
+su 稣穌窣簌粛粟素縤縮缩肃肅膆苏莤蓿蔌藗蘇蘓觫訴謖诉谡趚蹜速遡遬酥鋉餗驌骕鯂鱐鷫鹔
+suan 匴狻痠祘笇筭算篹蒜酸
+sui 亗倠哸嗺埣夊娞嬘尿岁嵗彗旞檖歲歳毸浽滖澻濉瀡煫熣燧璲瓍眭睟睢砕碎祟禭穂穗穟篲粹綏
+sui 縗繀繐繸绥脺膸芕荽荾葰蓑虽襚誶譢谇賥遀遂邃鏸鐆鐩陏隋随隧隨雖靃鞖韢髄髓
+sun 喰孙孫扻损損搎摌栒榫槂潠狲猻笋筍箰簨荪蓀蕵薞鎨隼飧飱餐鶽
+suo 乺些傞唆唢嗍嗦嗩娑嫅惢所抄挲摍暛桫梭歲溑溹犧獻琐琑瑣璅睃簑簔索縮缩羧莎莏蓑蜶衰褨
+suo 趖逤鎈鎍鎖鎻鏁锁髿魦鮻
+ta 他侤傝咜嗒嚃嚺塌塔墖太她它崉拓挞搨搭撻榙榻橽毾沓涾溚溻漯澾濌濕牠狧獭獺祂禢褟誻譶
+ta 趿踏蹋蹹躢達遝遢錔鎉鎑铊闒闥闧闼阘靸鞜鞳韃鮙鰨鳎鿎
+tai 儓冭台呔咍囼坮太夳嬯孡忕忲态態抬擡斄旲枱檯汏汰泰溙漦炱炲燤珆箈籉粏肽胎能臺舦苔菭
+tai 薹跆邰酞鈦钛颱駘骀鮐鲐
+tan 但倓傝僋叹啴嗿嘆嘽嘾坍坛坦埮墰墵壇壜婒弹彈忐怹惔憛憳憻探摊撢擹攤昙暺曇榃橝檀歎毯
+tan 湠滩漢潬潭澹灘炭燂璮痑痰瘫癱碳磹緂繵罈罎胆舑舔舕菼蕁蕈藫袒襢覃談譚譠谈谭貚貪賧贪
+tan 郯醈醓醰鉭錟钽锬镡顃餤鷤黮
+tang 伖倘偒傏傥儻劏唐啺嘡坣埫堂塘嵣帑惝戃搪摥擴攩曭棠榶樘橖欓汤淌湯溏漟漡烫煻燙爣瑭矘
+tang 磄禟篖簜糃糖糛羰耥膅膛蓎蕩薚蝪螗螳赯趟踼蹚躺逿鄌醣鎕鎲鏜鐋钂铴镋镗閶闛闣隚鞺餳餹
+tang 饄饧鶶黨鼞
+tao 匋咷啕夲夵套嫍幍弢慆抭掏搯桃梼槄檮洮涛涭淘滔濤焘燾瑫祹籌絛綢綯縚縧绦绹萄蜪裪討詜
+tao 謟讨轁迯逃醄鋾錭陶鞀鞉鞱韜韬頫飸饀饕駣騊鼗
+te 匿式忑忒慝特犆職脦螣蟘貣貸鋱铽
+teng 儯幐滕漛熥疼痋籐籘縢腾膯藤虅螣誊謄邆霯駦騰驣鰧鼟
+ti 体倜偍剃剔厗啼嗁嚏嚔堤奃姼媂媞屉屜屟崹弟徥徲悌悐惕惖惿戻挮掦提揥擿是替朑桋梯棣楴
+ti 歒殢洟涕渧漽狄珶瑅瓋睇碮磃禵稊笹籊綈緹绨缇罤肆苐荑蕛薙蝭蟬衹裼褅褆詆諦謕趧趯踢蹄
+ti 蹏躍躰軆达逖逷遆醍銻錫鍗鐟锑隄題题騠骵體髰鬀鬄鮧鮷鯷鳀鴺鵜鶗鶙鷈鷉鷤鹈
+tian 佃倎兲典吞唺嗔塡填天娗婖寘屇忝恬悿捵掭搷晪栝殄沗沺沾淟添湉滇琠瑱璳甛甜田畇畋畑畠
+tian 痶盷睓睼瞋碵磌窴紾緂胋腆舔舚菾蚕蚺覥觍賟酟鈿銛錪鍩钿闐阗靔靝靦顚餂鴫鷆鷏黇鿬
+tiao 佻儵咷姚嬥宨岧岹庣恌挑斢旫晀朓条桃條樤眺祒祧稠窕窱笤粜糶絩聎脁艞芀苕萔蓚蓧蓨蜩螩
+tiao 覜誂調调趒跳迢鋚鎥鞗髫鯈鰷鲦齠龆
+tie 僣呫帖怗怙惵聑萜蛈蝶貼贴跕鉄銕鋨鐡鐵铁飻餮驖鴩
+ting 亭侱侹停厅厛听圢奠娗婷嵉庁庭廰廳廷忊挺桯梃楟榳汀涏渟濎烃烴烶珵珽町甼筳綎耓聤聴聼
+ting 聽脡艇艼莛葶蜓蝏誔諪邒鋌铤閮霆鞓頲颋鼮
+tong 仝佟侗僮勭同哃嗵囲垌峂峒峝庝彤恫恸恿慟憅捅晍曈朣桐桶樋橦氃洞浵潼炵烔熥燑爞犝狪獞
+tong 痌痛眮瞳砼硐硧秱穜童筒筩粡絧統綂统膧茼蓪蚒衕詷赨通酮鉖鉵銅铜餇鮦鲖鼕
+tou 亠偷偸埱头妵婾媮愉投敨斢紏綉緰蘣褕諭諳透鋀鍮钭頭飳骰黈
+tu 余兎兔凃凸吐唋啚図图圕圖圗土圡堍堗塗墿宊屠峹嵞嶀庩廜徒怢悇捈捸揬摕梌汢涂涋湥潳瑹
+tu 痜瘏禿秃稌突筡腯荼莵菟葖蒤趃跿迌途酴釷鈯鋵鍎钍馟駼鵌鵚鵵鶟鷋鷵鼵
+tuan 剬剸团団團塼墥嫥專彖慱抟摶槫檲湍湪漙煓猯畽疃痪磚篿糰蓴褍褖貒鏄鱄鶉鷒鷻
+tui 侻俀僓墤娧尵弚忒推橔焞煺穨聉脮脱腿蓷藬蘈蛻蜕褪讉蹆蹪退隤頹頺頽颓饋駾騩骽魋
+tun 吞吨吴呑啍噋囤坉屯庉忳旽暾朜氽汭涒炖焞燉畽窀膯臀臋芚蜳褪豘豚軘錪霕飩饨魨鲀黗
+tuo 乇他仛佗侂侻咃唾圫坨堶妥媠嫷它岮庹彵惰托扡拓拕拖挩捝撱杔柁柝棁椭楕槖橐橢毤毻汑池
+tuo 沰沱沲涶牠狏砣砤碢税箨籜紽脫脱莌萚蘀袉袥託詑讬跅跎軃迱酡鋖铊陀陁飥饦馱馲駄駝駞騨
+tuo 驒驝驮驼鬌魠鮀鰖鱓鴕鵎鸵鼉鼍鼧鿳鿸
+wa 佤凹劸咓哇唲啘嗗嗢坬姽娃娲媧屲帓徍挖搲攨洼溛漥瓦瓩瓲畖砙穵窊窐窪聉腽膃蛙袜襪譁譌
+wa 邷靺鞋韈韤黳鼃
+wai 咼喎外夞崴歪瀤竵顡
+wan 万丸倇刓剜卍卐唍园埦塆壪夗夘妧娩婉婠完宛岏帵弯彎忨惋惌抏挽捖捥掔晚晥晩晼朊杤梚椀
+wan 槾汍湾潫澫灣烷玩琓琬畹皖盌睕瞣碗笂箢紈綩綰纨绾翫脕脘腕芄莞莧莬菀萖萬薍蚖蜿蟃豌貦
+wan 貫贃贎踠輐輓鄤鋄鋔錽鎫關頑顽骫魭
+wang 亡亾仼兦匡妄尢尣尩尪尫彺往徃徍忘忹惘抂旺暀望朢枉棢汪瀇王琞皇盳網网罒罔莣菵蚟蛧蝄
+wang 誷輞辋迋迬魍龬
+wei 为于亹伟伪位倭偉偎偽僞儰卫危厃叞味唩唯喂喡喴囗围圍圩墛壝委威娓媁媙媦寪尉尾屗峗峞
+wei 崣崴嵔嵬嶶巍帏帷幃廆徫微恑惟愄愇慰懀捤揋揻撝撱斖暐未机桅梶椲椳楲欈沇沩洈洧浘涠渨
+wei 渭湋溈溦潍潙潿濊濰濻瀢炜為烓煀煒煟煨熭燰爲犚犩猚猥猬玮琟瑋璏瓗畏痏痿癐癓瞶硊硙碨
+wei 磈磑立維緭緯縅纬维罻胃腲膸艉芛芟苇苿茟荱荽菋萎葦葨葳蒍蓶蔚蔿薇薳藯蘶蜲蜹蜼蝛蝟螱
+wei 衛衞褽覣覹觿詴諉謂讆讏诿谓趡踒踓躗躛軎轊违逶違遗遺鄬醀鍏鍡鏏闈闱阢隇隈隗霨霺韋韑
+wei 韙韡韦韪頠颹餧餵饖骩骪骫魏鮇鮠鮪鰃鰄鰖鲔鳂鳚
+wen 免刎匁吻呅呚呡問塭妏彣忞忟抆揾搵文昧昷桽榅榲歾殁殟汶渂温溫炆玟珳瑥璺瘒瘟眼稳穏穩
+wen 笏紊紋絻緼纹聞肳脕脗芠莬蕰藴蚉蚊螡蟁褞豱輼轀辒鎾閺閿闅闦问闻阌限雯鞰韞顐饂馼駇魰
+wen 鰛鰮鳁鳼鴍鴖鼤
+weng 勜嗡塕壅奣嵡攚暡滃瓮甕瞈罋翁聬蓊蕹螉鎓鶲鹟齆
+wo 仴倭偓卧唩喔堝夭婐婑媉幄我挝捰捼捾握撾擭斡杌枂楃沃涡涴涹渥渦濄濣焥猧瓁瘟瞃硪窝窩
+wo 肟腛臒臥艧莴萵蒦薶蜗蝸踒踠雘馧齷龌龏
+wu 乄乌五亡仵伆伍侮俉倵儛兀剭务務勿午卼吳吴吾呉呒呜唔啎嗚嘸噁圬坞塢墲奦妩娪娬婺嫵寤
+wu 屋屼岉峿嵍嵨巫幠庑廡弙忢忤怃悞悟悮惡憮戊扜扝扤捂揾摀敄无旿晤杅杇杌梧橆歍武毋汙汚
+wu 污沕洖洿浯渞溩潕烏焐無熃熓物牾玝珷珸瑦璑甒痦盓瞀瞴矹碔祦禑窏窹筽箼粅膴舞芜芴茣莁
+wu 蕪蘁蜈蝥螐蟱誈誣誤譕诬误趶躌迕逜邬郚鄔釫鋈鋘錻鎢钨铻阢陚隖雺雾霚霧靰騖骛鯃鰞鴮鵐
+wu 鵡鶩鷡鹀鹉鹜鼯鼿齀齬
+xi 习係俙傒僖兮凞匸卌卤卥厀吚吸呬咥咦咭唏唽喜喺嘻噏嚊嚱囍塈墍壐夕奚娭媐媳嬆嬉屃屎屖
+xi 屣屭嵇嵠嶍嶲巂巇希席徆徙徯忚忥怬怸恄恓息悉悕惁惜愾慀憘憙戏戯戱戲扱扸摡撕既昔晞晰
+xi 晳暿曦析枲栖桸棲椞椺榽槢樨橀橲檄欪欯欷歖歙氣氥汐洒洗浠淅渓溪滊漇漝潝潟澙烯焁焈焟
+xi 焬煕熂熄熈熙熹熺熻燍燨爔牺犀犔犠犧狶猎玺琋璽瓕瘜皙盻睎瞦矖矽硒碏磎磶礂禊禧稀稧穸
+xi 窸粞糦系細綌緆縘縰繥繫纚细绤羛羲習翕翖肸肹腊膝舃舄舾茜莃莔菥葈葸蒠蒵蓆蓰蔇蕮薂虒
+xi 虩蜤蜥蜴蝷螅螇蟋蟢蠵衋袭裼襲西覀覡覤觋觹觽觿訢誒諰謑謵譆谿豀豨豯貕赥赩趇趘蹊蹝躧
+xi 邜郄郋郗郤鄎酅醯釐釳釸鈒鈢鉨鉩錫鎴鏭鑴铣锡闟阋隙隟隰隵雟雭霫霼飁餏餙餼饩饻騱騽驨
+xi 鬩鯑鰓鰼鱚鳛鵗鸂黖鼳鼷鿭
+xia 丅下乤侠俠傄匣厦叚吓呷哧嚇圷埉夏夓岈峡峽廈徦懗押捾搳敮斜昰暇柙梺欱歃浹炠烚煆狎狭
+xia 狹珨瑕疜疨瘕睱瞎硖硤碬磍祫笚筪縀縖罅翈舝舺芐葭蕸虲虾蝦螛諕謑谺赮轄辖遐郃鍜鎋鎼鏬
+xia 閕閜陜陿霞颬騢魻鰕鶷黠
+xian 仙仚伭佡俔僊僩僲僴先冼县咞咸哯唌啣嗛嘕垷埳壏奾妗妶姍姭姺娊娨娴娹婱嫌嫺嫻嬐孅宪寰
+xian 尟尠屳岘峴崄嶮幰廯弦彡忺慳憪憲憸懢挦捍掀探搟撊撏攇攕显晛暹杴枮梘槏橌櫶毨氙洗涀涎
+xian 湺澖濂瀗灑灦烍燹狝猃献獫獮獻玁现珗現甉痫癇癎盷県睍瞯瞷矣硍碱礆礥祆禒秈稴筅筧箲籼
+xian 粯糮絃絤綅綖綫線縣縿繊纎纖纤线缐羡羨羬肩胘脅腺膁臔臤臽舷苋苮莧莶薟藓藖蘚蘞蚬蚿蛝
+xian 蜆衔衘褼襳見见誢誸諴譀譣豏賢贒贤赻跣跹蹮躚軐軒輱酰醎銑銛銜鋧錎錟鍁鍌鏾鑦铣铦锨锬
+xian 閑閒闲限陥险陷険險霰韅韯韱顕顯餡馅馦鮮鱻鲜鶱鷳鷴鷼鹇鹹麙麲黹鼸
+xiang 乡亨享亯佭傢像儴勨勷厢向响啌嚮塂姠嶑巷庠廂忀想晑曏栙楿樣橡欀洋湘潒珦瓖瓨皀相祥稥
+xiang 箱絴緗纕缃缿羏翔膷舡芗萫葙薌蘘蚃蟓蠁衖襄襐詳详象跭迒郷鄉鄊鄕銄銗鐌鑲镶閧闂降響項
+xiang 项飨餉饗饟饷香驤骧鬨鮝鯗鱌鱜鱶鲞鴹麘
+xiao 侾俏俲傚削効呺呼咲哓哮唬啸嗃嘋嘐嘨嘯嘵嚣嚻囂奡婋孝宯宵小崤庨彇恔恷憢揱搜撓撨效敩
+xiao 斅斆晓暁曉枭枵校梟橚櫹歊歒歗殽毊洨消涍淆滧漻潇潚澩瀟灱灲烋焇熇熽燆爻狡猇獟獢痚痟
+xiao 皛皢硝硣穘窙笑筊筱筿箫箾篠簘簫絞綃绡翛肖胶膮芍茭莦萧萷蕭薂藃虈虓蛸蟂蟏蟰蠨訤詨誟
+xiao 誵謏謞謼譊踃轇逍郩銷销霄颵驍驕骁髇髐魈鴞鴵鵁鷍鷕鸮
+xie 些亵伳偕偞偰僁儶写冩劦勰协協卨卸叶唏喈嗋噧垥塮夑奊契娎媟孈寫屑屓屟屧峫嶰廨徢恊愶
+xie 慀懈拹挟挾接揳搚携撷擕擷攜斜旪暬枻械楔榍榝榭槷檞歇汁泄泻洩渫湝溉滊潰澥瀉瀣灺炧炨
+xie 烲焎熁燮燲爕猲獦獬瑎碿祄禼糏紲絏絜絬綊緤緳繲纈绁缬缷翓胁脅脇脋膎薢薤藛蝎蝑蝢蟹蠍
+xie 蠏血衺褉褻襭觟諜諧謝譮讗谐谢豫跬躞躠迦邂邪鍱隰鞋鞢鞵韰頁頡颉鬹魼鮭鲑齂齘齛齥龤
+xin 伈伩信俽噷噺囟妡嬜孞寻尋庍廞心忄忻惞憖新昕杺枔欣款歆炘焮盺礥脪舋芯莘薪衅襑訢訫軐
+xin 辛邤釁鈊鋅鐔鑫锌阠顖馨馫馸鬵
+xing 侀倖兴刑哘坓型垶姓娙婞嫈嬹巠幸形性悻惺擤星曐杏洐涬滎煋熒狌猩瑆皨省睲硎箵篂緈胜腥
+xing 臖興荇荥莕蛵行裄觪觲謃邢郉醒鈃鉶銒鋞钘铏陉陘餳饧騂骍鮏鯹鿿
+xiong 兄兇凶匂匈哅夐宪忷恟敻昫汹洶焸焽熊胷胸芎訩詗詾讻诇賯赨雄
+xiu 休俢修咻嗅宿岫峀庥朽樇溴滫潃烋烌煦珛琇璓秀糔綇綉繍繡绣羞脙脩臭臹苬茠莠蓨螑袖褎褏
+xiu 貅銝銹鎀鏅鏥鏽锈飍饈馐髤髹鮴鱃鵂鸺齅
+xu 休伵侐俆偦冔勖勗卹叙吁呴咻喣嘘嘼噓圩垿墟壻姁婿媭嬃嶼幁序徐怴怵恤惐慉戌掝揟敍敘旭
+xu 旮旴昫晇暊朂朐栩楈槒欨欰欻歔歘殈汿沀洫浒淢湑溆滀滸漵潊烅烼煦獝珝珬畜疞盢盨盱眗瞁
+xu 瞲稰稸窢糈絮続緒緖緰縃繻續绪续聓聟肷胥芧蒣蓄蓿蕦藇藚虗虚虛蛡蝑裇訏許訹詡諝諿謣謳
+xu 譃许诩谞賉鄦酗醑鉥銊鑐需須頊须顼馘驉鬚魆魖魣鱮
+xuan 亘儇券吅咺喧塇夐妶媗嫙嬛宣弲怰悬愃愋懁懸揎撰旋昍昕昡晅暄暅暖暶梋楥楦檈泫洵渲漩澴
+xuan 炫烜煊煖狟玄玆玹琁琄瑄璇璿瓊痃癣癬盤眩眴睻矎碹禤箮絃絢絹縇縣縼繏绚翧翾萱萲蓒蔙蕿
+xuan 藼蘐蜁蜎蝖蠉衒袨諠諼譞讂谖贙軒轩选選鉉鋗鍹鏇鐶铉镟鞙顈颴饌駨駽鰚
+xue 乴削吷噱嚯坹壆学學岤峃嶨怴敩斅斈桖樰泧泬泶滈澩瀥燢狘疦疶瞲矆穴膤艝茓蒆薛血袕觷謔
+xue 谑趐踅轌辥辪雤雪靴鞾韡鱈鳕鷽鸴
+xun 伨侚偱勋勛勲勳卂咰噀噚嚑坃埙塤壎壦奞姰孫寻尋峋巡巺巽廵徇循恂悛愻揗撏攳旬曛杊栒桪
+xun 梭樳殉殾毥汛洵浔浚潠潭潯濬灥焄熏燂燅燖燻爋爓狥狻獯珣璕畃矄稄窨篔紃絢纁臐荀荤荨葷
+xun 蔒蕈薫薰蘍蟫蟳訊訓訙詢训讯询賐迅迿逊逡遜郇鄩醺鑂鑫顨馴駨驯鱏鱘鲟鶽
+ya 丫乛亚亜亞伢俹劜厊压厑厓厭吖呀呾哑唖啞圔圠圧垭埡堊堐壓姶娅婭孲岈崕崖庌庘御押拁挜
+ya 掗揠札枒桠椏椻歇氩氬浥涯漄潝烏牙犽猚猰玡琊瑘疨痖瘂睚砑稏穵窫笌聐芽蕥蚜衙襾訝讶軋
+ya 輵轧迓邪釾錏鐚铔閘雅顔鴉鴨鵪鵶鸦鸭齖齾
+yan 严乵俨俺偃偐偣傿儼兖兗剡剦匽厃厌厣厭厳厴咽唁唌啱喭噞嚥嚴埏埯堰塩墕壛壧夵奄妍妟姲
+yan 姸娫娮媕嫣嬊嬐嬮嬿孍宴屵岩崦嵃嵒嵓嶖嶮巌巖巗巘巚巡广庵延弇彥彦恹愝懕懨戭扊抁挻掞
+yan 掩揅揜揞敥昖晏暥曕曣曮棪椻椼楌樮橪檐檿櫩欕殗殷氤汧沇沿洇洝涎淊淡淫淹渰渷湮溎滟演
+yan 漹灎灔灧灩炎炏烟烻焉焑焔焰焱煙熖燄燕爓牪狠狿猒珚琂琰甗癌盐眼研砚硏硯硽碞礹筵篶簷
+yan 綖縯罨羡胭腌臙艳艶艷芫莚菴菸萒葕蔅蔫虤蜒蝘衍裺褗覎觃觾言訁訮詽諺讌讞讠谚谳豓豔豣
+yan 贋贗赝趼躽軅這遃郔郾鄢酀酓酽醃醶醼釅鉛鋋铅閆閹閻闫阉阎阏阭阽隁隒雁靨顏顑顔顩颜餍
+yan 饜騐験騴驗驠验鬳魇魘鰋鳫鴈鴳鶠鷃鷰鹽麙麣麲黡黤黫黬黭黰黶鼴鼹齞齴龑
+yang 仰佒佯傟养劷勜卬咉坱垟央姎婸岟崵崸徉怏恙慃懩扬抰揚攁敭旸昂昜映暘杨柍样楊楧様樣歍
+yang 殃氜氧氱泱洋漾瀁炀炴烊煬玚珜瑒疡痒瘍癢眏眻礢禓秧紻羊羏羕羪胦英蛘蝆詇詳諹軮輰鉠鍚
+yang 鐊钖阦阳陽雵霙霷鞅颺飏養駚鰑鴦鴹鸉鸯
+yao 么仸侥倄偠傜僥匋吆咬喓嗂嚙垚堯夭妖姚婹媱宎尧尭岆峣崤崾嶢嶤幺幼徭怮恌愮抭揺搖摇摿
+yao 撽暚曜杳枖柼楆榚榣殀殽洮溔滧瀹烄烑熎燿爻狕猶猺獟玅珧瑤瑶由疟瘧眑矅磘祅穾窅窈窑窔
+yao 窯窰筄箹約繇纅约耀肴腰舀艞苭药葯葽蓔蕘薬藥蘨袎要覞訞詏謠謡讑谣踰軺轺遙遥邀邎銚鎐
+yao 鑰钥铫闄陶靿顤颻飖餆餚騕驁鰩鳐鴁鴢鷂鷕鹞鼼齩
+ye 业也亪亱倻偞僷冶叶吔啘嘢噎嚈埜堨墅墷壄夜射峫嶪嶫抴捓捙掖揶擛擨擪擫晔暍曄曅曗曳曵
+ye 枒枼枽椰楪業歋殕殗洂液漜潱澲烨焆煠熀燁爗爷爺璍瓛痷皣瞱瞸礏窫緤耶腋葉虵蠮蠱謁谒邺
+ye 鄓鄴野釾鋣鍱鎁鎑鐷铘靥靨頁页餘餣饁饐馌驜鵺鸈黦
+yi 一丿乁乂义乊乙也亄亦亿仡以仪伇伊伿佁佚佾侇依俋倚偯儀億儗兿冝刈劓劮勚勩匇匜医印叕
+yi 叹吚呓呭呹咦咿唈喦嗌噎噫囈圛圪圯坄坨垼埶埸墿壱壹夁夕失夷奕妷姨姬媐嫕嫛嬄嬑嬟宐宜
+yi 宧寱寲尾屹峄峓崺嶧嶬嶷已巳巸帟帠幆庡廙异弈弋弌弬彛彜彝彞彵役忆忔怈怠怡怿恞悒悘悥
+yi 意憶懌懿戺扅扆扡抑拸挹掎掜揖搤撎攺敡敼斁施旑旖易晹暆曀曎杙枍枻柂栘栧栺桋棭椅椬椸
+yi 榏槸樴檍檥檹欥欭欹歖歝殔殪殹毅毉沂沶泄泆洢洩洫浂浥浳渏湙溢漪潩澺瀷炈焉焬焱焲熙熠
+yi 熤熪熼燚燡燱犄狋狏猗獈玴珆瑿瓵畩異疑疙疫痍痬瘗瘞瘱癔益眙睪瞖矣硛礒礙祎禕秇移稦穓
+yi 竩笖箷簃籎紲絏維綺縊繄繶繹绎缢羛羠義羿翊翌翳翼耛耴肄肊胰膉臆舣艗艤艺艾芅苅苡苢荑
+yi 萓萟蓺薏藙藝蘙虉蚁蛇蛜蛡蛦蛾蜴螔螘螠蟻衣衤衪衵袂袘袣裔裛裿褘褹襼觺訑訲訳詍詑詒詣
+yi 誃誼謚謻譩譯議譺讉讛议译诒诣谊豙豛豷貖貤貽賹贀贻跇跠踦軼輗輢轙轶辥辷迆迤迭迱迻逘
+yi 逸遗遺邑郼酏醫醳醷釋釔釴釶鈘鈠鉇鉯銕銥錡鎰鏔鐿钀钇铱镒镱阣阤陭隿霬靉靾頉頤頥顊顗
+yi 颐飴饐饴駅驛驿骮鮧鮨鯣鳦鴺鶂鶃鶍鷁鷊鷖鷧鷾鸃鹝鹢鹥黓黝黟黳齮齸
+yin 乑乚伒众侌冘凐印吟听吲唫喑噖噾嚚囙因圁圻垔垠垦垽堙堷壹夤姻婣婬寅尹峾崟崯嶾币廕廴
+yin 引愔慇慭憖憗懚斦朄栶梀檃檭檼櫽欭歅殥殷氤沂泿洇洕淫淾湚湮溵滛潯濥濦烎烟犾狺猌玪珢
+yin 璌瘖瘾癊癮硍碒磤禋秵窨筃粌絪緸縯胤芩苂茚茵荫荶蒑蔩蔭蘟蚓螾蟫裀訔訚訡誾諲讔赺趛輑
+yin 鄞酳釿鈏鈝銀銦铟银闉阥阴陰陻隂隐隠隱霒霠霪靷鞇音韾飮飲饮駰骃鮣鷣齗龂龈
+ying 俓偀僌呎哽唡啢啨営嘤噟嚶塋夃央婴媖媵嫈嬰嬴孆孾嵤巊应廮影応愥應摬撄攍攖旲映景暎朠
+ying 桜桯梬楹樱櫻櫿泂浧渶溁溋滎滢潁潆濙濚濴瀅瀛瀠瀯瀴灐灜焸煐熒營珱瑛瑩璎瓔甇甖瘿癭盁
+ying 盈矨硬碤礯禜穎籝籯緓縈繩纓绬缨罂罃罌耺膡膺英茔荥荧莖莹莺萤营萦萾蓥藀蘡蛍蝇蝧蝿螢
+ying 蠅蠳褮覮謍譍譻賏贏赢軈迎逞郢鍈鎣鐛鑍锳霙鞕韹韺頴颍颕颖鱦鴬鶑鶧鶯鷪鷹鸎鸚鹦鹰
+yo 哟唷喲嚛
+yong 佣俑傛傭勇勈咏喁嗈噰埇塎墉壅嫞容嵱庸廱彮怺恿悀惥愑愹慂慵拥揘擁柡栐槦永泳涌湧滽澭
+yong 灉牅用甬痈癕癰砽硧禜臃苚蕹蛹詠踊踴遇邕郺鄘醟銿鏞镛雍雝顒颙飬饔鯒鰫鱅鲬鳙鷛
+you 丣亴优佑侑偤優冘卣又友右呦哊唀嚘囿妋姷孧宥尢尤峟峳幼幽庮忧怞怣怮悠憂懮戭扰揂攸斿
+you 有柚栯梄梎楢槱櫌櫾汓汼沋油泅泑浟游湵滺瀀牖牗牰犹狖猶猷獶由甴疣痏祐禉秞糿繇纋羐羑
+you 羗耰聈聱肬脜脩苃莜莠莤莸蒏蕕蚰蚴蜏蝣蝤褎訧誘诱貁輏輶迶逌逰遊邮郵鄾酉酭釉鈾銪銹铀
+you 铕駀魷鮋鯈鱿鲉麀黝鼬
+yu 与乻予于亏亐伃伛余俁俞俣俼偊傴僪儥兪匬吁吳吾唷唹喁喅喐喩喻噊噢噳圄圉圫域堉堣堬奥
+yu 妤妪娛娯娱媀媮嫗嬩宇寓寙尉屿峪峿崛崳嵎嵛嶎嶼庽庾彧御忬悆悇惐愈愉愚慾懊懙或戫扜扵
+yu 挧捓揄敔斔斞於旕旟昙昱杅栩栯桙棛棜棫楀楡楰榆櫲欎欝欤欲歈歟歶毓毹汙汩浴淢淤淯渔渝
+yu 湡滪漁潏澚澞澦澳灪灹焴煜煨熨燏燠爩牏狱狳獄獝玉玗玙琙琟瑀瑜璵畬畭瘀瘉瘐癒盂盓睮矞
+yu 砡硢硲礇礖礜祤禦禹禺秗稢稶穥穻窬窳竽箊篽籅籞籲粥紆緎繘纡罭羭羽聿肀育腧腴臾舁舆與
+yu 舒艅艈芋芌茟茰菀菸萭萮萸蒮蓣蓹蔚蕍蕷薁藇蘌蘛虞虶蜍蜟蜮蝓蝺螸蟈衘衙衧袬裕褕覦觎誉
+yu 語諛諭謣譽语谀谕豫貐貗踰軉輍輿轝込迂迃逳逾遇遹邘郁郚鄅酑醧釪鈺銉鋊鋙錥鍝鐍鐭钰铻
+yu 閼閾阈陓隃隅隩雓雨雩霱預頨顒预飫餘饇饫馀馭騟驈驭骬髃鬰鬱鬻魊魚魣鮽鯲鰅鱊鱮鱼鳿鴥
+yu 鴧鴪鵒鷠鷸鸆鸒鹆鹬麌齬齵龉龥
+yuan 傆允元円冤剈原厡厵员員喛噮囦园圆圎園圓圜垣垸塬夗妧妴媛媴嫄嬽宛寃弲怨悁惌愿捐掾援
+yuan 杬棩楥榞榬橼櫞沅涓涴淵渁渆渊渕湲源溒灁爰猨猿獂瑗畹盶眢禐笎箢緣縁缘羱肙芫苑茒葾蒝
+yuan 蒬薗薳蚖蜎蜵蝝蝯螈衏袁裫裷褑褤謜貟贠輐轅辕远逺遠邍邧酛鈨鋺鎱阮院隕願駌騵魭鳶鴛鵷
+yuan 鶢鶰鸢鸳鹓黿鼋鼘鼝
+yue 乐刖哕哾噦块妁妜嬳岄岳嶽彟彠恱悅悦戉抈捳曰曱月枂栎樂樾汋瀹爚玥矱礿禴箹篗籆籥籰粤
+yue 粵約约臒蘥蚎蚏蜕蠖越趯跀跃躍躒軏鈅鉞鑠鑰钥钺閱閲阅髺鸑鸙黦龠
+yun 云伝傊允勻匀员員喗囩均夽奫妘媪孕尹怨恽惲愠愪慍抎抣昀晕暈枟榅橒殒殞氲氳沄涒涢温溳
+yun 澐煴煾熅熉熨狁玧畇眃磒秐筍筠筼篔紜緷緼縕縜繧纭缊耘耺腪芸荺蒀蒕蒷蕓蕰蕴薀藴蘊蜵蝹
+yun 褞賱贇赟輼运運郓郧鄆鄖酝醖醞鈗鋆阭陨隕雲霣韗韞韫韵韻頵餫馧馻齫齳
+za 偺匝咂咋咱啑喒噈囋囐帀扎拶杂沞沯砸磼籴紥紮臜臢襍迊鉔雑雜雥韴魳
+zai 仔傤儎再哉在宰崽才扗栽洅渽溨災灾烖甾睵縡菑賳載载酨
+zan 偺儧儹兂兓咱喒噆囋寁拶揝撍攅攒攢昝暂暫桚湔濽灒瓉瓒瓚禶穳簪簮糌臢襸讃讚賛贊赞趱趲
+zan 蹔鄼酂酇錾鏨鏩鐕鐟饡
+zang 匨塟奘弉戕牂羘脏臓臟臧葬蔵藏賍賘贓贜赃銺駔驡驵髒
+zao 傮凿唕唣喿噪慥早枣栆梍棗槽澡灶煰燥璅璪皁皂窖竃竈簉糟繅繰艁草薻藻蚤謲譟趮蹧躁造遭
+zao 醩鑿
+ze 仄伬侧側则則咋唶啧嘖夨嫧崱帻幘庂択择捑措擇昃昗樍歵汄沢泎泽溭澤灂皟睪瞔矠礋稄稷笮
+ze 箦簀耫舴葃蔶蘀蠌襗諎謫謮責賾责赜迮飵鰂鸅齚齰
+zei 戝蠈賊贼鯽鰂鱡鲗
+zen 僭囎怎譖譛谮
+zeng 増增憎曾橧熷璔甑矰磳綜縡繒综缯罾譄贈赠鄫鋥锃鬷鱛
+zha 乍偧册剳劄厏吒咤哳喋喥喳囃奓宱怍扎抯拃挓插揸搩搾摣札柞柤查柵査栅楂榨樝渣溠潳灹炸
+zha 煠牐甴痄皶皻眨砟箑箚紥紮耫膪苲蚱蚻觰詐謯譇譗诈踷蹅軋轧醡鍘铡閘闸霅鞢馇鮓鮺鲊鲝齄
+zha 齇齟
+zhai 亝债債厇厏夈宅寨抧择捚摘擇斋斎榸檡瘵砦祭窄簀粂翟豸責鉙骴齋
+zhan 佔偡占噡嫸展崭嵁嶃嶄嶘嶦怗惉战戦戰拃搌斩斬旃旜枬栈栴桟棧椾榐橏欃毡氈氊沾湛琖皽盏
+zhan 盞瞻碊站粘綻绽菚薝蘸虥虦蛅袒襢覱詀詹謙譧譫讝谵趈蹍躔輚輾轏辗邅醆閚霑顫颤颭飐飦餰
+zhan 饘驏驙魙鱣鳣鸇鹯點黵龪
+zhang 丈仉仗傽墇嫜嶂帐帳幛幥张弡張彰慞扙掌暲杖樟涨涱漲漳獐璋痮瘬瘴瞕礃章粀粻胀脹蔁蟑賬
+zhang 账遧鄣鏱長长障鞝餦騿鱆麞
+zhao 佋兆召啁啅嘲垗妱巶找招旐昭晁曌朝枛棹櫂沼淖炤照燳爪爫狣瑵皽盄着瞾窼笊箌罀罩羄肁肇
+zhao 肈菬蚤詔诏赵趙釗鉊鍣钊駋鮡鳭鼂
+zhe 乇乽厇哲啠啫喆嗻嘀嚞囁埑堵嫬悊慴慹扸折摺攝晢晣杔柘棏樜歽浙淛潪着矺砓磔禇籷粍者耷
+zhe 聑聶蔗虴蛰蜇螫蟄蟅袩褚褶襵詟謫謺讁讋谪赭輒輙轍辄辙这這遮銸鍺锗陬馲鮿鷓鷙鹧
+zhei 这
+zhen 侦侲偵唇圳坫塦姫嫃寊屒帧帪弫慎戡抮挋振揕搸敶斟昣朕枕枮栕栚桢桭椹楨榛槇樼殝沴浈湞
+zhen 溱潧澵獉珍珎瑧瑱甄甽畛疹眕眞真眹砧碪祯禎禛稹竧箴籈紖紾絼縝縥纼缜聄胗臻萙葴蒖蓁薽
+zhen 蜄袗裖診誫謓诊貞賑贞赈趁軫轃轸辴遉酖酙針鉁鋴錱鍖鍼鎭鎮针镇阵陣陳震靕駗鬒鮝鱵鴆鸩
+zhen 黰黱鼎
+zheng 丁争佂偵凧埥埩塣姃媜峥崝崢嶒帧幀征徎徰徴徵怔愸憕承抍拯挣掙掟揁撜政整晸朾正氶炡烝
+zheng 爭狰猙症癥眐睁睜瞠禎筝箏篜糽聇脀蒸証諍證证诤貞趟踭郑鄭鉦錚钲铮鬇鮏鯖鲭鴊鿇
+zhi 之乿伎侄俧倁値值偫傂儨凪制劕劧卮厎厔只吱呮咫嗭嚔址坁坧垁埃埴執墆墌夂妷姪娡嬂寘實
+zhi 峙崻巵帋帙帜幟庢庤廌彘徏徔徝徵志忮怾恃恉慹憄懥懫戠执扺扻抧抵挃指挚掷搘搱摨摭摯擲
+zhi 擳擿支斦旘旨晊晢智杝杫枝枳柣栀栉栺桎梔梽植椥楖榰樀樲樴櫍櫛止歭殖氏汁汥汦沚治泜洔
+zhi 洷淔淽滍滞滯漐潌潪瀄炙熫犆狾猘璏瓆瓡畤疐疷疻痔痣瘈直眰知砋砥礩祁祉祑祗祬禃禔秇秓
+zhi 秖秩秪积秲秷稙稚稺穉窒筫紙紩絷絺綕緻縶織纸织置翐耆聀职職肢胑胝胵脂膣膱至致臷臸芖
+zhi 芝芷茋茝菭薙藢蘵蚔蛭蜘螲蟙衹衼袟袠製襧覟觗觝觯觶訨誌豑豒豸貭質贄质贽趾跖跱踬踯踶
+zhi 蹠蹢躑躓軄軹軽輊轵轾迣遟遲郅酯釞鉄銍銴鋕鑕铚锧阤阯陁陟隲隻雉馶馽駤騭騺驇骘鯯鳷鴙
+zhi 鴲鶨鷙鸷黹鼅鿵
+zhong 中仲伀众偅冢刣喠堹塚塜夂妐妕媑尰幒彸徸忠忪柊歱汷泈炂煄狆瘇盅眾祌种種穜童筗籦終緟
+zhong 终肿腫舯茽董蔠蚛蚣蝩螤螽蟲衆衳衶衷諥踵蹱重鈆鈡銿鍾鐘钟锺鴤鼨
+zhou 伷侏侜僽冑周呪咒咮啁啄喌喙噣嚋妯婤宙州帚徟掫昼晝晭椆注洀洲淍炿烐珘甃疛皱皺盩睭矪
+zhou 碡祝箒籀籒籕粙粥紂縐纣绉翢肘育胄舟舳荮菷葤薵詋詶諏謅譸诌诪賙赒軸輈輖轴辀週郮酎鈾
+zhou 銂霌駎駲騆驟骤鬻鯞鵃鸼
+zhu 丶主之伫佇住侏劚助劯咮嘱囑坾墸壴孎宔尌属屬嵀庶拄敱斀斸曯朮术朱杼枓柱柷株楮槠樦橥
+zhu 櫡櫧櫫欘殶泏泞注洙渚潴澍濐瀦灟炢炷烛煑煮燭爥猪珠疰瘃眝瞩矚砫硃磩祝祩秼窋竚竹竺笁
+zhu 笜筑筯箸築篫篴簗紵紸絑纻罜羜翥舳芧苎苧茁茱茿莇著蓫薥藷藸蚰蛀蛛蝫蠋蠩蠾袾註詝誅諸
+zhu 诛诸豬貯贮跓跦躅軴軸迬逐逗逫邾鉒銖鋳鑄钃铢铸阻除陼霔飳馵駐駯騶驻鮢鯺鱁鴸鸀麆麈鼄
+zhua 抓挝摣撾檛爪簻膼髽
+zhuai 尵拽睉跩顡
+zhuan 专传傳僎僝剸叀啭囀堟塼嫥孨専專巽恮摶撰沌湍漙灷瑑瑼甎砖磗磚竱篆篹篿簨籑縳耑腞膞蒃
+zhuan 蟤襈諯譔賺赚転轉转鄟顓颛饌馔鱄
+zhuang 僮壮壯壵奘妆妝娤幢庄庒憧戆戇撞桩梉樁湷漴焋状狀獞粧糚艟荘莊装裝
+zhui 倕坠垂墜娷惴桘椎槌沝甀畷硾磓礈笍箠綴縋缀缒腏膇致萑諈贅赘轛追醀醊錐錗錣鑆锥隊隧隹
+zhui 餟騅骓鵻
+zhun 准凖啍埻宒屯忳旽淳準盹稕窀純綧肫衠訰諄谆迍飩
+zhuo 丵倬剢劅卓叕啄啅噣圴墌妰娺彴拙捉捔撯擆擢斀斫斮斱斲斵晫桌梲棁棳棹椓槕櫡汋浊浞涿準
+zhuo 濁濯灂灼炪烵焯犳狵琢琸矠硺禚穛穱窡窧箸篧籗籱繳缴罬茁著蓔蝃蠗蠿諁諑謶诼蹠躅酌鉵鋜
+zhuo 鐯鐲镯鵫鷟
+zi 乲事仔倳兹剚吇吱呰咨啙嗞姉姊姕姿子孖字孜孳孶崰嵫恣杍栥梓椔榟橴次沝泚淄渍湽滋滓漬
+zi 澬牸玆璾甾疵眥眦矷禌秄秭秶稵穧笫籽粢紎紫緇缁耔胏胔胾自芓茈茊茡茲荢菑葘蓻薋虸觜訾
+zi 訿諮谘貲資赀资赼趑趦輜輺辎鄑釨鈭鋅錙鍿鎡锱镃頾頿髭鯔鰦鲻鶅鼒齍齜龇
+zong 从倊倧偬傯堫宗嵏嵕嵸從总惣惾愡捴揔搃摠昮朡枞棕椶樅潈潨熜熧燪猔猣疭瘲碂磫稯粽糉糭
+zong 綜緃総緵縂縦縱總纵综翪腙葼蓗蓯蝬豵踨踪蹤錝鍐鏓鑁騌騣骔鬃鬉鬷鯮鯼
+zou 奏媰掫揍搊棷棸楱箃緅芻菆諏诹走赱邹郰鄒鄹陬騶驺鯐鯫鲰黀齱齺龰
+zu 伹俎倅傶卆卒哫唨啐嘁崒崪族柤淬爼珇砠祖租稡箤組綷组菹葅蒩詛诅趲足踤踿蹴鉃鉏鉐錊鎐
+zu 鎺鏃镞阻靻顇駔
+zuan 劗揝攥欑籑籫繤纂纉纘缵賺赚躜躦鑚鑽钻
+zui 厜咀嗺嘴噿堆嫢嶉嶊嶵摧晬最朘栬槜槯樶檇檌欈濢璻睟祽稡穝絊纗罪羧脧蕝蕞蟕觜辠酔酨酻
+zui 醉鋷錊
+zun 僎僔噂墫壿尊嶟拵捘撙栫樽瀳繜罇袸譐跧蹲遵銌鐏鱒鳟鶎鷷
+zuo 乍佐作侳做凿咗唑嘬坐岝岞左座怍挫捽撮昨柞柮椊琢祚秨稓笮筰糳繓胙莋葃葄蓙袏迮酢醋鈼
+zuo 鑿阼飵
+"""
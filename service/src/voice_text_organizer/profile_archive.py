@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import shutil
+import wave
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from voice_text_organizer.mfcc import FINGERPRINT_VERSION, pcm_to_float, read_wav_mono_pcm
+from voice_text_organizer.personalization import (
+    build_mfcc_fingerprint_bytes_from_signal,
+    decode_mfcc_fingerprint_bytes,
+)
+from voice_text_organizer.sample_quality import evaluate_sample_audio_quality
+
+ARCHIVE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+STREAM_CHUNK_BYTES = 64 * 1024
+# Below this many files, starting worker processes costs more than fingerprinting inline.
+PARALLEL_MIN_FILES = 8
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    term: str
+    # Member name inside the archive, or a WAV path for directory imports.
+    source: str
+    duration_ms: int | None = None
+    quality_score: float | None = None
+    fingerprint: bytes | None = None
+
+
+class _ChunkSink:
+    # Write-only and unseekable, so zipfile streams entries with data descriptors.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_profile_archive(profile: dict[str, Any]) -> Iterator[bytes]:
+    # profile is HistoryStore.export_profile(); samples whose WAV is gone are left out.
+    sink = _ChunkSink()
+    manifest_samples: list[dict[str, Any]] = []
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for sample in profile["samples"]:
+            try:
+                source = Path(sample["audio_path"]).open("rb")
+            except OSError:
+                continue
+            audio_name = f"samples/{sample['sample_id']}.wav"
+            with source, archive.open(audio_name, mode="w") as target:
+                while chunk := source.read(STREAM_CHUNK_BYTES):
+                    target.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            fingerprint_name = None
+            if sample["mfcc_fingerprint"] is not None:
+                fingerprint_name = f"fingerprints/{sample['sample_id']}.npy"
+                archive.writestr(fingerprint_name, sample["mfcc_fingerprint"], compress_type=zipfile.ZIP_DEFLATED)
+            manifest_samples.append(
+                {
+                    "term": sample["term"],
+                    "audio": audio_name,
+                    "fingerprint": fingerprint_name,
+                    "fingerprint_version": sample.get("fingerprint_version"),
+                    "duration_ms": sample["duration_ms"],
+                    "quality_score": sample["quality_score"],
+                }
+            )
+            yield sink.drain()
+
+        manifest = {"version": ARCHIVE_FORMAT_VERSION, "terms": profile["terms"], "samples": manifest_samples}
+        archive.writestr(
+            MANIFEST_NAME,
+            json.dumps(manifest, ensure_ascii=False),
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+    yield sink.drain()
+
+
+def _readable_fingerprint(blob: bytes) -> bool:
+    try:
+        return decode_mfcc_fingerprint_bytes(blob).ndim == 2
+    except (ValueError, EOFError, OSError):
+        return False
+
+
+def read_archive_entries(archive: zipfile.ZipFile) -> tuple[list[str], list[ImportEntry]]:
+    try:
+        manifest = json.loads(archive.read(MANIFEST_NAME).decode("utf-8"))
+    except (KeyError, ValueError) as exc:
+        raise ValueError("archive has no readable manifest") from exc
+    if not isinstance(manifest, dict) or manifest.get("version") != ARCHIVE_FORMAT_VERSION:
+        raise ValueError("unsupported profile archive version")
+
+    names = set(archive.namelist())
+    entries: list[ImportEntry] = []
+    for item in manifest.get("samples", []):
+        term = str(item.get("term", "")).strip()
+        audio_name = item.get("audio")
+        if not term or audio_name not in names:
+            continue
+        fingerprint = None
+        fingerprint_name = item.get("fingerprint")
+        # Fingerprints from another extractor version are recomputed from the WAV instead.
+        if fingerprint_name in names and item.get("fingerprint_version") == FINGERPRINT_VERSION:
+            blob = archive.read(fingerprint_name)
+            fingerprint = blob if _readable_fingerprint(blob) else None
+        duration_ms = item.get("duration_ms")
+        quality_score = item.get("quality_score")
+        entries.append(
+            ImportEntry(
+                term=term,
+                source=audio_name,
+                duration_ms=int(duration_ms) if isinstance(duration_ms, (int, float)) else None,
+                quality_score=float(quality_score) if isinstance(quality_score, (int, float)) else None,
+                fingerprint=fingerprint,
+            )
+        )
+    terms = [str(term).strip() for term in manifest.get("terms", []) if str(term).strip()]
+    return terms, entries
+
+
+def scan_sample_directory(directory: Path) -> tuple[list[str], list[ImportEntry]]:
+    # One sub-directory per term, holding that term's WAV samples.
+    terms: list[str] = []
+    entries: list[ImportEntry] = []
+    for term_dir in sorted(path for path in directory.iterdir() if path.is_dir()):
+        term = term_dir.name.strip()
+        if not term:
+            continue
+        terms.append(term)
+        entries.extend(ImportEntry(term=term, source=str(path)) for path in sorted(term_dir.glob("*.wav")))
+    return terms, entries
+
+
+def analyze_sample_file(audio_path: str) -> tuple[bytes, dict[str, float]]:
+    pcm, sample_rate = read_wav_mono_pcm(audio_path)
+    quality = evaluate_sample_audio_quality(pcm, sample_rate)
+    return build_mfcc_fingerprint_bytes_from_signal(pcm_to_float(pcm), sample_rate), quality
+
+
+def _analyze_or_error(audio_path: str) -> tuple[bytes, dict[str, float]] | str:
+    try:
+        return analyze_sample_file(audio_path)
+    except (ValueError, EOFError, OSError, wave.Error) as exc:
+        return str(exc) or type(exc).__name__
+
+
+def analyze_sample_files(audio_paths: list[str], *, workers: int) -> list[tuple[bytes, dict[str, float]] | str]:
+    # One result per path: (fingerprint, quality) or the reason the file was rejected.
+    if workers <= 1 or len(audio_paths) < PARALLEL_MIN_FILES:
+        return [_analyze_or_error(path) for path in audio_paths]
+    workers = min(workers, len(audio_paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_or_error, audio_paths, chunksize=max(1, len(audio_paths) // (workers * 4))))
+
+
+def prepare_import(
+    entries: list[ImportEntry],
+    sample_dir_for: Callable[[str], Path],
+    *,
+    archive: zipfile.ZipFile | None = None,
+    workers: int = 1,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    # Copies every sample into its term directory and returns HistoryStore.import_term_samples
+    # records, plus one message per sample that could not be used.
+    errors: list[str] = []
+    staged: list[tuple[ImportEntry, Path]] = []
+    for entry in entries:
+        target = sample_dir_for(entry.term) / f"import-{uuid4().hex}.wav"
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if archive is not None:
+                with archive.open(entry.source) as source, target.open("wb") as destination:
+                    shutil.copyfileobj(source, destination, STREAM_CHUNK_BYTES)
+            else:
+                shutil.copyfile(entry.source, target)
+        except (OSError, KeyError, zipfile.BadZipFile) as exc:
+            target.unlink(missing_ok=True)
+            errors.append(f"{entry.source}: {exc}")
+            continue
+        staged.append((entry, target))
+
+    unanalyzed = [
+        target
+        for entry, target in staged
+        if entry.fingerprint is None or entry.duration_ms is None or entry.quality_score is None
+    ]
+    analyzed = dict(zip(unanalyzed, analyze_sample_files([str(path) for path in unanalyzed], workers=workers)))
+
+    records: list[dict[str, Any]] = []
+    for entry, target in staged:
+        result = analyzed.get(target)
+        if isinstance(result, str):
+            target.unlink(missing_ok=True)
+            errors.append(f"{entry.source}: {result}")
+            continue
+        if result is None:
+            fingerprint, duration_ms, quality_score = entry.fingerprint, entry.duration_ms, entry.quality_score
+        else:
+            fingerprint, quality = result
+            duration_ms, quality_score = int(quality["duration_ms"]), float(quality["quality_score"])
+        records.append(
+            {
+                "term": entry.term,
+                "audio_path": str(target),
+                "duration_ms": duration_ms,
+                "quality_score": quality_score,
+                "mfcc_fingerprint": fingerprint,
+            }
+        )
+    return records, errors
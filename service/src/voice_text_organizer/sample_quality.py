@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+
+from voice_text_organizer.mfcc import pcm_to_float
+
+MAX_SAMPLE_DURATION_MS = 15000
+MIN_SAMPLE_DURATION_MS = 300
+MAX_SAMPLE_SILENCE_RATIO = 0.97
+MIN_SAMPLE_RMS = 0.003
+MIN_SAMPLE_PEAK = 0.01
+MIN_SILENCE_ABS_THRESHOLD = 0.003
+MAX_SILENCE_ABS_THRESHOLD = 0.015
+SILENCE_THRESHOLD_RMS_SCALE = 1.2
+MIN_ENERGY_RATIO_FOR_SILENCE_REJECT = 1.5
+MIN_PEAK_RATIO_FOR_SILENCE_REJECT = 1.3
+MAX_SAMPLE_CLIPPING_RATIO = 0.03
+
+
+def silence_threshold(rms: float) -> float:
+    return min(MAX_SILENCE_ABS_THRESHOLD, max(MIN_SILENCE_ABS_THRESHOLD, rms * SILENCE_THRESHOLD_RMS_SCALE))
+
+
+def evaluate_sample_audio_quality(pcm: np.ndarray, sample_rate: int) -> dict[str, float]:
+    if sample_rate <= 0:
+        raise ValueError("invalid sample rate")
+    if pcm.size == 0:
+        raise ValueError("empty audio")
+
+    duration_ms = int(round((pcm.size / float(sample_rate)) * 1000.0))
+    if duration_ms <= MIN_SAMPLE_DURATION_MS:
+        raise ValueError("sample duration must be > 0.3s")
+    if duration_ms > MAX_SAMPLE_DURATION_MS:
+        raise ValueError("sample duration must be <= 15s")
+
+    normalized = pcm_to_float(pcm)
+    rms = float(np.sqrt(np.mean(np.square(normalized))))
+    peak = float(np.max(np.abs(normalized)))
+    if rms < MIN_SAMPLE_RMS and peak < MIN_SAMPLE_PEAK:
+        raise ValueError("sample volume too low")
+
+    silence_ratio = float(np.mean(np.abs(normalized) < silence_threshold(rms)))
+    if (
+        silence_ratio >= MAX_SAMPLE_SILENCE_RATIO
+        and rms < (MIN_SAMPLE_RMS * MIN_ENERGY_RATIO_FOR_SILENCE_REJECT)
+        and peak < (MIN_SAMPLE_PEAK * MIN_PEAK_RATIO_FOR_SILENCE_REJECT)
+    ):
+        raise ValueError("too much silence in sample")
+
+    clipping_ratio = float(np.mean(np.abs(pcm) >= 32760))
+    if clipping_ratio > MAX_SAMPLE_CLIPPING_RATIO:
+        raise ValueError("sample clipping is too high")
+
+    quality_score = max(
+        0.0,
+        min(
+            1.0,
+            1.0
+            - (silence_ratio * 0.45)
+            - (max(0.0, MIN_SAMPLE_RMS - rms) * 4.0)
+            - (clipping_ratio * 1.2),
+        ),
+    )
+    return {
+        "duration_ms": float(duration_ms),
+        "quality_score": float(quality_score),
+        "silence_ratio": float(silence_ratio),
+        "peak": float(peak),
+        "rms": float(rms),
+        "clipping_ratio": float(clipping_ratio),
+    }
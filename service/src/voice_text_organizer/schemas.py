@@ -90,6 +90,7 @@ class DashboardTermSampleStopResponse(BaseModel):
     duration_ms: int
     quality_score: float
     sample_path: str
+    fingerprint_pending: bool = False
 
 
 class DashboardTermSamplesExportResponse(BaseModel):
@@ -111,6 +112,27 @@ class DashboardTermSampleDeleteResponse(BaseModel):
     status: Literal["pending", "active"]
 
 
+class DashboardProfileImportRequest(BaseModel):
+    path: str
+
+
+class DashboardProfileImportResponse(BaseModel):
+    ok: bool = True
+    terms: int
+    imported: int
+    skipped: int
+    failed: int
+    errors: list[str] = []
+
+
+class DashboardFingerprintRecomputeResponse(BaseModel):
+    state: Literal["idle", "running", "done", "failed"]
+    total: int
+    processed: int
+    updated: int
+    failed: int
+
+
 class SettingsViewResponse(BaseModel):
     default_mode: Literal["cloud", "local"]
     update_channel: Literal["stable", "beta"] = "stable"
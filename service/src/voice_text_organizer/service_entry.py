@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
 
 import uvicorn
 
-from voice_text_organizer.main import app
-
 
 def main() -> None:
+    from voice_text_organizer.main import app
+
     host = os.getenv("VTO_HOST", "127.0.0.1")
     port = int(os.getenv("VTO_PORT", "8775"))
     uvicorn.run(app, host=host, port=port, log_level="info")
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
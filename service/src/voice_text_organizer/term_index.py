@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterator
+
+import numpy as np
+
+
+def fold_case(text: str) -> str:
+    # Lowercase without changing length, so match offsets line up with the original text.
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(lowered if len(lowered) == 1 else char for char, lowered in ((c, c.lower()) for c in text))
+
+
+class AhoCorasick:
+    def __init__(self, patterns: list[str]) -> None:
+        self.patterns = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern_id)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        # Yields (start, pattern id) for every occurrence, overlapping ones included.
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern_id in self._output[state]:
+                yield end - len(self.patterns[pattern_id]), pattern_id
+
+
+class TermIndex:
+    def __init__(self, terms: list[str]) -> None:
+        self.terms = list(terms)
+        self.key = tuple(self.terms)
+        self._chars: dict[str, int] = {}
+        positions: list[int] = []
+        char_ids: list[int] = []
+        counts: list[int] = []
+        for position, term in enumerate(self.terms):
+            for char, count in Counter(term.lower()).items():
+                positions.append(position)
+                char_ids.append(self._chars.setdefault(char, len(self._chars)))
+                counts.append(count)
+        # Sparse term x character occurrence matrix, one entry per distinct character of a term.
+        self._positions = np.asarray(positions, dtype=np.int64)
+        self._char_ids = np.asarray(char_ids, dtype=np.int64)
+        self._counts = np.asarray(counts, dtype=np.float64)
+        self._lengths = np.asarray([len(term.lower()) for term in self.terms], dtype=np.float64)
+        self._automaton: AhoCorasick | None = None
+
+    def present_terms(self, text: str) -> set[str]:
+        if self._automaton is None:
+            self._automaton = AhoCorasick([fold_case(term) for term in self.terms])
+        return {self.terms[pattern_id] for _, pattern_id in self._automaton.iter_matches(fold_case(text))}
+
+    def pair_bounds(self, spans: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        # SequenceMatcher.ratio() is 2*M/(len(a)+len(b)), and the match count M never exceeds the
+        # characters both strings share (the bound behind quick_ratio). Returns the positions of
+        # terms sharing at least one character with some span, and their per-span bounds.
+        lowered = [span.lower() for span in spans]
+        columns: dict[int, int] = {}
+        span_counts: list[dict[int, int]] = []
+        for span in lowered:
+            counts: dict[int, int] = {}
+            for char, count in Counter(span).items():
+                char_id = self._chars.get(char)
+                if char_id is not None:
+                    counts[columns.setdefault(char_id, len(columns))] = count
+            span_counts.append(counts)
+
+        column_of = np.full(len(self._chars), -1, dtype=np.int64)
+        column_of[list(columns)] = list(columns.values())
+        entry_columns = column_of[self._char_ids]
+        hit = entry_columns >= 0
+        if not hit.any():
+            return np.zeros(0, dtype=np.int64), np.zeros((0, len(spans)), dtype=np.float64)
+
+        available = np.zeros((len(columns), len(spans)), dtype=np.float64)
+        for span_idx, counts in enumerate(span_counts):
+            for column, count in counts.items():
+                available[column, span_idx] = count
+
+        positions = self._positions[hit]
+        # Entries are stored term by term, so each term's rows are contiguous.
+        starts = np.flatnonzero(np.r_[True, positions[1:] != positions[:-1]])
+        shared = np.add.reduceat(np.minimum(self._counts[hit, None], available[entry_columns[hit]]), starts, axis=0)
+
+        term_positions = positions[starts]
+        term_lengths = self._lengths[term_positions, None]
+        span_lengths = np.asarray([len(span) for span in lowered], dtype=np.float64)[None, :]
+        matched = np.minimum(np.minimum(shared, term_lengths), span_lengths)
+        return term_positions, 2.0 * matched / (term_lengths + span_lengths)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from voice_text_organizer.mfcc import pcm_to_float
+from voice_text_organizer.sample_quality import silence_threshold
+
+VAD_FRAME_MS = 20
+# Speech frames are widened by this much on both sides so onsets and decays survive trimming.
+VAD_PADDING_MS = 200
+# Pauses up to this long are kept as spoken; longer ones shrink to the two paddings around them.
+VAD_MAX_PAUSE_MS = 700
+# Frame RMS must clear the noise floor by this factor. The floor is the 10th percentile RMS of the
+# frames under the absolute silence threshold, so a recording with no silence in it never takes
+# its own quiet speech for noise.
+VAD_NOISE_FLOOR_SCALE = 3.0
+# Unvoiced consonants (s, sh, f) are quiet but cross zero often; they count as speech at a
+# fraction of the energy threshold.
+VAD_FRICATIVE_ENERGY_RATIO = 0.5
+VAD_FRICATIVE_ZCR = 0.3
+# Trimming less than this is not worth writing a second file for.
+VAD_MIN_SAVED_MS = 300
+
+
+@dataclass(frozen=True)
+class VadResult:
+    pcm: np.ndarray
+    sample_rate: int
+    # (start, end) sample offsets in the original recording, in order; pcm is their concatenation.
+    segments: tuple[tuple[int, int], ...]
+    original_samples: int
+
+    @property
+    def trimmed(self) -> bool:
+        return self.pcm.size < self.original_samples
+
+    @property
+    def bytes_saved(self) -> int:
+        return (self.original_samples - self.pcm.size) * 2
+
+    def original_seconds(self, trimmed_seconds: float) -> float:
+        # Maps a timestamp in the trimmed audio back to the recording it was cut from.
+        if not self.segments:
+            return trimmed_seconds
+        lengths = np.array([end - start for start, end in self.segments], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        position = min(max(0, int(round(trimmed_seconds * self.sample_rate))), int(offsets[-1]))
+        index = min(int(np.searchsorted(offsets, position, side="right")) - 1, len(self.segments) - 1)
+        return (self.segments[index][0] + position - offsets[index]) / self.sample_rate
+
+
+def _speech_frames(signal: np.ndarray, frame_len: int) -> np.ndarray:
+    frame_count = -(-signal.size // frame_len)
+    frames = np.pad(signal, (0, frame_count * frame_len - signal.size)).reshape(frame_count, frame_len)
+    frame_rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+
+    rms = float(np.sqrt(np.mean(np.square(signal, dtype=np.float64))))
+    threshold = silence_threshold(rms)
+    quiet = frame_rms[frame_rms < threshold]
+    if quiet.size:
+        threshold = max(threshold, float(np.percentile(quiet, 10)) * VAD_NOISE_FLOOR_SCALE)
+    voiced = frame_rms >= threshold
+    fricative = (frame_rms >= threshold * VAD_FRICATIVE_ENERGY_RATIO) & (zcr >= VAD_FRICATIVE_ZCR)
+    return voiced | fricative
+
+
+def _frame_runs(mask: np.ndarray) -> list[tuple[int, int]]:
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype(np.int8), [0]])))
+    return [(int(start), int(end)) for start, end in zip(edges[::2], edges[1::2])]
+
+
+def trim_silence(pcm: np.ndarray, sample_rate: int) -> VadResult:
+    # Cuts leading/trailing silence and long pauses. Audio with no detectable speech is returned
+    # whole, so the ASR (not the VAD) decides that nothing was said.
+    untouched = VadResult(pcm=pcm, sample_rate=sample_rate, segments=((0, pcm.size),), original_samples=pcm.size)
+    frame_len = max(1, sample_rate * VAD_FRAME_MS // 1000)
+    if pcm.size < frame_len:
+        return untouched
+    speech = _speech_frames(pcm_to_float(pcm), frame_len)
+    if not speech.any():
+        return untouched
+
+    padding = -(-VAD_PADDING_MS // VAD_FRAME_MS)
+    max_pause = VAD_MAX_PAUSE_MS // VAD_FRAME_MS
+    merged: list[list[int]] = []
+    for start, end in _frame_runs(speech):
+        start, end = max(0, start - padding), min(speech.size, end + padding)
+        if merged and start - merged[-1][1] <= max_pause:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    segments = tuple((start * frame_len, min(pcm.size, end * frame_len)) for start, end in merged)
+    kept = sum(end - start for start, end in segments)
+    if (pcm.size - kept) * 1000 < VAD_MIN_SAVED_MS * sample_rate:
+        return untouched
+    trimmed = np.concatenate([pcm[start:end] for start, end in segments])
+    return VadResult(pcm=trimmed, sample_rate=sample_rate, segments=segments, original_samples=pcm.size)
@@ -1,5 +1,175 @@
-from voice_text_organizer.asr import normalize_asr_text
+from pathlib import Path
+
+import httpx
+import numpy as np
+import pytest
+
+from voice_text_organizer import asr
+from voice_text_organizer.asr import build_asr_prompt, normalize_asr_text, transcribe_with_siliconflow
+from voice_text_organizer.audio import RecordedAudio
+from voice_text_organizer.audio_codec import decode_flac
+from voice_text_organizer.config import Settings
+from voice_text_organizer.mfcc import write_wav_mono_pcm
 
 
 def test_normalize_asr_text_strips_whitespace() -> None:
     assert normalize_asr_text("  hello    world  ") == "hello world"
+
+
+def test_build_asr_prompt_keeps_order_within_budget() -> None:
+    assert build_asr_prompt(["Typeless", "  ", "Kubernetes", "SiliconFlow"], max_chars=22) == "Typeless, Kubernetes"
+
+
+@pytest.fixture
+def asr_calls(monkeypatch, tmp_path: Path):
+    audio_path = tmp_path / "clip.wav"
+    audio_path.write_bytes(b"RIFF")
+    calls: list[dict[str, str]] = []
+    statuses: list[int] = []
+
+    def fake_post(url, *, headers, data, files, timeout):
+        calls.append(dict(data))
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, json={"text": " hello  Typeless "}, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(asr.httpx, "post", fake_post)
+    monkeypatch.setattr(asr, "_prompt_rejected_urls", set())
+    return audio_path, calls, statuses
+
+
+def test_transcribe_sends_hotwords_as_prompt(asr_calls) -> None:
+    audio_path, calls, _ = asr_calls
+    settings = Settings(default_mode="local", siliconflow_api_key="key")
+
+    text = transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless", "Kubernetes"])
+
+    assert text == "hello Typeless"
+    assert calls == [{"model": settings.siliconflow_asr_model, "prompt": "Typeless, Kubernetes"}]
+
+
+def test_transcribe_falls_back_when_prompt_is_rejected(asr_calls) -> None:
+    audio_path, calls, statuses = asr_calls
+    settings = Settings(default_mode="local", siliconflow_api_key="key")
+    statuses.append(400)
+
+    assert transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"]) == "hello Typeless"
+    assert [("prompt" in call) for call in calls] == [True, False]
+    assert asr.asr_prompt_rejected(settings.siliconflow_asr_url)
+
+    transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"])
+    assert "prompt" not in calls[-1]
+    assert len(calls) == 3
+
+
+def test_prompt_stays_enabled_when_the_plain_retry_also_fails(asr_calls) -> None:
+    audio_path, calls, statuses = asr_calls
+    settings = Settings(default_mode="local", siliconflow_api_key="key")
+    statuses.extend([422, 422])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"])
+    assert [("prompt" in call) for call in calls] == [True, False]
+    assert not asr.asr_prompt_rejected(settings.siliconflow_asr_url)
+
+    transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"])
+    assert "prompt" in calls[-1]
+
+
+def test_transcribe_does_not_retry_server_errors(asr_calls) -> None:
+    audio_path, calls, statuses = asr_calls
+    settings = Settings(default_mode="local", siliconflow_api_key="key")
+    statuses.append(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"])
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def asr_uploads(monkeypatch, tmp_path: Path):
+    audio_path = tmp_path / "clip.wav"
+    pcm = (np.sin(np.arange(8000) / 5.0) * 4000).astype(np.int16)
+    write_wav_mono_pcm(audio_path, pcm, 16000)
+    uploads: list[tuple[str, bytes, str]] = []
+    statuses: list[int] = []
+
+    def fake_post(url, *, headers, data, files, timeout):
+        name, body, content_type = files["file"]
+        uploads.append((name, body if isinstance(body, bytes) else body.read(), content_type))
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, json={"text": "hello"}, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(asr.httpx, "post", fake_post)
+    monkeypatch.setattr(asr, "_prompt_rejected_urls", set())
+    monkeypatch.setattr(asr, "_codec_rejected_urls", set())
+    return audio_path, pcm, uploads, statuses
+
+
+def test_transcribe_uploads_flac_when_configured(asr_uploads) -> None:
+    audio_path, pcm, uploads, _ = asr_uploads
+    settings = Settings(default_mode="local", siliconflow_api_key="key", asr_upload_codec="flac")
+
+    assert transcribe_with_siliconflow(audio_path, settings) == "hello"
+
+    name, body, content_type = uploads[0]
+    assert (name, content_type) == ("clip.flac", "audio/flac")
+    np.testing.assert_array_equal(decode_flac(body)[0], pcm)
+
+
+def test_transcribe_falls_back_to_wav_when_codec_is_rejected(asr_uploads) -> None:
+    audio_path, _, uploads, statuses = asr_uploads
+    settings = Settings(default_mode="local", siliconflow_api_key="key", asr_upload_codec="flac")
+    statuses.append(415)
+
+    assert transcribe_with_siliconflow(audio_path, settings) == "hello"
+    assert [content_type for _, _, content_type in uploads] == ["audio/flac", "audio/wav"]
+    assert asr.asr_codec_rejected(settings.siliconflow_asr_url)
+
+    transcribe_with_siliconflow(audio_path, settings)
+    assert uploads[-1][2] == "audio/wav"
+    assert len(uploads) == 3
+
+
+def test_prompt_rejection_does_not_disable_codec(asr_uploads) -> None:
+    audio_path, _, uploads, statuses = asr_uploads
+    settings = Settings(default_mode="local", siliconflow_api_key="key", asr_upload_codec="flac")
+    statuses.extend([400, 400])
+
+    assert transcribe_with_siliconflow(audio_path, settings, hotwords=["Typeless"]) == "hello"
+    assert [content_type for _, _, content_type in uploads] == ["audio/flac", "audio/wav", "audio/flac"]
+    assert asr.asr_prompt_rejected(settings.siliconflow_asr_url)
+    assert not asr.asr_codec_rejected(settings.siliconflow_asr_url)
+
+
+def test_transcribe_uploads_recorded_audio_from_memory(asr_uploads) -> None:
+    _, pcm, uploads, _ = asr_uploads
+    settings = Settings(default_mode="local", siliconflow_api_key="key")
+    audio = RecordedAudio.from_pcm(pcm, 16000)
+
+    assert transcribe_with_siliconflow(audio, settings) == "hello"
+
+    name, body, content_type = uploads[0]
+    assert (name, content_type) == ("recording.wav", "audio/wav")
+    assert body == audio.wav_stream().read()
+    assert body[44:] == pcm.astype("<i2").tobytes()
+
+
+def test_recorded_audio_upload_streams_through_httpx_with_a_known_length(monkeypatch) -> None:
+    pcm = (np.arange(70000) % 4000).astype(np.int16)
+    audio = RecordedAudio(chunks=(pcm[:30000], pcm[30000:]), sample_rate=16000)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"text": "hello"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(asr.httpx, "post", client.post)
+    monkeypatch.setattr(asr, "_prompt_rejected_urls", set())
+    monkeypatch.setattr(asr, "_codec_rejected_urls", set())
+
+    assert transcribe_with_siliconflow(audio, Settings(default_mode="local", siliconflow_api_key="key")) == "hello"
+
+    body = requests[0].read()
+    assert int(requests[0].headers["Content-Length"]) == len(body)
+    assert audio.wav_stream().read() + b"\r\n" in body
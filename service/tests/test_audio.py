@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import io
+import sys
+import time
+import types
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from voice_text_organizer import audio
+from voice_text_organizer.audio import AudioRecorder, RecordedAudio, _PcmBuffer
+
+
+class _FakeInputStream:
+    instances: list[_FakeInputStream] = []
+
+    def __init__(self, *, samplerate, channels, dtype, callback) -> None:
+        self.callback = callback
+        self.channels = channels
+        _FakeInputStream.instances.append(self)
+
+    def start(self) -> None:
+        return None
+
+    def stop(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    def feed(self, block: np.ndarray) -> None:
+        self.callback(block.reshape(-1, self.channels), block.shape[0], None, None)
+
+
+@pytest.fixture
+def fake_sounddevice(monkeypatch):
+    _FakeInputStream.instances.clear()
+    monkeypatch.setitem(sys.modules, "sounddevice", types.SimpleNamespace(InputStream=_FakeInputStream))
+    return _FakeInputStream.instances
+
+
+def test_pcm_buffer_spans_chunks_without_copying() -> None:
+    buffer = _PcmBuffer(chunk_frames=100, channels=1)
+    pcm = np.arange(250, dtype=np.int16).reshape(-1, 1)
+    for offset in range(0, 250, 64):
+        buffer.append(pcm[offset : offset + 64])
+
+    views = buffer.views()
+    assert [view.shape[0] for view in views] == [100, 100, 50]
+    np.testing.assert_array_equal(np.concatenate(views), pcm)
+    assert all(view.base is not None for view in views)
+    np.testing.assert_array_equal(np.concatenate(buffer.views(90, 120)), pcm[90:120])
+
+
+def test_recorder_writes_captured_blocks_to_wav(fake_sounddevice, tmp_path: Path) -> None:
+    recorder = AudioRecorder(temp_dir=str(tmp_path))
+    recorder.start("session")
+    pcm = (np.sin(np.arange(40000) / 7.0) * 8000).astype(np.int16)
+    for offset in range(0, pcm.size, 1024):
+        fake_sounddevice[0].feed(pcm[offset : offset + 1024])
+
+    path = recorder.stop("session")
+
+    with wave.open(str(path), "rb") as wav_file:
+        assert wav_file.getnframes() == pcm.size
+        assert wav_file.getframerate() == 16000
+        np.testing.assert_array_equal(np.frombuffer(wav_file.readframes(pcm.size), dtype=np.int16), pcm)
+
+
+def test_recorder_rejects_empty_capture(fake_sounddevice, tmp_path: Path) -> None:
+    recorder = AudioRecorder(temp_dir=str(tmp_path))
+    recorder.start("session")
+    with pytest.raises(RuntimeError, match="no audio captured"):
+        recorder.stop("session")
+
+
+def test_pcm_buffer_drops_blocks_beyond_the_chunk_cap_until_released() -> None:
+    buffer = _PcmBuffer(chunk_frames=100, channels=1, max_chunks=2)
+    assert buffer.append(np.ones((150, 1), dtype=np.int16))
+    assert not buffer.append(np.ones((100, 1), dtype=np.int16))
+    assert buffer.frames_dropped == 100
+
+    buffer.release(100)
+    assert buffer.append(np.full((100, 1), 2, dtype=np.int16))
+    np.testing.assert_array_equal(np.concatenate(buffer.views(100, 250))[:, 0], [1] * 50 + [2] * 100)
+
+
+def test_pcm_buffer_release_mid_chunk_keeps_that_chunk_counted() -> None:
+    buffer = _PcmBuffer(chunk_frames=100, channels=1, max_chunks=2)
+    assert buffer.append(np.ones((200, 1), dtype=np.int16))
+    buffer.release(150)
+    buffer.release(120)
+    assert not buffer.append(np.ones((150, 1), dtype=np.int16))
+
+    buffer.release(200)
+    assert buffer.append(np.full((150, 1), 3, dtype=np.int16))
+    np.testing.assert_array_equal(np.concatenate(buffer.views(200, 350))[:, 0], [3] * 150)
+
+
+def test_streaming_recorder_spills_to_disk_while_recording(fake_sounddevice, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(audio, "SPILL_FLUSH_SECONDS", 0.01)
+    recorder = AudioRecorder(temp_dir=str(tmp_path), stream_to_disk=True)
+    recorder.start("session")
+    output = tmp_path / "session.wav"
+    pcm = (np.arange(16000 * 6) % 3000).astype(np.int16)
+    for offset in range(0, pcm.size, 8000):
+        fake_sounddevice[0].feed(pcm[offset : offset + 8000])
+        deadline = time.monotonic() + 2.0
+        while output.stat().st_size < 44 + (offset + 8000) * 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        with wave.open(str(output), "rb") as partial:
+            assert partial.getnframes() == offset + 8000
+
+    assert recorder.stop("session") == output
+    with wave.open(str(output), "rb") as wav_file:
+        assert wav_file.getnframes() == pcm.size
+        np.testing.assert_array_equal(np.frombuffer(wav_file.readframes(pcm.size), dtype=np.int16), pcm)
+
+
+def test_streaming_recorder_removes_empty_file(fake_sounddevice, tmp_path: Path) -> None:
+    recorder = AudioRecorder(temp_dir=str(tmp_path), stream_to_disk=True)
+    recorder.start("session")
+    with pytest.raises(RuntimeError, match="no audio captured"):
+        recorder.stop("session")
+    assert not (tmp_path / "session.wav").exists()
+
+
+def test_stop_audio_hands_back_pcm_without_writing_a_file(fake_sounddevice, tmp_path: Path) -> None:
+    recorder = AudioRecorder(temp_dir=str(tmp_path))
+    recorder.start("session")
+    pcm = (np.arange(20000) % 2000).astype(np.int16)
+    fake_sounddevice[0].feed(pcm)
+
+    audio = recorder.stop_audio("session")
+
+    assert audio.path is None
+    assert audio.duration_seconds == pytest.approx(1.25)
+    np.testing.assert_array_equal(audio.pcm, pcm)
+    assert list(tmp_path.iterdir()) == []
+    with wave.open(io.BytesIO(audio.wav_stream().read()), "rb") as wav_file:
+        assert (wav_file.getnchannels(), wav_file.getframerate(), wav_file.getnframes()) == (1, 16000, pcm.size)
+        np.testing.assert_array_equal(np.frombuffer(wav_file.readframes(pcm.size), dtype=np.int16), pcm)
+
+
+def test_stop_audio_keeps_chunk_views_and_streams_them_as_wav(fake_sounddevice, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(audio, "CHUNK_SECONDS", 1)
+    recorder = AudioRecorder(temp_dir=str(tmp_path))
+    recorder.start("session")
+    pcm = (np.arange(40000) % 3000).astype(np.int16)
+    fake_sounddevice[0].feed(pcm)
+
+    recorded = recorder.stop_audio("session")
+
+    assert [chunk.size for chunk in recorded.chunks] == [16000, 16000, 8000]
+    assert all(chunk.base is not None for chunk in recorded.chunks)
+    assert "pcm" not in vars(recorded)
+    expected = io.BytesIO()
+    with wave.open(expected, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(pcm.tobytes())
+    stream = recorded.wav_stream()
+    assert stream.seek(0, io.SEEK_END) == len(expected.getvalue())
+    stream.seek(0)
+    assert b"".join(iter(lambda: stream.read(7000), b"")) == expected.getvalue()
+    np.testing.assert_array_equal(recorded.pcm, pcm)
+
+
+def test_stop_audio_of_streamed_session_keeps_its_file(fake_sounddevice, tmp_path: Path) -> None:
+    recorder = AudioRecorder(temp_dir=str(tmp_path), stream_to_disk=True)
+    recorder.start("session")
+    pcm = (np.arange(8000) % 500).astype(np.int16)
+    fake_sounddevice[0].feed(pcm)
+
+    audio = recorder.stop_audio("session")
+
+    assert audio.path == tmp_path / "session.wav"
+    np.testing.assert_array_equal(audio.pcm, RecordedAudio.from_wav(audio.path).pcm)
+    np.testing.assert_array_equal(audio.pcm, pcm)
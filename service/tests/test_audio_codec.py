@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from voice_text_organizer.audio_codec import FLAC_BLOCK_SIZE, crc8, crc16, crc16_many, decode_flac, encode_flac
+
+
+def _slow_crc16(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x8005) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return crc
+
+
+def test_crcs_match_flac_check_values() -> None:
+    assert crc8(b"123456789") == 0xF4
+    assert crc16(b"123456789") == 0xFEE8
+    messages = [np.random.default_rng(seed).bytes(size) for seed, size in enumerate([0, 1, 2, 3, 255, 1000])]
+    assert crc16_many(messages) == [_slow_crc16(message) for message in messages]
+
+
+def _speech_like(seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    time_axis = np.arange(int(16000 * seconds)) / 16000.0
+    envelope = np.abs(np.sin(2.0 * np.pi * 1.5 * time_axis))
+    voiced = np.sin(2.0 * np.pi * 180.0 * time_axis) + 0.4 * np.sin(2.0 * np.pi * 360.0 * time_axis)
+    return (voiced * envelope * 5000.0 + rng.normal(0.0, 40.0, time_axis.size)).astype(np.int16)
+
+
+@pytest.mark.parametrize(
+    "pcm",
+    [
+        np.array([7], dtype=np.int16),
+        np.array([-32768, 32767, -32768, 32767, 0], dtype=np.int16),
+        np.zeros(FLAC_BLOCK_SIZE + 3, dtype=np.int16),
+        np.random.default_rng(1).integers(-32768, 32768, FLAC_BLOCK_SIZE, dtype=np.int16),
+        _speech_like(1.3),
+    ],
+    ids=["single", "extremes", "silence", "white-noise", "speech-like"],
+)
+def test_flac_round_trip_is_lossless(pcm: np.ndarray) -> None:
+    decoded, sample_rate = decode_flac(encode_flac(pcm, 16000))
+    assert sample_rate == 16000
+    np.testing.assert_array_equal(decoded, pcm)
+
+
+def test_flac_stream_carries_streaminfo_and_compresses_speech() -> None:
+    pcm = _speech_like(2.0)
+    encoded = encode_flac(pcm, 16000)
+
+    assert encoded[:4] == b"fLaC"
+    assert encoded[4] == 0x80
+    info = int.from_bytes(encoded[18:26], "big")
+    assert (info >> 44, (info >> 36) & 0x1F, info & ((1 << 36) - 1)) == (16000, 15, pcm.size)
+    assert encoded[26:42] == hashlib.md5(pcm.astype("<i2").tobytes()).digest()
+    assert len(encoded) < pcm.size * 2 * 0.7
+
+
+def test_flac_rejects_empty_or_multichannel_input() -> None:
+    with pytest.raises(ValueError):
+        encode_flac(np.zeros(0, dtype=np.int16), 16000)
+    with pytest.raises(ValueError):
+        encode_flac(np.zeros((10, 2), dtype=np.int16), 16000)
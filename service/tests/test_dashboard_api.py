@@ -1,7 +1,14 @@
 ﻿from __future__ import annotations
 
+import io
+import wave
+import zipfile
 from pathlib import Path
 
+import numpy as np
+
+from voice_text_organizer.history_store import HistoryStore
+
 
 def test_dashboard_summary_endpoint(client, monkeypatch) -> None:
     monkeypatch.setattr(
@@ -96,8 +103,13 @@ def test_dashboard_term_sample_start_and_stop(client, monkeypatch) -> None:
         raising=False,
     )
     monkeypatch.setattr(
-        "voice_text_organizer.main._evaluate_sample_audio_quality",
-        lambda _path: {
+        "voice_text_organizer.main.read_wav_mono_pcm",
+        lambda _path: (np.zeros(16000, dtype=np.int16), 16000),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        "voice_text_organizer.main.evaluate_sample_audio_quality",
+        lambda _pcm, _sample_rate: {
             "duration_ms": 860,
             "quality_score": 0.91,
             "silence_ratio": 0.22,
@@ -106,7 +118,11 @@ def test_dashboard_term_sample_start_and_stop(client, monkeypatch) -> None:
         },
         raising=False,
     )
-    monkeypatch.setattr("voice_text_organizer.main.build_mfcc_fingerprint_bytes", lambda _path: b"mfcc", raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main.build_mfcc_fingerprint_bytes_from_signal",
+        lambda _signal, _sample_rate: b"mfcc",
+        raising=False,
+    )
     monkeypatch.setattr(
         "voice_text_organizer.main._persist_term_sample_file",
         lambda term, session_id, source_path: Path(f"saved-{term}-{session_id}.wav"),
@@ -194,3 +210,110 @@ def test_term_sample_dir_uses_runtime_parent_recordings(monkeypatch, tmp_path: P
     sample_dir = main._term_sample_dir("Typeless")
     expected_prefix = tmp_path / "repo" / "recordings" / "term_samples"
     assert str(sample_dir).startswith(str(expected_prefix))
+
+
+def test_dashboard_term_sample_stop_moves_file_and_defers_fingerprint(client, monkeypatch, tmp_path: Path) -> None:
+    recorded = tmp_path / "recorded.wav"
+    t = np.arange(16000, dtype=np.float32) / 16000.0
+    pcm = (0.3 * np.sin(2.0 * np.pi * (200.0 + 300.0 * t) * t) * 32767.0).astype(np.int16)
+    with wave.open(str(recorded), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(pcm.tobytes())
+
+    store = HistoryStore(tmp_path / "history.db")
+    monkeypatch.setattr("voice_text_organizer.main.history_store", store, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.settings.defer_sample_fingerprints", True, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: recorded, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._term_sample_dir", lambda _term: tmp_path / "samples", raising=False)
+
+    session_id = client.post("/v1/dashboard/terms/sample/start", json={"term": "Typeless"}).json()["session_id"]
+    stop = client.post("/v1/dashboard/terms/sample/stop", json={"term": "Typeless", "session_id": session_id})
+
+    assert stop.status_code == 200
+    payload = stop.json()
+    assert payload["fingerprint_pending"] is True
+    assert not recorded.exists()
+    assert Path(payload["sample_path"]).read_bytes()[:4] == b"RIFF"
+
+    from voice_text_organizer.main import sample_fingerprint_executor
+
+    sample_fingerprint_executor.submit(lambda: None).result(timeout=10)
+    assert store.list_pending_term_samples() == []
+    assert store.term_library_snapshot().active_terms == ("Typeless",)
+
+
+def test_startup_resumes_pending_samples_and_drops_unreadable_ones(monkeypatch, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    from voice_text_organizer import main
+    from voice_text_organizer.fingerprint_recompute import FingerprintRecomputeJob
+
+    readable = tmp_path / "readable.wav"
+    t = np.arange(16000, dtype=np.float32) / 16000.0
+    pcm = (0.3 * np.sin(2.0 * np.pi * (200.0 + 300.0 * t) * t) * 32767.0).astype(np.int16)
+    with wave.open(str(readable), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(pcm.tobytes())
+    corrupt = tmp_path / "corrupt.wav"
+    corrupt.write_bytes(b"not a wav")
+
+    store = HistoryStore(tmp_path / "history.db")
+    for path in (readable, tmp_path / "missing.wav", corrupt):
+        store.add_term_sample(
+            term="Typeless",
+            audio_path=str(path),
+            duration_ms=1000,
+            quality_score=0.9,
+            mfcc_fingerprint=None,
+        )
+    monkeypatch.setattr("voice_text_organizer.main.history_store", store, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main.recompute_job", FingerprintRecomputeJob(store, "local_default", workers=1)
+    )
+
+    TestClient(main.app).get("/health")
+    main.sample_fingerprint_executor.submit(lambda: None).result(timeout=10)
+    assert len(store.list_pending_term_samples()) == 3
+
+    with TestClient(main.app):
+        main.sample_fingerprint_executor.submit(lambda: None).result(timeout=10)
+
+    assert store.list_pending_term_samples() == []
+    assert store.load_term_sample_ids(["Typeless"]) == {"Typeless": [1]}
+    assert not corrupt.exists()
+
+
+def test_dashboard_profile_import_then_export(client, monkeypatch, tmp_path: Path) -> None:
+    t = np.arange(16000, dtype=np.float32) / 16000.0
+    pcm = (0.3 * np.sin(2.0 * np.pi * (200.0 + 300.0 * t) * t) * 32767.0).astype(np.int16)
+    for name in ("a.wav", "b.wav"):
+        (tmp_path / "incoming" / "Typeless").mkdir(parents=True, exist_ok=True)
+        with wave.open(str(tmp_path / "incoming" / "Typeless" / name), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(pcm.tobytes())
+
+    store = HistoryStore(tmp_path / "history.db")
+    monkeypatch.setattr("voice_text_organizer.main.history_store", store, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._term_sample_dir", lambda term: tmp_path / "samples" / term, raising=False)
+
+    imported = client.post("/v1/dashboard/profile/import", json={"path": str(tmp_path / "incoming")})
+    assert imported.status_code == 200
+    assert imported.json()["imported"] == 2
+    assert imported.json()["failed"] == 0
+
+    exported = client.get("/v1/dashboard/profile/export")
+    assert exported.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(exported.content)) as archive:
+        names = archive.namelist()
+    assert "manifest.json" in names
+    assert sum(name.endswith(".wav") for name in names) == 2
+
+    missing = client.post("/v1/dashboard/profile/import", json={"path": str(tmp_path / "missing.zip")})
+    assert missing.status_code == 422
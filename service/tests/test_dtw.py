@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from voice_text_organizer.dtw import (
+    _reference_dtw_distance,
+    _reference_subsequence_dtw_distance,
+    build_query_envelope,
+    dtw_distance,
+    dtw_distance_batch,
+    fast_dtw_distance_batch,
+    lb_keogh,
+    subsequence_dtw_distance_batch,
+)
+
+
+def _random_matrix(rng: np.random.Generator, frames: int, dim: int = 13) -> np.ndarray:
+    return rng.standard_normal((frames, dim)).astype(np.float32)
+
+
+@pytest.mark.parametrize("window", [None, 1, 2, 7, 30])
+def test_dtw_distance_matches_reference(window: int | None) -> None:
+    rng = np.random.default_rng(7)
+    for _ in range(25):
+        a = _random_matrix(rng, int(rng.integers(1, 70)))
+        b = _random_matrix(rng, int(rng.integers(1, 70)))
+
+        assert dtw_distance(a, b, window=window) == _reference_dtw_distance(a, b, window=window)
+
+
+def test_dtw_distance_batch_matches_pairwise_with_mixed_lengths() -> None:
+    rng = np.random.default_rng(11)
+    query = _random_matrix(rng, 120)
+    samples = [_random_matrix(rng, frames) for frames in (95, 120, 140, 149, 150, 80, 0)]
+
+    distances = dtw_distance_batch(query, samples, window=30)
+
+    expected = [_reference_dtw_distance(query, sample, window=30) for sample in samples]
+    assert distances.tolist() == expected
+    # Length gaps outside the band can never reach the end cell.
+    assert np.isinf(distances[4]) and np.isinf(distances[5]) and np.isinf(distances[6])
+
+
+def test_dtw_distance_batch_rejects_dimension_mismatch() -> None:
+    query = np.zeros((10, 13), dtype=np.float32)
+    with pytest.raises(ValueError, match="dimensions mismatch"):
+        dtw_distance_batch(query, [np.zeros((10, 12), dtype=np.float32)], window=5)
+
+
+def test_lb_keogh_never_exceeds_dtw_distance() -> None:
+    rng = np.random.default_rng(5)
+    for _ in range(60):
+        window = int(rng.integers(1, 30))
+        query = _random_matrix(rng, int(rng.integers(1, 80)))
+        sample = (_random_matrix(rng, int(rng.integers(1, 80))) * rng.uniform(0.2, 3.0)).astype(np.float32)
+
+        bound = lb_keogh(build_query_envelope(query, window=window), sample)
+
+        assert bound <= dtw_distance(query, sample, window=window)
+
+
+def test_dtw_distance_batch_abandons_only_pairs_over_budget() -> None:
+    rng = np.random.default_rng(9)
+    query = _random_matrix(rng, 60)
+    samples = [_random_matrix(rng, 60) for _ in range(6)]
+    exact = dtw_distance_batch(query, samples, window=20)
+    limit = float(np.median(exact))
+
+    bounded = dtw_distance_batch(query, samples, window=20, max_distance=limit)
+
+    for full, partial in zip(exact, bounded):
+        if full <= limit:
+            assert partial == full
+        else:
+            assert np.isinf(partial) or partial == full
+
+
+def test_dtw_distance_batch_keeps_shorter_samples_alive_in_mixed_batches() -> None:
+    rng = np.random.default_rng(21)
+    query = _random_matrix(rng, 60)
+    # The near-copy ends many anti-diagonals before the long sample, and must keep its distance.
+    short = (query[:48] + rng.normal(0.0, 0.05, (48, query.shape[1]))).astype(np.float32)
+    samples = [short, _random_matrix(rng, 75)]
+    exact = dtw_distance_batch(query, samples, window=20)
+    limit = float(exact.max()) * 1.01
+
+    bounded = dtw_distance_batch(query, samples, window=20, max_distance=limit)
+
+    np.testing.assert_array_equal(bounded, exact)
+    assert np.isfinite(bounded).all()
+
+
+def _warped_copy(rng: np.random.Generator, source: np.ndarray, frames: int) -> np.ndarray:
+    positions = np.sort(rng.uniform(0, source.shape[0] - 1, size=frames))
+    base = np.floor(positions).astype(int)
+    upper = np.minimum(base + 1, source.shape[0] - 1)
+    weight = (positions - base)[:, None]
+    warped = source[base] * (1.0 - weight) + source[upper] * weight
+    return (warped + 0.05 * rng.standard_normal(warped.shape)).astype(np.float32)
+
+
+@pytest.mark.parametrize("radius", [0, 1, 3])
+def test_fast_dtw_distance_batch_tracks_exact_distance(radius: int) -> None:
+    rng = np.random.default_rng(13)
+    query = np.cumsum(_random_matrix(rng, 90), axis=0).astype(np.float32)
+    samples = [_warped_copy(rng, query, frames) for frames in (70, 90, 105, 118)]
+
+    exact = dtw_distance_batch(query, samples, window=30)
+    approximate = fast_dtw_distance_batch(query, samples, window=30, radius=radius)
+
+    assert np.all(approximate >= exact * (1.0 - 1e-6))
+    assert np.allclose(approximate, exact, rtol=0.05)
+
+
+def test_fast_dtw_distance_batch_handles_identity_and_unreachable_pairs() -> None:
+    rng = np.random.default_rng(17)
+    query = _random_matrix(rng, 64)
+    samples = [query.copy(), _random_matrix(rng, 20), _random_matrix(rng, 3)]
+
+    distances = fast_dtw_distance_batch(query, samples, window=10)
+
+    assert distances[0] == pytest.approx(0.0, abs=1e-4)
+    assert np.isinf(distances[1]) and np.isinf(distances[2])
+
+
+def test_subsequence_dtw_matches_reference_and_finds_embedded_sample() -> None:
+    rng = np.random.default_rng(17)
+    region = _random_matrix(rng, 80)
+    samples = [_random_matrix(rng, int(rng.integers(1, 30))) for _ in range(6)]
+
+    distances = subsequence_dtw_distance_batch(region, samples)
+    expected = [_reference_subsequence_dtw_distance(region, sample) for sample in samples]
+    np.testing.assert_allclose(distances, expected, rtol=1e-6)
+
+    embedded = subsequence_dtw_distance_batch(region, [region[30:45]], max_distance=0.5)
+    assert embedded[0] == pytest.approx(0.0, abs=1e-5)
+    assert np.isinf(subsequence_dtw_distance_batch(region, samples[:1], max_distance=1e-3)[0])
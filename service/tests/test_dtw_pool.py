@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from voice_text_organizer.dtw import build_query_envelope
+from voice_text_organizer.dtw_pool import DtwProcessPool
+from voice_text_organizer.fingerprint_arena import FingerprintArena
+from voice_text_organizer.personalization import DTW_WINDOW, EnhanceStats, _best_sample_distance, enhance_voice_text
+
+
+@pytest.fixture
+def arena_samples(tmp_path: Path) -> tuple[Path, np.ndarray, dict[int, np.ndarray]]:
+    rng = np.random.default_rng(21)
+    query = rng.standard_normal((60, 13)).astype(np.float32)
+    samples = {
+        1: (query + 0.05 * rng.standard_normal(query.shape)).astype(np.float32),
+        2: rng.standard_normal((55, 13)).astype(np.float32),
+        3: rng.standard_normal((70, 13)).astype(np.float32),
+    }
+    FingerprintArena(tmp_path, "local_default").append(
+        [(1, "Typeless", samples[1]), (2, "Typeless", samples[2]), (3, "Kubernetes", samples[3])]
+    )
+    return tmp_path, query, samples
+
+
+def test_pool_matches_in_process_scoring_and_sees_new_samples(arena_samples) -> None:
+    arena_dir, query, samples = arena_samples
+    envelope = build_query_envelope(query, window=DTW_WINDOW)
+    pool = DtwProcessPool(arena_dir, "local_default", workers=2)
+    try:
+        stats = EnhanceStats()
+        distances = pool.best_distances(
+            query,
+            envelope,
+            {"Typeless": [1, 2], "Kubernetes": [3]},
+            timeout_ms=30_000,
+            stats=stats,
+        )
+
+        expected = _best_sample_distance(query, envelope, [samples[1], samples[2]], EnhanceStats())
+        assert distances["Typeless"] == expected
+        assert stats.timed_out is False
+        assert stats.scored_pairs + stats.pruned_pairs + stats.abandoned_pairs == 3
+
+        FingerprintArena(arena_dir, "local_default").append([(4, "Notebook", query)])
+        refreshed = pool.best_distances(query, envelope, {"Notebook": [4]}, timeout_ms=30_000, stats=EnhanceStats())
+        assert refreshed["Notebook"] == 0.0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_remaps_samples_replaced_under_the_same_id(arena_samples) -> None:
+    arena_dir, query, _ = arena_samples
+    envelope = build_query_envelope(query, window=DTW_WINDOW)
+    pool = DtwProcessPool(arena_dir, "local_default", workers=1)
+    try:
+        before = pool.best_distances(query, envelope, {"Kubernetes": [3]}, timeout_ms=30_000, stats=EnhanceStats())
+        assert before["Kubernetes"] > 0.0
+
+        arena = FingerprintArena(arena_dir, "local_default")
+        arena.remove({3})
+        arena.append([(3, "Kubernetes", query)])
+        after = pool.best_distances(query, envelope, {"Kubernetes": [3]}, timeout_ms=30_000, stats=EnhanceStats())
+        assert after["Kubernetes"] == 0.0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_returns_partial_results_at_deadline(arena_samples) -> None:
+    arena_dir, query, _ = arena_samples
+    pool = DtwProcessPool(arena_dir, "local_default", workers=1)
+    try:
+        stats = EnhanceStats()
+        distances = pool.best_distances(
+            query,
+            build_query_envelope(query, window=DTW_WINDOW),
+            {"Typeless": [1, 2], "Kubernetes": [3]},
+            timeout_ms=0,
+            stats=stats,
+        )
+
+        assert distances == {}
+        assert stats.timed_out is True
+    finally:
+        pool.shutdown()
+
+
+def test_enhance_voice_text_scores_through_pool(arena_samples) -> None:
+    arena_dir, query, samples = arena_samples
+    pool = DtwProcessPool(arena_dir, "local_default", workers=1)
+    try:
+        stats = EnhanceStats()
+        enhanced = enhance_voice_text(
+            voice_text="type less release is ready",
+            audio_path="unused.wav",
+            active_terms=["Typeless"],
+            sample_lookup={"Typeless": [samples[1], samples[2]]},
+            timeout_ms=30_000,
+            stats=stats,
+            query_matrix=samples[1],
+            pool=pool,
+            sample_ids={"Typeless": [1, 2]},
+        )
+    finally:
+        pool.shutdown()
+
+    assert "Typeless" in enhanced
+    assert stats.pairs == 2 and stats.scored_pairs >= 1
+
+
+def test_timed_out_request_does_not_hold_up_the_next_one(tmp_path: Path) -> None:
+    rng = np.random.default_rng(5)
+    region = rng.standard_normal((1500, 13)).astype(np.float32)
+    arena = FingerprintArena(tmp_path, "local_default")
+    slow_ids = list(range(1, 601))
+    arena.append([(sample_id, "Typeless", rng.standard_normal((150, 13)).astype(np.float32)) for sample_id in slow_ids])
+    arena.append([(1000, "Notebook", region[:40].copy())])
+    pool = DtwProcessPool(tmp_path, "local_default", workers=1)
+    try:
+        # Warm the worker so its start-up cost does not count against either deadline.
+        pool.best_distances(
+            None,
+            None,
+            {"Notebook": [1000]},
+            timeout_ms=30_000,
+            stats=EnhanceStats(),
+            dtw_mode="subsequence",
+            term_queries={"Notebook": region[:40]},
+        )
+
+        first = EnhanceStats()
+        assert pool.best_distances(
+            None,
+            None,
+            {"Typeless": slow_ids},
+            timeout_ms=100,
+            stats=first,
+            dtw_mode="subsequence",
+            term_queries={"Typeless": region},
+        ) == {}
+        assert first.timed_out is True
+
+        second = EnhanceStats()
+        distances = pool.best_distances(
+            None,
+            None,
+            {"Notebook": [1000]},
+            timeout_ms=1500,
+            stats=second,
+            dtw_mode="subsequence",
+            term_queries={"Notebook": region[:200]},
+        )
+        assert second.timed_out is False
+        assert distances["Notebook"] == pytest.approx(0.0, abs=1e-4)
+    finally:
+        pool.shutdown()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import numpy as np
+
+from voice_text_organizer.embedding import (
+    build_sample_embeddings,
+    embed_fingerprint,
+    embed_query_windows,
+    embed_windows,
+)
+
+
+def test_embed_windows_match_fingerprint_embeddings_of_each_slice() -> None:
+    rng = np.random.default_rng(5)
+    frames = rng.standard_normal((90, 13)).astype(np.float32)
+
+    windows = embed_windows(frames, 30, [0, 17, 60])
+    for row, start in zip(windows, (0, 17, 60)):
+        np.testing.assert_allclose(row, embed_fingerprint(frames[start : start + 30]), atol=1e-5)
+    assert np.allclose(np.linalg.norm(windows, axis=1), 1.0, atol=1e-5)
+
+    query = embed_query_windows(frames, 30)
+    np.testing.assert_allclose(query[-1], embed_fingerprint(frames[60:]), atol=1e-5)
+    assert embed_fingerprint(frames[:2]).shape == windows.shape[1:]
+
+
+def test_build_sample_embeddings_stacks_rows_in_lookup_order() -> None:
+    rng = np.random.default_rng(6)
+    lookup = {
+        "Typeless": [rng.standard_normal((40, 13)).astype(np.float32) for _ in range(2)],
+        "Kubernetes": [rng.standard_normal((25, 13)).astype(np.float32)],
+        "Pending": [],
+    }
+
+    embeddings = build_sample_embeddings(lookup)
+
+    assert embeddings.matrix.flags.c_contiguous
+    assert embeddings.matrix.shape[0] == 3
+    assert embeddings.rows["Typeless"].tolist() == [0, 1]
+    assert embeddings.rows["Kubernetes"].tolist() == [2]
+    assert embeddings.rows["Pending"].tolist() == []
+    np.testing.assert_allclose(embeddings.matrix[2], embed_fingerprint(lookup["Kubernetes"][0]))
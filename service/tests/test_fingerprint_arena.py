@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from voice_text_organizer import fingerprint_arena
+from voice_text_organizer.fingerprint_arena import FingerprintArena
+
+
+def _matrix(frames: int, value: float) -> np.ndarray:
+    return np.full((frames, 13), value, dtype=np.float32)
+
+
+def test_arena_appends_and_reopens_as_memmap_views(tmp_path: Path) -> None:
+    arena = FingerprintArena(tmp_path, "local_default")
+    arena.append([(1, "Typeless", _matrix(3, 1.0)), (2, "Kubernetes", _matrix(5, 2.0))])
+    arena.append([(3, "Typeless", _matrix(4, 3.0))])
+
+    reopened = FingerprintArena(tmp_path, "local_default").matrices()
+
+    assert sorted(reopened) == [1, 2, 3]
+    term, matrix = reopened[3]
+    assert term == "Typeless"
+    assert matrix.shape == (4, 13) and float(matrix[0, 0]) == 3.0
+    assert isinstance(matrix, np.memmap)
+    assert not matrix.flags.writeable
+
+
+def test_arena_skips_mismatched_dimensions(tmp_path: Path) -> None:
+    arena = FingerprintArena(tmp_path, "p")
+    appended = arena.append([(1, "a", _matrix(3, 1.0)), (2, "b", np.zeros((3, 12), dtype=np.float32))])
+
+    assert sorted(appended) == [1]
+    assert arena.sample_ids() == {1}
+
+
+def test_arena_clear_allows_a_new_width(tmp_path: Path) -> None:
+    arena = FingerprintArena(tmp_path, "p")
+    arena.append([(1, "a", _matrix(3, 1.0))])
+    arena.clear()
+    appended = arena.append([(2, "a", np.ones((3, 9), dtype=np.float32))])
+
+    assert sorted(appended) == [2]
+    reopened = FingerprintArena(tmp_path, "p")
+    assert reopened.dim == 9 and reopened.sample_ids() == {2}
+    assert len(list(tmp_path.glob("p-*.f32"))) == 1
+
+
+def test_arena_compacts_when_mostly_dead(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fingerprint_arena, "MIN_COMPACT_ROWS", 1)
+    arena = FingerprintArena(tmp_path, "p")
+    arena.append([(sample_id, "t", _matrix(10, float(sample_id))) for sample_id in range(1, 5)])
+
+    arena.remove({1, 2, 3})
+
+    assert sorted(path.name for path in tmp_path.glob("p-*.f32")) == ["p-1.f32"]
+    assert (tmp_path / "p-1.f32").stat().st_size == 10 * 13 * 4
+    reopened = FingerprintArena(tmp_path, "p").matrices()
+    assert list(reopened) == [4]
+    assert float(reopened[4][1][0, 0]) == 4.0
+
+
+def test_arena_ignores_corrupt_index(tmp_path: Path) -> None:
+    (tmp_path / "p.json").write_text("{not json", encoding="utf-8")
+
+    arena = FingerprintArena(tmp_path, "p")
+    arena.append([(7, "t", _matrix(2, 1.0))])
+
+    assert FingerprintArena(tmp_path, "p").sample_ids() == {7}
+
+
+def test_arena_appends_after_rows_written_by_another_instance(tmp_path: Path) -> None:
+    first = FingerprintArena(tmp_path, "p")
+    first.append([(1, "a", _matrix(3, 1.0))])
+    second = FingerprintArena(tmp_path, "p")
+    first.append([(2, "b", _matrix(4, 2.0))])
+
+    # second still holds the one-row index; it must append after row 7, not over sample 2.
+    second.append([(3, "c", _matrix(2, 3.0))])
+    second.remove({1})
+
+    reopened = FingerprintArena(tmp_path, "p").matrices()
+    assert {sample_id: float(matrix[0, 0]) for sample_id, (_, matrix) in reopened.items()} == {2: 2.0, 3: 3.0}
+    assert reopened[2][1].shape == (4, 13)
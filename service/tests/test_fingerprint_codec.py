@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from voice_text_organizer.dtw import dtw_distance_batch
+from voice_text_organizer.fingerprint_codec import (
+    FINGERPRINT_FORMAT_COMPACT,
+    FINGERPRINT_FORMAT_NPY,
+    decode_fingerprint,
+    decode_reduced_fingerprint,
+    encode_compact_fingerprint,
+    fit_pca_basis,
+)
+from voice_text_organizer.mfcc import DEFAULT_MFCC_EXTRACTOR
+from voice_text_organizer.personalization import encode_mfcc_fingerprint
+
+
+def _fingerprints(count: int = 12) -> list[np.ndarray]:
+    rng = np.random.default_rng(1)
+    matrices = []
+    for _ in range(count):
+        start_hz, end_hz = rng.uniform(150.0, 3500.0, 2)
+        seconds = float(rng.uniform(0.6, 1.0))
+        t = np.arange(int(seconds * 16000)) / 16000.0
+        phase = start_hz * t + (end_hz - start_hz) * t * t / (2.0 * seconds)
+        signal = 0.3 * np.sin(2.0 * math.pi * phase) + 0.01 * rng.standard_normal(t.size)
+        matrices.append(DEFAULT_MFCC_EXTRACTOR.compute(signal.astype(np.float32), 16000))
+    return matrices
+
+
+def _pairwise(matrices: list[np.ndarray]) -> np.ndarray:
+    return np.array([dtw_distance_batch(query, matrices, window=30) for query in matrices])
+
+
+@pytest.mark.parametrize(
+    ("encoding", "components", "max_relative_error"),
+    [("float16", 0, 1e-3), ("int8", 0, 1e-2), ("int8", 10, 0.08), ("float16", 10, 0.08)],
+)
+def test_compact_fingerprints_track_float32_dtw_distances(
+    encoding: str, components: int, max_relative_error: float
+) -> None:
+    matrices = _fingerprints()
+    basis = fit_pca_basis(matrices, components) if components else None
+    blobs = [encode_compact_fingerprint(matrix, encoding, basis) for matrix in matrices]
+    decoded = [decode_fingerprint(blob, FINGERPRINT_FORMAT_COMPACT, basis) for blob in blobs]
+
+    expected = _pairwise(matrices)
+    actual = _pairwise(decoded)
+    comparable = np.isfinite(expected) & (expected > 0)
+    assert np.array_equal(np.isfinite(expected), np.isfinite(actual))
+    errors = np.abs(actual[comparable] - expected[comparable]) / expected[comparable]
+    assert errors.max() < max_relative_error
+    # Nearest neighbours are what the acoustic gate depends on.
+    np.fill_diagonal(expected, np.inf)
+    np.fill_diagonal(actual, np.inf)
+    assert np.array_equal(expected.argmin(axis=1), actual.argmin(axis=1))
+
+    legacy = sum(len(encode_mfcc_fingerprint(matrix)) for matrix in matrices)
+    assert sum(len(blob) for blob in blobs) * 1.8 < legacy
+
+
+@pytest.mark.parametrize("encoding", ["float16", "int8"])
+def test_reduced_fingerprints_give_reconstructed_dtw_distances(encoding: str) -> None:
+    matrices = _fingerprints()
+    basis = fit_pca_basis(matrices, 6)
+    assert basis is not None
+    blobs = [encode_compact_fingerprint(matrix, encoding, basis) for matrix in matrices]
+    reconstructed = [decode_fingerprint(blob, FINGERPRINT_FORMAT_COMPACT, basis) for blob in blobs]
+    reduced = [decode_reduced_fingerprint(blob, FINGERPRINT_FORMAT_COMPACT, basis) for blob in blobs]
+    assert all(matrix.shape[1] == 7 for matrix in reduced)
+
+    for query in matrices:
+        expected = dtw_distance_batch(query, reconstructed, window=30)
+        actual = dtw_distance_batch(basis.reduce(query), reduced, window=30)
+        np.testing.assert_allclose(actual, expected, rtol=1e-4)
+
+    legacy = decode_reduced_fingerprint(encode_mfcc_fingerprint(matrices[0]), FINGERPRINT_FORMAT_NPY, basis)
+    np.testing.assert_allclose(legacy, basis.reduce(matrices[0]))
+
+
+def test_decode_fingerprint_keeps_legacy_rows_and_rejects_bad_input() -> None:
+    matrix = _fingerprints(1)[0]
+    np.testing.assert_array_equal(decode_fingerprint(encode_mfcc_fingerprint(matrix), FINGERPRINT_FORMAT_NPY), matrix)
+
+    basis = fit_pca_basis(_fingerprints(), 6)
+    projected = encode_compact_fingerprint(matrix, "int8", basis)
+    with pytest.raises(ValueError, match="pca basis"):
+        decode_fingerprint(projected, FINGERPRINT_FORMAT_COMPACT)
+    with pytest.raises(ValueError, match="truncated"):
+        decode_fingerprint(projected[:-3], FINGERPRINT_FORMAT_COMPACT, basis)
+    with pytest.raises(ValueError, match="unknown fingerprint format"):
+        decode_fingerprint(projected, 7)
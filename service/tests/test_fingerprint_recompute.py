@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from voice_text_organizer.fingerprint_recompute import FingerprintRecomputeJob
+from voice_text_organizer.history_store import HistoryStore
+from voice_text_organizer.personalization import build_mfcc_fingerprint_bytes, decode_mfcc_fingerprint_bytes
+
+
+def _write_chirp(path: Path, *, start_hz: float, sample_rate: int = 16000) -> None:
+    t = np.arange(int(0.8 * sample_rate), dtype=np.float64) / sample_rate
+    signal = 0.3 * np.sin(2.0 * np.pi * (start_hz + 400.0 * t) * t)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((signal * 32767.0).astype(np.int16).tobytes())
+
+
+def _store_with_stale_samples(tmp_path: Path) -> tuple[HistoryStore, list[Path]]:
+    store = HistoryStore(tmp_path / "history.db")
+    paths = []
+    for index in range(3):
+        wav = tmp_path / f"{index}.wav"
+        _write_chirp(wav, start_hz=200.0 + 100.0 * index)
+        store.add_term_sample(
+            term="Typeless",
+            audio_path=str(wav),
+            duration_ms=800,
+            quality_score=0.9,
+            mfcc_fingerprint=build_mfcc_fingerprint_bytes(wav),
+        )
+        paths.append(wav)
+    with sqlite3.connect(tmp_path / "history.db") as conn:
+        conn.execute("UPDATE term_samples SET fingerprint_version = 'r0-old'")
+    return store, paths
+
+
+def test_stale_samples_are_excluded_then_recomputed(tmp_path: Path) -> None:
+    store, paths = _store_with_stale_samples(tmp_path)
+    paths[2].unlink()
+    assert store.term_library_snapshot().active_terms == ()
+    assert len(store.list_stale_term_samples()) == 3
+
+    job = FingerprintRecomputeJob(store, "local_default", workers=1)
+    assert job.start().state == "running"
+    progress = job.wait(timeout=10)
+
+    assert (progress.state, progress.total, progress.updated, progress.failed) == ("done", 3, 2, 1)
+    snapshot = store.term_library_snapshot()
+    assert snapshot.sample_counts == {"Typeless": 2}
+    expected = [decode_mfcc_fingerprint_bytes(build_mfcc_fingerprint_bytes(path)) for path in paths[:2]]
+    for matrix, reference in zip(snapshot.sample_lookup["Typeless"], reversed(expected)):
+        np.testing.assert_array_equal(matrix, reference)
+    assert store.list_stale_term_samples() == [(3, str(paths[2]))]
+
+
+def test_recompute_waits_while_interactive_requests_run(tmp_path: Path) -> None:
+    store, _ = _store_with_stale_samples(tmp_path)
+    busy = {"value": True}
+    job = FingerprintRecomputeJob(store, "local_default", workers=1, busy=lambda: busy["value"])
+
+    job.start()
+    time.sleep(0.2)
+    assert job.progress().processed == 0
+
+    busy["value"] = False
+    assert job.wait(timeout=10).updated == 3
+
+
+def test_recompute_endpoint_reports_progress(client, monkeypatch, tmp_path: Path) -> None:
+    store, _ = _store_with_stale_samples(tmp_path)
+    job = FingerprintRecomputeJob(store, "local_default", workers=1)
+    monkeypatch.setattr("voice_text_organizer.main.recompute_job", job, raising=False)
+
+    assert client.get("/v1/dashboard/fingerprints/recompute").json()["state"] == "idle"
+    started = client.post("/v1/dashboard/fingerprints/recompute")
+    assert started.status_code == 200
+    assert started.json()["total"] == 3
+    job.wait(timeout=10)
+    assert client.get("/v1/dashboard/fingerprints/recompute").json() == {
+        "state": "done",
+        "total": 3,
+        "processed": 3,
+        "updated": 3,
+        "failed": 0,
+    }
@@ -1,10 +1,16 @@
 ﻿from __future__ import annotations
 
+import io
+import sqlite3
+import threading
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from voice_text_organizer import history_store as history_store_module
 from voice_text_organizer.history_store import HistoryStore
+from voice_text_organizer.personalization import TermMatchOutcome
 
 
 def test_manual_term_add_returns_pending_and_existed_state(tmp_path: Path) -> None:
@@ -113,3 +119,363 @@ def test_record_transcript_no_longer_auto_adds_terms(tmp_path: Path) -> None:
 
     blob = store.export_terms_blob(status="all", limit=20)
     assert "Kubernetes" not in blob
+
+
+def _fingerprint(value: float) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, np.full((4, 13), value, dtype=np.float32), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def test_term_sample_matrices_are_cached_and_invalidated(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    store = HistoryStore(db_path)
+    first = store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "a.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(1.0),
+    )
+    store.add_term_sample(
+        term="Kubernetes",
+        audio_path=str(tmp_path / "b.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(2.0),
+    )
+
+    loaded = store.load_term_sample_matrices(["Typeless", "Kubernetes"])
+    assert loaded["Typeless"][0][0, 0] == 1.0
+    assert loaded["Kubernetes"][0][0, 0] == 2.0
+
+    # Served from memory: edits made behind the store's back are not observed.
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE term_samples SET mfcc_fingerprint = ?", (_fingerprint(9.0),))
+    cached = store.load_term_sample_matrices(["Typeless"])
+    assert cached["Typeless"][0] is loaded["Typeless"][0]
+    assert not cached["Typeless"][0].flags.writeable
+
+    store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "c.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(3.0),
+    )
+    reloaded = store.load_term_sample_matrices(["Typeless"])
+    assert [matrix[0, 0] for matrix in reloaded["Typeless"]] == [3.0, 1.0]
+
+    store.delete_term_sample("Typeless", int(first["sample_id"]))
+    assert [matrix[0, 0] for matrix in store.load_term_sample_matrices(["Typeless"])["Typeless"]] == [3.0]
+
+    store.delete_term("Kubernetes")
+    assert store.load_term_sample_matrices(["Kubernetes"]) == {"Kubernetes": []}
+
+
+def test_term_sample_matrices_reopen_from_arena_without_decoding(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = tmp_path / "history.db"
+    store = HistoryStore(db_path)
+    for value in (1.0, 2.0):
+        store.add_term_sample(
+            term="Typeless",
+            audio_path=str(tmp_path / f"{value}.wav"),
+            duration_ms=700,
+            quality_score=0.9,
+            mfcc_fingerprint=_fingerprint(value),
+        )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO term_samples(profile_id, term, audio_path, duration_ms, quality_score, mfcc_fingerprint) "
+            "VALUES ('local_default', 'Typeless', 'x.wav', 700, 0.9, ?)",
+            (_fingerprint(5.0),),
+        )
+
+    decoded: list[bytes] = []
+    original_decode = history_store_module.decode_mfcc_fingerprint_bytes
+
+    def counting_decode(blob: bytes) -> np.ndarray:
+        decoded.append(blob)
+        return original_decode(blob)
+
+    monkeypatch.setattr(history_store_module, "decode_mfcc_fingerprint_bytes", counting_decode)
+    reopened = HistoryStore(db_path)
+    loaded = reopened.load_term_sample_matrices(["Typeless"])
+
+    assert [matrix[0, 0] for matrix in loaded["Typeless"]] == [5.0, 2.0, 1.0]
+    # Only the row written behind the arena's back had to be decoded.
+    assert decoded == [_fingerprint(5.0)]
+
+
+def test_term_library_snapshot_is_reused_until_a_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "a.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(1.0),
+    )
+    store.add_manual_term("Pending")
+
+    snapshot = store.term_library_snapshot()
+    assert snapshot.active_terms == ("Typeless",)
+    assert snapshot.sample_counts == {"Typeless": 1}
+    assert snapshot.sample_lookup["Typeless"][0][0, 0] == 1.0
+    assert snapshot.embeddings.matrix.shape[0] == 1
+    assert snapshot.embeddings.rows["Typeless"].tolist() == [0]
+
+    def fail_connect() -> sqlite3.Connection:
+        raise AssertionError("snapshot read touched the database")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "_connect", fail_connect)
+        assert store.term_library_snapshot() is snapshot
+
+    second = store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "b.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(2.0),
+    )
+    updated = store.term_library_snapshot()
+    assert updated is not snapshot
+    assert updated.sample_counts == {"Typeless": 2}
+    assert updated.sample_ids["Typeless"][0] == second["sample_id"]
+    assert updated.embeddings.rows["Typeless"].tolist() == [0, 1]
+    np.testing.assert_array_equal(updated.embeddings.matrix[1], snapshot.embeddings.matrix[0])
+    assert snapshot.sample_counts == {"Typeless": 1}
+
+    store.delete_term("Typeless")
+    assert store.term_library_snapshot().active_terms == ()
+
+
+def test_term_library_snapshot_survives_the_stores_own_non_term_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "a.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(1.0),
+    )
+    snapshot = store.term_library_snapshot()
+
+    embedded: list[np.ndarray] = []
+    original_embed = history_store_module.embed_fingerprint
+    monkeypatch.setattr(
+        history_store_module, "embed_fingerprint", lambda matrix: embedded.append(matrix) or original_embed(matrix)
+    )
+    store.record_transcript(mode="light_edit", voice_text="hello", final_text="Hello", duration_seconds=1)
+    assert store.term_library_snapshot() is snapshot
+    store.record_term_match_outcomes([TermMatchOutcome("Typeless", 1.0, True)])
+    assert store.term_library_snapshot() is snapshot
+    assert embedded == []
+
+
+def test_term_library_snapshot_observes_external_writers(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    store = HistoryStore(db_path)
+    store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "a.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(1.0),
+    )
+    snapshot = store.term_library_snapshot()
+
+    other = HistoryStore(db_path)
+    other.add_term_sample(
+        term="Kubernetes",
+        audio_path=str(tmp_path / "b.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(2.0),
+    )
+
+    updated = store.term_library_snapshot()
+    assert updated is not snapshot
+    assert set(updated.active_terms) == {"Typeless", "Kubernetes"}
+    assert updated.sample_lookup["Kubernetes"][0][0, 0] == 2.0
+
+
+def test_delete_succeeds_when_the_arena_cannot_be_updated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    for value, term in ((1.0, "Typeless"), (2.0, "Typeless"), (3.0, "Kubernetes")):
+        store.add_term_sample(
+            term=term,
+            audio_path=str(tmp_path / f"{value}.wav"),
+            duration_ms=700,
+            quality_score=0.9,
+            mfcc_fingerprint=_fingerprint(value),
+        )
+    first_id = store.load_term_sample_ids(["Typeless"])["Typeless"][-1]
+
+    def failing_remove(self, sample_ids: set[int]) -> None:
+        raise OSError("arena locked")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(history_store_module.FingerprintArena, "remove", failing_remove)
+        assert store.delete_term_sample("Typeless", first_id)["sample_count"] == 1
+        assert store.delete_term("Kubernetes") is True
+
+    loaded = store.load_term_sample_matrices(["Typeless", "Kubernetes"])
+    assert [matrix[0, 0] for matrix in loaded["Typeless"]] == [2.0]
+    assert loaded["Kubernetes"] == []
+
+
+def test_two_stores_appending_to_one_arena_keep_each_others_rows(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    first = HistoryStore(db_path)
+    second = HistoryStore(db_path)
+
+    def add(store: HistoryStore, term: str, value: float) -> None:
+        store.add_term_sample(
+            term=term,
+            audio_path=str(tmp_path / f"{term}.wav"),
+            duration_ms=700,
+            quality_score=0.9,
+            mfcc_fingerprint=_fingerprint(value),
+        )
+
+    add(first, "T1", 1.0)
+    second.term_library_snapshot()
+    add(first, "T2", 2.0)
+    # The second store's arena was loaded before T2 was appended behind its back.
+    add(second, "T3", 3.0)
+    add(first, "T4", 4.0)
+
+    expected = {"T1": 1.0, "T2": 2.0, "T3": 3.0, "T4": 4.0}
+    for store in (first, second, HistoryStore(db_path)):
+        snapshot = store.term_library_snapshot()
+        assert {term: float(snapshot.sample_lookup[term][0][0, 0]) for term in expected} == expected
+
+
+def test_compact_fingerprint_rows_coexist_with_legacy_rows(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    legacy_store = HistoryStore(db_path)
+    legacy_store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "a.wav"),
+        duration_ms=700,
+        quality_score=0.9,
+        mfcc_fingerprint=_fingerprint(1.0),
+    )
+    assert legacy_store.term_library_snapshot().basis is None
+
+    rng = np.random.default_rng(3)
+    matrix = rng.standard_normal((120, 13)).astype(np.float32)
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+    compact_store = HistoryStore(db_path, fingerprint_encoding="int8", pca_components=8)
+    for term in ("Typeless", "Kubernetes"):
+        compact_store.add_term_sample(
+            term=term,
+            audio_path=str(tmp_path / f"{term}.wav"),
+            duration_ms=700,
+            quality_score=0.9,
+            mfcc_fingerprint=buffer.getvalue(),
+        )
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT fingerprint_format, LENGTH(mfcc_fingerprint) FROM term_samples ORDER BY id").fetchall()
+        bases = conn.execute("SELECT COUNT(*) FROM fingerprint_bases").fetchone()[0]
+    assert [row[0] for row in rows] == [1, 2, 2]
+    assert rows[1][1] * 3 < len(buffer.getvalue())
+    assert bases == 1
+
+    # The legacy store looked before any basis existed; it must not have cached that.
+    assert legacy_store.term_library_snapshot().basis is not None
+    fitted_late = compact_store.load_term_sample_matrices(["Typeless", "Kubernetes"])
+    assert [matrix.shape[1] for matrices in fitted_late.values() for matrix in matrices] == [9, 9, 9]
+
+    reopened = HistoryStore(db_path)
+    loaded = reopened.load_term_sample_matrices(["Typeless", "Kubernetes"])
+    basis = reopened.term_library_snapshot().basis
+    assert basis is not None
+    # Matrices stay in the profile's reduced space (8 coefficients plus the residual column),
+    # legacy rows included; exports still come back as 13-D float32.
+    assert loaded["Kubernetes"][0].shape == (120, 9)
+    np.testing.assert_allclose(loaded["Typeless"][1], basis.reduce(np.full((4, 13), 1.0)), atol=1e-5)
+    exported = reopened.load_term_sample_fingerprints(["Kubernetes"])["Kubernetes"][0]
+    np.testing.assert_allclose(basis.reduce(np.load(io.BytesIO(exported))), loaded["Kubernetes"][0], atol=1e-4)
+
+
+def test_term_match_stats_accumulate_and_persist(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    store = HistoryStore(db_path)
+    store.add_manual_term("Typeless")
+    store.record_term_match_outcomes(
+        [
+            TermMatchOutcome("Typeless", 1.0, True),
+            TermMatchOutcome("Typeless", 2.0, False),
+            TermMatchOutcome("Kubernetes", float("inf"), False),
+        ]
+    )
+
+    stats = store.get_term_match_stats()
+    assert stats["Typeless"].attempts == 2
+    assert stats["Typeless"].replacements == 1
+    assert stats["Typeless"].typical_distance == pytest.approx(1.2)
+    assert stats["Kubernetes"].typical_distance is None
+
+    reopened = HistoryStore(db_path).get_term_match_stats()
+    assert reopened == stats
+
+    store.delete_term("Typeless")
+    assert "Typeless" not in store.get_term_match_stats()
+    assert "Typeless" not in HistoryStore(db_path).get_term_match_stats()
+
+
+def test_term_match_stats_keep_every_concurrent_increment(tmp_path: Path) -> None:
+    db_path = tmp_path / "history.db"
+    stores = [HistoryStore(db_path), HistoryStore(db_path)]
+    for store in stores:
+        store.get_term_match_stats()
+
+    def record(store: HistoryStore) -> None:
+        for _ in range(25):
+            store.record_term_match_outcomes([TermMatchOutcome("Typeless", 1.0, True)])
+
+    threads = [threading.Thread(target=record, args=(stores[index % 2],)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = HistoryStore(db_path).get_term_match_stats()["Typeless"]
+    assert (stats.attempts, stats.replacements) == (150, 150)
+    assert stats.typical_distance == pytest.approx(1.0)
+
+
+def test_pending_sample_stays_inactive_until_fingerprint_completes(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    matrix = np.random.default_rng(3).normal(size=(40, 13)).astype(np.float32)
+    buffer = io.BytesIO()
+    np.save(buffer, matrix, allow_pickle=False)
+
+    added = store.add_term_sample(
+        term="Typeless",
+        audio_path=str(tmp_path / "sample.wav"),
+        duration_ms=800,
+        quality_score=0.9,
+        mfcc_fingerprint=None,
+    )
+    assert added["status"] == "pending"
+    assert added["fingerprint_pending"] is True
+    assert store.term_library_snapshot().active_terms == ()
+    assert store.export_terms_blob() == "Typeless\t1\tpending"
+    assert store.list_pending_term_samples() == [(added["sample_id"], str(tmp_path / "sample.wav"))]
+
+    assert store.complete_term_sample_fingerprint(added["sample_id"], buffer.getvalue()) is True
+    assert store.complete_term_sample_fingerprint(added["sample_id"], buffer.getvalue()) is False
+    snapshot = store.term_library_snapshot()
+    assert snapshot.active_terms == ("Typeless",)
+    np.testing.assert_array_equal(snapshot.sample_lookup["Typeless"][0], matrix)
+    assert store.list_pending_term_samples() == []
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from voice_text_organizer.mfcc import MfccExtractor, build_mel_filterbank, frame_signal
+
+
+def _write_tone(path: Path, *, frequency: float, seconds: float, sample_rate: int = 16000) -> None:
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / float(sample_rate)
+    pcm = np.clip(0.3 * np.sin(2.0 * math.pi * frequency * t) * 32767.0, -32768, 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+
+
+def test_frame_signal_returns_strided_view_matching_index_framing() -> None:
+    signal = np.arange(1000, dtype=np.float32)
+
+    frames = frame_signal(signal, 400, 160)
+
+    expected_count = 1 + math.ceil((1000 - 400) / 160)
+    assert frames.shape == (expected_count, 400)
+    assert frames[2, 0] == 320.0 and frames[3, -1] == 879.0 and frames[4, -1] == 0.0
+    assert not frames.flags.owndata
+
+
+def test_mel_filterbank_is_triangular_and_float32() -> None:
+    fbank = build_mel_filterbank(16000, 512)
+
+    assert fbank.shape == (26, 257)
+    assert fbank.dtype == np.float32
+    assert float(fbank.max()) == 1.0
+    assert np.all(fbank >= 0.0)
+
+
+def test_extractor_caches_plans_and_stays_float32() -> None:
+    extractor = MfccExtractor()
+    signal = np.random.default_rng(3).standard_normal(32000).astype(np.float32) * 0.1
+
+    matrix = extractor.compute(signal, 16000)
+
+    assert matrix.dtype == np.float32
+    assert matrix.shape == (199, 13)
+    assert extractor.plan(16000) is extractor.plan(16000)
+    assert extractor.plan(8000).frame_len == 200
+
+
+def test_extractor_batch_matches_single_file(tmp_path: Path) -> None:
+    paths = []
+    for index, (frequency, seconds) in enumerate([(320.0, 0.6), (880.0, 3.2), (1500.0, 0.02)]):
+        path = tmp_path / f"{index}.wav"
+        _write_tone(path, frequency=frequency, seconds=seconds)
+        paths.append(path)
+    extractor = MfccExtractor()
+
+    batch = extractor.compute_files(paths)
+
+    assert [matrix.shape[0] for matrix in batch] == [59, 220, 1]
+    for path, matrix in zip(paths, batch):
+        assert np.array_equal(matrix, extractor.compute_file(path))
@@ -1,16 +1,37 @@
 ﻿from __future__ import annotations
 
 import math
+import random
+import time
 import wave
+from difflib import SequenceMatcher
 from pathlib import Path
 
 import numpy as np
+import pytest
 
+from voice_text_organizer.embedding import build_sample_embeddings
+from voice_text_organizer.fingerprint_codec import (
+    FINGERPRINT_FORMAT_COMPACT,
+    decode_reduced_fingerprint,
+    encode_compact_fingerprint,
+    fit_pca_basis,
+)
+from voice_text_organizer.history_store import HistoryStore
+from voice_text_organizer.mfcc import write_wav_mono_pcm
 from voice_text_organizer.personalization import (
+    COLD_TERM_MIN_ATTEMPTS,
+    MAX_ACCEPTED_DISTANCE,
+    EnhanceStats,
+    TermMatchStats,
+    _collect_text_spans,
+    apply_replacements,
     build_mfcc_fingerprint_bytes,
     decode_mfcc_fingerprint_bytes,
     dtw_distance,
     enhance_voice_text,
+    locate_audio_region,
+    select_asr_hotwords,
     select_candidate_terms,
 )
 
@@ -62,6 +83,53 @@ def test_select_candidate_terms_prioritizes_text_similarity() -> None:
     assert len(candidates) == 2
 
 
+def _brute_force_candidates(voice_text: str, active_terms: list[str], max_candidates: int) -> list[tuple[str, str, float]]:
+    spans = _collect_text_spans(voice_text)
+    scored = []
+    for term in active_terms:
+        best_match, best_score = "", 0.0
+        for span in spans:
+            if term.lower() == span.lower():
+                best_match, best_score = span, 1.0
+                break
+            score = SequenceMatcher(None, term.lower(), span.lower()).ratio()
+            if score > best_score:
+                best_match, best_score = span, score
+        scored.append((best_score, term.lower(), term, best_match))
+    scored.sort(reverse=True)
+    return [(term, best_match, score) for score, _, term, best_match in scored[:max_candidates]]
+
+
+def test_select_candidate_terms_matches_brute_force_scoring() -> None:
+    rng = random.Random(8)
+    words = ["typeless", "kubernetes", "release", "notes", "deploy", "grafana", "vue", "sync"]
+    hanzi = "的是在不了有和人这中大为上个国我以要他时来用们生到作地"
+    terms = words[:5] + ["".join(rng.choice(hanzi) for _ in range(rng.randint(2, 4))) for _ in range(150)]
+    terms += ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 9))) for _ in range(150)]
+
+    for trial in range(12):
+        if trial % 2:
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(2, 9)))
+        else:
+            text = "".join(rng.choice(hanzi) for _ in range(rng.randint(4, 24))) + " " + rng.choice(words)
+
+        candidates = select_candidate_terms(text, terms, max_candidates=20)
+
+        observed = [(item["term"], item["best_match"], item["text_score"]) for item in candidates]
+        assert observed == _brute_force_candidates(text, terms, 20)
+
+
+def test_apply_replacements_rewrites_once_without_overlaps() -> None:
+    text = "Type less and type less, then cube notes"
+
+    rewritten = apply_replacements(
+        text,
+        [("type less", "Typeless"), ("less and", "Lessand"), ("type less", "TYPELESS"), ("cube notes", "Kubernetes")],
+    )
+
+    assert rewritten == "Typeless and TYPELESS, then Kubernetes"
+
+
 def test_enhance_voice_text_replaces_match_when_confident(tmp_path: Path) -> None:
     wav = tmp_path / "term.wav"
     _write_sine(wav, frequency=520.0)
@@ -93,3 +161,358 @@ def test_enhance_voice_text_returns_original_on_timeout(tmp_path: Path) -> None:
     )
 
     assert enhanced == original
+
+
+def test_enhance_voice_text_prunes_hopeless_comparisons(tmp_path: Path) -> None:
+    wav = tmp_path / "term.wav"
+    _write_sine(wav, frequency=520.0)
+    noisy = tmp_path / "noisy.wav"
+    _write_sine(noisy, frequency=3100.0, seconds=1.1)
+    fp = build_mfcc_fingerprint_bytes(wav)
+    noisy_fp = build_mfcc_fingerprint_bytes(noisy)
+
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="type less release is ready",
+        audio_path=wav,
+        active_terms=["Typeless", "Kubernetes"],
+        sample_lookup={"Typeless": [noisy_fp, fp], "Kubernetes": [fp, fp]},
+        timeout_ms=900,
+        stats=stats,
+    )
+
+    assert "Typeless" in enhanced
+    assert stats.pairs == 4
+    assert stats.skipped_pairs == 2
+    assert stats.scored_pairs == 1
+    assert stats.pruned_pairs + stats.abandoned_pairs == 1
+    assert stats.timed_out is False
+
+
+def test_enhance_voice_text_checks_deadline_while_gathering_candidates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    wav = tmp_path / "term.wav"
+    _write_sine(wav, frequency=520.0)
+    fp = build_mfcc_fingerprint_bytes(wav)
+    decoded: list[bytes] = []
+
+    def slow_decode(blob: bytes) -> np.ndarray:
+        decoded.append(blob)
+        time.sleep(0.08)
+        return decode_mfcc_fingerprint_bytes(blob)
+
+    monkeypatch.setattr("voice_text_organizer.personalization.decode_mfcc_fingerprint_bytes", slow_decode)
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="type less and type set release",
+        active_terms=["Typeless", "Typeset"],
+        sample_lookup={"Typeless": [fp], "Typeset": [fp]},
+        timeout_ms=50,
+        stats=stats,
+        query_matrix=decode_mfcc_fingerprint_bytes(fp),
+    )
+
+    assert enhanced == "type less and type set release"
+    assert stats.timed_out is True
+    assert len(decoded) == 1
+    assert stats.scored_pairs == 0
+
+
+def test_enhance_voice_text_approximate_mode_still_replaces(tmp_path: Path) -> None:
+    wav = tmp_path / "term.wav"
+    _write_sine(wav, frequency=520.0)
+    fp = build_mfcc_fingerprint_bytes(wav)
+
+    enhanced = enhance_voice_text(
+        voice_text="type less release is ready",
+        audio_path=wav,
+        active_terms=["Typeless"],
+        sample_lookup={"Typeless": [fp]},
+        timeout_ms=900,
+        dtw_mode="approximate",
+    )
+
+    assert "Typeless" in enhanced
+
+
+def test_enhance_voice_text_rejects_unknown_dtw_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="dtw mode"):
+        enhance_voice_text(
+            voice_text="type less",
+            audio_path=tmp_path / "missing.wav",
+            active_terms=["Typeless"],
+            sample_lookup={},
+            dtw_mode="fuzzy",  # type: ignore[arg-type]
+        )
+
+
+def test_locate_audio_region_scales_with_term_not_recording() -> None:
+    text = "x" * 90 + "type less" + "x" * 1
+    start, end = locate_audio_region(text, "Type Less", total_frames=1000, term_frames=40)
+
+    assert start == 900 - 90
+    assert end == 1000
+    assert locate_audio_region("short", "missing", total_frames=300, term_frames=40) == (0, 300)
+
+    assert locate_audio_region("a" * 10 + "type less" + "a" * 81, "type less", 1000, 40) == (10, 280)
+
+
+def _chirp(start_hz: float, end_hz: float, seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate), dtype=np.float64) / float(sample_rate)
+    phase = start_hz * t + (end_hz - start_hz) * t * t / (2.0 * seconds)
+    return (0.3 * np.sin(2.0 * math.pi * phase)).astype(np.float32)
+
+
+def _write_pcm(path: Path, signal: np.ndarray, sample_rate: int = 16000) -> None:
+    pcm = np.clip(signal * 32767.0, -32768, 32767).astype(np.int16)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+
+
+def test_enhance_voice_text_subsequence_mode_finds_term_in_long_recording(tmp_path: Path) -> None:
+    term = _chirp(300.0, 2400.0, 0.8)
+    term_wav = tmp_path / "term.wav"
+    _write_pcm(term_wav, term)
+    other_wav = tmp_path / "other.wav"
+    _write_pcm(other_wav, _chirp(2600.0, 500.0, 0.8))
+    long_wav = tmp_path / "long.wav"
+    _write_pcm(long_wav, np.concatenate([_chirp(150.0, 900.0, 2.4), term, _chirp(3000.0, 1200.0, 2.4)]))
+
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="we shipped it, the type less release is out now",
+        audio_path=long_wav,
+        active_terms=["Typeless"],
+        sample_lookup={"Typeless": [build_mfcc_fingerprint_bytes(term_wav)]},
+        timeout_ms=900,
+        stats=stats,
+        dtw_mode="subsequence",
+    )
+    assert enhanced == "we shipped it, the Typeless release is out now"
+    assert stats.scored_pairs == 1
+
+    unrelated = enhance_voice_text(
+        voice_text="we shipped it, the type less release is out now",
+        audio_path=long_wav,
+        active_terms=["Typeless"],
+        sample_lookup={"Typeless": [build_mfcc_fingerprint_bytes(other_wav)]},
+        timeout_ms=900,
+        dtw_mode="subsequence",
+    )
+    assert unrelated == "we shipped it, the type less release is out now"
+
+
+def test_enhance_voice_text_subsequence_mode_matches_decimated_sample_rate(tmp_path: Path) -> None:
+    term = np.concatenate([_chirp(300.0, 2400.0, 1.0), _chirp(2400.0, 800.0, 1.0), _chirp(800.0, 1800.0, 1.2)])
+    term_wav = tmp_path / "term.wav"
+    _write_pcm(term_wav, term)
+    long_wav = tmp_path / "long.wav"
+    _write_pcm(long_wav, np.concatenate([_chirp(150.0, 900.0, 2.4), term, _chirp(3000.0, 1200.0, 2.4)]))
+    sample = decode_mfcc_fingerprint_bytes(build_mfcc_fingerprint_bytes(term_wav))
+    assert sample.shape[0] == 220
+
+    distances = []
+    for durations in (None, {"Typeless": [3200]}):
+        stats = EnhanceStats()
+        enhanced = enhance_voice_text(
+            voice_text="we shipped it, the type less release is out now",
+            audio_path=long_wav,
+            active_terms=["Typeless"],
+            sample_lookup={"Typeless": [sample]},
+            stats=stats,
+            dtw_mode="subsequence",
+            sample_durations_ms=durations,
+        )
+        assert enhanced == "we shipped it, the Typeless release is out now"
+        distances.append(stats.outcomes[0].best_distance)
+
+    assert distances[1] < distances[0] - 0.1
+
+
+def test_enhance_voice_text_scores_reduced_pca_samples(tmp_path: Path) -> None:
+    term = _chirp(300.0, 2400.0, 0.8)
+    long_wav = tmp_path / "long.wav"
+    _write_pcm(long_wav, np.concatenate([_chirp(150.0, 900.0, 2.4), term, _chirp(3000.0, 1200.0, 2.4)]))
+    matrices = []
+    for index, signal in enumerate([term, _chirp(2600.0, 500.0, 0.8), _chirp(500.0, 900.0, 0.8)]):
+        path = tmp_path / f"sample-{index}.wav"
+        _write_pcm(path, signal)
+        matrices.append(decode_mfcc_fingerprint_bytes(build_mfcc_fingerprint_bytes(path)))
+    basis = fit_pca_basis(matrices, 8)
+    assert basis is not None
+    reduced = [
+        decode_reduced_fingerprint(encode_compact_fingerprint(matrix, "int8", basis), FINGERPRINT_FORMAT_COMPACT, basis)
+        for matrix in matrices
+    ]
+
+    for sample, expected in ((reduced[0], "Typeless"), (reduced[1], "type less")):
+        enhanced = enhance_voice_text(
+            voice_text="we shipped it, the type less release is out now",
+            audio_path=long_wav,
+            active_terms=["Typeless"],
+            sample_lookup={"Typeless": [sample]},
+            dtw_mode="subsequence",
+            basis=basis,
+        )
+        assert enhanced == f"we shipped it, the {expected} release is out now"
+
+
+def test_enhance_voice_text_embedding_prefilter_limits_dtw_pairs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    term = _chirp(300.0, 2400.0, 0.8)
+    long_wav = tmp_path / "long.wav"
+    _write_pcm(long_wav, np.concatenate([_chirp(150.0, 900.0, 2.4), term, _chirp(3000.0, 1200.0, 2.4)]))
+
+    matrices = []
+    for index, signal in enumerate([term, _chirp(2600.0, 500.0, 0.8), _chirp(500.0, 900.0, 0.8)]):
+        path = tmp_path / f"sample-{index}.wav"
+        _write_pcm(path, signal)
+        matrices.append(decode_mfcc_fingerprint_bytes(build_mfcc_fingerprint_bytes(path)))
+    sample_lookup = {"Typeless": [matrices[1], matrices[0], matrices[2]]}
+
+    monkeypatch.setattr("voice_text_organizer.personalization.EMBEDDING_TOP_K", 1)
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="we shipped it, the type less release is out now",
+        audio_path=long_wav,
+        active_terms=["Typeless"],
+        sample_lookup=sample_lookup,
+        timeout_ms=900,
+        stats=stats,
+        dtw_mode="subsequence",
+        embeddings=build_sample_embeddings(sample_lookup),
+    )
+
+    assert enhanced == "we shipped it, the Typeless release is out now"
+    assert stats.filtered_pairs == 2
+    assert stats.scored_pairs == 1
+
+
+def test_select_candidate_terms_tries_losing_terms_last() -> None:
+    terms = ["Typeless", "Typeset"]
+    plain = select_candidate_terms("typeles typese", terms, max_candidates=2)
+    assert [item["term"] for item in plain] == ["Typeless", "Typeset"]
+
+    history = {"Typeless": TermMatchStats(attempts=20, replacements=0)}
+    adaptive = select_candidate_terms("typeles typese", terms, max_candidates=2, match_stats=history)
+    assert [item["term"] for item in adaptive] == ["Typeset", "Typeless"]
+    assert {item["term"] for item in adaptive} == {item["term"] for item in plain}
+
+
+def test_enhance_voice_text_skips_terms_that_recorded_outcomes_turned_cold(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    wav = tmp_path / "term.wav"
+    _write_sine(wav, frequency=520.0)
+    noise = tmp_path / "noise.wav"
+    rng = np.random.default_rng(0)
+    write_wav_mono_pcm(noise, (rng.standard_normal(12800) * 3000).astype(np.int16), 16000)
+    store = HistoryStore(tmp_path / "history.db")
+    request = {
+        "voice_text": "type less release is ready",
+        "audio_path": wav,
+        "active_terms": ["Typeless"],
+        "sample_lookup": {"Typeless": [build_mfcc_fingerprint_bytes(noise)]},
+        "timeout_ms": 900,
+    }
+
+    for _ in range(COLD_TERM_MIN_ATTEMPTS):
+        assert not store.get_term_match_stats().get("Typeless", TermMatchStats()).is_cold(MAX_ACCEPTED_DISTANCE)
+        stats = EnhanceStats()
+        enhanced = enhance_voice_text(**request, stats=stats, match_stats=store.get_term_match_stats())
+        assert enhanced == request["voice_text"]
+        assert stats.cold_skipped_pairs == 0
+        store.record_term_match_outcomes(stats.outcomes)
+
+    history = store.get_term_match_stats()
+    assert history["Typeless"].typical_distance == pytest.approx(MAX_ACCEPTED_DISTANCE)
+    assert history["Typeless"].is_cold(MAX_ACCEPTED_DISTANCE)
+    assert not history["Typeless"].is_cold(MAX_ACCEPTED_DISTANCE + 0.5)
+
+    monkeypatch.setattr("voice_text_organizer.personalization.DEADLINE_PRESSURE_RATIO", 0.0)
+    pressured = EnhanceStats()
+    assert enhance_voice_text(**request, stats=pressured, match_stats=history) == request["voice_text"]
+    assert pressured.cold_skipped_pairs == 1
+    assert pressured.scored_pairs == pressured.abandoned_pairs == 0
+    assert pressured.outcomes == []
+
+
+def test_enhance_voice_text_replaces_proven_long_homophones_without_audio(tmp_path: Path) -> None:
+    wav = tmp_path / "spoken.wav"
+    _write_sine(wav)
+    request = {
+        "voice_text": "会议纪要发到非书文档",
+        "audio_path": wav,
+        "active_terms": ["飞书文档"],
+        "sample_lookup": {"飞书文档": []},
+        "timeout_ms": 900,
+    }
+
+    stats = EnhanceStats()
+    proven = {"飞书文档": TermMatchStats(attempts=COLD_TERM_MIN_ATTEMPTS, replacements=COLD_TERM_MIN_ATTEMPTS)}
+    assert enhance_voice_text(**request, stats=stats, match_stats=proven) == "会议纪要发到飞书文档"
+    assert stats.phonetic_replacements == 1
+    assert stats.pairs == 0
+
+    # Without a track record (or with a poor one) it needs an acoustic match, and this term has no samples.
+    unproven = {"飞书文档": TermMatchStats(attempts=COLD_TERM_MIN_ATTEMPTS, replacements=1)}
+    for history in (None, unproven):
+        unchecked = EnhanceStats()
+        assert enhance_voice_text(**request, stats=unchecked, match_stats=history) == request["voice_text"]
+        assert unchecked.phonetic_replacements == 0
+
+
+def test_enhance_voice_text_keeps_unproven_homophones_the_audio_does_not_support(tmp_path: Path) -> None:
+    wav = tmp_path / "spoken.wav"
+    _write_sine(wav, frequency=520.0)
+    noise = tmp_path / "sample.wav"
+    write_wav_mono_pcm(noise, (np.random.default_rng(3).standard_normal(12800) * 3000).astype(np.int16), 16000)
+
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="会议纪要发到非书文档",
+        audio_path=wav,
+        active_terms=["飞书文档"],
+        sample_lookup={"飞书文档": [build_mfcc_fingerprint_bytes(noise)]},
+        timeout_ms=900,
+        stats=stats,
+    )
+
+    assert enhanced == "会议纪要发到非书文档"
+    assert stats.phonetic_replacements == 0
+    assert [(outcome.term, outcome.replaced) for outcome in stats.outcomes] == [("飞书文档", False)]
+
+
+def test_enhance_voice_text_sends_short_homophones_to_acoustic_check(tmp_path: Path) -> None:
+    wav = tmp_path / "term.wav"
+    _write_sine(wav, frequency=520.0)
+    fp = build_mfcc_fingerprint_bytes(wav)
+
+    stats = EnhanceStats()
+    enhanced = enhance_voice_text(
+        voice_text="今天用钉丁开会",
+        audio_path=wav,
+        active_terms=["钉钉"],
+        sample_lookup={"钉钉": [fp]},
+        timeout_ms=900,
+        stats=stats,
+    )
+
+    assert enhanced == "今天用钉钉开会"
+    assert stats.phonetic_replacements == 0
+    assert stats.scored_pairs == 1
+
+
+def test_select_asr_hotwords_puts_frequently_corrected_terms_first() -> None:
+    history = {
+        "Kubernetes": TermMatchStats(attempts=10, replacements=6),
+        "Typeless": TermMatchStats(attempts=10, replacements=2),
+    }
+    active = ["OpenAI", "Typeless", "SiliconFlow", "Kubernetes"]
+
+    assert select_asr_hotwords(active, history, limit=3) == ["Kubernetes", "Typeless", "OpenAI"]
+    assert select_asr_hotwords(active, None, limit=2) == ["OpenAI", "Typeless"]
+    assert select_asr_hotwords(active, history, limit=0) == []
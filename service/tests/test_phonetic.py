@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from voice_text_organizer.personalization import _collect_text_spans
+from voice_text_organizer.phonetic import PhoneticIndex, char_readings, fuzzy_syllable, phonetic_similarity, text_readings
+
+
+def test_char_readings_are_toneless_and_keep_heteronyms() -> None:
+    assert char_readings("飞") == ("fei",)
+    assert set(char_readings("行")) == {"xing", "hang"}
+    assert "lv" in char_readings("绿")
+    assert char_readings("A") == ()
+    assert text_readings("飞书A") is None
+
+
+def test_fuzzy_syllables_fold_common_confusions() -> None:
+    assert fuzzy_syllable("zhang") == fuzzy_syllable("zan")
+    assert fuzzy_syllable("ling") == fuzzy_syllable("nin")
+    assert fuzzy_syllable("shi") == fuzzy_syllable("si") == "si"
+
+    exact = phonetic_similarity(text_readings("飞书"), text_readings("非书"))
+    fuzzy = phonetic_similarity(text_readings("飞书"), text_readings("非苏"))
+    assert exact == 1.0
+    assert fuzzy == 0.75
+    assert phonetic_similarity(text_readings("飞书"), text_readings("飞机")) == 0.0
+
+
+def test_phonetic_index_finds_homophone_spans() -> None:
+    index = PhoneticIndex(["飞书文档", "腾讯会议", "Typeless", "钉钉"])
+    text = "请把会议纪要发到非书文档，然后开滕讯会义"
+
+    matches = index.best_matches(_collect_text_spans(text))
+
+    assert matches["飞书文档"] == ("非书文档", 1.0)
+    assert matches["腾讯会议"] == ("滕讯会义", 1.0)
+    assert "Typeless" not in matches
+    assert index.best_matches(_collect_text_spans("飞书文档已更新")) == {}
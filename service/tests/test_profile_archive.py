@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import wave
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from voice_text_organizer import profile_archive
+from voice_text_organizer.history_store import HistoryStore
+from voice_text_organizer.profile_archive import (
+    analyze_sample_files,
+    iter_profile_archive,
+    prepare_import,
+    read_archive_entries,
+    scan_sample_directory,
+)
+
+
+def _write_chirp(path: Path, *, start_hz: float, seconds: float = 0.8, sample_rate: int = 16000) -> None:
+    t = np.arange(int(seconds * sample_rate), dtype=np.float64) / sample_rate
+    signal = 0.3 * np.sin(2.0 * np.pi * (start_hz + 400.0 * t) * t)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((signal * 32767.0).astype(np.int16).tobytes())
+
+
+def test_profile_archive_round_trips_terms_samples_and_fingerprints(tmp_path: Path) -> None:
+    source = HistoryStore(tmp_path / "source" / "history.db")
+    source.add_manual_term("NoSamples")
+    for index, term in enumerate(["Typeless", "Typeless", "Kubernetes"]):
+        wav = tmp_path / "source" / f"{index}.wav"
+        _write_chirp(wav, start_hz=200.0 + 150.0 * index)
+        fingerprint, quality = profile_archive.analyze_sample_file(str(wav))
+        source.add_term_sample(
+            term=term,
+            audio_path=str(wav),
+            duration_ms=int(quality["duration_ms"]),
+            quality_score=float(quality["quality_score"]),
+            mfcc_fingerprint=fingerprint,
+        )
+
+    blob = b"".join(iter_profile_archive(source.export_profile()))
+    with zipfile.ZipFile(io.BytesIO(blob)) as archive:
+        terms, entries = read_archive_entries(archive)
+        assert sorted(terms) == ["Kubernetes", "NoSamples", "Typeless"]
+        assert all(entry.fingerprint is not None for entry in entries)
+        records, errors = prepare_import(entries, lambda term: tmp_path / "target" / term, archive=archive)
+    assert errors == []
+
+    target = HistoryStore(tmp_path / "target" / "history.db")
+    result = target.import_term_samples(terms, records)
+    assert result["imported"] == 3
+    assert result["skipped_paths"] == []
+    assert "NoSamples\t0\tpending" in target.export_terms_blob()
+
+    expected = source.term_library_snapshot()
+    imported = target.term_library_snapshot()
+    assert imported.sample_counts == expected.sample_counts
+    for term, matrices in expected.sample_lookup.items():
+        for left, right in zip(sorted(matrices, key=len), sorted(imported.sample_lookup[term], key=len)):
+            np.testing.assert_array_equal(left, right)
+
+
+def test_read_archive_entries_rejects_unknown_version() -> None:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("manifest.json", '{"version": 99, "terms": [], "samples": []}')
+    with zipfile.ZipFile(buffer) as archive, pytest.raises(ValueError, match="version"):
+        read_archive_entries(archive)
+
+
+def test_directory_import_fingerprints_in_parallel_and_reports_bad_files(tmp_path: Path) -> None:
+    for index in range(9):
+        _write_chirp(tmp_path / "incoming" / f"Term{index % 3}" / f"{index}.wav", start_hz=180.0 + 40.0 * index)
+    (tmp_path / "incoming" / "Term0" / "broken.wav").write_bytes(b"not a wav")
+
+    terms, entries = scan_sample_directory(tmp_path / "incoming")
+    assert terms == ["Term0", "Term1", "Term2"]
+    records, errors = prepare_import(entries, lambda term: tmp_path / "samples" / term, workers=2)
+
+    assert len(records) == 9
+    assert len(errors) == 1 and "broken.wav" in errors[0]
+    assert sorted(path.name for path in (tmp_path / "samples" / "Term0").iterdir()) == sorted(
+        Path(record["audio_path"]).name for record in records if record["term"] == "Term0"
+    )
+    sequential = analyze_sample_files([records[0]["audio_path"]], workers=1)[0]
+    assert not isinstance(sequential, str)
+    assert sequential[0] == records[0]["mfcc_fingerprint"]
+
+
+def test_import_term_samples_caps_samples_per_term(tmp_path: Path) -> None:
+    store = HistoryStore(tmp_path / "history.db")
+    records = [
+        {"term": "Typeless", "audio_path": f"s{index}.wav", "duration_ms": 500, "quality_score": 0.9, "mfcc_fingerprint": None}
+        for index in range(7)
+    ]
+
+    result = store.import_term_samples(["Typeless"], records)
+
+    assert result["imported"] == 5
+    assert result["skipped_paths"] == ["s5.wav", "s6.wav"]
+    assert len(store.list_pending_term_samples()) == 5
@@ -1,9 +1,18 @@
-﻿from pathlib import Path
+﻿import threading
+from pathlib import Path
 
+import numpy as np
+
+from voice_text_organizer.audio import RecordedAudio
 from voice_text_organizer.main import store
+from voice_text_organizer.personalization import PersonalizationContext
 from voice_text_organizer.template_classifier import TemplateClassification
 
 
+def _recorded_audio() -> RecordedAudio:
+    return RecordedAudio.from_pcm(np.zeros(16000, dtype=np.int16), 16000)
+
+
 def test_record_start_and_stop_returns_voice_and_final_text(client, monkeypatch) -> None:
     monkeypatch.setattr(
         "voice_text_organizer.main.transcribe_audio",
@@ -12,8 +21,8 @@ def test_record_start_and_stop_returns_voice_and_final_text(client, monkeypatch)
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
     monkeypatch.setattr(
-        "voice_text_organizer.main.recorder.stop",
-        lambda _session_id: Path("dummy.wav"),
+        "voice_text_organizer.main.recorder.stop_audio",
+        lambda _session_id: _recorded_audio(),
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
@@ -55,13 +64,13 @@ def test_record_stop_duplicate_call_returns_404(client, monkeypatch) -> None:
 
     state = {"stopped": False}
 
-    def fake_stop(_session_id: str) -> Path:
+    def fake_stop(_session_id: str) -> RecordedAudio:
         if state["stopped"]:
             raise KeyError(_session_id)
         state["stopped"] = True
-        return Path("dummy.wav")
+        return _recorded_audio()
 
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", fake_stop, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", fake_stop, raising=False)
 
     start = client.post("/v1/record/start", json={})
     assert start.status_code == 200
@@ -96,7 +105,7 @@ def test_record_stop_selected_text_translate_command_uses_rewrite(client, monkey
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
 
@@ -125,7 +134,7 @@ def test_record_stop_explicit_task_command_uses_rewrite(client, monkeypatch) ->
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
 
@@ -155,7 +164,7 @@ def test_record_stop_classifier_low_confidence_falls_back_light_edit(client, mon
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
     monkeypatch.setattr(
@@ -194,7 +203,7 @@ def test_record_stop_template_rewrite_error_falls_back_to_light_edit(client, mon
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
     monkeypatch.setattr(
@@ -231,7 +240,7 @@ def test_record_stop_default_language_hint_prefers_chinese(client, monkeypatch)
 
     monkeypatch.setattr("voice_text_organizer.main.transcribe_audio", fake_transcribe, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.route_rewrite", lambda *_args, **_kwargs: "中文转录结果", raising=False)
@@ -254,7 +263,7 @@ def test_record_stop_honors_explicit_language_hint(client, monkeypatch) -> None:
 
     monkeypatch.setattr("voice_text_organizer.main.transcribe_audio", fake_transcribe, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.route_rewrite", lambda *_args, **_kwargs: "english transcript", raising=False)
@@ -277,12 +286,12 @@ def test_record_stop_applies_personalized_acoustic_when_enabled(client, monkeypa
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", True, raising=False)
     monkeypatch.setattr(
         "voice_text_organizer.main._apply_personalized_acoustic",
-        lambda voice_text, audio_path: "Typeless release",
+        lambda voice_text, audio_path, prefetch=None: "Typeless release",
         raising=False,
     )
     monkeypatch.setattr(
@@ -308,7 +317,7 @@ def test_record_stop_skips_personalized_acoustic_when_disabled(client, monkeypat
         raising=False,
     )
     monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
-    monkeypatch.setattr("voice_text_organizer.main.recorder.stop", lambda _session_id: Path("dummy.wav"), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
     monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
     monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", False, raising=False)
     monkeypatch.setattr(
@@ -330,3 +339,155 @@ def test_record_stop_skips_personalized_acoustic_when_disabled(client, monkeypat
     stop = client.post("/v1/record/stop", json={"session_id": session_id, "mode": "cloud"})
     assert stop.status_code == 200
     assert stop.json()["voice_text"] == "type less release"
+
+
+def test_record_stop_prefetches_personalization_during_asr(client, monkeypatch) -> None:
+    prefetched = threading.Event()
+    query_matrix = np.zeros((4, 13), dtype=np.float32)
+
+    def fake_transcribe(_path, language_hint="auto"):
+        # ASR only returns once the prefetch worker has run, so the two must overlap.
+        assert prefetched.wait(timeout=5)
+        return "type less release"
+
+    def fake_prepare(audio_path):
+        prefetched.set()
+        return PersonalizationContext(
+            active_terms=["Typeless"],
+            sample_lookup={"Typeless": [query_matrix]},
+            query_matrix=query_matrix,
+        )
+
+    observed = {}
+
+    def fake_enhance(**kwargs):
+        observed.update(kwargs)
+        return "Typeless release"
+
+    monkeypatch.setattr("voice_text_organizer.main.transcribe_audio", fake_transcribe, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", True, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._prepare_personalization", fake_prepare, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.enhance_voice_text", fake_enhance, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main._resolve_final_text",
+        lambda **kwargs: kwargs["voice_text"],
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
+
+    start = client.post("/v1/record/start", json={})
+    session_id = start.json()["session_id"]
+
+    stop = client.post("/v1/record/stop", json={"session_id": session_id, "mode": "cloud"})
+    assert stop.status_code == 200
+    assert stop.json()["voice_text"] == "Typeless release"
+    assert observed["query_matrix"] is query_matrix
+    assert observed["active_terms"] == ["Typeless"]
+
+
+def test_record_stop_passes_term_hints_and_counts_corrections(client, monkeypatch) -> None:
+    observed: dict[str, object] = {}
+
+    def fake_transcribe(_path, language_hint="auto", hotwords=None):
+        observed["hotwords"] = hotwords
+        return "typeless release"
+
+    effect = {"hinted_requests": 0, "hinted_changed": 0, "plain_requests": 0, "plain_changed": 0}
+    monkeypatch.setattr("voice_text_organizer.main.transcribe_audio", fake_transcribe, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._asr_hotwords", lambda: ["Typeless"], raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.asr_prompt_rejected", lambda _url: False, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.personalization_effect", effect, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.stop_audio", lambda _session_id: _recorded_audio(), raising=False)
+    monkeypatch.setattr("voice_text_organizer.main._safe_unlink", lambda _path: None, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", True, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main._apply_personalized_acoustic",
+        lambda voice_text, audio_path, prefetch=None: "Typeless release",
+        raising=False,
+    )
+    monkeypatch.setattr(
+        "voice_text_organizer.main._resolve_final_text",
+        lambda **kwargs: kwargs["voice_text"],
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
+
+    session_id = client.post("/v1/record/start", json={}).json()["session_id"]
+    stop = client.post("/v1/record/stop", json={"session_id": session_id, "mode": "cloud"})
+
+    assert stop.status_code == 200
+    assert observed["hotwords"] == ["Typeless"]
+    assert effect == {"hinted_requests": 1, "hinted_changed": 1, "plain_requests": 0, "plain_changed": 0}
+
+
+def test_record_stop_uploads_vad_trimmed_audio_from_memory(client, monkeypatch) -> None:
+    time_axis = np.arange(16000) / 16000.0
+    speech = np.sin(2.0 * np.pi * 220.0 * time_axis) * 6000.0
+    pcm = np.concatenate([np.zeros(32000), speech, np.zeros(48000)]).astype(np.int16)
+    uploads: list[RecordedAudio] = []
+
+    def fake_transcribe(audio, language_hint="auto"):
+        uploads.append(audio)
+        return "spoken words"
+
+    monkeypatch.setattr("voice_text_organizer.main.transcribe_audio", fake_transcribe, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main.recorder.stop_audio",
+        lambda _session_id: RecordedAudio.from_pcm(pcm, 16000),
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.settings.vad_trim_enabled", True, raising=False)
+    monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", False, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main._resolve_final_text",
+        lambda **kwargs: kwargs["voice_text"],
+        raising=False,
+    )
+    durations: list[int] = []
+    monkeypatch.setattr(
+        "voice_text_organizer.main.history_store.record_transcript",
+        lambda **kwargs: durations.append(kwargs["duration_seconds"]),
+        raising=False,
+    )
+
+    session_id = client.post("/v1/record/start", json={}).json()["session_id"]
+    stop = client.post("/v1/record/stop", json={"session_id": session_id, "mode": "cloud"})
+
+    assert stop.status_code == 200
+    assert uploads[0].path is None
+    assert 16000 <= uploads[0].pcm.size < pcm.size // 2
+    assert durations == [6]
+
+
+def test_record_stop_removes_streamed_recording_file(client, monkeypatch, tmp_path: Path) -> None:
+    from voice_text_organizer.mfcc import write_wav_mono_pcm
+
+    audio_path = tmp_path / "session.wav"
+    write_wav_mono_pcm(audio_path, np.zeros(16000, dtype=np.int16), 16000)
+    monkeypatch.setattr(
+        "voice_text_organizer.main.transcribe_audio",
+        lambda _audio, language_hint="auto": "spoken words",
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.recorder.start", lambda _session_id: None, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main.recorder.stop_audio",
+        lambda _session_id: RecordedAudio.from_wav(audio_path),
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.settings.personalized_acoustic_enabled", False, raising=False)
+    monkeypatch.setattr(
+        "voice_text_organizer.main._resolve_final_text",
+        lambda **kwargs: kwargs["voice_text"],
+        raising=False,
+    )
+    monkeypatch.setattr("voice_text_organizer.main.history_store.record_transcript", lambda **_kwargs: None, raising=False)
+
+    session_id = client.post("/v1/record/start", json={}).json()["session_id"]
+    assert client.post("/v1/record/stop", json={"session_id": session_id, "mode": "cloud"}).status_code == 200
+    assert not audio_path.exists()
@@ -6,7 +6,8 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from voice_text_organizer.main import _evaluate_sample_audio_quality
+from voice_text_organizer.sample_quality import evaluate_sample_audio_quality
+from voice_text_organizer.mfcc import read_wav_mono_pcm
 
 
 def _write_pcm16_wav(path: Path, pcm: np.ndarray, sample_rate: int = 16000) -> None:
@@ -32,7 +33,7 @@ def test_sample_quality_accepts_quiet_but_audible_voice(tmp_path: Path) -> None:
     audio_path = tmp_path / "quiet-audible.wav"
     _write_pcm16_wav(audio_path, pcm, sample_rate=sample_rate)
 
-    quality = _evaluate_sample_audio_quality(audio_path)
+    quality = evaluate_sample_audio_quality(*read_wav_mono_pcm(audio_path))
     assert quality["duration_ms"] >= 1100
     assert quality["quality_score"] > 0.0
 
@@ -50,4 +51,4 @@ def test_sample_quality_rejects_near_silence(tmp_path: Path) -> None:
     _write_pcm16_wav(audio_path, pcm, sample_rate=sample_rate)
 
     with pytest.raises(ValueError, match="sample volume too low"):
-        _evaluate_sample_audio_quality(audio_path)
+        evaluate_sample_audio_quality(*read_wav_mono_pcm(audio_path))
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import random
+from difflib import SequenceMatcher
+
+from voice_text_organizer.term_index import AhoCorasick, TermIndex
+
+
+def test_pair_bounds_never_undercut_sequence_matcher_ratio() -> None:
+    rng = random.Random(4)
+    alphabet = "abcde 的是在不了"
+    terms = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7))) for _ in range(80)] + ["", "xyz"]
+    spans = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 9))) for _ in range(30)]
+
+    positions, bounds = TermIndex(terms).pair_bounds(spans)
+
+    assert 80 not in positions.tolist() and 81 not in positions.tolist()
+    for row, position in enumerate(positions.tolist()):
+        for column, span in enumerate(spans):
+            assert bounds[row, column] >= SequenceMatcher(None, terms[position].lower(), span.lower()).ratio()
+
+
+def test_aho_corasick_reports_overlapping_matches() -> None:
+    automaton = AhoCorasick(["he", "she", "his", "hers", ""])
+
+    matches = sorted(automaton.iter_matches("ushers"))
+
+    assert matches == [(1, 1), (2, 0), (2, 3)]
+
+
+def test_present_terms_is_case_insensitive_and_rebuilt_per_index() -> None:
+    index = TermIndex(["Typeless", "K8s", "发布"])
+
+    assert index.present_terms("typeless 发布 ready") == {"Typeless", "发布"}
+    assert index.present_terms("İstanbul k8S") == {"K8s"}
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from voice_text_organizer.vad import VAD_PADDING_MS, trim_silence
+
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float, amplitude: float = 6000.0) -> np.ndarray:
+    time_axis = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return np.sin(2.0 * np.pi * 220.0 * time_axis) * amplitude
+
+
+def _noise(seconds: float, amplitude: float = 20.0, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0.0, amplitude, int(SAMPLE_RATE * seconds))
+
+
+def _pcm(*parts: np.ndarray) -> np.ndarray:
+    return np.concatenate(parts).astype(np.int16)
+
+
+def test_trim_silence_drops_edges_and_collapses_long_pauses() -> None:
+    pcm = _pcm(_noise(2.0), _tone(1.0), _noise(3.0, seed=1), _tone(0.5), _noise(0.4, seed=2), _tone(0.5), _noise(2.0, seed=3))
+
+    result = trim_silence(pcm, SAMPLE_RATE)
+
+    assert result.trimmed
+    # Two segments: the 3 s pause is cut, the 0.4 s pause is kept.
+    assert len(result.segments) == 2
+    padding = SAMPLE_RATE * VAD_PADDING_MS // 1000
+    assert result.segments[0][0] == pytest.approx(2 * SAMPLE_RATE - padding, abs=SAMPLE_RATE * 0.02)
+    assert result.segments[1][1] == pytest.approx(7.4 * SAMPLE_RATE + padding, abs=SAMPLE_RATE * 0.02)
+    assert result.pcm.size == sum(end - start for start, end in result.segments)
+    assert result.bytes_saved == (pcm.size - result.pcm.size) * 2
+    np.testing.assert_array_equal(result.pcm[: result.segments[0][1] - result.segments[0][0]], pcm[slice(*result.segments[0])])
+
+
+def test_original_seconds_maps_trimmed_timestamps_back() -> None:
+    pcm = _pcm(_noise(2.0), _tone(1.0), _noise(3.0, seed=1), _tone(1.0), _noise(1.0, seed=2))
+    result = trim_silence(pcm, SAMPLE_RATE)
+
+    first_start, first_end = result.segments[0]
+    second_start, _ = result.segments[1]
+    assert result.original_seconds(0.0) == pytest.approx(first_start / SAMPLE_RATE)
+    after_first = (first_end - first_start) / SAMPLE_RATE
+    assert result.original_seconds(after_first + 0.1) == pytest.approx(second_start / SAMPLE_RATE + 0.1)
+
+
+def test_trim_silence_keeps_quiet_fricatives() -> None:
+    # White noise around -40 dBFS: below the voiced threshold, but crossing zero on most samples.
+    hiss = np.random.default_rng(7).uniform(-1.0, 1.0, SAMPLE_RATE // 4) * 570.0
+    pcm = _pcm(_noise(1.5, amplitude=5.0), hiss, _tone(0.5), _noise(1.5, amplitude=5.0, seed=1))
+
+    result = trim_silence(pcm, SAMPLE_RATE)
+
+    assert result.trimmed
+    assert result.segments[0][0] <= int(1.5 * SAMPLE_RATE) - SAMPLE_RATE * VAD_PADDING_MS // 2000
+
+
+def test_trim_silence_leaves_silent_and_tight_recordings_untouched() -> None:
+    silent = _pcm(_noise(3.0))
+    assert not trim_silence(silent, SAMPLE_RATE).trimmed
+
+    tight = _pcm(_noise(0.1), _tone(2.0), _noise(0.1, seed=1))
+    result = trim_silence(tight, SAMPLE_RATE)
+    assert not result.trimmed
+    assert result.pcm is tight
+
+
+def test_trim_silence_keeps_a_quiet_stretch_of_continuous_speech() -> None:
+    # No silence at all: the quietest frames are a phrase spoken 20 dB softer, not background noise.
+    pcm = _pcm(_tone(3.0, amplitude=10000.0), _tone(1.5, amplitude=1000.0), _tone(3.0, amplitude=10000.0))
+
+    result = trim_silence(pcm, SAMPLE_RATE)
+
+    assert not result.trimmed
+    assert result.segments == ((0, pcm.size),)